@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import ast
-from dataclasses import dataclass
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from board_index import OptionInfo, load_index
+
 
 ROOT = Path(__file__).resolve().parents[2]
 TARGETS_DIR = ROOT / "litex_boards" / "targets"
@@ -28,107 +31,16 @@ COMMON_ACTION_OPTIONS = {
 }
 
 
-@dataclass(frozen=True)
-class OptionInfo:
-    path: Path
-    line: int
-    names: tuple[str, ...]
-    dest: str | None
-    action: str | None
-    default: str | None
-    default_value: object
-    help: str | None
-
-
-def _expr_text(node: ast.AST) -> str:
-    try:
-        return ast.unparse(node)
-    except Exception:
-        return "<unknown>"
-
-
-def _string_value(node: ast.AST | None) -> str | None:
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return node.value
-    return None
-
-
-def _literal_value(node: ast.AST | None) -> object:
-    if node is None:
-        return None
-    try:
-        return ast.literal_eval(node)
-    except Exception:
-        return None
-
-
-def _keyword(call: ast.Call, name: str) -> ast.AST | None:
-    for kw in call.keywords:
-        if kw.arg == name:
-            return kw.value
-    return None
-
-
-def _call_name(node: ast.Call) -> str | None:
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    return None
-
-
 def collect_options(path: Path) -> list[OptionInfo]:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    options = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
-        if _call_name(node) not in {"add_target_argument", "add_argument"}:
-            continue
-        names = []
-        for arg in node.args:
-            value = _string_value(arg)
-            if value is None:
-                break
-            if value.startswith("--"):
-                names.append(value)
-        if not names:
-            continue
-        action = _string_value(_keyword(node, "action"))
-        help_text = _string_value(_keyword(node, "help"))
-        default_node = _keyword(node, "default")
-        options.append(OptionInfo(
-            path=path,
-            line=node.lineno,
-            names=tuple(names),
-            dest=_string_value(_keyword(node, "dest")),
-            action=action,
-            default=_expr_text(default_node) if default_node is not None else None,
-            default_value=_literal_value(default_node),
-            help=help_text,
-        ))
-    return options
+    return list(load_index().target(path).options)
 
 
 def collect_platform_imports(path: Path) -> set[str]:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    imports: set[str] = set()
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ImportFrom):
-            continue
-        if node.module == "litex_boards.platforms":
-            imports.update(alias.name for alias in node.names)
-        elif node.module is not None and node.module.startswith("litex_boards.platforms."):
-            imports.add(node.module.removeprefix("litex_boards.platforms."))
-    return imports
+    return set(load_index().target(path).platform_imports)
 
 
 def target_uses_litex_parser(path: Path) -> bool:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Name) and node.id == "LiteXArgumentParser":
-            return True
-    return False
+    return load_index().target(path).uses_litex_parser
 
 
 def audit_target(path: Path) -> list[str]:
@@ -137,15 +49,14 @@ def audit_target(path: Path) -> list[str]:
         rel = path.relative_to(ROOT)
     except ValueError:
         rel = path
-    if not target_uses_litex_parser(path):
+    record = load_index().target(path)
+    if not record.uses_litex_parser:
         issues.append(f"{rel}: target should use LiteXArgumentParser")
 
-    imports = collect_platform_imports(path)
-    if path.stem != "simple" and not imports:
+    if path.stem != "simple" and not record.platform_imports:
         issues.append(f"{rel}: no litex_boards.platforms import found")
 
-    options = collect_options(path)
-    by_name = {name: option for option in options for name in option.names}
+    by_name = {name: option for option in record.options for name in option.names}
 
     for name, expected_default in COMMON_OPTION_DEFAULTS.items():
         option = by_name.get(name)
@@ -170,8 +81,7 @@ def audit_target(path: Path) -> list[str]:
         issues.append(f"{rel}:{option.line}: keep --eth-ip when adding --local-ip compatibility")
 
     if "--with-etherbone" in by_name and "--eth-dynamic-ip" in by_name:
-        text = path.read_text(encoding="utf-8")
-        if "with_etherbone and args.eth_dynamic_ip" not in text and "add_mutually_exclusive_group" not in text:
+        if not record.guards_etherbone_dynamic_ip:
             issues.append(
                 f"{rel}: document or enforce --with-etherbone/--eth-dynamic-ip interaction"
             )
@@ -196,6 +106,7 @@ def main() -> int:
     args = parser.parse_args()
 
     issues = collect_issues()
+    load_index().save()
     rendered = "\n".join(issues) + ("\n" if issues else "")
 
     if args.write_known:
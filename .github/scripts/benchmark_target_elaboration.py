@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_target_builds import (
+    ROOT,
+    TARGETS_DIR,
+    BuildJob,
+    collect_exclusions,
+    python_module_names,
+    target_job,
+)
+
+
+BASELINE_PATH = ROOT / ".github" / "scripts" / "target_elaboration_baseline.json"
+DEFAULT_OUTPUT_DIR = ROOT / "build" / "benchmark_targets"
+DEFAULT_RESULTS_PATH = ROOT / "build" / "target_elaboration.json"
+
+# Metrics compared against the baseline; small absolute deltas are ignored to filter out noise.
+REGRESSION_METRICS = {
+    "wall_time"     : 1.0,  # seconds.
+    "peak_rss_mb"   : 32.0, # MiB.
+    "verilog_lines" : 100,
+}
+
+
+@dataclass(frozen=True)
+class TargetBenchmark:
+    name: str
+    ok: bool
+    wall_time: float
+    peak_rss_mb: float
+    verilog_lines: int
+    csr_count: int
+    memory_regions: int
+
+
+def benchmark_job(name: str, output_root: Path = DEFAULT_OUTPUT_DIR) -> BuildJob:
+    csr_json = output_root / "targets" / name / "csr.json"
+    return target_job(name, output_root, extra_args=("--csr-json", str(csr_json)))
+
+
+def _peak_rss_mb(rusage) -> float:
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss*scale/2**20
+
+
+def _verilog_lines(output_dir: Path) -> int:
+    lines = 0
+    for path in (output_dir / "gateware").glob("*.v"):
+        with open(path, "rb") as f:
+            lines += sum(1 for _ in f)
+    return lines
+
+
+def _csr_counts(output_dir: Path) -> tuple[int, int]:
+    path = output_dir / "csr.json"
+    if not path.exists():
+        return 0, 0
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return len(data.get("csr_registers", {})), len(data.get("memories", {}))
+
+
+def measure(job: BuildJob) -> TargetBenchmark:
+    shutil.rmtree(job.output_dir, ignore_errors=True)
+    job.output_dir.mkdir(parents=True)
+    log_path = job.output_dir.parent / f"{job.name}.log"
+    start = time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(job.cmd, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+        # Reap the child ourselves to get its own resource usage, not the aggregate of all children.
+        _, status, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    wall_time = time.monotonic() - start
+    csr_count, memory_regions = _csr_counts(job.output_dir)
+    return TargetBenchmark(
+        name           = job.name,
+        ok             = proc.returncode == 0,
+        wall_time      = round(wall_time, 3),
+        peak_rss_mb    = round(_peak_rss_mb(rusage), 1),
+        verilog_lines  = _verilog_lines(job.output_dir),
+        csr_count      = csr_count,
+        memory_regions = memory_regions,
+    )
+
+
+def load_results(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("targets", {})
+
+
+def write_results(path: Path, results: dict[str, dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"targets": results}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def merge_baseline(baseline: dict[str, dict], results: dict[str, dict]) -> dict[str, dict]:
+    # Failed builds are not recorded: their zero metrics would flag the target once it builds again.
+    return {**baseline, **{name: result for name, result in results.items() if result["ok"]}}
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    metrics: tuple[str, ...] = tuple(REGRESSION_METRICS),
+) -> tuple[list[str], list[str]]:
+    regressions: list[str] = []
+    changes: list[str] = []
+    for name, result in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if reference["ok"] and not result["ok"]:
+            regressions.append(f"{name}: no-compile build now fails")
+            continue
+        for metric in metrics:
+            min_delta = REGRESSION_METRICS[metric]
+            old, new = reference[metric], result[metric]
+            if new - old > max(old*threshold, min_delta):
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{(new - old)/max(old, 1e-9):.0%})")
+        for metric in ["csr_count", "memory_regions"]:
+            if reference[metric] != result[metric]:
+                changes.append(f"{name}: {metric} {reference[metric]} -> {result[metric]}")
+    return regressions, changes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LiteX-Boards target elaboration (no-compile builds)")
+    parser.add_argument("names", nargs="*", help="Targets to benchmark; defaults to all targets built by the test suite")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of targets to elaborate concurrently")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression against the baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Results JSON file")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Root directory for build outputs")
+    parser.add_argument("--metrics", nargs="+", choices=list(REGRESSION_METRICS), default=list(REGRESSION_METRICS), help="Metrics compared against the baseline")
+    parser.add_argument("--check", action="store_true", help="Fail when a target regresses beyond --threshold")
+    parser.add_argument("--write-baseline", action="store_true", help="Merge the successful results into the baseline")
+    args = parser.parse_args()
+
+    excluded = collect_exclusions("TARGET_EXCLUSIONS")
+    names = args.names or [name for name in python_module_names(TARGETS_DIR) if name not in excluded]
+    jobs = [benchmark_job(name, args.output_dir) for name in names]
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [executor.submit(measure, job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = {k: v for k, v in asdict(result).items() if k != "name"}
+            status = "ok  " if result.ok else "FAIL"
+            print(
+                f"{status} {result.wall_time:8.2f}s {result.peak_rss_mb:8.1f}MiB "
+                f"{result.verilog_lines:8d} lines {result.csr_count:4d} CSRs "
+                f"{result.memory_regions:3d} regions {result.name}",
+                flush=True,
+            )
+
+    write_results(args.output, results)
+
+    if args.write_baseline:
+        write_results(args.baseline, merge_baseline(load_results(args.baseline), results))
+        return 0
+
+    regressions, changes = compare(results, load_results(args.baseline), args.threshold, args.metrics)
+    for change in changes:
+        print(f"changed: {change}")
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if args.check and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import operator
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+TARGETS_DIR = ROOT / "litex_boards" / "targets"
+PLATFORMS_DIR = ROOT / "litex_boards" / "platforms"
+TEST_TARGETS_PATH = ROOT / "test" / "test_targets.py"
+INDEX_PATH = ROOT / "build" / "board_index.json"
+
+# Bump when the records below change shape; the index source hash also invalidates the cache.
+INDEX_VERSION = 2
+
+EXCLUSION_NAMES = (
+    "EXCLUSION_CATEGORIES",
+    "PLATFORM_EXCLUSIONS",
+    "TARGET_EXCLUSIONS",
+)
+
+# Feature cores that targets should only import on the code path that uses them.
+FEATURE_PACKAGES = (
+    "litedram",
+    "liteeth",
+    "litei2c",
+    "liteiclink",
+    "litejesd204b",
+    "litepcie",
+    "litesata",
+    "litescope",
+    "litesdcard",
+    "litespi",
+)
+
+PARSER_LINE_RE = re.compile(r"^(?P<indent>\s*)(?P<recv>(?:parser|\w+opts))\.add_(?:target_)?argument\(")
+
+
+@dataclass(frozen=True)
+class OptionInfo:
+    line: int
+    names: tuple[str, ...]
+    first_arg: str | None
+    keywords: tuple[str, ...]
+    dest: str | None
+    action: str | None
+    default: str | None
+    default_value: object
+    help: str | None
+
+
+@dataclass(frozen=True)
+class ParserLine:
+    line: int
+    indent: int
+    receiver: str
+    sig: tuple[str, ...]
+    help_col: int
+
+
+@dataclass(frozen=True)
+class DeferrableImport:
+    line: int
+    end_line: int
+    statement: str
+    blocks: tuple[tuple[int, int, str], ...]  # (header line, indent, statement) for each block using it.
+
+
+@dataclass(frozen=True)
+class TargetRecord:
+    name: str
+    options: tuple[OptionInfo, ...]
+    platform_imports: tuple[str, ...]
+    uses_litex_parser: bool
+    exclusive_groups: dict[str, tuple[int, int]]
+    parser_lines: tuple[ParserLine, ...]
+    guards_etherbone_dynamic_ip: bool
+    deferrable_imports: tuple[DeferrableImport, ...]
+
+    def option(self, name: str) -> OptionInfo | None:
+        for option in self.options:
+            if name in option.names:
+                return option
+        return None
+
+
+@dataclass(frozen=True)
+class PlatformRecord:
+    name: str
+    toolchains: tuple[str, ...]
+    devices: tuple[str, ...]
+    default_clk_name: str | None
+    default_clk_freq: float | None
+
+
+# AST helpers --------------------------------------------------------------------------------------
+
+def expr_text(node: ast.AST | None) -> str | None:
+    if node is None:
+        return None
+    try:
+        return ast.unparse(node)
+    except Exception:
+        return "<unknown>"
+
+
+def string_value(node: ast.AST | None) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def literal_value(node: ast.AST | None) -> object:
+    if node is None:
+        return None
+    try:
+        value = ast.literal_eval(node)
+    except Exception:
+        return None
+    # Only keep values that survive a JSON round-trip unchanged.
+    return value if isinstance(value, (str, int, float, bool)) else None
+
+
+def keyword(call: ast.Call, name: str) -> ast.AST | None:
+    for kw in call.keywords:
+        if kw.arg == name:
+            return kw.value
+    return None
+
+
+def call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    return None
+
+
+def option_names(call: ast.Call) -> tuple[str, ...]:
+    names = []
+    for arg in call.args:
+        value = string_value(arg)
+        if value is None:
+            break
+        if value.startswith("--"):
+            names.append(value)
+    return tuple(names)
+
+
+_BINOPS = {
+    ast.Add  : operator.add,
+    ast.Sub  : operator.sub,
+    ast.Mult : operator.mul,
+    ast.Div  : operator.truediv,
+}
+
+def _number_value(node: ast.AST) -> float | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        left, right = _number_value(node.left), _number_value(node.right)
+        if left is None or right is None or (isinstance(node.op, ast.Div) and right == 0):
+            return None
+        return _BINOPS[type(node.op)](left, right)
+    return None
+
+# Parsers ------------------------------------------------------------------------------------------
+
+def _parser_line(line: str, lineno: int) -> ParserLine | None:
+    m = PARSER_LINE_RE.match(line)
+    if not m or "help=" not in line or ")" not in line:
+        return None
+    # Keep the alignment checker strict on simple single-option lines only.
+    if line.count('"--') != 1:
+        return None
+    return ParserLine(
+        line     = lineno,
+        indent   = len(m.group("indent")),
+        receiver = m.group("recv"),
+        sig      = tuple(name for name in ("action=", "default=", "type=", "choices=") if name in line),
+        help_col = line.index("help="),
+    )
+
+
+def parse_platform_imports(tree: ast.AST) -> tuple[str, ...]:
+    imports: set[str] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        if node.module == "litex_boards.platforms":
+            imports.update(alias.name for alias in node.names)
+        elif node.module is not None and node.module.startswith("litex_boards.platforms."):
+            imports.add(node.module.removeprefix("litex_boards.platforms."))
+    return tuple(sorted(imports))
+
+
+def _use_paths(tree: ast.Module, names: set[str]):
+    # Yield (name node, [(ancestor, field), ...]) for every reference to names.
+    def visit(node, path):
+        if isinstance(node, ast.Name) and node.id in names:
+            yield node, path
+        for field, value in ast.iter_fields(node):
+            children = value if isinstance(value, list) else [value]
+            for child in children:
+                if isinstance(child, ast.AST):
+                    yield from visit(child, path + [(node, field)])
+    yield from visit(tree, [])
+
+
+def _conditional_blocks(path) -> list[tuple[ast.If, str]]:
+    # if/else blocks of the path (outermost first) that run in function scope, not class or module scope.
+    blocks = []
+    in_function = False
+    for node, field in path:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            in_function = field == "body"
+            blocks = []
+        elif isinstance(node, ast.ClassDef):
+            in_function = False
+            blocks = []
+        elif isinstance(node, ast.If) and field in {"body", "orelse"} and in_function:
+            blocks.append((node, field))
+    return blocks
+
+
+def _common_prefix(paths):
+    prefix = paths[0]
+    for path in paths[1:]:
+        length = 0
+        for (a, fa), (b, fb) in zip(prefix, path):
+            if a is not b or fa != fb:
+                break
+            length += 1
+        prefix = prefix[:length]
+    return prefix
+
+
+def _block_header(block: tuple[ast.If, str], lines: list[str]) -> tuple[int, int] | None:
+    node, field = block
+    first = getattr(node, field)[0]
+    first_line = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", [])])
+    if first_line == node.lineno:
+        return None
+    # Insert right after the if/else header, above any comment leading the block.
+    header = first_line - 2
+    while header >= 0 and (not lines[header].strip() or lines[header].strip().startswith("#")):
+        header -= 1
+    if header < 0 or not lines[header].split("#")[0].rstrip().endswith(":"):
+        return None
+    return header + 1, first.col_offset
+
+
+def _block_imports(block: tuple[ast.If, str], module: str) -> set[str]:
+    # Names already imported from module by the leading imports of the block.
+    names = set()
+    for stmt in getattr(block[0], block[1]):
+        if not isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            break
+        if isinstance(stmt, ast.ImportFrom) and stmt.module == module:
+            names.update(alias.asname or alias.name for alias in stmt.names)
+    return names
+
+
+def parse_deferrable_imports(tree: ast.Module, lines: list[str]) -> tuple[DeferrableImport, ...]:
+    deferrable = []
+    for stmt in tree.body:
+        if not isinstance(stmt, ast.ImportFrom) or stmt.level or stmt.module is None:
+            continue
+        if stmt.module.split(".")[0] not in FEATURE_PACKAGES or any(alias.name == "*" for alias in stmt.names):
+            continue
+        aliases = {alias.asname or alias.name: alias for alias in stmt.names}
+        uses    = list(_use_paths(tree, set(aliases)))
+        if not uses or any(not isinstance(node.ctx, ast.Load) for node, _ in uses):
+            continue
+        # Prefer the deepest block shared by all uses, else import in the outermost block of each use.
+        common = _conditional_blocks(_common_prefix([path for _, path in uses]))
+        blocks = {}
+        for node, path in uses:
+            block = common[-1] if common else (_conditional_blocks(path) or [None])[0]
+            if block is None:
+                blocks = {}
+                break
+            blocks.setdefault((id(block[0]), block[1]), (block, set()))[1].add(node.id)
+        if not blocks:
+            continue
+        headers = {key: _block_header(block, lines) for key, (block, _) in blocks.items()}
+        if None in headers.values():
+            continue
+        entries = []
+        for key, (block, names) in blocks.items():
+            # Blocks that already import the names locally only need the module-level import removed.
+            names = names - _block_imports(block, stmt.module)
+            if not names:
+                continue
+            rendered = ", ".join(
+                alias.name if alias.asname is None else f"{alias.name} as {alias.asname}"
+                for name, alias in aliases.items() if name in names
+            )
+            entries.append((*headers[key], f"from {stmt.module} import {rendered}"))
+        deferrable.append(DeferrableImport(
+            line      = stmt.lineno,
+            end_line  = stmt.end_lineno,
+            statement = ast.get_source_segment("\n".join(lines), stmt).replace("\n", " "),
+            blocks    = tuple(sorted(entries)),
+        ))
+    return tuple(deferrable)
+
+
+def parse_target(path: Path, text: str) -> TargetRecord:
+    tree = ast.parse(text, filename=str(path))
+
+    options = []
+    groups: dict[str, tuple[int, int]] = {}
+    uses_litex_parser = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id == "LiteXArgumentParser":
+            uses_litex_parser = True
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "add_mutually_exclusive_group"
+        ):
+            groups[node.targets[0].id] = (node.value.lineno, 0)
+        if not isinstance(node, ast.Call) or call_name(node) not in {"add_target_argument", "add_argument"}:
+            continue
+        names = option_names(node)
+        if not names:
+            continue
+        default_node = keyword(node, "default")
+        options.append(OptionInfo(
+            line          = node.lineno,
+            names         = names,
+            first_arg     = string_value(node.args[0]) if node.args else None,
+            keywords      = tuple(kw.arg for kw in node.keywords if kw.arg is not None),
+            dest          = string_value(keyword(node, "dest")),
+            action        = string_value(keyword(node, "action")),
+            default       = expr_text(default_node),
+            default_value = literal_value(default_node),
+            help          = string_value(keyword(node, "help")),
+        ))
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        if node.func.attr != "add_argument":
+            continue
+        owner = node.func.value
+        if isinstance(owner, ast.Name) and owner.id in groups:
+            lineno, count = groups[owner.id]
+            groups[owner.id] = (lineno, count + 1)
+
+    parser_lines = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        info = _parser_line(line, lineno)
+        if info is not None:
+            parser_lines.append(info)
+
+    return TargetRecord(
+        name                        = path.stem,
+        options                     = tuple(options),
+        platform_imports            = parse_platform_imports(tree),
+        uses_litex_parser           = uses_litex_parser,
+        exclusive_groups            = groups,
+        parser_lines                = tuple(parser_lines),
+        guards_etherbone_dynamic_ip = (
+            "with_etherbone and args.eth_dynamic_ip" in text or "add_mutually_exclusive_group" in text
+        ),
+        deferrable_imports          = parse_deferrable_imports(tree, text.splitlines()),
+    )
+
+
+def _platform_devices(tree: ast.Module, init: ast.FunctionDef) -> tuple[str, ...]:
+    module_values = {
+        target.id: node.value
+        for node in tree.body if isinstance(node, ast.Assign)
+        for target in node.targets if isinstance(target, ast.Name)
+    }
+    local_values = {
+        target.id: node.value
+        for node in ast.walk(init) if isinstance(node, ast.Assign)
+        for target in node.targets if isinstance(target, ast.Name)
+    }
+    defaults = {
+        arg.arg: literal_value(default)
+        for arg, default in zip(reversed(init.args.args), reversed(init.args.defaults))
+    }
+
+    def resolve(node: ast.AST | None, depth: int = 0) -> tuple[str, ...]:
+        if node is None or depth > 4:
+            return ()
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return (node.value,)
+        if isinstance(node, ast.JoinedStr):
+            return (expr_text(node),)
+        if isinstance(node, ast.Name):
+            return resolve(local_values.get(node.id, module_values.get(node.id)), depth + 1)
+        if isinstance(node, ast.Subscript):
+            table = node.value
+            if isinstance(table, ast.Name):
+                table = local_values.get(table.id, module_values.get(table.id))
+            if isinstance(table, ast.Dict):
+                devices = {}
+                for key, value in zip(table.keys, table.values):
+                    resolved = resolve(value, depth + 1)
+                    if resolved:
+                        devices[literal_value(key)] = resolved[0]
+                # List the device selected by the default argument first.
+                selected = defaults.get(node.slice.id) if isinstance(node.slice, ast.Name) else None
+                ordered = [devices[selected]] if selected in devices else []
+                return tuple(dict.fromkeys(ordered + list(devices.values())))
+        return ()
+
+    for node in ast.walk(init):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "__init__"
+            and len(node.args) >= 2
+        ):
+            return resolve(node.args[1])
+    return ()
+
+
+def parse_platform(path: Path, text: str) -> PlatformRecord:
+    tree = ast.parse(text, filename=str(path))
+    toolchains: set[str] = set()
+    devices: tuple[str, ...] = ()
+    clk_name = None
+    clk_freq = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == "__init__":
+            for arg, default in zip(reversed(node.args.args), reversed(node.args.defaults)):
+                if arg.arg == "toolchain":
+                    value = string_value(default)
+                    if value is not None:
+                        toolchains.add(value)
+            devices = devices or _platform_devices(tree, node)
+        elif isinstance(node, ast.ClassDef) and node.name == "Platform":
+            for item in node.body:
+                if not isinstance(item, ast.Assign):
+                    continue
+                for target in item.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+                    if target.id == "default_clk_name":
+                        clk_name = string_value(item.value)
+                    elif target.id == "default_clk_period":
+                        period = _number_value(item.value)
+                        clk_freq = 1e9/period if period else None
+    return PlatformRecord(
+        name             = path.stem,
+        toolchains       = tuple(sorted(toolchains)),
+        devices          = devices,
+        default_clk_name = clk_name,
+        default_clk_freq = clk_freq,
+    )
+
+
+def parse_exclusions(path: Path, text: str) -> dict[str, object]:
+    tree = ast.parse(text, filename=str(path))
+    values = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in EXCLUSION_NAMES:
+                value = ast.literal_eval(node.value)
+                values[target.id] = sorted(value) if isinstance(value, set) else value
+    return values
+
+# Serialization ------------------------------------------------------------------------------------
+
+def _target_from_dict(data: dict) -> TargetRecord:
+    return TargetRecord(
+        name                        = data["name"],
+        options                     = tuple(
+            OptionInfo(**{**option, "names": tuple(option["names"]), "keywords": tuple(option["keywords"])})
+            for option in data["options"]
+        ),
+        platform_imports            = tuple(data["platform_imports"]),
+        uses_litex_parser           = data["uses_litex_parser"],
+        exclusive_groups            = {name: tuple(value) for name, value in data["exclusive_groups"].items()},
+        parser_lines                = tuple(
+            ParserLine(**{**line, "sig": tuple(line["sig"])}) for line in data["parser_lines"]
+        ),
+        guards_etherbone_dynamic_ip = data["guards_etherbone_dynamic_ip"],
+        deferrable_imports          = tuple(
+            DeferrableImport(**{**entry, "blocks": tuple(tuple(block) for block in entry["blocks"])})
+            for entry in data["deferrable_imports"]
+        ),
+    )
+
+
+def _platform_from_dict(data: dict) -> PlatformRecord:
+    return PlatformRecord(**{**data, "toolchains": tuple(data["toolchains"]), "devices": tuple(data["devices"])})
+
+
+KINDS = {
+    "target"     : (parse_target,     asdict, _target_from_dict),
+    "platform"   : (parse_platform,   asdict, _platform_from_dict),
+    "exclusions" : (parse_exclusions, dict,   dict),
+}
+
+# Index --------------------------------------------------------------------------------------------
+
+def _index_signature() -> str:
+    source = Path(__file__).read_bytes()
+    return f"{INDEX_VERSION}:{hashlib.sha256(source).hexdigest()}"
+
+
+class BoardIndex:
+    """Board metadata parsed once per file and cached on disk by file mtime and content hash."""
+    def __init__(self, path: Path | None = INDEX_PATH):
+        self.path    = path
+        self.entries = {}
+        self.records = {}
+        self.dirty   = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                data = {}
+            if data.get("signature") == _index_signature():
+                self.entries = data.get("entries", {})
+
+    def _record(self, kind: str, path: Path):
+        path = Path(path).resolve()
+        key  = f"{kind}:{path}"
+        if key in self.records:
+            return self.records[key]
+        parse, dump, load = KINDS[kind]
+        mtime_ns = path.stat().st_mtime_ns
+        entry    = self.entries.get(key)
+        record   = None
+        if entry is not None and entry["mtime_ns"] == mtime_ns:
+            record = load(entry["record"])
+        else:
+            content = path.read_bytes()
+            digest  = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry["sha256"] == digest:
+                record = load(entry["record"])
+            else:
+                record = parse(path, content.decode("utf-8"))
+            self.entries[key] = {"mtime_ns": mtime_ns, "sha256": digest, "record": dump(record)}
+            self.dirty = True
+        self.records[key] = record
+        return record
+
+    def target(self, path: Path) -> TargetRecord:
+        return self._record("target", path)
+
+    def platform(self, path: Path) -> PlatformRecord:
+        return self._record("platform", path)
+
+    def exclusions(self, path: Path = TEST_TARGETS_PATH) -> dict[str, object]:
+        return self._record("exclusions", path)
+
+    def targets(self, targets_dir: Path = TARGETS_DIR) -> list[tuple[Path, TargetRecord]]:
+        return [(path, self.target(path)) for path in module_paths(targets_dir)]
+
+    def platforms(self, platforms_dir: Path = PLATFORMS_DIR) -> list[tuple[Path, PlatformRecord]]:
+        return [(path, self.platform(path)) for path in module_paths(platforms_dir)]
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        # Drop records of files that no longer exist (removed boards, temporary test trees).
+        self.entries = {
+            key: entry for key, entry in self.entries.items()
+            if Path(key.split(":", 1)[1]).exists()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"signature": _index_signature(), "entries": self.entries}
+        self.path.write_text(json.dumps(data, sort_keys=True) + "\n", encoding="utf-8")
+        self.dirty = False
+
+
+def module_paths(directory: Path) -> list[Path]:
+    return [path for path in sorted(directory.glob("*.py")) if path.name != "__init__.py"]
+
+
+def relative_path(path: Path) -> Path:
+    try:
+        return path.resolve().relative_to(ROOT)
+    except ValueError:
+        return path
+
+
+_index = None
+
+def load_index() -> BoardIndex:
+    global _index
+    if _index is None:
+        _index = BoardIndex()
+    return _index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the LiteX-Boards metadata index")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the on-disk cache and re-parse every file")
+    args = parser.parse_args()
+
+    index = BoardIndex(INDEX_PATH if not args.rebuild else None)
+    index.path = INDEX_PATH
+    targets   = index.targets()
+    platforms = index.platforms()
+    index.exclusions()
+    index.dirty = True
+    index.save()
+    print(f"Indexed {len(targets)} targets and {len(platforms)} platforms in {relative_path(INDEX_PATH)}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 import argparse
-import ast
+import json
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from board_index import load_index
+from run_target_builds import default_jobs
 
 
 ROOT = Path(__file__).resolve().parents[2]
 TEST_TARGETS_PATH = ROOT / "test" / "test_targets.py"
+DEFAULT_REPORT_PATH = ROOT / "build" / "stale_exclusions.json"
 
 SKIPPED_CATEGORIES = {
     "external_toolchain",
@@ -33,28 +42,26 @@ class Probe:
 @dataclass(frozen=True)
 class ProbeResult:
     probe: Probe
-    returncode: int
+    returncode: int | None  # None when the global deadline expired before the probe could run.
     output: str
+    duration: float = 0.0
+    timed_out: bool = False
 
     @property
     def stale(self) -> bool:
         return self.returncode == 0
 
+    @property
+    def status(self) -> str:
+        if self.returncode is None:
+            return "not_run"
+        if self.timed_out:
+            return "timeout"
+        return "stale" if self.stale else "kept"
+
 
 def collect_exclusion_metadata(path: Path = TEST_TARGETS_PATH):
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    values = {}
-    for node in tree.body:
-        if not isinstance(node, ast.Assign):
-            continue
-        for target in node.targets:
-            if isinstance(target, ast.Name) and target.id in {
-                "EXCLUSION_CATEGORIES",
-                "PLATFORM_EXCLUSIONS",
-                "TARGET_EXCLUSIONS",
-            }:
-                values[target.id] = ast.literal_eval(node.value)
-    return values
+    return load_index().exclusions(path)
 
 
 def is_probe_eligible(record: dict[str, str]) -> bool:
@@ -107,15 +114,49 @@ def collect_probes(output_dir: Path) -> list[Probe]:
     return probes
 
 
-def run_probe(probe: Probe, timeout: int) -> ProbeResult:
-    result = subprocess.run(
-        probe.cmd,
-        stdout  = subprocess.PIPE,
-        stderr  = subprocess.STDOUT,
-        text    = True,
-        timeout = timeout,
-    )
-    return ProbeResult(probe=probe, returncode=result.returncode, output=result.stdout)
+def run_probe(probe: Probe, timeout: float | None, deadline: float | None = None) -> ProbeResult:
+    # The per-probe timeout is shortened so that no probe outlives the global deadline.
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ProbeResult(probe=probe, returncode=None, output="Global deadline reached.")
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    start = time.monotonic()
+    try:
+        result = subprocess.run(
+            probe.cmd,
+            cwd     = ROOT,
+            stdout  = subprocess.PIPE,
+            stderr  = subprocess.STDOUT,
+            text    = True,
+            timeout = timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        return ProbeResult(
+            probe      = probe,
+            returncode = -1,
+            output     = output + f"\nTimed out after {timeout:.0f}s.",
+            duration   = time.monotonic() - start,
+            timed_out  = True,
+        )
+    return ProbeResult(probe=probe, returncode=result.returncode, output=result.stdout, duration=time.monotonic() - start)
+
+
+def run_probes(
+    probes   : Iterable[Probe],
+    workers  : int | None = None,
+    timeout  : float | None = None,
+    deadline : float | None = None,
+) -> Iterator[ProbeResult]:
+    probes = list(probes)
+    if not probes:
+        return
+    workers = max(1, min(workers or default_jobs(), len(probes)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_probe, probe, timeout, deadline) for probe in probes]
+        for future in as_completed(futures):
+            yield future.result()
 
 
 def summarize_failure(result: ProbeResult) -> str:
@@ -123,10 +164,31 @@ def summarize_failure(result: ProbeResult) -> str:
     return " | ".join(lines[-4:])
 
 
+def write_report(path: Path, results: list[ProbeResult]):
+    entries = [
+        {
+            "kind"       : result.probe.kind,
+            "name"       : result.probe.name,
+            "category"   : result.probe.category,
+            "reason"     : result.probe.reason,
+            "status"     : result.status,
+            "returncode" : result.returncode,
+            "duration"   : round(result.duration, 3),
+            "summary"    : "" if result.stale else summarize_failure(result),
+        }
+        for result in sorted(results, key=lambda result: (result.probe.kind, result.probe.name))
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"probes": entries}, indent=2) + "\n", encoding="utf-8")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Detect stale LiteX-Boards build exclusions")
     parser.add_argument("--check", action="store_true", help="Exit non-zero when an exclusion now passes")
     parser.add_argument("--timeout", type=int, default=120, help="Timeout per probe in seconds")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Number of probes to run concurrently (default: CPU count)")
+    parser.add_argument("--deadline", type=float, default=None, help="Global deadline in seconds for all probes")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT_PATH, help="JSON report written after probing")
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -138,15 +200,25 @@ def main() -> int:
     shutil.rmtree(args.output_dir, ignore_errors=True)
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    stale = []
-    for probe in collect_probes(args.output_dir):
-        result = run_probe(probe, args.timeout)
+    probes = collect_probes(args.output_dir)
+    load_index().save()
+
+    deadline = None if args.deadline is None else time.monotonic() + args.deadline
+    results  = []
+    stale    = []
+    for result in run_probes(probes, args.jobs, args.timeout, deadline):
+        results.append(result)
+        probe = result.probe
         if result.stale:
             stale.append(probe)
-            print(f"STALE {probe.kind} exclusion: {probe.name} ({probe.reason})")
+            print(f"STALE {probe.kind} exclusion: {probe.name} ({probe.reason})", flush=True)
+        elif result.returncode is None:
+            print(f"not probed before deadline: {probe.kind} {probe.name}", flush=True)
         elif not args.check:
             summary = summarize_failure(result)
-            print(f"kept {probe.kind} exclusion: {probe.name} ({probe.category}) {summary}")
+            print(f"kept {probe.kind} exclusion: {probe.name} ({probe.category}, {result.duration:.0f}s) {summary}", flush=True)
+
+    write_report(args.report, results)
 
     if stale:
         if args.check:
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from board_index import TARGETS_DIR, DeferrableImport, load_index, module_paths, relative_path
+
+
+def check_target(path: Path) -> list[str]:
+    issues = []
+    for entry in load_index().target(path).deferrable_imports:
+        issues.append(
+            f"{relative_path(path)}:{entry.line}: import feature core on the code path that uses it "
+            f"({entry.statement})"
+        )
+    return issues
+
+
+def defer_imports(text: str, deferrable: tuple[DeferrableImport, ...]) -> str:
+    removed    = set()
+    insertions = {}
+    for entry in sorted(deferrable, key=lambda entry: entry.line):
+        removed.update(range(entry.line, entry.end_line + 1))
+        for line, indent, statement in entry.blocks:
+            insertions.setdefault(line, []).append(" "*indent + statement + "\n")
+
+    output = []
+    after_removal = False
+    for lineno, line in enumerate(text.splitlines(keepends=True), start=1):
+        if lineno in removed:
+            after_removal = True
+            continue
+        # Do not leave two blank lines where a whole import group was moved.
+        if after_removal and not line.strip() and output and not output[-1].strip():
+            after_removal = False
+            continue
+        after_removal = False
+        output.append(line)
+        output.extend(insertions.get(lineno, []))
+    return "".join(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that targets import feature cores lazily")
+    parser.add_argument("--fix", action="store_true", help="Move deferrable imports into the blocks that use them")
+    args = parser.parse_args()
+
+    issues = []
+    for path in module_paths(TARGETS_DIR):
+        record = load_index().target(path)
+        if not record.deferrable_imports:
+            continue
+        if args.fix:
+            text = path.read_text(encoding="utf-8")
+            path.write_text(defer_imports(text, record.deferrable_imports), encoding="utf-8")
+        else:
+            issues.extend(check_target(path))
+    load_index().save()
+
+    if issues:
+        print("\n".join(issues))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_target_builds import (
+    ROOT,
+    TARGETS_DIR,
+    BuildJob,
+    cache_key,
+    collect_exclusions,
+    default_jobs,
+    package_versions,
+    python_module_names,
+    run_job,
+    summarize_failure,
+    target_job,
+)
+
+
+DEFAULT_OUTPUT_DIR = ROOT / "build" / "fingerprint_targets"
+DEFAULT_GOLDEN_PATH = ROOT / "build" / "target_fingerprints.json"
+DEFAULT_CACHE_PATH = ROOT / "build" / "target_fingerprints_cache.json"
+
+# Bump when the normalization changes, so that cached fingerprints are recomputed.
+FINGERPRINT_VERSION = 1
+
+CONSTRAINT_SUFFIXES = (".xdc", ".ucf", ".pcf", ".lpf", ".sdc", ".qsf", ".cst", ".pdc", ".ccf")
+
+# Generated files carry the LiteX revision and build date in their header.
+HEADER_RE = re.compile(r"^.*Auto-generated by LiteX.*$", re.MULTILINE)
+
+
+def fingerprint_job(name: str, output_root: Path = DEFAULT_OUTPUT_DIR) -> BuildJob:
+    output_dir = output_root / "targets" / name
+    return target_job(name, output_root, extra_args=(
+        "--csr-csv",  str(output_dir / "csr.csv"),
+        "--csr-json", str(output_dir / "csr.json"),
+    ))
+
+
+def normalize(text: str, output_dir: Path) -> str:
+    text = HEADER_RE.sub("", text)
+    text = text.replace(str(output_dir.resolve()), "<build>").replace(str(output_dir), "<build>")
+    return text.replace(str(ROOT), "<root>")
+
+
+def digest(texts: list[str]) -> str | None:
+    if not texts:
+        return None
+    sha = hashlib.sha256()
+    for text in texts:
+        sha.update(text.encode())
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def _files(directory: Path, suffixes: tuple[str, ...]) -> list[Path]:
+    if not directory.exists():
+        return []
+    return sorted(path for path in directory.iterdir() if path.suffix in suffixes)
+
+
+def _read(paths: list[Path], output_dir: Path) -> list[str]:
+    return [normalize(path.read_text(encoding="utf-8", errors="replace"), output_dir) for path in paths]
+
+
+def collect_fingerprints(output_dir: Path, help_output: str) -> dict[str, str | None]:
+    memories = []
+    csr_json = output_dir / "csr.json"
+    if csr_json.exists():
+        memories.append(json.dumps(json.loads(csr_json.read_text(encoding="utf-8")).get("memories", {}), sort_keys=True))
+    return {
+        "help"        : digest([normalize(help_output, output_dir)]),
+        "verilog"     : digest(_read(_files(output_dir / "gateware", (".v", ".sv")), output_dir)),
+        "constraints" : digest(_read(_files(output_dir / "gateware", CONSTRAINT_SUFFIXES), output_dir)),
+        "csr"         : digest(_read(_files(output_dir, (".csv",)), output_dir)),
+        "memory_map"  : digest(memories),
+    }
+
+
+def fingerprint(job: BuildJob, timeout: float | None = None) -> tuple[BuildJob, dict[str, str | None] | None, str]:
+    result = run_job(job, timeout)
+    if not result.ok:
+        return job, None, summarize_failure(result)
+    help_cmd = (job.cmd[0], "-m", f"litex_boards.targets.{job.name}", "--help")
+    help_output = subprocess.run(help_cmd, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True).stdout
+    return job, collect_fingerprints(job.output_dir, help_output), ""
+
+
+def fingerprint_key(name: str, versions: dict[str, str | None]) -> str:
+    # Keyed like the build cache: target sources, local imports, package versions and arguments.
+    return f"{FINGERPRINT_VERSION}:{cache_key(target_job(name), versions)}"
+
+
+def load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+
+
+def write_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(fingerprints: dict[str, dict], golden: dict[str, dict]) -> dict[str, list[str]]:
+    """Return {target: [changed artifacts]} for targets whose fingerprints differ from the golden ones."""
+    changes = {}
+    for name, current in sorted(fingerprints.items()):
+        reference = golden.get(name)
+        if reference is None:
+            changes[name] = ["new"]
+            continue
+        changed = [
+            artifact for artifact in sorted(set(current) | set(reference))
+            if current.get(artifact) != reference.get(artifact)
+        ]
+        if changed:
+            changes[name] = changed
+    return changes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fingerprint the default no-compile build of LiteX-Boards targets")
+    parser.add_argument("names", nargs="*", help="Targets to fingerprint; defaults to all targets built by the test suite")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Number of targets to elaborate concurrently")
+    parser.add_argument("--timeout", type=float, default=None, help="Timeout per target in seconds")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN_PATH, help="Golden fingerprints JSON file")
+    parser.add_argument("--write", action="store_true", help="Record the fingerprints as the new golden reference")
+    parser.add_argument("--cache-path", type=Path, default=DEFAULT_CACHE_PATH, help="Fingerprint cache JSON file")
+    parser.add_argument("--force-rebuild", action="store_true", help="Ignore cached fingerprints")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Root directory for build outputs")
+    args = parser.parse_args()
+
+    excluded = collect_exclusions("TARGET_EXCLUSIONS")
+    names    = args.names or [name for name in python_module_names(TARGETS_DIR) if name not in excluded]
+    versions = package_versions()
+    cache    = {} if args.force_rebuild else load_json(args.cache_path)
+
+    fingerprints = {}
+    failures     = {}
+    pending      = []
+    for name in names:
+        entry = cache.get(name)
+        key   = fingerprint_key(name, versions)
+        if entry is not None and entry["key"] == key:
+            fingerprints[name] = entry["fingerprints"]
+        else:
+            pending.append((key, fingerprint_job(name, args.output_dir)))
+    print(f"{len(names) - len(pending)}/{len(names)} fingerprints reused from cache.", flush=True)
+
+    keys = {job.name: key for key, job in pending}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs or default_jobs())) as executor:
+        futures = [executor.submit(fingerprint, job, args.timeout) for _, job in pending]
+        for future in as_completed(futures):
+            job, result, failure = future.result()
+            if result is None:
+                failures[job.name] = failure
+                print(f"FAIL {job.name}: {failure}", flush=True)
+                continue
+            fingerprints[job.name] = result
+            cache[job.name] = {"key": keys[job.name], "fingerprints": result}
+            print(f"done {job.name}", flush=True)
+    write_json(args.cache_path, cache)
+
+    if args.write:
+        write_json(args.golden, {**load_json(args.golden), **fingerprints})
+        print(f"Wrote {len(fingerprints)} fingerprints to {args.golden}.")
+        return 1 if failures else 0
+
+    changes = compare(fingerprints, load_json(args.golden))
+    for name, artifacts in changes.items():
+        print(f"CHANGED {name}: {', '.join(artifacts)}")
+    if not changes and not failures:
+        print(f"{len(fingerprints)} targets match the golden fingerprints.")
+    return 1 if changes or failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
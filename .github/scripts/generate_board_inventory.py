@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import ast
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from board_index import OptionInfo, load_index
+
 
 ROOT = Path(__file__).resolve().parents[2]
 TARGETS_DIR = ROOT / "litex_boards" / "targets"
@@ -41,73 +45,12 @@ class BoardInfo:
     target_test: str
 
 
-def _expr_text(node: ast.AST | None) -> str:
-    if node is None:
-        return ""
-    try:
-        return ast.unparse(node)
-    except Exception:
-        return ""
-
-
-def _string_value(node: ast.AST | None) -> str | None:
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return node.value
-    return None
-
-
-def _keyword(call: ast.Call, name: str) -> ast.AST | None:
-    for kw in call.keywords:
-        if kw.arg == name:
-            return kw.value
-    return None
-
-
-def _call_name(node: ast.Call) -> str | None:
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    return None
-
-
-def _option_names(call: ast.Call) -> tuple[str, ...]:
-    names = []
-    for arg in call.args:
-        value = _string_value(arg)
-        if value is None:
-            break
-        if value.startswith("--"):
-            names.append(value)
-    return tuple(names)
-
-
-def collect_target_options(path: Path) -> dict[str, ast.Call]:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    options: dict[str, ast.Call] = {}
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
-        if _call_name(node) not in {"add_target_argument", "add_argument"}:
-            continue
-        for name in _option_names(node):
-            options[name] = node
-    return options
+def collect_target_options(path: Path) -> dict[str, OptionInfo]:
+    return {name: option for option in load_index().target(path).options for name in option.names}
 
 
 def collect_platform_imports(path: Path) -> tuple[str, ...]:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    platforms: set[str] = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom) and node.module == "litex_boards.platforms":
-            platforms.update(alias.name for alias in node.names)
-        elif (
-            isinstance(node, ast.ImportFrom)
-            and node.module is not None
-            and node.module.startswith("litex_boards.platforms.")
-        ):
-            platforms.add(node.module.removeprefix("litex_boards.platforms."))
-    return tuple(sorted(platforms))
+    return load_index().target(path).platform_imports
 
 
 def collect_platform_toolchains(platforms: tuple[str, ...]) -> tuple[str, ...]:
@@ -116,36 +59,23 @@ def collect_platform_toolchains(platforms: tuple[str, ...]) -> tuple[str, ...]:
         path = PLATFORMS_DIR / f"{platform}.py"
         if not path.exists():
             continue
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.FunctionDef) or node.name != "__init__":
-                continue
-            for arg, default in zip(reversed(node.args.args), reversed(node.args.defaults)):
-                if arg.arg == "toolchain":
-                    value = _string_value(default)
-                    if value is not None:
-                        toolchains.add(value)
+        toolchains.update(load_index().platform(path).toolchains)
     return tuple(sorted(toolchains))
 
 
 def _collect_structured_target_exclusions(path: Path) -> dict[str, str]:
-    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    for node in tree.body:
-        if not isinstance(node, ast.Assign):
+    value = load_index().exclusions(path).get("TARGET_EXCLUSIONS")
+    if value is None:
+        return {}
+    exclusions = {}
+    for name, record in value.items():
+        if not isinstance(record, dict) or "reason" not in record:
             continue
-        if not any(isinstance(target, ast.Name) and target.id == "TARGET_EXCLUSIONS" for target in node.targets):
-            continue
-        value = ast.literal_eval(node.value)
-        exclusions = {}
-        for name, record in value.items():
-            if not isinstance(record, dict) or "reason" not in record:
-                continue
-            reason = record["reason"]
-            if record.get("category") == "external_toolchain":
-                reason = f"toolchain-gated: {reason}"
-            exclusions[name] = reason
-        return exclusions
-    return {}
+        reason = record["reason"]
+        if record.get("category") == "external_toolchain":
+            reason = f"toolchain-gated: {reason}"
+        exclusions[name] = reason
+    return exclusions
 
 
 def _collect_legacy_target_exclusions(path: Path) -> dict[str, str]:
@@ -177,7 +107,7 @@ def collect_board_info(target_path: Path, target_test_exclusions: dict[str, str]
     platforms = collect_platform_imports(target_path)
     sys_clk = "default"
     if "--sys-clk-freq" in options:
-        sys_clk = _expr_text(_keyword(options["--sys-clk-freq"], "default")) or "default"
+        sys_clk = options["--sys-clk-freq"].default or "default"
     features = tuple(label for option, label in FEATURE_OPTIONS.items() if option in options)
     return BoardInfo(
         target=target_path.stem,
@@ -231,6 +161,7 @@ def main() -> int:
     args = parser.parse_args()
 
     rendered = render_inventory(collect_inventory())
+    load_index().save()
     if args.check:
         if not INVENTORY_PATH.exists():
             return 1
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from board_index import PLATFORMS_DIR, ROOT, TARGETS_DIR, PlatformRecord, TargetRecord, load_index
+
+
+REGISTRY_PATH = ROOT / "litex_boards" / "boards.json"
+
+
+def _exclusion_categories(name: str) -> dict[str, str]:
+    value = load_index().exclusions().get(name) or {}
+    return {
+        board: record["category"]
+        for board, record in value.items()
+        if isinstance(record, dict) and "category" in record
+    }
+
+
+def target_features(record: TargetRecord) -> list[str]:
+    features = []
+    for option in record.options:
+        for name in option.names:
+            if name.startswith("--with-"):
+                features.append(name[len("--with-"):])
+    return sorted(set(features))
+
+
+def target_sys_clk_freq(record: TargetRecord) -> float | None:
+    option = record.option("--sys-clk-freq")
+    if option is None or isinstance(option.default_value, bool):
+        return None
+    if isinstance(option.default_value, (int, float)):
+        return float(option.default_value)
+    return None
+
+
+def target_entry(record: TargetRecord, platforms: dict[str, PlatformRecord], exclusion: str | None) -> dict:
+    imported   = [platforms[name] for name in record.platform_imports if name in platforms]
+    devices    = [device for platform in imported for device in platform.devices]
+    toolchains = sorted({toolchain for platform in imported for toolchain in platform.toolchains})
+    return {
+        "platforms"    : list(record.platform_imports),
+        "device"       : devices[0] if devices else None,
+        "toolchains"   : toolchains,
+        "sys_clk_freq" : target_sys_clk_freq(record),
+        "features"     : target_features(record),
+        "exclusion"    : exclusion,
+    }
+
+
+def platform_entry(record: PlatformRecord, exclusion: str | None) -> dict:
+    return {
+        "devices"          : list(record.devices),
+        "toolchains"       : list(record.toolchains),
+        "default_clk_name" : record.default_clk_name,
+        "default_clk_freq" : record.default_clk_freq,
+        "exclusion"        : exclusion,
+    }
+
+
+def collect_registry(targets_dir: Path = TARGETS_DIR, platforms_dir: Path = PLATFORMS_DIR) -> dict:
+    index = load_index()
+    target_exclusions   = _exclusion_categories("TARGET_EXCLUSIONS")
+    platform_exclusions = _exclusion_categories("PLATFORM_EXCLUSIONS")
+    platforms = {record.name: record for _, record in index.platforms(platforms_dir)}
+    return {
+        "targets": {
+            record.name: target_entry(record, platforms, target_exclusions.get(record.name))
+            for _, record in index.targets(targets_dir)
+        },
+        "platforms": {
+            name: platform_entry(record, platform_exclusions.get(name))
+            for name, record in platforms.items()
+        },
+    }
+
+
+def render_registry(registry: dict) -> str:
+    return json.dumps(registry, indent=1, sort_keys=True) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the LiteX-Boards board registry (litex_boards/boards.json)")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if the registry is out of date")
+    args = parser.parse_args()
+
+    rendered = render_registry(collect_registry())
+    load_index().save()
+    if args.check:
+        if not REGISTRY_PATH.exists() or REGISTRY_PATH.read_text(encoding="utf-8") != rendered:
+            print(f"{REGISTRY_PATH.relative_to(ROOT)} is out of date, run {Path(__file__).relative_to(ROOT)}.")
+            return 1
+        return 0
+
+    REGISTRY_PATH.write_text(rendered, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
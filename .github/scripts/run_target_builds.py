@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+ROOT = Path(__file__).resolve().parents[2]
+TARGETS_DIR = ROOT / "litex_boards" / "targets"
+PLATFORMS_DIR = ROOT / "litex_boards" / "platforms"
+TEST_TARGETS_PATH = ROOT / "test" / "test_targets.py"
+DEFAULT_OUTPUT_DIR = ROOT / "build" / "test_targets"
+DEFAULT_CACHE_PATH = ROOT / "build" / "test_targets_cache.json"
+
+CACHE_PACKAGES = ("litex", "litedram", "liteeth", "litepcie")
+
+# Changes to these files can affect every build, so they always select the full sweep.
+FULL_SWEEP_PATHS = (
+    "setup.py",
+    "test/test_targets.py",
+    ".github/scripts/run_target_builds.py",
+)
+
+TARGET_ARGS = (
+    "--cpu-type=vexriscv",
+    "--cpu-variant=minimal",
+    "--uart-name=stub",
+    "--build",
+    "--no-compile",
+)
+
+PLATFORM_ARGS = (
+    "--build",
+    "--no-compile",
+    "--uart-name=stub",
+)
+
+
+@dataclass(frozen=True)
+class BuildJob:
+    kind: str
+    name: str
+    cmd: tuple[str, ...]
+    output_dir: Path
+
+
+@dataclass(frozen=True)
+class BuildResult:
+    job: BuildJob
+    returncode: int
+    output: str
+    duration: float
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+def default_jobs() -> int:
+    value = os.getenv("LITEX_BOARDS_TEST_JOBS")
+    if value:
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def python_module_names(directory: Path) -> list[str]:
+    return sorted(
+        path.stem
+        for path in directory.glob("*.py")
+        if path.name != "__init__.py"
+    )
+
+
+def collect_exclusions(name: str, path: Path = TEST_TARGETS_PATH) -> set[str]:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(isinstance(target, ast.Name) and target.id == name for target in node.targets):
+            return set(ast.literal_eval(node.value))
+    return set()
+
+
+def target_job(name: str, output_root: Path = DEFAULT_OUTPUT_DIR, extra_args: Iterable[str] = ()) -> BuildJob:
+    output_dir = output_root / "targets" / name
+    return BuildJob(
+        kind       = "target",
+        name       = name,
+        cmd        = (
+            sys.executable,
+            "-m", f"litex_boards.targets.{name}",
+            *TARGET_ARGS,
+            *extra_args,
+            "--output-dir", str(output_dir),
+        ),
+        output_dir = output_dir,
+    )
+
+
+def platform_job(name: str, output_root: Path = DEFAULT_OUTPUT_DIR) -> BuildJob:
+    output_dir = output_root / "platforms" / name
+    return BuildJob(
+        kind       = "platform",
+        name       = name,
+        cmd        = (
+            sys.executable,
+            "-m", "litex_boards.targets.simple",
+            f"litex_boards.platforms.{name}",
+            *PLATFORM_ARGS,
+            "--output-dir", str(output_dir),
+        ),
+        output_dir = output_dir,
+    )
+
+
+def module_path(module: str) -> Path | None:
+    if module != "litex_boards" and not module.startswith("litex_boards."):
+        return None
+    base = ROOT.joinpath(*module.split("."))
+    for path in [base.with_suffix(".py"), base / "__init__.py"]:
+        if path.exists():
+            return path
+    return None
+
+
+def collect_local_imports(path: Path) -> set[Path]:
+    return _collect_local_imports(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _collect_local_imports(path: Path, mtime_ns: int) -> frozenset[Path]:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module is not None:
+            modules.add(node.module)
+            modules.update(f"{node.module}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+    paths = {module_path(module) for module in modules}
+    return frozenset(path for path in paths if path is not None)
+
+
+def collect_dependencies(path: Path) -> set[Path]:
+    dependencies: set[Path] = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        if current in dependencies:
+            continue
+        dependencies.add(current)
+        pending.extend(collect_local_imports(current))
+    return dependencies
+
+
+def job_sources(job: BuildJob) -> set[Path]:
+    if job.kind == "platform":
+        return collect_dependencies(TARGETS_DIR / "simple.py") | collect_dependencies(PLATFORMS_DIR / f"{job.name}.py")
+    return collect_dependencies(TARGETS_DIR / f"{job.name}.py")
+
+
+def changed_files(rev: str) -> set[Path]:
+    tracked = subprocess.run(
+        ["git", "diff", "--name-only", rev, "--"],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True, check=True,
+    ).stdout.split()
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True, check=True,
+    ).stdout.split()
+    return {ROOT / name for name in tracked + untracked}
+
+
+def select_affected(jobs: Iterable[BuildJob], changed: Iterable[Path]) -> list[BuildJob]:
+    jobs    = list(jobs)
+    changed = {path.resolve() for path in changed}
+    if any((ROOT / name).resolve() in changed for name in FULL_SWEEP_PATHS):
+        return jobs
+    return [job for job in jobs if job_sources(job) & changed]
+
+
+def package_versions() -> dict[str, str | None]:
+    versions = {}
+    for package in CACHE_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def job_arguments(job: BuildJob) -> tuple[str, ...]:
+    # The interpreter path and output directory do not change the generated design.
+    args = list(job.cmd[1:])
+    if "--output-dir" in args:
+        index = args.index("--output-dir")
+        del args[index:index + 2]
+    return tuple(args)
+
+
+def cache_key(job: BuildJob, versions: dict[str, str | None] | None = None) -> str:
+    if versions is None:
+        versions = package_versions()
+    sources = {
+        str(path.relative_to(ROOT)): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(job_sources(job))
+    }
+    payload = {
+        "args"     : job_arguments(job),
+        "python"   : list(sys.version_info[:2]),
+        "sources"  : sources,
+        "versions" : versions,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class BuildCache:
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, force_rebuild: bool = False):
+        self.path          = path
+        self.force_rebuild = force_rebuild
+        self.versions      = package_versions()
+        self.entries       = {}
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                self.entries = {}
+
+    def key(self, job: BuildJob) -> str:
+        return cache_key(job, self.versions)
+
+    def hit(self, job: BuildJob) -> bool:
+        return not self.force_rebuild and self.key(job) in self.entries
+
+    def record(self, result: BuildResult):
+        if not result.ok or result.cached:
+            return
+        self.entries[self.key(result.job)] = {
+            "kind"     : result.job.kind,
+            "name"     : result.job.name,
+            "duration" : round(result.duration, 3),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def default_cache() -> BuildCache | None:
+    if os.getenv("LITEX_BOARDS_TEST_NO_CACHE"):
+        return None
+    return BuildCache(force_rebuild=bool(os.getenv("LITEX_BOARDS_TEST_FORCE_REBUILD")))
+
+
+def run_job(job: BuildJob, timeout: float | None = None) -> BuildResult:
+    shutil.rmtree(job.output_dir, ignore_errors=True)
+    start = time.monotonic()
+    try:
+        result = subprocess.run(
+            job.cmd,
+            cwd     = ROOT,
+            stdout  = subprocess.PIPE,
+            stderr  = subprocess.STDOUT,
+            text    = True,
+            timeout = timeout,
+        )
+        returncode, output = result.returncode, result.stdout
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        returncode, output = -1, output + f"\nTimed out after {timeout}s."
+    return BuildResult(job=job, returncode=returncode, output=output, duration=time.monotonic() - start)
+
+
+def run_jobs(
+    jobs    : Iterable[BuildJob],
+    workers : int | None = None,
+    timeout : float | None = None,
+    cache   : BuildCache | None = None,
+) -> Iterator[BuildResult]:
+    pending = []
+    for job in jobs:
+        if cache is not None and cache.hit(job):
+            yield BuildResult(job=job, returncode=0, output="", duration=0.0, cached=True)
+        else:
+            pending.append(job)
+    if not pending:
+        return
+    # Each job is a separate interpreter, so threads are enough to keep every worker busy.
+    workers = max(1, min(workers or default_jobs(), len(pending)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_job, job, timeout) for job in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                if cache is not None:
+                    cache.record(result)
+                yield result
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def slowest(results: Iterable[BuildResult], count: int = 10) -> list[BuildResult]:
+    return sorted(results, key=lambda result: result.duration, reverse=True)[:count]
+
+
+def summarize_failure(result: BuildResult) -> str:
+    lines = [line for line in result.output.splitlines() if line.strip()]
+    return " | ".join(lines[-4:])
+
+
+def render_summary(results: list[BuildResult], count: int = 10) -> str:
+    failed = [result for result in results if not result.ok]
+    cached = [result for result in results if result.cached]
+    built  = [result for result in results if not result.cached]
+    lines = [f"{len(results) - len(failed)}/{len(results)} builds passed ({len(cached)} cached)."]
+    if built:
+        lines.append(f"Slowest {min(count, len(built))}:")
+        for result in slowest(built, count):
+            lines.append(f"  {result.duration:8.2f}s {result.job.kind:<8} {result.job.name}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run LiteX-Boards no-compile builds in parallel")
+    parser.add_argument("names", nargs="*", help="Targets (or platforms with --platforms) to build; defaults to all")
+    parser.add_argument("--platforms", action="store_true", help="Build platforms with the simple target instead of targets")
+    parser.add_argument("--all",       action="store_true", help="Include targets/platforms excluded in test/test_targets.py")
+    parser.add_argument("--jobs", "-j", type=int, default=default_jobs(), help="Number of builds to run concurrently")
+    parser.add_argument("--timeout", type=float, default=None, help="Timeout per build in seconds")
+    parser.add_argument("--slowest", type=int, default=10, help="Number of slowest builds to list in the summary")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Root directory for per-build outputs")
+    parser.add_argument("--changed-since", metavar="REV", help="Only build targets/platforms affected by changes since a git revision")
+    parser.add_argument("--list",          action="store_true", help="List the selected targets/platforms without building them")
+    parser.add_argument("--cache-path", type=Path, default=DEFAULT_CACHE_PATH, help="Elaboration cache file")
+    parser.add_argument("--no-cache",      action="store_true", help="Do not read or update the elaboration cache")
+    parser.add_argument("--force-rebuild", action="store_true", help="Rebuild every selected target and refresh the cache")
+    args = parser.parse_args()
+
+    if args.platforms:
+        excluded = set() if args.all else collect_exclusions("PLATFORM_EXCLUSIONS")
+        names = args.names or [name for name in python_module_names(PLATFORMS_DIR) if name not in excluded]
+        jobs = [platform_job(name, args.output_dir) for name in names]
+    else:
+        excluded = {"simple"} if args.all else collect_exclusions("TARGET_EXCLUSIONS")
+        names = args.names or [name for name in python_module_names(TARGETS_DIR) if name not in excluded]
+        jobs = [target_job(name, args.output_dir) for name in names]
+
+    if args.changed_since:
+        jobs = select_affected(jobs, changed_files(args.changed_since))
+
+    if args.list:
+        for job in jobs:
+            print(job.name)
+        return 0
+
+    cache = None if args.no_cache else BuildCache(args.cache_path, force_rebuild=args.force_rebuild)
+
+    results = []
+    for result in run_jobs(jobs, workers=args.jobs, timeout=args.timeout, cache=cache):
+        results.append(result)
+        status = "ok  " if result.ok else "FAIL"
+        if result.cached:
+            status = "cached"
+        print(f"{status:<6} {result.duration:8.2f}s {result.job.kind} {result.job.name}", flush=True)
+        if not result.ok:
+            print(f"       {summarize_failure(result)}", flush=True)
+
+    print("")
+    print(render_summary(results, args.slowest))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Elaboration profiling of target entry points.
+#
+# python3 -m litex_boards.targets.<board> --profile-elaboration [--profile-output=<file>] [target args]
+# python3 -m litex_boards.profiling [--profile-output=<file>] <board> [target args]
+#
+# Reports time and net allocations of the main elaboration phases (CRG, SoCCore, SDRAM/PCIe/Ethernet/
+# HBM integration, SoC finalize, Verilog/constraints emission). --profile-output writes a cProfile
+# dump (.pstats/.prof) or a speedscope phase timeline (.json). Targets add the options with
+# add_profiling_args() and call profile_elaboration() once parsed: the hooks are only installed when
+# --profile-elaboration is given.
+
+import atexit
+import argparse
+import functools
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+
+# (module, class or None, function) wrapped as "<label>" phases.
+PHASES = [
+    ("litex.soc.integration.soc_core",       "SoCCore",         "__init__",                   "SoCCore.__init__"),
+    ("litex.soc.integration.soc",            "LiteXSoC",        "add_sdram",                  "add_sdram"),
+    ("litex.soc.integration.soc",            "LiteXSoC",        "add_pcie",                   "add_pcie"),
+    ("litex.soc.integration.soc",            "LiteXSoC",        "add_ethernet",               "add_ethernet"),
+    ("litex.soc.integration.soc",            "LiteXSoC",        "add_etherbone",              "add_etherbone"),
+    ("litex.soc.integration.soc",            "SoC",             "finalize",                   "SoC finalize"),
+    ("litex.soc.cores.ram.xilinx_usp_hbm2",  "USPHBM2",         "__init__",                   "USPHBM2.__init__"),
+    ("litex.soc.cores.ram.xilinx_usp_hbm2",  None,              "add_usphbm2_pseudochannels", "add_usphbm2_pseudochannels"),
+    ("litex.build.generic_platform",         "GenericPlatform", "get_verilog",                "Verilog emission"),
+    ("litex.soc.integration.builder",        "Builder",         "build",                      "Builder.build"),
+]
+
+# Toolchain methods emitting constraint files; vendor toolchains override them, so every subclass is wrapped.
+CONSTRAINT_METHODS = ["build_io_constraints", "build_timing_constraints", "build_placement_constraints"]
+
+# Elaboration Profiler -----------------------------------------------------------------------------
+
+class ElaborationProfiler:
+    def __init__(self, output=None):
+        self.output   = output
+        self.start    = time.perf_counter()
+        self.stats    = {}
+        self.events   = []
+        self.frames   = {}
+        self.cprofile = None
+
+    def wrap(self, label, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self._event("O", label)
+            t0 = time.perf_counter()
+            m0 = tracemalloc.get_traced_memory()[0]
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - t0
+                alloc   = tracemalloc.get_traced_memory()[0] - m0
+                calls, total_time, total_alloc = self.stats.get(label, (0, 0.0, 0))
+                self.stats[label] = (calls + 1, total_time + elapsed, total_alloc + alloc)
+                self._event("C", label)
+        wrapper._litex_boards_profiled = True
+        return wrapper
+
+    def _event(self, kind, label):
+        frame = self.frames.setdefault(label, len(self.frames))
+        self.events.append({"type": kind, "frame": frame, "at": time.perf_counter() - self.start})
+
+    def patch(self, owner, name, label):
+        function = getattr(owner, name, None)
+        if function is None or getattr(function, "_litex_boards_profiled", False):
+            return
+        setattr(owner, name, self.wrap(label, function))
+
+    def install(self):
+        tracemalloc.start()
+        if self.output is not None and not self.output.endswith(".json"):
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+        for module_name, class_name, name, label in PHASES:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            owner = module if class_name is None else getattr(module, class_name, None)
+            if owner is not None:
+                self.patch(owner, name, label)
+
+        # Constraint emission: wrap toolchains lazily, once they have been imported by the platform.
+        from litex.soc.integration.builder import Builder
+        build = Builder.build
+        def patch_toolchains_and_build(builder, *args, **kwargs):
+            self.patch_toolchains()
+            return build(builder, *args, **kwargs)
+        Builder.build = functools.wraps(build)(patch_toolchains_and_build)
+        Builder.build._litex_boards_profiled = True
+
+        atexit.register(self.report)
+
+    def patch_crgs(self, module):
+        """Wrap the constructors of the CRG classes defined in the target `module`."""
+        from migen.fhdl.module import Module
+        for name, cls in vars(module).items():
+            if (isinstance(cls, type) and issubclass(cls, Module) and name.endswith("CRG") and
+                cls.__module__ == module.__name__ and "__init__" in cls.__dict__):
+                self.patch(cls, "__init__", f"{name} construction")
+
+    def patch_toolchains(self):
+        from litex.build.generic_toolchain import GenericToolchain
+        pending = [GenericToolchain]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            for name in CONSTRAINT_METHODS:
+                if name in cls.__dict__:
+                    self.patch(cls, name, "Constraints emission")
+
+    def render(self):
+        total = time.perf_counter() - self.start
+        lines = [
+            f"{'Phase':<32} {'Calls':>5} {'Time (s)':>10} {'% total':>8} {'Net alloc (MiB)':>16}",
+            "-"*75,
+        ]
+        for label, (calls, elapsed, alloc) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{label:<32} {calls:>5} {elapsed:>10.3f} {100*elapsed/total:>7.1f}% {alloc/2**20:>16.1f}")
+        lines.append("-"*75)
+        lines.append(f"{'Total (inclusive phases)':<32} {'':>5} {total:>10.3f}")
+        return "\n".join(lines)
+
+    def write_speedscope(self, filename):
+        frames = sorted(self.frames, key=self.frames.get)
+        profile = {
+            "$schema"  : "https://www.speedscope.app/file-format-schema.json",
+            "shared"   : {"frames": [{"name": frame} for frame in frames]},
+            "profiles" : [{
+                "type"       : "evented",
+                "name"       : "LiteX elaboration",
+                "unit"       : "seconds",
+                "startValue" : 0,
+                "endValue"   : time.perf_counter() - self.start,
+                "events"     : self.events,
+            }],
+            "exporter" : "litex_boards.profiling",
+        }
+        with open(filename, "w") as f:
+            json.dump(profile, f)
+
+    def report(self):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        print("\nElaboration profile:")
+        print(self.render())
+        if self.output is None:
+            return
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(self.output)
+        else:
+            self.write_speedscope(self.output)
+        print(f"Profile written to {self.output}.")
+
+# Target Hook --------------------------------------------------------------------------------------
+
+def add_profiling_args(parser):
+    """Add the --profile-elaboration/--profile-output options to a target parser."""
+    parser.add_target_argument("--profile-elaboration", action="store_true", help="Report time/allocations of the elaboration phases.")
+    parser.add_target_argument("--profile-output",      default=None,        help="With --profile-elaboration, write a cProfile dump (.pstats/.prof) or a speedscope timeline (.json).")
+
+def profile_elaboration(args, module_name):
+    """Install the elaboration profiler when --profile-elaboration is given (before elaboration).
+
+    `module_name` is the target module (`__name__` of its main()), whose CRG classes are profiled.
+    """
+    if not args.profile_elaboration:
+        return None
+    profiler = ElaborationProfiler(output=args.profile_output)
+    profiler.install()
+    profiler.patch_crgs(sys.modules[module_name])
+    return profiler
+
+# Main ---------------------------------------------------------------------------------------------
+
+def target_module_name(target):
+    """Accept a board name (sqrl_xcu1525), a target file or a full module name."""
+    if target.endswith(".py"):
+        target = target.replace("\\", "/").rsplit("/", 1)[-1][:-3]
+    if "." not in target:
+        target = f"litex_boards.targets.{target}"
+    return target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the elaboration of a LiteX-Boards target.")
+    parser.add_argument("--profile-output", default=None, help="Write a cProfile dump (.pstats/.prof) or a speedscope timeline (.json).")
+    parser.add_argument("target",                         help="Target (board name or litex_boards.targets.<board> module).")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Target arguments.")
+    args = parser.parse_args(argv)
+
+    # Run the target main() with --profile-elaboration (see profile_elaboration()).
+    module   = importlib.import_module(target_module_name(args.target))
+    sys.argv = [module.__file__] + args.args + ["--profile-elaboration"]
+    if args.profile_output is not None:
+        sys.argv += ["--profile-output", args.profile_output]
+    module.main()
+
+if __name__ == "__main__":
+    main()
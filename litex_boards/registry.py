@@ -0,0 +1,135 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Board registry: lists targets and platforms with their metadata without importing them.
+#
+# from litex_boards import registry
+# for target in registry.targets().values():
+#     print(target.name, target.device, target.toolchains, target.features)
+# BaseSoC = registry.target("digilent_arty").soc_class()
+#
+# Metadata comes from boards.json, generated from the target/platform sources (and test exclusions) by
+# .github/scripts/generate_board_registry.py; modules are only imported when a class is requested.
+
+import functools
+import importlib
+import json
+import os
+from dataclasses import dataclass
+
+REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "boards.json")
+
+# Target / Platform Info ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TargetInfo:
+    name         : str
+    platforms    : tuple
+    device       : str   = None
+    toolchains   : tuple = ()
+    sys_clk_freq : float = None
+    features     : tuple = ()
+    exclusion    : str   = None # Category of the no-compile test exclusion, None when tested.
+
+    @property
+    def module_name(self):
+        return f"litex_boards.targets.{self.name}"
+
+    def module(self):
+        return importlib.import_module(self.module_name)
+
+    def soc_class(self):
+        return self.module().BaseSoC
+
+
+@dataclass(frozen=True)
+class PlatformInfo:
+    name             : str
+    devices          : tuple = ()
+    toolchains       : tuple = ()
+    default_clk_name : str   = None
+    default_clk_freq : float = None
+    exclusion        : str   = None
+
+    @property
+    def device(self):
+        return self.devices[0] if self.devices else None
+
+    @property
+    def module_name(self):
+        return f"litex_boards.platforms.{self.name}"
+
+    def module(self):
+        return importlib.import_module(self.module_name)
+
+    def platform_class(self):
+        return self.module().Platform
+
+# Registry -----------------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _load(path=REGISTRY_PATH):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    targets = {
+        name: TargetInfo(
+            name         = name,
+            platforms    = tuple(entry["platforms"]),
+            device       = entry["device"],
+            toolchains   = tuple(entry["toolchains"]),
+            sys_clk_freq = entry["sys_clk_freq"],
+            features     = tuple(entry["features"]),
+            exclusion    = entry["exclusion"],
+        ) for name, entry in data["targets"].items()
+    }
+    platforms = {
+        name: PlatformInfo(
+            name             = name,
+            devices          = tuple(entry["devices"]),
+            toolchains       = tuple(entry["toolchains"]),
+            default_clk_name = entry["default_clk_name"],
+            default_clk_freq = entry["default_clk_freq"],
+            exclusion        = entry["exclusion"],
+        ) for name, entry in data["platforms"].items()
+    }
+    return targets, platforms
+
+
+def targets():
+    """Return {name: TargetInfo} for all board targets."""
+    return dict(_load()[0])
+
+
+def platforms():
+    """Return {name: PlatformInfo} for all board platforms."""
+    return dict(_load()[1])
+
+
+def target(name):
+    try:
+        return _load()[0][name]
+    except KeyError:
+        raise ValueError(f"Unknown target {name!r}.") from None
+
+
+def platform(name):
+    try:
+        return _load()[1][name]
+    except KeyError:
+        raise ValueError(f"Unknown platform {name!r}.") from None
+
+
+def find_targets(device=None, toolchain=None, feature=None):
+    """Return the targets matching all given criteria (device prefix, toolchain, --with-<feature>)."""
+    matches = []
+    for info in _load()[0].values():
+        if device is not None and not (info.device or "").lower().startswith(device.lower()):
+            continue
+        if toolchain is not None and toolchain not in info.toolchains:
+            continue
+        if feature is not None and feature not in info.features:
+            continue
+        matches.append(info)
+    return matches
@@ -0,0 +1,260 @@
+// This file is part of LiteX-Boards.
+// SPDX-License-Identifier: BSD-2-Clause
+//
+// SDRAM calibration cache (litex_boards/targets/sdramcalib): liblitedram's sdram_init() is built as
+// sdram_init_full() and this sdram_init_main() (main SDRAM part of sdram_init(), see sdram_channels.c)
+// first tries to restore the leveling results cached in the SPI Flash, only validated with a short
+// memtest. The full calibration is run when the cache is
+// invalid (not written yet, other bitstream) or when the memtest fails, and on all the subsequent
+// sdram_init calls (sdram_init BIOS command); its results are then saved to the SPI Flash.
+
+#include <generated/csr.h>
+#ifdef CSR_SDRAM_BASE
+#include <generated/mem.h>
+#include <generated/soc.h>
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+
+#include <libbase/crc.h>
+#include <libbase/memtest.h>
+
+#include <generated/sdram_phy.h>
+#include <system.h>
+
+#include <liblitedram/sdram.h>
+#include <liblitedram/accessors.h>
+
+int sdram_init_full(void);
+int sdram_init_main(void);
+
+#if defined(CSR_DDRPHY_BASE) && defined(CSR_SDRAM_CALIB_BASE) && \
+    defined(CSR_SPIFLASH_CORE_MASTER_CS_ADDR) && !defined(SDRAM_DELAY_PER_DQ)
+
+#include <liblitespi/spiflash.h>
+
+#define SDRAM_CALIB_CACHE_MAGIC   0x4344534c /* "LSDC" */
+#define SDRAM_CALIB_CACHE_VERSION 1
+
+struct sdram_calib_cache_module {
+	uint16_t rdly_dq;
+	uint16_t wdly_dq;
+	uint16_t wdly_dqs;
+	uint8_t  rdly_dq_bitslip;
+	uint8_t  wdly_dq_bitslip;
+};
+
+struct sdram_calib_cache {
+	uint32_t magic;
+	uint32_t version;
+	uint32_t ident;   /* CRC32 of the SoC identifier (changes with the bitstream). */
+	uint32_t modules;
+	uint16_t cdly;
+	uint8_t  rdphase;
+	uint8_t  wrphase;
+	struct sdram_calib_cache_module module[SDRAM_PHY_MODULES];
+	uint32_t crc;     /* CRC32 of the above. */
+};
+
+static int sdram_calib_cache_initialized;
+
+static uint32_t sdram_calib_cache_ident(void) {
+#ifdef CONFIG_IDENTIFIER
+	return crc32((const unsigned char *) CONFIG_IDENTIFIER, strlen(CONFIG_IDENTIFIER));
+#else
+	return 0;
+#endif // CONFIG_IDENTIFIER
+}
+
+/*-----------------------------------------------------------------------*/
+/* Capture/Restore                                                       */
+/*-----------------------------------------------------------------------*/
+
+static void sdram_calib_cache_capture(struct sdram_calib_cache *c) {
+	int module;
+
+	memset(c, 0, sizeof(*c));
+	c->magic   = SDRAM_CALIB_CACHE_MAGIC;
+	c->version = SDRAM_CALIB_CACHE_VERSION;
+	c->ident   = sdram_calib_cache_ident();
+	c->modules = SDRAM_PHY_MODULES;
+#ifdef CSR_SDRAM_CALIB_CDLY_ADDR
+	c->cdly    = sdram_calib_cdly_read();
+#endif // CSR_SDRAM_CALIB_CDLY_ADDR
+#ifdef CSR_DDRPHY_RDPHASE_ADDR
+	c->rdphase = ddrphy_rdphase_read();
+#endif // CSR_DDRPHY_RDPHASE_ADDR
+#ifdef CSR_DDRPHY_WRPHASE_ADDR
+	c->wrphase = ddrphy_wrphase_read();
+#endif // CSR_DDRPHY_WRPHASE_ADDR
+	for (module = 0; module < SDRAM_PHY_MODULES; module++) {
+		sdram_calib_sel_write(module);
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_ADDR
+		c->module[module].rdly_dq = sdram_calib_rdly_dq_read();
+#endif // CSR_SDRAM_CALIB_RDLY_DQ_ADDR
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_BITSLIP_ADDR
+		c->module[module].rdly_dq_bitslip = sdram_calib_rdly_dq_bitslip_read();
+#endif // CSR_SDRAM_CALIB_RDLY_DQ_BITSLIP_ADDR
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_ADDR
+		c->module[module].wdly_dq = sdram_calib_wdly_dq_read();
+#endif // CSR_SDRAM_CALIB_WDLY_DQ_ADDR
+#ifdef CSR_SDRAM_CALIB_WDLY_DQS_ADDR
+		c->module[module].wdly_dqs = sdram_calib_wdly_dqs_read();
+#endif // CSR_SDRAM_CALIB_WDLY_DQS_ADDR
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_BITSLIP_ADDR
+		c->module[module].wdly_dq_bitslip = sdram_calib_wdly_dq_bitslip_read();
+#endif // CSR_SDRAM_CALIB_WDLY_DQ_BITSLIP_ADDR
+	}
+	c->crc = crc32((const unsigned char *) c, offsetof(struct sdram_calib_cache, crc));
+}
+
+/* Pulse a (reset/increment) PHY CSR n times, letting the delays settle when needed. */
+#define sdram_calib_cache_pulse(csr_write, n, settle) do { \
+	int _i; \
+	for (_i = 0; _i < (n); _i++) { \
+		csr_write(1); \
+		if (settle) \
+			cdelay(100); \
+	} \
+} while (0)
+
+static void sdram_calib_cache_restore(const struct sdram_calib_cache *c) {
+	int module;
+
+#ifdef CSR_DDRPHY_CDLY_RST_ADDR
+	ddrphy_cdly_rst_write(1);
+	cdelay(100);
+	sdram_calib_cache_pulse(ddrphy_cdly_inc_write, c->cdly, 1);
+#endif // CSR_DDRPHY_CDLY_RST_ADDR
+	for (module = 0; module < SDRAM_PHY_MODULES; module++) {
+		const struct sdram_calib_cache_module *m = &c->module[module];
+		sdram_select(module, 0);
+#ifdef CSR_DDRPHY_RDLY_DQ_RST_ADDR
+		ddrphy_rdly_dq_rst_write(1);
+		sdram_calib_cache_pulse(ddrphy_rdly_dq_inc_write, m->rdly_dq, 0);
+#endif // CSR_DDRPHY_RDLY_DQ_RST_ADDR
+#ifdef CSR_DDRPHY_RDLY_DQ_BITSLIP_RST_ADDR
+		ddrphy_rdly_dq_bitslip_rst_write(1);
+		sdram_calib_cache_pulse(ddrphy_rdly_dq_bitslip_write, m->rdly_dq_bitslip, 0);
+#endif // CSR_DDRPHY_RDLY_DQ_BITSLIP_RST_ADDR
+#ifdef CSR_DDRPHY_WDLY_DQ_RST_ADDR
+		ddrphy_wdly_dq_rst_write(1);
+		cdelay(100);
+		sdram_calib_cache_pulse(ddrphy_wdly_dq_inc_write, m->wdly_dq, 1);
+#endif // CSR_DDRPHY_WDLY_DQ_RST_ADDR
+#ifdef CSR_DDRPHY_WDLY_DQS_INC_COUNT_ADDR
+		/* UltraScale DQS delays can't be reset, increment them around. */
+		while (ddrphy_wdly_dqs_inc_count_read() != 0) {
+			ddrphy_wdly_dqs_inc_write(1);
+			cdelay(100);
+		}
+		sdram_calib_cache_pulse(ddrphy_wdly_dqs_inc_write, m->wdly_dqs, 1);
+#elif defined(CSR_DDRPHY_WDLY_DQS_RST_ADDR)
+		ddrphy_wdly_dqs_rst_write(1);
+		cdelay(100);
+		sdram_calib_cache_pulse(ddrphy_wdly_dqs_inc_write, m->wdly_dqs, 1);
+#endif // CSR_DDRPHY_WDLY_DQS_INC_COUNT_ADDR
+#ifdef CSR_DDRPHY_WDLY_DQ_BITSLIP_RST_ADDR
+		ddrphy_wdly_dq_bitslip_rst_write(1);
+		sdram_calib_cache_pulse(ddrphy_wdly_dq_bitslip_write, m->wdly_dq_bitslip, 0);
+#endif // CSR_DDRPHY_WDLY_DQ_BITSLIP_RST_ADDR
+		sdram_deselect(module, 0);
+	}
+#ifdef CSR_DDRPHY_RDPHASE_ADDR
+	ddrphy_rdphase_write(c->rdphase);
+#endif // CSR_DDRPHY_RDPHASE_ADDR
+#ifdef CSR_DDRPHY_WRPHASE_ADDR
+	ddrphy_wrphase_write(c->wrphase);
+#endif // CSR_DDRPHY_WRPHASE_ADDR
+}
+
+/*-----------------------------------------------------------------------*/
+/* SPI Flash                                                             */
+/*-----------------------------------------------------------------------*/
+
+static const struct sdram_calib_cache *sdram_calib_cache_flash(void) {
+	return (const struct sdram_calib_cache *) (SPIFLASH_BASE + SDRAM_CALIB_CACHE_FLASH_OFFSET);
+}
+
+static int sdram_calib_cache_load(struct sdram_calib_cache *c) {
+	flush_cpu_dcache();
+	memcpy(c, sdram_calib_cache_flash(), sizeof(*c));
+	if (c->magic != SDRAM_CALIB_CACHE_MAGIC || c->version != SDRAM_CALIB_CACHE_VERSION)
+		return 0;
+	if (c->crc != crc32((const unsigned char *) c, offsetof(struct sdram_calib_cache, crc)))
+		return 0;
+	return (c->ident == sdram_calib_cache_ident()) && (c->modules == SDRAM_PHY_MODULES);
+}
+
+static void sdram_calib_cache_save(void) {
+	struct sdram_calib_cache c;
+
+	sdram_calib_cache_capture(&c);
+	flush_cpu_dcache();
+	if (memcmp(&c, sdram_calib_cache_flash(), sizeof(c)) == 0)
+		return;
+	printf("Saving SDRAM calibration to SPI Flash @0x%08lx...\n", (unsigned long) SDRAM_CALIB_CACHE_FLASH_OFFSET);
+	spiflash_erase_range(SDRAM_CALIB_CACHE_FLASH_OFFSET, SDRAM_CALIB_CACHE_FLASH_SIZE);
+	spiflash_write_stream(SDRAM_CALIB_CACHE_FLASH_OFFSET, (uint8_t *) &c, sizeof(c));
+	flush_cpu_dcache();
+}
+
+/*-----------------------------------------------------------------------*/
+/* Initialization                                                        */
+/*-----------------------------------------------------------------------*/
+
+static int sdram_init_cached(void) {
+	struct sdram_calib_cache c;
+
+	if (!sdram_calib_cache_load(&c))
+		return 0;
+
+	printf("Initializing SDRAM @0x%08lx (cached calibration)...\n", MAIN_RAM_BASE);
+	sdram_software_control_on();
+#if CSR_DDRPHY_RST_ADDR
+	ddrphy_rst_write(1);
+	cdelay(1000);
+	ddrphy_rst_write(0);
+	cdelay(1000);
+#endif // CSR_DDRPHY_RST_ADDR
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(0);
+	ddrctrl_init_error_write(0);
+#endif // CSR_DDRCTRL_BASE
+	init_sequence();
+	sdram_calib_cache_restore(&c);
+	sdram_software_control_off();
+
+	if (!memtest((unsigned int *) MAIN_RAM_BASE, SDRAM_CALIB_CACHE_MEMTEST_SIZE)) {
+		printf("Cached SDRAM calibration failed, recalibrating.\n");
+		return 0;
+	}
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(1);
+#endif // CSR_DDRCTRL_BASE
+	return 1;
+}
+
+int sdram_init_main(void) {
+	int first = !sdram_calib_cache_initialized;
+
+	sdram_calib_cache_initialized = 1;
+	if (first && sdram_init_cached())
+		return 1;
+	if (!sdram_init_full())
+		return 0;
+	sdram_calib_cache_save();
+	return 1;
+}
+
+#else
+
+int sdram_init_main(void) {
+	return sdram_init_full();
+}
+
+#endif // defined(CSR_DDRPHY_BASE) && defined(CSR_SDRAM_CALIB_BASE) && ...
+
+#endif // CSR_SDRAM_BASE
@@ -0,0 +1,12 @@
+// This file is part of LiteX-Boards.
+// SPDX-License-Identifier: BSD-2-Clause
+//
+// Force-included in the SDRAM channel build of liblitedram (sdram_channel.o, see Makefile): CSR
+// accesses are done relative to the CSR window of the channel being initialized.
+
+#ifndef __SDRAM_CHANNEL_H
+#define __SDRAM_CHANNEL_H
+
+extern unsigned long sdram_channel_csr_base;
+
+#endif /* __SDRAM_CHANNEL_H */
@@ -0,0 +1,108 @@
+// This file is part of LiteX-Boards.
+// SPDX-License-Identifier: BSD-2-Clause
+//
+// SDRAM channels (litex_boards/targets/sdramchannels): sdram_init() initializes and levels the extra
+// DRAM channels (sdram<N>/ddrphy<N>) then the main SDRAM (sdram_init_main(), see sdram_calib_cache.c).
+// Each channel has its CSR banks at the offsets of the main ones in its own CSR window
+// (SDRAM_CHANNEL<n>_CSR_BASE), so LiteX's sdram_init() is also built (as sdram_channel_init_full(),
+// see Makefile) with its CSR accesses relative to sdram_channel_csr_base. Channels are initialized
+// first since the main RAM can be interleaved over them.
+
+#include <generated/csr.h>
+#ifdef CSR_SDRAM_BASE
+#include <generated/soc.h>
+
+#include <stdint.h>
+#include <stdio.h>
+
+#include <libbase/memtest.h>
+
+#include <system.h>
+
+#include <liblitedram/sdram.h>
+
+int sdram_init_main(void);
+
+#ifdef SDRAM_CHANNELS
+
+#define SDRAM_CHANNEL_READY_TIMEOUT 1000 /* In ms. */
+
+/* sdram<N>_ready/init_done CSRs (SoC CSR bus) of the n-th channel. */
+#define _SDRAM_CHANNEL_CAT(a, b, c) a ## b ## c
+#define SDRAM_CHANNEL_CAT(a, b, c)  _SDRAM_CHANNEL_CAT(a, b, c)
+#define SDRAM_CHANNEL_READY_ADDR(n) SDRAM_CHANNEL_CAT(CSR_SDRAM, SDRAM_CHANNEL ## n, _READY_ADDR)
+#define SDRAM_CHANNEL_INIT_DONE_ADDR(n) SDRAM_CHANNEL_CAT(CSR_SDRAM, SDRAM_CHANNEL ## n, _INIT_DONE_ADDR)
+
+struct sdram_channel {
+	int channel;
+	unsigned long csr_base;
+	unsigned long ready_addr;
+	unsigned long init_done_addr;
+	uint64_t base;
+	uint64_t size;
+};
+
+#define SDRAM_CHANNEL_ENTRY(n) { \
+	SDRAM_CHANNEL ## n, SDRAM_CHANNEL ## n ## _CSR_BASE, SDRAM_CHANNEL_READY_ADDR(n), SDRAM_CHANNEL_INIT_DONE_ADDR(n), \
+	SDRAM_CHANNEL ## n ## _BASE, SDRAM_CHANNEL ## n ## _SIZE }
+
+static const struct sdram_channel sdram_channels[] = {
+	SDRAM_CHANNEL_ENTRY(1),
+#if SDRAM_CHANNELS > 2
+	SDRAM_CHANNEL_ENTRY(2),
+#endif
+#if SDRAM_CHANNELS > 3
+	SDRAM_CHANNEL_ENTRY(3),
+#endif
+};
+
+unsigned long sdram_channel_csr_base;
+
+int sdram_channel_init_full(void);
+
+static int sdram_channel_init(const struct sdram_channel *c) {
+	int timeout;
+
+	printf("Initializing SDRAM channel %d...\n", c->channel);
+	csr_write_simple(0, c->init_done_addr);
+	/* Channel clocked from its own reference: wait for its MMCM/IDELAYCTRL. */
+	for (timeout = SDRAM_CHANNEL_READY_TIMEOUT; !csr_read_simple(c->ready_addr); timeout--) {
+		if (timeout == 0) {
+			printf("SDRAM channel %d not ready (clock not locked).\n", c->channel);
+			return 0;
+		}
+		busy_wait(1);
+	}
+
+	sdram_channel_csr_base = c->csr_base;
+	if (!sdram_channel_init_full())
+		return 0;
+
+	/* Memtest when the channel is mapped in the CPU address space. */
+	if ((c->size != 0) && (c->base + c->size - 1 <= UINTPTR_MAX)) {
+		if (!memtest((unsigned int *) (uintptr_t) c->base, MEMTEST_DATA_SIZE))
+			return 0;
+	}
+	/* Enables the channel's memory benches (see membench). */
+	csr_write_simple(1, c->init_done_addr);
+	return 1;
+}
+
+int sdram_init(void) {
+	unsigned int i;
+	int ok = 1;
+
+	for (i = 0; i < sizeof(sdram_channels)/sizeof(sdram_channels[0]); i++)
+		ok &= sdram_channel_init(&sdram_channels[i]);
+	return sdram_init_main() & ok;
+}
+
+#else
+
+int sdram_init(void) {
+	return sdram_init_main();
+}
+
+#endif // SDRAM_CHANNELS
+
+#endif // CSR_SDRAM_BASE
@@ -14,6 +14,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import adi_adrv2crr_fmc
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -23,12 +25,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.pwm import PWM
 from litex.soc.cores.xadc import ZynqUSPSystemMonitor
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -84,6 +80,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(
                 pads             = platform.request("ddram", ddram_channel),
                 memtype          = "DDR4",
@@ -93,11 +91,12 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MT40A512M16(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             assert self.csr_data_width == 32
 
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
@@ -145,7 +144,10 @@ def main():
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true",        help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true",        help="Enable PCIe DMA monitor CSRs.")
     parser.add_target_argument("--driver",                action="store_true",        help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
 
@@ -169,6 +171,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -16,6 +16,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import adi_plutosdr
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -78,7 +79,9 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=adi_plutosdr.Platform, description="LiteX SoC on Pluto SDR")
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
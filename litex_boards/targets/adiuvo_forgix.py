@@ -13,6 +13,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import adiuvo_forgix
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -284,7 +285,9 @@ def main():
         no_timer             = True,
         uart_name            = "crossover",
         with_uartbone        = False)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     builder_argdict = parser.builder_argdict
     output_dir = builder_argdict["output_dir"] or "build/adiuvo_forgix"
@@ -45,6 +45,7 @@ from litex.gen import *
 
 from litex.build.io import DDROutput
 from litex_boards.platforms import alchitry_mojo
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -54,9 +55,6 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS6HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC32M8
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -118,6 +116,8 @@ class BaseSoC(SoCCore):
 
         # Add SDRAM if a shield with RAM has been added
         if not self.integrated_main_ram_size and (with_hdmi_shield or with_sdram_shield):
+            from litedram.modules import MT48LC32M8
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.crg.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
@@ -159,7 +159,9 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
     #       set to a fixed rate of 500 kilobaud.
@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alchitry_pt_v2
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -19,9 +21,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -64,6 +63,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -72,7 +73,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -96,7 +97,10 @@ def main():
     parser.add_target_argument("--variant",        default="pt_v2",           help="Board variant (only pt_v2 for now).")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI flash.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant        = args.variant,
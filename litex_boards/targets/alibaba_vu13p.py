@@ -13,19 +13,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alibaba_vu13p
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args, set_main_ram_data_width, parse_ddram_channels
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
 
 # QSFP ---------------------------------------------------------------------------------------------
 
@@ -37,10 +33,22 @@ def parse_qsfp_port(port):
     qsfp, sfp = port.replace("qsfp", "").split("_sfp")
     return int(qsfp), int(sfp)
 
+# DDR4 Channels ------------------------------------------------------------------------------------
+
+DDRAM_CHANNELS       = range(4)
+DDRAM_CHANNELS_COUNT = [1, 2, 4] # Main RAM is interleaved across 1, 2 or 4 channels.
+DDRAM_CHANNEL_SIZE   = 0x40000000
+DDRAM_MAIN_RAM_MAX   = 0x40000000 # Main RAM window (up to the IO region), the memory benches cover it all.
+DDRAM_STRIPE_WORD    = 64         # Native port word of a channel controller (bytes, x64 DDR4 at 1:4).
+
+def check_ddram_stripe(stripe):
+    if stripe & (stripe - 1) or not (DDRAM_STRIPE_WORD <= stripe <= DDRAM_CHANNEL_SIZE):
+        raise ValueError(f"DDRAM stripe must be a power of 2 between {DDRAM_STRIPE_WORD} and {DDRAM_CHANNEL_SIZE} bytes")
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, ddram_channel=0):
+    def __init__(self, platform, sys_clk_freq, ddram_channel=0, ddram_local_channels=[]):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_sys4x  = ClockDomain()
@@ -72,40 +80,65 @@ class _CRG(LiteXModule):
 
         self.idelayctrl = USIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
 
+        # DDR4 channels with their own controller (--ddram-stripe): clocked from their own reference
+        # clock, see sdramchannels.
+        for channel in ddram_local_channels:
+            from litex_boards.targets.sdramchannels.common import SDRAMChannelCRG
+            setattr(self, f"ddram{channel}_crg", SDRAMChannelCRG(platform, f"ddram{channel}",
+                clkin            = platform.request("ddram_refclk", channel),
+                clkin_freq       = 400e6,
+                sys_clk_freq     = sys_clk_freq,
+                sys_clk          = self.cd_sys.clk,
+                rst              = self.rst,
+                iodelay_clk_freq = 400e6))
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-                ddram_channel         = 0,
-                with_led_chaser       = True,
-                with_ethernet         = False,
-                with_etherbone        = False,
-                ethernet_port         = "qsfp0_sfp0",
-                etherbone_port        = "qsfp0_sfp0",
-                eth_ip                = "192.168.1.50",
-                eth_dynamic_ip        = True,
-                remote_ip             = None,
-                etherbone_ip          = "192.168.1.50",
-                with_pcie             = False,
-                pcie_lanes            = 4,
-                pcie_ndmas            = 1,
-                pcie_address_width    = 32,
-                with_pcie_dma_status  = False,
-                with_pcie_dma_monitor = False,
+                ddram_channel          = 0,
+                ddram_channels         = None,
+                ddram_stripe           = None,
+                with_led_chaser        = True,
+                with_ethernet          = False,
+                with_etherbone         = False,
+                ethernet_port          = "qsfp0_sfp0",
+                etherbone_port         = "qsfp0_sfp0",
+                eth_rate               = "1g",
+                eth_data_width         = None,
+                eth_ip                 = "192.168.1.50",
+                eth_dynamic_ip         = True,
+                remote_ip              = None,
+                etherbone_ip           = "192.168.1.50",
+                etherbone_buffer_depth = 16,
+                with_pcie              = False,
+                pcie_lanes             = 4,
+                pcie_ndmas             = 1,
+                pcie_address_width     = 32,
+                with_pcie_dma_status   = False,
+                with_pcie_dma_monitor  = False,
+                with_pcie_dma_bench    = False,
+                with_mem_bench         = False,
+                main_ram_data_width    = None,
                 **kwargs):
         platform = alibaba_vu13p.Platform()
-        if ddram_channel not in range(4):
-            raise ValueError("DDRAM channel must be 0, 1, 2 or 3")
+        ddram_channels = parse_ddram_channels(ddram_channel if ddram_channels is None else ddram_channels, DDRAM_CHANNELS, DDRAM_CHANNELS_COUNT)
+        if ddram_stripe is not None:
+            check_ddram_stripe(ddram_stripe)
+            if len(ddram_channels) == 1:
+                raise ValueError("DDRAM stripe requires main RAM interleaved across 2 or 4 channels")
         if with_ethernet and with_etherbone and ethernet_port == etherbone_port:
             raise ValueError("Ethernet and Etherbone QSFP ports must be different")
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, ddram_channel)
+        self.crg = _CRG(platform, sys_clk_freq, ddram_channels[0],
+            ddram_local_channels = [] if ddram_stripe is None else ddram_channels[1:])
 
         if kwargs.get("uart_name", "serial") == "serial":
             if kwargs.get("uart_name", "serial") == "serial": kwargs["uart_name"] = "crossover"
 
         # SoCCore ----------------------------------------------------------------------------------
+        set_main_ram_data_width(kwargs, main_ram_data_width)
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Alibaba VU13P", **kwargs)
 
         # Running LED
@@ -113,19 +146,70 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", ddram_channel),
-                memtype          = "DDR4",
-                sys_clk_freq     = sys_clk_freq,
-                iodelay_clk_freq = 400e6)
-            self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT40A512M16(sys_clk_freq, "1:4"),
-                size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
-            )
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
+            if ddram_stripe is None:
+                # Several channels are driven in lockstep by a single controller (their pads are
+                # combined in one PHY): each controller word is striped across the channels, main RAM
+                # stays one contiguous region and is calibrated by the BIOS like a single wider channel.
+                self.ddrphy = usddrphy.USPDDRPHY([platform.request("ddram", channel) for channel in ddram_channels],
+                    memtype          = "DDR4",
+                    sys_clk_freq     = sys_clk_freq,
+                    iodelay_clk_freq = 400e6)
+                self.add_sdram("sdram",
+                    phy           = self.ddrphy,
+                    module        = MT40A512M16(sys_clk_freq, "1:4"),
+                    size          = min(DDRAM_CHANNEL_SIZE*len(ddram_channels), DDRAM_MAIN_RAM_MAX),
+                    **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=main_ram_data_width)
+                )
+                sdram_ports = self.sdram.crossbar
+                init_done   = None
+            else:
+                # A controller per channel (the others clocked locally and initialized by the BIOS,
+                # see sdramchannels), main RAM striped across them every `ddram_stripe` bytes.
+                from litex_boards.targets.sdramchannels.common import add_sdram_channel, SDRAMInterleaver, add_sdram_interleaved_main_ram
+                for i, channel in enumerate(ddram_channels):
+                    ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", channel),
+                        memtype          = "DDR4",
+                        sys_clk_freq     = sys_clk_freq,
+                        iodelay_clk_freq = 400e6)
+                    if i == 0:
+                        self.ddrphy = ddrphy
+                        self.add_sdram("sdram",
+                            phy                   = self.ddrphy,
+                            module                = MT40A512M16(sys_clk_freq, "1:4"),
+                            with_soc_interconnect = False)
+                        get_ports = [self.sdram.crossbar.get_port]
+                    else:
+                        sdram_channel = add_sdram_channel(self, channel,
+                            phy          = ddrphy,
+                            module       = MT40A512M16(sys_clk_freq, "1:4"),
+                            clock_domain = f"ddram{channel}")
+                        get_ports.append(sdram_channel.get_port)
+                self.sdram_interleaver = SDRAMInterleaver(get_ports, stripe=ddram_stripe)
+                add_sdram_interleaved_main_ram(self, self.sdram_interleaver,
+                    size = min(DDRAM_CHANNEL_SIZE*len(ddram_channels), DDRAM_MAIN_RAM_MAX),
+                    **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=main_ram_data_width)
+                )
+                sdram_ports = self.sdram_interleaver
+                init_done   = Reduce("AND", [getattr(self, f"sdram{channel}").init_done.storage for channel in ddram_channels[1:]])
+            self.add_constant("DDRAM_CHANNELS", len(ddram_channels))
+            # Interleaving granularity in bytes (in lockstep, the controller word).
+            self.add_constant("DDRAM_STRIPE", ddram_stripe or self.ddrphy.settings.nphases*self.ddrphy.settings.dfi_databits//8)
+
+            # Memory Bench (channels are benched together, through the shared controller or the
+            # interleaver, once initialized).
+            if with_mem_bench:
+                from litex_boards.targets.membench.common import add_mem_bench
+                add_mem_bench(self, "ddram_bench",
+                    size       = DDRAM_CHANNEL_SIZE*len(ddram_channels),
+                    write_port = sdram_ports.get_port(),
+                    read_port  = sdram_ports.get_port(),
+                    init_done  = init_done)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
@@ -145,26 +229,37 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         qsfp_in_use = [False, False]
 
         if with_ethernet:
             qsfp_id, sfp_lane = parse_qsfp_port(ethernet_port)
-            self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
-                sys_clk_freq = self.clk_freq,
-                refclk_from_fabric = True)
-            self.add_ethernet(phy=self.ethphy, local_ip=eth_ip if not eth_dynamic_ip else None, dynamic_ip=eth_dynamic_ip, remote_ip=remote_ip)
+            self.ethphy = self.get_qsfp_eth_phy(qsfp_id, sfp_lane, eth_rate)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            self.add_ethernet(
+                phy        = self.ethphy,
+                phy_cd     = "ethphy_eth" if with_etherbone else "eth",
+                data_width = eth_data_width,
+                local_ip   = eth_ip if not eth_dynamic_ip else None,
+                dynamic_ip = eth_dynamic_ip,
+                remote_ip  = remote_ip)
             qsfp_in_use[qsfp_id] = True
 
         if with_etherbone:
             qsfp_id, sfp_lane = parse_qsfp_port(etherbone_port)
-            self.bonephy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
-                sys_clk_freq = self.clk_freq,
-                refclk_from_fabric = True)
-            self.add_etherbone(phy=self.bonephy, ip_address=etherbone_ip)
+            self.bonephy = self.get_qsfp_eth_phy(qsfp_id, sfp_lane, eth_rate)
+            eth_data_width = check_eth_data_width(self.bonephy, eth_data_width)
+            self.add_etherbone(
+                phy        = self.bonephy,
+                phy_cd     = "bonephy_eth" if with_ethernet else "eth",
+                data_width = eth_data_width,
+                ip_address = etherbone_ip,
+                **etherbone_args(self, etherbone_buffer_depth))
             qsfp_in_use[qsfp_id] = True
 
         for qsfp_id, in_use in enumerate(qsfp_in_use):
@@ -191,6 +286,29 @@ class BaseSoC(SoCCore):
                 pads         = platform.request_all("user_led"),
                 sys_clk_freq = sys_clk_freq)
 
+    # QSFP Ethernet PHYs ---------------------------------------------------------------------------
+
+    def get_qsfp_eth_phy(self, qsfp_id, sfp_lane, eth_rate="1g"):
+        """Return a 1000BASE-X or 10GBASE-R Ethernet PHY on a QSFP lane (10GBASE-R PHYs of a QSFP share its QPLL)."""
+        data_pads = self.platform.request(f"qsfp{qsfp_id}_sfp", sfp_lane)
+        if eth_rate == "1g":
+            from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
+            return USP_GTY_1000BASEX(self.crg.cd_eth.clk,
+                data_pads          = data_pads,
+                sys_clk_freq       = self.clk_freq,
+                refclk_from_fabric = True)
+        if eth_rate == "10g":
+            from litex_boards.targets.eth10g.common import USP_GTY_10GBASER_QPLL, USP_GTY_10GBASER
+            qpll_name = f"qsfp{qsfp_id}_qpll"
+            if not hasattr(self, qpll_name):
+                setattr(self, qpll_name, USP_GTY_10GBASER_QPLL(
+                    refclk_or_clk_pads = self.platform.request("qsfp_refclk", qsfp_id),
+                    refclk_freq        = 161.1328125e6))
+            return USP_GTY_10GBASER(getattr(self, qpll_name),
+                data_pads    = data_pads,
+                sys_clk_freq = self.clk_freq)
+        raise ValueError(f"Unsupported Ethernet rate {eth_rate!r}, expected 1g or 10g")
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -199,52 +317,83 @@ def main():
     parser = LiteXArgumentParser(platform=alibaba_vu13p.Platform, description="LiteX SoC on Alibaba VU13P.")
     parser.add_target_argument("--flash",          action="store_true",         help="Flash bitstream to SPI flash.")
     parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float,   help="System clock frequency.")
-    parser.add_target_argument("--ddram-channel",  default=0, type=lambda x: int(x, 0), choices=range(4), help="DDRAM channel.")
+    parser.add_target_argument("--main-ram-data-width", default=None, type=int, choices=[64, 128, 256, 512], help="Main RAM data width: widen the SoC bus/DMAs and L2 cache up to the DDR4 native width.")
+    parser.add_target_argument("--ddram-channels", "--ddram-channel", dest="ddram_channels", default="0", help="DDRAM channels main RAM is interleaved across (1, 2 or 4, comma/range list or all).")
+    parser.add_target_argument("--ddram-stripe",   default=None, type=int,   help="Use a DDR4 controller per channel and stripe main RAM across them every N bytes (power of 2, >= 64, default: channels in lockstep).")
     parser.add_target_argument("--with-ethernet",  action="store_true",         help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",         help="Enable Etherbone support.")
     parser.add_target_argument("--ethernet-port",  default="qsfp0_sfp0",        choices=QSFP_PORTS, help="Ethernet SFP port.")
     parser.add_target_argument("--etherbone-port", default="qsfp0_sfp1",        choices=QSFP_PORTS, help="Etherbone SFP port.")
+    parser.add_target_argument("--eth-rate",       default="1g", choices=["1g", "10g"],             help="Ethernet/Etherbone rate (1000BASE-X or 10GBASE-R).")
+    parser.add_target_argument("--eth-data-width", default=None, type=int, choices=[8, 32, 64],     help="Ethernet/Etherbone datapath width (default: PHY width).")
     parser.add_target_argument("--ethernet-ip",    default="192.168.1.50",      help="Ethernet IP address.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",     help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",         help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--etherbone-ip",   default="192.168.1.50",      help="Ethernet IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--with-pcie",      action="store_true",         help="Enable PCIe support.")
     parser.add_target_argument("--pcie-lanes",     default=4, type=int,         choices=[4, 8, 16], help="PCIe lane count.")
     parser.add_target_argument("--pcie-ndmas",     default=1, type=int,         help="Number of PCIe DMA channels.")
     parser.add_target_argument("--pcie-address-width", default=32, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true",         help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true",         help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
+    parser.add_target_argument("--with-mem-bench",        action="store_true",         help="Add DDR4 bandwidth/latency bench cores (see litex_boards.tools.mem_bench).")
     parser.add_target_argument("--driver",                action="store_true",         help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None, bus_data_width=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
+    try:
+        ddram_channels = parse_ddram_channels(args.ddram_channels, DDRAM_CHANNELS, DDRAM_CHANNELS_COUNT)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.ddram_stripe is not None:
+        try:
+            check_ddram_stripe(args.ddram_stripe)
+        except ValueError as e:
+            parser.error(str(e))
+        if len(ddram_channels) == 1:
+            parser.error("--ddram-stripe requires main RAM interleaved across 2 or 4 DDRAM channels.")
 
     if args.with_ethernet and args.with_etherbone:
         if args.ethernet_port == args.etherbone_port:
             parser.error("Ethernet and Etherbone SFP ports must be different.")
 
     soc = BaseSoC(
-        sys_clk_freq          = args.sys_clk_freq,
-        ddram_channel         = args.ddram_channel,
-        with_ethernet         = args.with_ethernet,
-        with_etherbone        = args.with_etherbone,
-        ethernet_port         = args.ethernet_port,
-        etherbone_port        = args.etherbone_port,
-        eth_ip                = args.ethernet_ip,
-        remote_ip             = args.remote_ip,
-        eth_dynamic_ip        = args.eth_dynamic_ip,
-        etherbone_ip          = args.etherbone_ip,
-        with_pcie             = args.with_pcie,
-        pcie_lanes            = args.pcie_lanes,
-        pcie_ndmas            = args.pcie_ndmas,
-        pcie_address_width    = args.pcie_address_width,
-        with_pcie_dma_status  = args.pcie_with_dma_status,
-        with_pcie_dma_monitor = args.pcie_with_dma_monitor,
+        sys_clk_freq           = args.sys_clk_freq,
+        main_ram_data_width    = args.main_ram_data_width,
+        ddram_channels         = ddram_channels,
+        ddram_stripe           = args.ddram_stripe,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        ethernet_port          = args.ethernet_port,
+        etherbone_port         = args.etherbone_port,
+        eth_rate               = args.eth_rate,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.ethernet_ip,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        etherbone_ip           = args.etherbone_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_ndmas             = args.pcie_ndmas,
+        pcie_address_width     = args.pcie_address_width,
+        with_pcie_dma_status   = args.pcie_with_dma_status,
+        with_pcie_dma_monitor  = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench    = args.pcie_with_dma_bench,
+        with_mem_bench         = args.with_mem_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
+    if args.ddram_stripe is not None:
+        from litex_boards.targets.sdramchannels.common import add_sdram_channels_software
+        add_sdram_channels_software(builder)
     if args.build or args.driver:
         if not args.build:
             builder.compile_software = False
@@ -252,7 +401,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
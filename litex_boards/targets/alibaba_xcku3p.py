@@ -23,6 +23,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alibaba_xcku3p
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder  import *
@@ -30,11 +32,6 @@ from litex.soc.integration.builder  import *
 from litex.soc.cores.clock import *
 from litex.soc.cores.led   import LedChaser
 
-from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software       import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -58,15 +55,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_sfp         = 0,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_pcie       = False,
-        pcie_lanes      = 4,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_sfp                = 0,
+        eth_rate               = "1g",
+        eth_data_width         = None,
+        etherbone_buffer_depth = 16,
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_pcie              = False,
+        pcie_lanes             = 4,
         **kwargs):
         platform = alibaba_xcku3p.Platform()
 
@@ -80,18 +80,31 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
-            self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("sfp", eth_sfp),
-                sys_clk_freq = self.clk_freq,
-                refclk_from_fabric = True)
-            platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
+            if eth_rate == "10g":
+                from litex_boards.targets.eth10g.common import USP_GTY_10GBASER_QPLL, USP_GTY_10GBASER
+                # 156.25MHz SFP+ RefClk.
+                refclk_pads = platform.request("sfp_mgt_clk")
+                platform.add_period_constraint(refclk_pads, 1e9/156.25e6)
+                self.eth_qpll = USP_GTY_10GBASER_QPLL(refclk_pads, refclk_freq=156.25e6)
+                self.ethphy   = USP_GTY_10GBASER(self.eth_qpll,
+                    data_pads    = self.platform.request("sfp", eth_sfp),
+                    sys_clk_freq = self.clk_freq)
+            else:
+                from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
+                self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
+                    data_pads    = self.platform.request("sfp", eth_sfp),
+                    sys_clk_freq = self.clk_freq,
+                    refclk_from_fabric = True)
+                platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(
                 platform,
                 platform.request(f"pcie_x{pcie_lanes}"),
@@ -125,24 +138,32 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-sfp",        default=0, type=int, choices=[0, 1], help="Ethernet SFP.")
+    parser.add_target_argument("--eth-rate",       default="1g", choices=["1g", "10g"], help="Ethernet/Etherbone rate (1000BASE-X or 10GBASE-R).")
+    parser.add_target_argument("--eth-data-width", default=None, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width (default: PHY width).")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",              help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",                 help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default=None,                        help="Remote IP address of TFTP server.")
     parser.add_target_argument("--with-pcie",      action="store_true",                 help="Enable PCIe support.")
     parser.add_target_argument("--pcie-lanes",     default=4, type=int,                 choices=[4, 8], help="PCIe lane count.")
     parser.add_target_argument("--driver",         action="store_true",                 help="Generate PCIe driver.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_sfp        = args.eth_sfp,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_pcie      = args.with_pcie,
-        pcie_lanes     = args.pcie_lanes,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_sfp                = args.eth_sfp,
+        eth_rate               = args.eth_rate,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_ip                 = args.eth_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
         **parser.soc_argdict
     )
 
@@ -154,6 +175,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -15,6 +15,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alientek_davincipro
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -25,12 +28,6 @@ from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna  import S7DNA
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import IS43TR16128B
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-from litepcie.phy.s7pciephy import S7PCIEPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -85,6 +82,8 @@ class BaseSoC(SoCCore):
         with_etherbone         = False,
         eth_phy                = "rgmii",
         eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
         remote_ip              = None,
         eth_dynamic_ip         = False,
         with_pcie              = False,
@@ -117,6 +116,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS43TR16128B
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -124,13 +125,14 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = IS43TR16128B(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
        # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 # phy
                 self.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
@@ -160,13 +162,15 @@ class BaseSoC(SoCCore):
                     data_pads    = self.platform.request("sfp", 0),
                     sys_clk_freq = self.clk_freq)
 
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip if not eth_dynamic_ip else None, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip if not eth_dynamic_ip else None, remote_ip=remote_ip)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
                 data_width = 64,
                 bar0_size  = 0x20000)
@@ -217,6 +221,8 @@ def main():
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
@@ -228,7 +234,10 @@ def main():
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-gpio",           action="store_true",        help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
@@ -241,6 +250,8 @@ def main():
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
         eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         remote_ip              = args.remote_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_buttons           = True,
@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import aliexpress_xc7k420t
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -69,7 +70,9 @@ def main():
     parser = LiteXArgumentParser(platform=aliexpress_xc7k420t.Platform, description="LiteX SoC on AliExpress u420t.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI-mode flash support.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -12,6 +12,8 @@ from litex.gen import *
 
 from litex.build.io import DDROutput
 from litex_boards.platforms import aliexpress_xc7k70t
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -21,9 +23,6 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS7HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import W9812G6JB
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -61,6 +60,7 @@ class BaseSoC(SoCCore):
         with_hdmi              = False,
         with_ethernet          = False,
         eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
         remote_ip              = None,
         eth_dynamic_ip         = False,
         with_pcie              = False,
@@ -80,6 +80,8 @@ class BaseSoC(SoCCore):
 
         # Add SDRAM if a shield with RAM has been added
         if not self.integrated_main_ram_size:
+            from litedram.modules import W9812G6JB
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.crg.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
@@ -109,7 +111,8 @@ class BaseSoC(SoCCore):
                 tx_delay = 1.417e-9,
                 rx_delay = 1.417e-9,
             )
-            self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
@@ -133,6 +136,7 @@ def main():
     parser.add_target_argument("--sdram-rate",     default="1:1",            help="SDRAM Rate: (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-ethernet",  action="store_true",      help="Enable Ethernet")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",   help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-pcie",      action="store_true",      help="Enable PCIe")
@@ -141,7 +145,9 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
     #       set to a fixed rate of 500 kilobaud.
@@ -150,6 +156,7 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_ethernet          = args.with_ethernet,
         eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         remote_ip              = args.remote_ip,
         with_pcie              = args.with_pcie,
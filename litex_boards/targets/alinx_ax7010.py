@@ -13,6 +13,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_ax7010
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 
 from litex.soc.cores.clock import *
@@ -59,7 +60,9 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=alinx_ax7010.Platform, description="LiteX SoC on zynq xc7z010.")
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
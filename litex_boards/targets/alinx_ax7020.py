@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_ax7020
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -93,7 +94,9 @@ def main():
     parser = LiteXArgumentParser(platform=alinx_ax7020.Platform, description="LiteX SoC on Alinx AX7020.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-ps-ddr",  action="store_true",       help="Uses PS DDR via HP0 as Main RAM.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
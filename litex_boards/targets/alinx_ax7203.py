@@ -11,15 +11,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_ax7203
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 from litedram.modules import MT41J256M16
 from litedram.phy import s7ddrphy
 
@@ -85,11 +84,12 @@ class BaseSoC(SoCCore):
         self.add_sdram("sdram",
             phy           = self.ddrphy,
             module        = MT41J256M16(sys_clk_freq, "1:4"),
-            l2_cache_size = kwargs.get("l2_size", 8192)
+            **l2_cache_args(self, kwargs, phy=self.ddrphy)
         )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -146,7 +146,10 @@ def main():
     parser.add_target_argument("--driver",                 action="store_true",      help="Generate drivers.")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",      help="Enable Video Framebuffer (HDMI).")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
@@ -164,6 +167,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
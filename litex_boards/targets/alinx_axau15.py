@@ -13,20 +13,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_axau15
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from liteeth.phy.usrgmii import LiteEthPHYRGMII
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -56,14 +51,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6),
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_pcie       = False, pcie_speed="gen3",
-        with_sdcard     = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_pcie              = False, pcie_speed="gen3",
+        with_sdcard            = False,
         **kwargs):
         platform = alinx_axau15.Platform()
 
@@ -75,6 +72,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -84,11 +83,12 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MT40A512M16(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
                 speed      = pcie_speed,
                 data_width = {"gen3": 128, "gen4": 256}[pcie_speed],
@@ -107,6 +107,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.usrgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -114,10 +115,11 @@ class BaseSoC(SoCCore):
                 rx_delay   = 1e-9,
                 usp        = True
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # SD Card ----------------------------------------------------------------------------------
         if with_sdcard:
@@ -139,26 +141,33 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",                   help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",                  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",                      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-pcie",      action="store_true",                      help="Enable PCIe support.")
     parser.add_target_argument("--pcie-speed",     default="gen3", choices=["gen3", "gen4"], help="PCIe speed.")
     parser.add_target_argument("--driver",         action="store_true",                      help="Generate PCIe driver.")
     parser.add_target_argument("--with-sdcard",    action="store_true",                      help="Add SDCard.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_pcie      = args.with_pcie,
-        pcie_speed     = args.pcie_speed,
-        with_sdcard    = args.with_sdcard,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_pcie              = args.with_pcie,
+        pcie_speed             = args.pcie_speed,
+        with_sdcard            = args.with_sdcard,
         **parser.soc_argdict
     )
 
@@ -170,6 +179,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
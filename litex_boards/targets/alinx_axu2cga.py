@@ -23,6 +23,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import alinx_axu2cga
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.build.tools import write_to_file
 
@@ -161,7 +162,9 @@ def main():
     parser.add_target_argument("--cable",        default="ft232",          help="JTAG interface.")
     parser.add_target_argument("--sys-clk-freq", default=25e6, type=float, help="System clock frequency.")
     parser.set_defaults(cpu_type="zynqmp")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -15,6 +15,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import altera_agilex5e_065b_premium_devkit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.integration.soc      import *
 from litex.soc.integration.soc      import SoCRegion
@@ -75,16 +77,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        variant         = "production",
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_sdcard     = False,
-        with_spi_sdcard = False,
-        with_led_chaser = True,
-        with_h2f_bridge = False,
+        variant                = "production",
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_sdcard            = False,
+        with_spi_sdcard        = False,
+        with_led_chaser        = True,
+        with_h2f_bridge        = False,
         **kwargs):
         with_hps = (kwargs.get("cpu_type", None) == "agilex_hps")
         if with_hps:
@@ -146,11 +150,13 @@ class BaseSoC(SoCCore):
                 ref_tx_clk  = platform.request("clk125"),
             )
 
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
                 self.add_ethernet(
                     phy            = self.ethphy,
+                    data_width     = eth_data_width,
                     dynamic_ip     = eth_dynamic_ip,
                     local_ip       = eth_ip,
                     remote_ip      = remote_ip,
@@ -179,6 +185,8 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
 
@@ -193,19 +201,23 @@ def main():
     parser.set_defaults(conv_tool="quartus_pfg")
     parser.set_defaults(integrated_main_ram_size=64*KILOBYTE)
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq    = args.sys_clk_freq,
-        variant         = args.variant,
-        with_ethernet   = args.with_ethernet,
-        with_etherbone  = args.with_etherbone,
-        eth_ip          = args.eth_ip,
-        remote_ip       = args.remote_ip,
-        eth_dynamic_ip  = args.eth_dynamic_ip,
-        with_sdcard     = args.with_sdcard,
-        with_spi_sdcard = args.with_spi_sdcard,
-        with_h2f_bridge = args.with_h2f_bridge,
+        sys_clk_freq           = args.sys_clk_freq,
+        variant                = args.variant,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_sdcard            = args.with_sdcard,
+        with_spi_sdcard        = args.with_spi_sdcard,
+        with_h2f_bridge        = args.with_h2f_bridge,
         **parser.soc_argdict)
 
     builder = Builder(soc, **parser.builder_argdict)
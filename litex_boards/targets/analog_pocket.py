@@ -16,6 +16,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import analog_pocket
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -24,9 +26,6 @@ from litex.build.io import DDROutput
 
 from litex.soc.cores.clock import CycloneVPLL
 
-from litedram.modules import AS4C32M16
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -81,12 +80,14 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import AS4C32M16
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = AS4C32M16(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Video ------------------------------------------------------------------------------------
@@ -147,7 +148,10 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal.")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer.")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
@@ -13,19 +13,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_artix_dc_scm
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthS7PHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -61,13 +57,15 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, device, toolchain="vivado", sys_clk_freq=100e6,
-        with_pcie      = False,
-        with_etherbone = False,
-        with_ethernet  = False,
-        eth_dynamic_ip = False,
-        eth_reset_time = "10e-3",
-        eth_ip         = "192.168.1.120",
-        remote_ip      = None,
+        with_pcie              = False,
+        with_etherbone         = False,
+        with_ethernet          = False,
+        eth_dynamic_ip         = False,
+        eth_reset_time         = "10e-3",
+        eth_ip                 = "192.168.1.120",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
         **kwargs):
         platform = antmicro_artix_dc_scm.Platform(device=device, toolchain=toolchain)
 
@@ -79,6 +77,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -86,25 +86,28 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.ethphy = LiteEthS7PHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets main_ethphy_eth_rx_clk_ibuf]")
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -128,26 +131,33 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--eth-reset-time", default="10e-3",         help="Duration of Ethernet PHY reset.")
     parser.add_target_argument("--with-sdram",     action="store_true",     help="Add SDRAM.")
     parser.add_target_argument("--with-emmc",      action="store_true",     help="Add eMMC.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        toolchain      = args.toolchain,
-        device         = args.device,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_pcie      = args.with_pcie,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        eth_reset_time = args.eth_reset_time,
+        toolchain              = args.toolchain,
+        device                 = args.device,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_pcie              = args.with_pcie,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        eth_reset_time         = args.eth_reset_time,
         **parser.soc_argdict
     )
 
@@ -14,6 +14,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_datacenter_ddr4_test_board
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -22,16 +25,10 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy.s7ddrphy import A7DDRPHY
 from litedram.init import get_sdram_phy_py_header
 from litedram.core.controller import ControllerSettings
 from litedram.common import PhySettings, GeomSettings, TimingSettings
 
-from liteeth.phy import LiteEthS7PHYRGMII
-from litespi.modules import S25FL128S0
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -77,6 +74,8 @@ class BaseSoC(SoCCore):
             with_ethernet          = False,
             with_etherbone         = False,
             eth_ip                 = "192.168.1.50",
+            eth_data_width         = 8,
+            etherbone_buffer_depth = 16,
             remote_ip              = None,
             eth_reset_time         = "10e-3",
             eth_dynamic_ip         = False,
@@ -98,6 +97,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM RDIMM -------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MTA18ASF2G72PZ
+            from litedram.phy.s7ddrphy import A7DDRPHY
             self.ddrphy = A7DDRPHY(platform.request("ddr4"),
                 memtype         = "DDR4",
                 iodelay_clk_freq = iodelay_clk_freq,
@@ -107,8 +108,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = 256,
+                **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=256),
                 size                    = 0x40000000,
             )
 
@@ -125,6 +125,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -134,10 +135,11 @@ class BaseSoC(SoCCore):
                 rx_delay   = 0.8e-9,
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -155,6 +157,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import S25FL128S0
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S0(Codes.READ_1_1_4), with_master=True)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
@@ -194,6 +198,8 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",                 default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",              default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip",         action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--eth-reset-time",         default="10e-3",         help="Duration of Ethernet PHY reset.")
@@ -202,7 +208,10 @@ def main():
     parser.add_target_argument("--with-video-terminal",    action="store_true",     help="Enable Video Terminal (HDMI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",     help="Enable Video Framebuffer (HDMI).")
     parser.add_target_argument("--with-spi-flash",         action="store_true",     help="Enable memory-mapped SPI flash.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
@@ -212,6 +221,8 @@ def main():
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
         eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         remote_ip              = args.remote_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_hyperram          = args.with_hyperram,
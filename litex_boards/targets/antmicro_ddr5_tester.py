@@ -13,6 +13,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_ddr5_tester
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.clock import *
@@ -21,11 +24,6 @@ from litex.soc.cores.video import VideoS7HDMIPHY
 from litex.soc.integration.builder import *
 from litex.soc.integration.soc import *
 
-from liteeth.phy import LiteEthS7PHYRGMII
-
-from litespi.modules import S25FL128S0
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 DDR5_LITEDRAM_ERROR = (
     "Antmicro DDR5 targets require a LiteDRAM checkout with litedram.phy.ddr5 "
     "and DDR5 module definitions. Antmicro's known DDR5-capable reference is "
@@ -99,6 +97,8 @@ class BaseSoC(SoCCore):
         with_ethernet          = False,
         with_etherbone         = False,
         eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
         remote_ip              = None,
         eth_reset_time         = "10e-3",
         eth_dynamic_ip         = False,
@@ -165,8 +165,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = module_cls(sys_clk_freq, "1:4"),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = 256,
+                **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=256),
                 size                    = 0x40000000,
             )
 
@@ -183,16 +182,18 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.ethphy = LiteEthS7PHYRGMII(
                 clock_pads      = self.platform.request("eth_clocks"),
                 pads            = self.platform.request("eth"),
                 rx_delay        = 0.8e-9,
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq),
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -211,6 +212,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import S25FL128S0
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S0(Codes.READ_1_1_4), with_master=True)
 
         # System I2C -------------------------------------------------------------------------------
@@ -265,6 +268,8 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",                 default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",              default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip",         action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--eth-reset-time",         default="10e-3",         help="Duration of Ethernet PHY reset.")
@@ -273,7 +278,10 @@ def main():
     parser.add_target_argument("--with-spi-flash",         action="store_true",     help="Enable memory-mapped SPI flash.")
     parser.add_target_argument("--with-video-terminal",    action="store_true",     help="Enable Video Terminal (HDMI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",     help="Enable Video Framebuffer (HDMI).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
@@ -284,6 +292,8 @@ def main():
             with_ethernet          = args.with_ethernet,
             with_etherbone         = args.with_etherbone,
             eth_ip                 = args.eth_ip,
+            eth_data_width         = args.eth_data_width,
+            etherbone_buffer_depth = args.etherbone_buffer_depth,
             remote_ip              = args.remote_ip,
             eth_reset_time         = args.eth_reset_time,
             eth_dynamic_ip         = args.eth_dynamic_ip,
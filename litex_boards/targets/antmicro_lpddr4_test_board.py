@@ -10,16 +10,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_lpddr4_test_board
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT53E256M16D1
-from litedram.phy import lpddr4
-
-from liteeth.phy import LiteEthS7PHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -46,14 +45,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=50e6, iodelay_clk_freq=200e6,
-            with_ethernet   = False,
-            with_etherbone  = False,
-            eth_ip          = "192.168.1.50",
-            remote_ip       = None,
-            eth_dynamic_ip  = False,
-            with_hyperram   = False,
-            with_sdcard     = False,
-            with_led_chaser = True,
+            with_ethernet          = False,
+            with_etherbone         = False,
+            eth_ip                 = "192.168.1.50",
+            eth_data_width         = 8,
+            etherbone_buffer_depth = 16,
+            remote_ip              = None,
+            eth_dynamic_ip         = False,
+            with_hyperram          = False,
+            with_sdcard            = False,
+            with_led_chaser        = True,
             **kwargs):
         platform = antmicro_lpddr4_test_board.Platform()
 
@@ -65,6 +66,8 @@ class BaseSoC(SoCCore):
 
         # LDDR4 SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT53E256M16D1
+            from litedram.phy import lpddr4
             self.ddrphy = lpddr4.K7LPDDR4PHY(platform.request("lpddr4"),
                 iodelay_clk_freq = iodelay_clk_freq,
                 sys_clk_freq     = sys_clk_freq,
@@ -72,8 +75,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
                 module                  = MT53E256M16D1(sys_clk_freq, "1:8"),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = 256,
+                **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=256),
             )
 
         # HyperRAM ---------------------------------------------------------------------------------
@@ -89,6 +91,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -97,10 +100,11 @@ class BaseSoC(SoCCore):
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0.8e-9,
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -120,24 +124,31 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-hyperram",  action="store_true",     help="Add HyperRAM.")
     parser.add_target_argument("--with-sdcard",    action="store_true",     help="Add SDCard.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq     = args.sys_clk_freq,
-        iodelay_clk_freq = args.iodelay_clk_freq,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        remote_ip        = args.remote_ip,
-        eth_dynamic_ip   = args.eth_dynamic_ip,
-        with_hyperram    = args.with_hyperram,
-        with_sdcard      = args.with_sdcard,
+        sys_clk_freq           = args.sys_clk_freq,
+        iodelay_clk_freq       = args.iodelay_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_hyperram          = args.with_hyperram,
+        with_sdcard            = args.with_sdcard,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
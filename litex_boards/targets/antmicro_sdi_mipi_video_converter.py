@@ -14,6 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import antmicro_sdi_mipi_video_converter
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.ram import NXLRAM
 from litex.soc.cores.clock import NXPLL
@@ -96,7 +97,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float,   help="System clock frequency.")
     parser.add_target_argument("--programmer",   default="radiant",          help="Programmer (radiant or ecpprog).")
     parser.add_target_argument("--prog-target",  default="direct",           help="Programming Target (direct or flash).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
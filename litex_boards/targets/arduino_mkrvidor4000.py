@@ -13,21 +13,24 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import arduino_mkrvidor4000
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import AS4C4M16
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+        self.rst    = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
 
         # # #
 
@@ -39,19 +42,24 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(self.rst)
         pll.register_clkin(clk48, 48e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
 
         # SDRAM clock
-        self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.comb += platform.request("sdram_clock").eq(sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=48e6, **kwargs):
+    def __init__(self, sys_clk_freq=48e6, sdram_rate="1:1", **kwargs):
         platform = arduino_mkrvidor4000.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         kwargs["with_jtagbone"] = True # TODO: untested
@@ -60,11 +68,14 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import AS4C4M16
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = AS4C4M16(sys_clk_freq, "1:1"), # Alliance Memory AS4C4M16
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                module        = AS4C4M16(sys_clk_freq, sdram_rate), # Alliance Memory AS4C4M16
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
 # Build --------------------------------------------------------------------------------------------
@@ -73,10 +84,15 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=arduino_mkrvidor4000.Platform, description="LiteX SoC on MKR Vidor 4000.")
     parser.add_target_argument("--sys-clk-freq",        default=48e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",          default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        sdram_rate   = args.sdram_rate,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
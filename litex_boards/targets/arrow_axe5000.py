@@ -12,6 +12,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import arrow_axe5000
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.soc.interconnect import wishbone
 
@@ -54,13 +56,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_l2_cache   = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
+        with_l2_cache          = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
         **kwargs):
         platform = arrow_axe5000.Platform()
 
@@ -139,7 +142,7 @@ class BaseSoC(SoCCore):
             )
 
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
 
@@ -164,6 +167,7 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
 
@@ -172,16 +176,19 @@ def main():
     parser.set_defaults(conv_tool  = "quartus_pfg")
 
     # soc.json default path
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_l2_cache  = args.with_l2_cache,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_l2_cache          = args.with_l2_cache,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
         **parser.soc_argdict
     )
 
@@ -29,6 +29,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import berkeleylab_marble
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -36,11 +39,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -70,15 +68,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = True,
-        with_rts_reset  = False,
-        with_led_chaser = True,
-        with_i2c        = True,
-        spd_dump        = None,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 255,
+        remote_ip              = None,
+        eth_dynamic_ip         = True,
+        with_rts_reset         = False,
+        with_led_chaser        = True,
+        with_i2c               = True,
+        spd_dump               = None,
         **kwargs):
         platform = berkeleylab_marble.Platform()
 
@@ -94,6 +94,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(
                 platform.request("ddram"),
                 memtype      = "DDR3",
@@ -113,23 +115,26 @@ class BaseSoC(SoCCore):
                 phy    = self.ddrphy,
                 module = ram_module,
                 # size=0x40000000,  # Limit its size to 1 GB
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.ddrphy),
                 with_bist     = kwargs.get("with_bist", False)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 tx_delay   = 0
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
 
         if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=255)
+            self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
         if with_ethernet:
             self.add_ethernet(
                 phy            = self.ethphy,
+                data_width     = eth_data_width,
                 dynamic_ip     = eth_dynamic_ip,
                 local_ip       = eth_ip,
                 remote_ip      = remote_ip,
@@ -156,25 +161,32 @@ def main():
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=255, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-rts-reset", action="store_true",       help="Connect UART RTS line to sys_clk reset.")
     parser.add_target_argument("--with-bist",      action="store_true",       help="Add DDR3 BIST Generator/Checker.")
 
     parser.add_target_argument("--spd-dump",                                  help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_etherbone = args.with_etherbone,
-        with_bist      = args.with_bist,
-        spd_dump       = args.spd_dump,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        with_bist              = args.with_bist,
+        spd_dump               = args.spd_dump,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
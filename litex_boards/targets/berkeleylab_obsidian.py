@@ -30,12 +30,12 @@ from litex.soc.integration.soc import SoCCore
 from litex.soc.integration.builder import Builder
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
-from litedram.modules import AS4C256M16D3A
-from litedram.phy.s7ddrphy import A7DDRPHY
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 from liteiclink.serdes.gtp_7series import GTPQuadPLL, GTP
 from litex_boards.platforms import berkeleylab_obsidian
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 from litex_boards.platforms.berkeleylab_obsidian import raw_pmod_io
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 # ---------------------------
 
@@ -86,17 +86,19 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(
         self,
-        sys_clk_freq    = 125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = True,
-        with_rts_reset  = False,
-        with_ddr3       = False,
-        with_bist       = False,
-        with_led_chaser = False,
-        with_spi_flash  = False,
+        sys_clk_freq           = 125e6,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 255,
+        remote_ip              = None,
+        eth_dynamic_ip         = True,
+        with_rts_reset         = False,
+        with_ddr3              = False,
+        with_bist              = False,
+        with_led_chaser        = False,
+        with_spi_flash         = False,
         **kwargs,
     ):
         self.n_serdes = 0
@@ -118,6 +120,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM
         if with_ddr3:
+            from litedram.modules import AS4C256M16D3A
+            from litedram.phy.s7ddrphy import A7DDRPHY
             self.ddrphy = A7DDRPHY(
                 platform.request("ddram"),
                 memtype="DDR3",
@@ -128,12 +132,13 @@ class BaseSoC(SoCCore):
                 "sdram",
                 phy=self.ddrphy,
                 module=AS4C256M16D3A(sys_clk_freq, "1:4"),
-                l2_cache_size=kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.ddrphy),
                 with_bist=with_bist,
             )
 
         # Ethernet
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads=self.platform.request("eth_clocks"),
                 pads=self.platform.request("eth"),
@@ -141,12 +146,14 @@ class BaseSoC(SoCCore):
                 tx_delay=2e-9,  # see utils/board_test/eth_test.py
                 hw_reset_cycles=2000000,  # 10 ms
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
 
         if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=255)
+            self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
         if with_ethernet:
             self.add_ethernet(
                 phy=self.ethphy,
+                data_width = eth_data_width,
                 dynamic_ip=eth_dynamic_ip,
                 local_ip=eth_ip,
                 remote_ip=remote_ip,
@@ -240,25 +247,32 @@ def main():
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=255, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-rts-reset", action="store_true",       help="Connect UART RTS line to sys_clk reset.")
     parser.add_target_argument("--with-ddr3",      action="store_true",       help="Add DDR3 dynamic RAM to the SOC")
     parser.add_target_argument("--with-bist",      action="store_true",       help="Add DDR3 BIST Generator/Checker.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_etherbone = args.with_etherbone,
-        with_rts_reset = args.with_rts_reset,
-        with_ddr3      = args.with_ddr3,
-        with_bist      = args.with_bist,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        with_rts_reset         = args.with_rts_reset,
+        with_ddr3              = args.with_ddr3,
+        with_bist              = args.with_bist,
         **parser.soc_argdict,
     )
     builder = Builder(soc, **parser.builder_argdict)
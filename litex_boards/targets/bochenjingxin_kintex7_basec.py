@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import bochenjingxin_kintex7_basec
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -65,7 +66,9 @@ def main():
     parser = LiteXArgumentParser(platform=bochenjingxin_kintex7_basec.Platform, description="LiteX SoC on Kintex-7 Base C.")
     parser.add_target_argument("--sys-clk-freq",        default=125e6, type=float, help="System clock frequency.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
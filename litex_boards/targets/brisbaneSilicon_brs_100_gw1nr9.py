@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import brisbaneSilicon_brs_100_gw1nr9
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock.gowin_gw1n import GW1NPLL
 from litex.soc.integration.soc_core import *
@@ -81,7 +82,9 @@ def main():
     parser.add_target_argument("--flash",             action="store_true",      help="Flash bitstream and BIOS.")
     parser.add_target_argument("--sys-clk-freq",      default=27e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--bios-flash-offset", default="0x0",            help="BIOS offset in SPI Flash.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain         = args.toolchain,
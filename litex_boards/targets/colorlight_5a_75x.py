@@ -51,17 +51,15 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_5a_75b, colorlight_5a_75e, colorlight_i5a_907
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import EM636165, M12L16161A, M12L64322A
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -119,16 +117,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, board, revision, sys_clk_freq=60e6, toolchain="trellis",
-        with_ethernet    = False,
-        with_etherbone   = False,
-        eth_ip           = "192.168.1.50",
-        remote_ip        = None,
-        eth_dynamic_ip   = False,
-        eth_phy          = 0,
-        with_led_chaser  = True,
-        use_internal_osc = False,
-        sdram_rate       = "1:1",
-        with_spi_flash   = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 32,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        eth_phy                = 0,
+        with_led_chaser        = True,
+        use_internal_osc       = False,
+        sdram_rate             = "1:1",
+        with_spi_flash         = False,
         **kwargs):
         board = board.lower()
         assert board in ["5a-75b", "5a-75e", "i5a-907"]
@@ -165,6 +165,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import EM636165, M12L16161A, M12L64322A
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             if board == "5a-75b" and revision == "6.1":
@@ -176,21 +178,23 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
                 module                  = sdram_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy),
                 l2_cache_full_memory_we = False,
 
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay   = 0e-9)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, data_width=32)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, data_width=32, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         # Disable leds when serial is used.
@@ -231,26 +235,33 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",           default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width",   default=32, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip",   action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",        default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-phy",          default=0, type=int,     help="Ethernet PHY (0 or 1).")
     parser.add_target_argument("--use-internal-osc", action="store_true",     help="Use internal oscillator.")
     parser.add_target_argument("--sdram-rate",       default="1:1",           help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-spi-flash",   action="store_true",     help="Add SPI flash support to the SoC")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(board=args.board, revision=args.revision,
-        sys_clk_freq     = args.sys_clk_freq,
-        toolchain        = args.toolchain,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        remote_ip        = args.remote_ip,
-        eth_dynamic_ip   = args.eth_dynamic_ip,
-        eth_phy          = args.eth_phy,
-        use_internal_osc = args.use_internal_osc,
-        sdram_rate       = args.sdram_rate,
-        with_spi_flash   = args.with_spi_flash,
+        sys_clk_freq           = args.sys_clk_freq,
+        toolchain              = args.toolchain,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        eth_phy                = args.eth_phy,
+        use_internal_osc       = args.use_internal_osc,
+        sdram_rate             = args.sdram_rate,
+        with_spi_flash         = args.with_spi_flash,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
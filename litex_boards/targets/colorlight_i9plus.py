@@ -28,6 +28,9 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_i9plus
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -37,20 +40,19 @@ from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna  import S7DNA
 
-from litedram.modules import M12L64322A
-from litedram.phy import GENSDRPHY
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_dram=True, with_ethernet=True):
+    def __init__(self, platform, sys_clk_freq, with_dram=True, with_ethernet=True, sdram_rate="1:1"):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_idelay = ClockDomain()
         if with_dram:
-            self.cd_sys_ps = ClockDomain()
+            if sdram_rate == "1:2":
+                self.cd_sys2x    = ClockDomain()
+                self.cd_sys2x_ps = ClockDomain()
+            else:
+                self.cd_sys_ps = ClockDomain()
 
         # # #
 
@@ -65,9 +67,13 @@ class _CRG(LiteXModule):
         pll.create_clkout(self.cd_idelay,    200e6)
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
         if with_dram:
-            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=27) # Tuned for reliable SDRAM operation.
+            if sdram_rate == "1:2":
+                pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+                pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180) # Idealy 90° but needs to be increased.
+            else:
+                pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=27) # Tuned for reliable SDRAM operation.
             # SDRAM clock
-            sdram_clk = ClockSignal("sys_ps")
+            sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
         self.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
@@ -77,18 +83,21 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=100e6,
-        with_dna        = False,
-        with_xadc       = False,
-        with_pmod_uart  = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_port        = 0,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = "192.168.1.100",
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_rgb_led    = False,
-        with_spi_flash  = False,
+        sdram_rate             = "1:1",
+        with_dna               = False,
+        with_xadc              = False,
+        with_pmod_uart         = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_port               = 0,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = "192.168.1.100",
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_rgb_led           = False,
+        with_spi_flash         = False,
         **kwargs):
         platform = colorlight_i9plus.Platform(toolchain=toolchain)
 
@@ -98,7 +107,7 @@ class BaseSoC(SoCCore):
 
         # CRG --------------------------------------------------------------------------------------
         with_dram = (kwargs.get("integrated_main_ram_size", 0) == 0)
-        self.crg  = _CRG(platform, sys_clk_freq, with_dram)
+        self.crg  = _CRG(platform, sys_clk_freq, with_dram, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ColorLight-i9+", **kwargs)
@@ -114,30 +123,35 @@ class BaseSoC(SoCCore):
 
         # SDRAM ------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            sdrphy_cls = GENSDRPHY
+            from litedram.modules import M12L64322A
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"))
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = M12L64322A(sys_clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                module        = M12L64322A(sys_clk_freq, sdram_rate),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_port),
                 pads       = self.platform.request("eth", eth_port),
                 tx_delay = 0)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_ethernet:
                 self.add_ethernet(
                     phy        = self.ethphy,
+                    data_width = eth_data_width,
                     dynamic_ip = eth_dynamic_ip,
                     local_ip   = None if eth_dynamic_ip else eth_ip,
                     remote_ip  = remote_ip,
                 )
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, **etherbone_args(self, etherbone_buffer_depth))
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -169,6 +183,7 @@ def main():
     parser = LiteXArgumentParser(platform=colorlight_i9plus.Platform, description="LiteX SoC on ColorLight-i9+.")
     parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",     default="1:1",             help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-dna",       action="store_true",       help="Enable 7-Series DNA.")
     parser.add_target_argument("--with-xadc",      action="store_true",       help="Enable 7-Series XADC.")
     parser.add_target_argument("--with-rgb-led",   action="store_true",       help="Enable WS2812 RGB LED on Ext-Board conn. P2, pin 26.")
@@ -178,27 +193,35 @@ def main():
     ethopts.add_argument("--with-etherbone",       action="store_true",       help="Enable Etherbone support.")
     parser.add_target_argument("--eth-port",       default=0, type=int,       help="Ethernet port to use (0/1)")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP address assignment.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI Flash.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_dna       = args.with_dna,
-        with_xadc      = args.with_xadc,
-        with_rgb_led   = args.with_rgb_led,
-        with_pmod_uart = args.with_pmod_uart,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_port       = args.eth_port,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_spi_flash = args.with_spi_flash,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        sdram_rate             = args.sdram_rate,
+        with_dna               = args.with_dna,
+        with_xadc              = args.with_xadc,
+        with_rgb_led           = args.with_rgb_led,
+        with_pmod_uart         = args.with_pmod_uart,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_port               = args.eth_port,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_spi_flash         = args.with_spi_flash,
         **parser.soc_argdict
     )
 
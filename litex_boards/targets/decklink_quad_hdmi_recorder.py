@@ -20,18 +20,13 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import decklink_quad_hdmi_recorder
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import H5TQ4G63CFR
-from litedram.phy import usddrphy
-
-from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -76,6 +71,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import H5TQ4G63CFR
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USDDRPHY(
                 pads             = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype          = "DDR3",
@@ -84,13 +82,14 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = H5TQ4G63CFR(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
         # disabling DRAM with --integrated-main-ram-size=0x100.
         if with_pcie:
+            from litepcie.phy.uspciephy import USPCIEPHY
             data_width = {
                 4 : 128,
                 8 : 256,
@@ -112,7 +111,10 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=200e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -127,6 +129,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -17,6 +17,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -27,11 +30,6 @@ from litex.soc.cores.gpio import GPIOIn, GPIOTristate
 from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna  import S7DNA
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -71,20 +69,24 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", toolchain="vivado", sys_clk_freq=100e6,
-        with_xadc       = False,
-        with_dna        = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        eth_dhcp        = False,
-        with_usb        = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
-        with_buttons    = False,
-        with_pmod_gpio  = False,
-        with_can        = False,
+        with_xadc              = False,
+        with_dna               = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        with_udp_streamer      = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        eth_dhcp               = False,
+        with_usb               = False,
+        with_led_chaser        = True,
+        with_spi_flash         = False,
+        with_sdram_calib_cache = False,
+        with_buttons           = False,
+        with_pmod_gpio         = False,
+        with_can               = False,
         **kwargs):
         platform = digilent_arty.Platform(variant=variant, toolchain=toolchain)
 
@@ -106,6 +108,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -113,31 +117,44 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_udp_streamer:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            if with_etherbone or with_udp_streamer:
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             elif with_ethernet:
                 self.add_ethernet(
                     phy         = self.ethphy,
+                    data_width  = eth_data_width,
                     dynamic_ip  = eth_dynamic_ip,
                     with_dhcp   = eth_dhcp,
                     local_ip    = None if (eth_dynamic_ip or eth_dhcp) else eth_ip,
                     remote_ip   = remote_ip,
                 )
 
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            from litex_boards.targets.udpstreamer.common import add_udp_streamer
+            add_udp_streamer(self, ethcore=self.ethcore_etherbone)
+
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
             from litespi.modules import S25FL128L
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128L(Codes.READ_1_1_4), rate="1:2", with_master=True)
 
+        # SDRAM Calibration Cache ------------------------------------------------------------------
+        if with_sdram_calib_cache and not self.integrated_main_ram_size:
+            from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache
+            add_sdram_calib_cache(self, phy=self.ddrphy)
+
         # USB-OHCI ---------------------------------------------------------------------------------
         if with_usb:
             from litex.soc.cores.usb_ohci import USBOHCI
@@ -211,7 +228,10 @@ def main():
     parser.add_target_argument("--with-usb",       action="store_true",       help="Enable USB Host.")
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--with-udp-streamer", action="store_true",    help="Enable DRAM to host UDP streamer (implies Etherbone).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--eth-dhcp",       action="store_true",       help="Enable Ethernet DHCP support.")
@@ -221,29 +241,40 @@ def main():
 
     parser.add_target_argument("--sdcard-adapter",                      help="SDCard PMOD adapter (digilent or numato).")
 
-    parser.add_target_argument("--with-spi-flash", action="store_true", help="Enable memory-mapped SPI flash.")
-    parser.add_target_argument("--with-pmod-gpio", action="store_true", help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
-    parser.add_target_argument("--with-can",       action="store_true", help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true", help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--with-sdram-calib-cache", action="store_true", help="Cache the DRAM leveling in SPI Flash (requires --with-spi-flash).")
+    parser.add_target_argument("--with-pmod-gpio",         action="store_true", help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    parser.add_target_argument("--with-can",               action="store_true", help="Enable CAN support (Through CTU-CAN-FD Core and SN65HVD230 'PMOD'.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+
+    if args.with_sdram_calib_cache and not args.with_spi_flash:
+        parser.error("--with-sdram-calib-cache requires --with-spi-flash.")
 
-    assert not (args.with_etherbone and (args.eth_dynamic_ip or args.eth_dhcp))
+    assert not ((args.with_etherbone or args.with_udp_streamer) and (args.eth_dynamic_ip or args.eth_dhcp))
 
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_xadc      = args.with_xadc,
-        with_dna       = args.with_dna,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        eth_dhcp       = args.eth_dhcp,
-        with_usb       = args.with_usb,
-        with_spi_flash = args.with_spi_flash,
-        with_pmod_gpio = args.with_pmod_gpio,
-        with_can       = args.with_can,
+        variant                = args.variant,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_xadc              = args.with_xadc,
+        with_dna               = args.with_dna,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        with_udp_streamer      = args.with_udp_streamer,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        eth_dhcp               = args.eth_dhcp,
+        with_usb               = args.with_usb,
+        with_spi_flash         = args.with_spi_flash,
+        with_sdram_calib_cache = args.with_sdram_calib_cache,
+        with_pmod_gpio         = args.with_pmod_gpio,
+        with_can               = args.with_can,
         **parser.soc_argdict
     )
 
@@ -257,6 +288,9 @@ def main():
         soc.add_sdcard()
 
     builder = Builder(soc, **parser.builder_argdict)
+    if args.with_sdram_calib_cache:
+        from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache_software
+        add_sdram_calib_cache_software(builder)
     if args.build:
         builder.build(**parser.toolchain_argdict)
 
@@ -12,15 +12,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty_s7
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -50,8 +49,9 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="s7-50", sys_clk_freq=100e6,
-        with_spi_flash  = False,
-        with_led_chaser = True,
+        with_spi_flash         = False,
+        with_sdram_calib_cache = False,
+        with_led_chaser        = True,
         **kwargs):
         platform = digilent_arty_s7.Platform(variant=variant)
 
@@ -63,6 +63,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -70,7 +72,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -79,6 +81,11 @@ class BaseSoC(SoCCore):
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S(Codes.READ_1_1_4), with_master=True)
 
+        # SDRAM Calibration Cache ------------------------------------------------------------------
+        if with_sdram_calib_cache and not self.integrated_main_ram_size:
+            from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache
+            add_sdram_calib_cache(self, phy=self.ddrphy)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.leds = LedChaser(
@@ -90,18 +97,29 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=digilent_arty_s7.Platform, description="LiteX SoC on Arty S7.")
-    parser.add_target_argument("--variant",        default="s7-50",           help="Board variant (s7-50 or s7-25).")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--variant",                default="s7-50",           help="Board variant (s7-50 or s7-25).")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",       help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--with-sdram-calib-cache", action="store_true",       help="Cache the DRAM leveling in SPI Flash (requires --with-spi-flash).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+
+    if args.with_sdram_calib_cache and not args.with_spi_flash:
+        parser.error("--with-sdram-calib-cache requires --with-spi-flash.")
 
     soc = BaseSoC(
-        variant        = args.variant,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_spi_flash = args.with_spi_flash,
+        variant                = args.variant,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_spi_flash         = args.with_spi_flash,
+        with_sdram_calib_cache = args.with_sdram_calib_cache,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
+    if args.with_sdram_calib_cache:
+        from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache_software
+        add_sdram_calib_cache_software(builder)
     if args.build:
         builder.build(**parser.toolchain_argdict)
 
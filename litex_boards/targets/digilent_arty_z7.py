@@ -32,6 +32,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_arty_z7
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 from litex.build.tools import write_to_file
 
 
@@ -168,7 +169,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.set_defaults(cpu_type="zynq7000")
     parser.set_defaults(no_uart=True)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant      = args.variant,
@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_basys3
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -71,7 +72,9 @@ def main():
     parser.add_target_argument("--sdcard-adapter",      help="SDCard PMOD adapter (digilent or numato).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal", action="store_true",        help="Enable Video Terminal (VGA).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
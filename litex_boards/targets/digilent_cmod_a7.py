@@ -12,6 +12,7 @@ from litex.gen import *
 
 
 from litex_boards.platforms import digilent_cmod_a7
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -143,7 +144,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",   default=48e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable memory-mapped SPI flash.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant        = args.variant,
@@ -7,23 +7,49 @@
 # Copyright (c) 2024 Gustavo Bastos <gustavocerq7gmail.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import ipaddress
+
 from migen import *
 
 from litex.gen import *
 
 from litex_boards.platforms import digilent_netfpga_sume
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args, parse_ddram_channels
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
+from litex.soc.interconnect import stream
+
+# SFP+ Ports ---------------------------------------------------------------------------------------
+
+SFP_PORTS      = range(4)
+SFP_PORT_MODES = ["mac", "udp", "stream"]
 
-from litedram.modules import MT8KTF51264
-from litedram.phy import s7ddrphy
+def parse_eth_ports(ports):
+    """Parse a port, a list of ports or a comma/range string ("0,2", "0-3", "all")."""
+    return parse_ddram_channels(ports, SFP_PORTS, name="Ethernet port")
 
+def check_eth_port_mode(mode):
+    if mode not in SFP_PORT_MODES:
+        raise ValueError(f"Unsupported Ethernet port mode {mode!r}, expected one of {SFP_PORT_MODES}")
+
+class _SFPStream(LiteXModule):
+    """Raw Ethernet frames of a SFP+ PHY (preamble/SFD and FCS included) in the sys clock domain."""
+    def __init__(self, phy, phy_cd):
+        from liteeth.common import eth_phy_description
+        self.tx_cdc = stream.ClockDomainCrossing(eth_phy_description(phy.dw), cd_from="sys", cd_to=f"{phy_cd}_tx")
+        self.rx_cdc = stream.ClockDomainCrossing(eth_phy_description(phy.dw), cd_from=f"{phy_cd}_rx", cd_to="sys")
+        self.comb += [
+            self.tx_cdc.source.connect(phy.sink),
+            phy.source.connect(self.rx_cdc.sink),
+        ]
+        self.sink, self.source = self.tx_cdc.sink, self.rx_cdc.source
 
-from liteeth.phy.v7_1000basex import V7_1000BASEX
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -51,13 +77,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_i2c        = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ports              = None,
+        eth_port_mode          = "mac",
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_i2c               = False,
         **kwargs):
         platform = digilent_netfpga_sume.Platform()
 
@@ -69,6 +99,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+             from litedram.modules import MT8KTF51264
+             from litedram.phy import s7ddrphy
              self.ddrphy = s7ddrphy.V7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -78,24 +110,82 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MT8KTF51264(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.ddrphy),
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
-            self.ethphy = V7_1000BASEX(
+        # The first of the SFP+ ports carries Ethernet/Etherbone (when enabled), the other ones are
+        # brought up as independent interfaces according to eth_port_mode.
+        if eth_ports is None and (with_ethernet or with_etherbone):
+            eth_ports = 0
+        eth_ports = () if eth_ports is None else parse_eth_ports(eth_ports)
+        check_eth_port_mode(eth_port_mode)
+        self.eth_streams = {}
+        self.eth_udp     = {}
+        if eth_ports:
+            from liteeth.phy.v7_1000basex import V7_1000BASEX
+        for n, port in enumerate(eth_ports):
+            # All the PHYs share the 200MHz SFP RefClk (V7_1000BASEX runs each GTH from its CPLL).
+            suffix = "" if n == 0 else str(port)
+            phy    = V7_1000BASEX(
                 refclk_or_clk_pads = self.crg.cd_sfp.clk,
-                data_pads          = self.platform.request("sfp"),
+                data_pads          = self.platform.request("sfp", port),
                 sys_clk_freq       = sys_clk_freq,
                 with_csr           = True
             )
-            self.comb += self.platform.request("sfp_tx_disable_n").eq(1)
+            self.add_module(name=f"ethphy{suffix}", module=phy)
+            phy_cd = "eth" if len(eth_ports) == 1 else f"ethphy{suffix}_eth"
+            eth_data_width = check_eth_data_width(phy, eth_data_width)
+            self.comb += self.platform.request("sfp_tx_disable_n", port).eq(1)
+            self.comb += self.platform.request("sfp_led", port)[0].eq(phy.link_up)
+
+            # Ethernet/Etherbone.
+            if n == 0 and (with_ethernet or with_etherbone):
+                if with_etherbone:
+                    self.add_etherbone(phy=phy, phy_cd=phy_cd, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
+                if with_ethernet:
+                    self.add_ethernet(phy=phy, phy_cd=phy_cd, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                continue
+
+            # CPU Ethernet MAC.
+            if eth_port_mode == "mac":
+                first = (n == 0)
+                self.add_ethernet(
+                    name       = f"ethmac{suffix}",
+                    phy        = phy,
+                    phy_cd     = phy_cd,
+                    data_width = eth_data_width,
+                    dynamic_ip = eth_dynamic_ip and first,
+                    local_ip   = eth_ip    if first and not eth_dynamic_ip else None,
+                    remote_ip  = remote_ip if first else None)
+                continue
+
+            # Hardware UDP/IP stack (ARP/ICMP answered in gateware, UDP ports from .udp.crossbar).
+            if eth_port_mode == "udp":
+                from liteeth.core import LiteEthUDPIPCore
+                ethcore = LiteEthUDPIPCore(
+                    phy         = phy,
+                    mac_address = 0x10e2d5000000 + port,
+                    ip_address  = str(ipaddress.IPv4Address(eth_ip) + n),
+                    clk_freq    = sys_clk_freq,
+                    dw          = 32,
+                    with_sys_datapath = True)
+                ethcore = ClockDomainsRenamer({
+                    "eth_tx": f"{phy_cd}_tx",
+                    "eth_rx": f"{phy_cd}_rx",
+                })(ethcore)
+                self.add_module(name=f"ethcore{suffix}", module=ethcore)
+                self.eth_udp[port] = ethcore
+
+            # Raw PHY stream.
+            if eth_port_mode == "stream":
+                self.eth_streams[port] = _SFPStream(phy, phy_cd)
+                self.add_module(name=f"ethstream{suffix}", module=self.eth_streams[port])
+
+            platform.add_false_path_constraints(self.crg.cd_sys.clk, phy.cd_eth_rx.clk, phy.cd_eth_tx.clk)
+        if eth_ports:
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks UCIO-1]")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-44]")
-        if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
-        if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -117,23 +207,39 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    parser.add_target_argument("--eth-ports",      default=None,            help="SFP+ ports to bring up (comma/range list or all, first one used by Ethernet/Etherbone).")
+    parser.add_target_argument("--eth-port-mode",  default="mac",           choices=SFP_PORT_MODES, help="Interface of the SFP+ ports not used by Ethernet/Etherbone (CPU MAC, UDP/IP stack or raw stream).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+    if args.eth_ports is not None:
+        try:
+            parse_eth_ports(args.eth_ports)
+        except ValueError as e:
+            parser.error(str(e))
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_etherbone = args.with_etherbone,
-        with_i2c       = args.with_i2c,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        eth_ports              = args.eth_ports,
+        eth_port_mode          = args.eth_port_mode,
+        with_i2c               = args.with_i2c,
         **parser.soc_argdict
     )
 
@@ -14,6 +14,8 @@ from litex.gen import *
 
 
 from litex_boards.platforms import digilent_nexys4
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -24,7 +26,6 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.integration.soc import colorer
 from litex.soc.cores.video import VideoVGAPHY
-from liteeth.phy.rmii import LiteEthPHYRMII
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -170,6 +171,7 @@ class BaseSoC(SoCCore):
         with_ethernet          = False,
         with_etherbone         = False,
         eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
         remote_ip              = None,
         eth_dynamic_ip         = False,
         with_video_terminal    = False,
@@ -188,11 +190,12 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
@@ -220,6 +223,7 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
@@ -228,12 +232,15 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
         eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         remote_ip              = args.remote_ip,
         with_etherbone         = args.with_etherbone,
@@ -11,6 +11,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_nexys4ddr
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -19,11 +22,6 @@ from litex.soc.cores.video import VideoVGAPHY
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.seven_seg import SevenSegmentDisplay
 
-from litedram.modules import MT47H64M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -55,10 +53,12 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
         with_spi_flash         = False,
+        with_sdram_calib_cache = False,
         with_seven_seg         = False,
         with_ethernet          = False,
         with_etherbone         = False,
         eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
         remote_ip              = None,
         eth_dynamic_ip         = False,
         with_led_chaser        = True,
@@ -75,6 +75,8 @@ class BaseSoC(SoCCore):
 
         # DDR2 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT47H64M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR2",
                 nphases      = 2,
@@ -82,7 +84,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT47H64M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # 7-Segment Display ------------------------------------------------------------------------
@@ -100,13 +102,19 @@ class BaseSoC(SoCCore):
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S(Codes.READ_1_1_4), with_master=True)
 
+        # SDRAM Calibration Cache ------------------------------------------------------------------
+        if with_sdram_calib_cache and not self.integrated_main_ram_size:
+            from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache
+            add_sdram_calib_cache(self, phy=self.ddrphy)
+
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             elif with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
@@ -133,26 +141,36 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
-    parser.add_target_argument("--with-spi-flash", action="store_true",     help="Enable memory-mapped SPI flash.")
-    parser.add_target_argument("--with-seven-seg", action="store_true",     help="Enable 7-segment display support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",     help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--with-sdram-calib-cache", action="store_true",     help="Cache the DRAM leveling in SPI Flash (requires --with-spi-flash).")
+    parser.add_target_argument("--with-seven-seg",         action="store_true",     help="Enable 7-segment display support.")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",     help="Enable dynamic Ethernet IP assignment.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100", help="Remote IP address of TFTP server.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+
+    if args.with_sdram_calib_cache and not args.with_spi_flash:
+        parser.error("--with-sdram-calib-cache requires --with-spi-flash.")
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
         with_spi_flash         = args.with_spi_flash,
+        with_sdram_calib_cache = args.with_sdram_calib_cache,
         with_seven_seg         = args.with_seven_seg,
         eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         remote_ip              = args.remote_ip,
         with_video_terminal    = args.with_video_terminal,
@@ -164,6 +182,9 @@ def main():
     if args.with_sdcard:
         soc.add_sdcard()
     builder = Builder(soc, **parser.builder_argdict)
+    if args.with_sdram_calib_cache:
+        from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache_software
+        add_sdram_calib_cache_software(builder)
     if args.build:
         builder.build(**parser.toolchain_argdict)
 
@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_pynq_z1
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 
 from litex.soc.integration.soc import *
@@ -97,7 +98,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",        default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-video-terminal", action="store_true",       help="Enable Video Terminal (HDMI).")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
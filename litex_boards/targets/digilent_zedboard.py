@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import digilent_zedboard
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 from litex.build.tools import write_to_file
 
 
@@ -143,7 +144,9 @@ def main():
     parser = LiteXArgumentParser(platform=digilent_zedboard.Platform, description="LiteX SoC on Zedboard.")
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float, help="System clock frequency.")
     parser.set_defaults(cpu_type="zynq7000")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import ebaz4205
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 
 from litex.soc.cores.clock import *
@@ -66,7 +67,9 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=ebaz4205.Platform, description="LiteX SoC on EBAZ4205.")
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
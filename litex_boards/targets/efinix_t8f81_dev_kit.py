@@ -15,6 +15,7 @@ from litex.gen import *
 from litex.gen.genlib.misc import WaitTimer
 
 from litex_boards.platforms import efinix_t8f81_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -94,7 +95,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",      default=33.333e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--bios-flash-offset", default="0x40000",            help="BIOS offset in SPI Flash.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         bios_flash_offset = int(args.bios_flash_offset, 0),
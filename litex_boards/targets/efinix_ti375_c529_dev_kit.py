@@ -14,6 +14,8 @@ from litex.build.io import DDROutput, DDRInput, SDRTristate
 from litex.build.generic_platform import Subsignal, Pins, Misc, IOStandard
 
 from litex_boards.platforms import efinix_ti375_c529_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.soc import SoCRegion
@@ -237,21 +239,23 @@ class BaseSoC(SoCCore):
     }}
 
     def __init__(self,
-            sys_clk_freq   = 100e6,
-            cpu_clk_freq   = 100e6,
-            with_spi_flash = False,
-            spi_flash_number = 0,
-            spi_flash_rate = "1:1",
-            with_ethernet  = False,
-            with_etherbone = False,
-            with_ptp       = False,
-            eth_phy        = "rgmii",
-            eth_ip         = "192.168.1.50",
-            remote_ip      = None,
-            eth_dynamic_ip = False,
-            ptp_p2p        = False,
-            ptp_debug      = False,
-            with_ohci      = False,
+            sys_clk_freq           = 100e6,
+            cpu_clk_freq           = 100e6,
+            with_spi_flash         = False,
+            spi_flash_number       = 0,
+            spi_flash_rate         = "1:1",
+            with_ethernet          = False,
+            with_etherbone         = False,
+            with_ptp               = False,
+            eth_phy                = "rgmii",
+            eth_ip                 = "192.168.1.50",
+            eth_data_width         = 8,
+            etherbone_buffer_depth = 16,
+            remote_ip              = None,
+            eth_dynamic_ip         = False,
+            ptp_p2p                = False,
+            ptp_debug              = False,
+            with_ohci              = False,
             **kwargs):
         platform = efinix_ti375_c529_dev_kit.Platform()
 
@@ -375,6 +379,7 @@ class BaseSoC(SoCCore):
                 self.ethphy.crg.cd_eth_rx.clk,
                 self.ethphy.crg.cd_eth_tx.clk,
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
                 ptp_igmp_groups = None
                 if with_ptp:
@@ -383,12 +388,14 @@ class BaseSoC(SoCCore):
                         ptp_igmp_groups.append(0xE000006B)     # 224.0.0.107.
                 self.add_etherbone(
                     phy                     = self.ethphy,
+                    data_width              = eth_data_width,
                     ip_address              = eth_ip,
                     with_timing_constraints = False,
                     with_ethmac             = with_ethernet,
                     with_igmp               = with_ptp,
                     igmp_groups             = ptp_igmp_groups,
                     igmp_interval           = 2,
+                    **etherbone_args(self, etherbone_buffer_depth),
                 )
 
                 if with_ptp:
@@ -415,6 +422,7 @@ class BaseSoC(SoCCore):
             elif with_ethernet:
                 self.add_ethernet(
                     phy                     = self.ethphy,
+                    data_width              = eth_data_width,
                     dynamic_ip              = eth_dynamic_ip,
                     local_ip                = eth_ip,
                     remote_ip               = remote_ip,
@@ -641,27 +649,33 @@ def main():
     parser.add_target_argument("--with-ptp",       action="store_true",                                          help="Enable PTP support over Etherbone.")
     parser.add_target_argument("--eth-phy",        default=None, type=str, choices=["rgmii", "sfp0", "sfp1"], help="Ethernet PHY. Defaults to rgmii unless explicitly specified.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",                                       help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",                                          help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--ptp-p2p",        action="store_true",                                          help="Enable PTP P2P mode.")
     parser.add_target_argument("--ptp-debug",      action="store_true",                                          help="Enable PTP debug monitor CSRs.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",                                      help="Remote IP address of TFTP server.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     eth_phy = args.eth_phy if args.eth_phy is not None else "rgmii"
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        cpu_clk_freq   = args.cpu_clk_freq,
-        with_ohci      = args.with_ohci,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_ptp       = args.with_ptp,
-        eth_phy        = eth_phy,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        ptp_p2p        = args.ptp_p2p,
-        ptp_debug      = args.ptp_debug,
-        remote_ip      = args.remote_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        cpu_clk_freq           = args.cpu_clk_freq,
+        with_ohci              = args.with_ohci,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        with_ptp               = args.with_ptp,
+        eth_phy                = eth_phy,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        ptp_p2p                = args.ptp_p2p,
+        ptp_debug              = args.ptp_debug,
+        remote_ip              = args.remote_ip,
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -12,6 +12,8 @@ from litex.gen import *
 from litex.gen.genlib.misc import WaitTimer
 
 from litex_boards.platforms import efinix_titanium_ti60_f225_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -21,8 +23,6 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.hyperbus import HyperRAM
 
-from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -62,14 +62,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=200e6,
-        with_spi_flash = False,
-        with_hyperram  = False,
-        with_ethernet  = False,
-        with_etherbone = False,
-        eth_phy        = 0,
-        eth_ip         = "192.168.1.50",
-        remote_ip      = None,
-        eth_dynamic_ip = False,
+        with_spi_flash         = False,
+        with_hyperram          = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_phy                = 0,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
         **kwargs):
         platform = efinix_titanium_ti60_f225_dev_kit.Platform()
 
@@ -119,6 +121,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
             platform.add_extension(efinix_titanium_ti60_f225_dev_kit.rgmii_ethernet_qse_ios("P1"))
             pads = platform.request("eth", eth_phy)
             self.ethphy = LiteEthPHYRGMII(
@@ -126,10 +129,11 @@ class BaseSoC(SoCCore):
                 clock_pads         = platform.request("eth_clocks", eth_phy),
                 pads               = pads,
                 with_hw_init_reset = False)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -147,21 +151,27 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-phy",        default=0, type=int,     help="Ethernet PHY: 0 (default) or 1.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_spi_flash = args.with_spi_flash,
-        with_hyperram  = args.with_hyperram,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        eth_phy        = args.eth_phy,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_spi_flash         = args.with_spi_flash,
+        with_hyperram          = args.with_hyperram,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        eth_phy                = args.eth_phy,
          **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
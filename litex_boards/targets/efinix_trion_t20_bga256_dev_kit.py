@@ -13,6 +13,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import efinix_trion_t20_bga256_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.build.io import ClkOutput
 from litex.build.generic_platform import *
@@ -24,17 +26,18 @@ from litex.soc.cores.led import LedChaser
 
 from litex.gen.genlib.misc import WaitTimer
 
-from litedram.modules import NDS36PT5
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
-        self.cd_rst    = ClockDomain(reset_less=True)
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+        self.rst    = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
+        self.cd_rst = ClockDomain(reset_less=True)
 
         # # #
 
@@ -55,29 +58,37 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(~rst_n | self.rst_pulse)
         pll.register_clkin(clk50, platform.default_clk_freq)
         pll.create_clkout(self.cd_sys, sys_clk_freq, with_reset=True)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=180)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=180)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=100e6, with_spi_flash=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, sdram_rate="1:1", with_spi_flash=False, with_led_chaser=True, **kwargs):
         platform = efinix_trion_t20_bga256_dev_kit.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Efinix Trion T20 BGA256 Dev Kit", **kwargs)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size and sys_clk_freq <= 50e6 :
-            self.specials += ClkOutput(ClockSignal("sys_ps"), platform.request("sdram_clock"))
+            from litedram.modules import NDS36PT5
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+            self.specials += ClkOutput(sdram_clk, platform.request("sdram_clock"))
 
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = NDS36PT5(sys_clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                module        = NDS36PT5(sys_clk_freq, sdram_rate),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy),
                 with_bist     = kwargs.get("with_bist", False)
             )
 
@@ -100,11 +111,16 @@ def main():
     parser = LiteXArgumentParser(platform=efinix_trion_t20_bga256_dev_kit.Platform, description="LiteX SoC on Efinix Trion T20 BGA256 Dev Kit.")
     parser.add_target_argument("--flash",          action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=45e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",     default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable memory-mapped SPI flash.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
+        sdram_rate     = args.sdram_rate,
         with_spi_flash = args.with_spi_flash,
          **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
@@ -12,6 +12,7 @@ from litex.gen import *
 from litex.gen.genlib.misc import WaitTimer
 
 from litex_boards.platforms import efinix_trion_t20_mipi_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.build.generic_platform import *
 
@@ -79,7 +80,9 @@ def main():
     parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI flash.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc     = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
@@ -13,6 +13,7 @@ from litex.gen import *
 from litex.build.generic_platform import Subsignal, Pins
 
 from litex_boards.platforms import efinix_tz170_j484_dev_kit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.soc import SoCRegion
@@ -297,7 +298,9 @@ def main():
     parser.add_target_argument("--spi-flash-number", default=0, type=int, choices=[0, 1],             help="SPI Flash number.")
     parser.add_target_argument("--spi-flash-rate",   default="1:2", type=str, choices=["1:1", "1:2"], help="SPI Flash rate.")
     parser.add_target_argument("--with-led-chaser",  action="store_true",                             help="Enable LED Chaser.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(args.sys_clk_freq, args.cpu_clk_freq, args.with_spi_flash,
                   args.spi_flash_number, args.spi_flash_rate, args.with_led_chaser, **parser.soc_argdict)
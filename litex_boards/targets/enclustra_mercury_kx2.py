@@ -12,15 +12,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import enclustra_mercury_kx2, enclustra_st1
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import H5TC4G63CFR
-from litedram.phy import s7ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -59,6 +58,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import H5TC4G63CFR
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -67,7 +68,7 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = H5TC4G63CFR(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -83,7 +84,10 @@ def main():
     parser = LiteXArgumentParser(platform=enclustra_mercury_kx2.Platform, description="LiteX SoC on Enclustra Mercury+ KX2.")
     parser.add_target_argument("--sys-clk-freq",       default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-st1-baseboard", action="store_true",       help="add enclustra ST1 baseboard")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq       = args.sys_clk_freq,
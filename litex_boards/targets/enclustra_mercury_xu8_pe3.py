@@ -11,18 +11,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import enclustra_mercury_xu8_pe3
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A256M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -75,6 +71,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 speed      = "gen3",
                 data_width = {4: 128, 8: 256}[pcie_lanes],
@@ -84,6 +81,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A256M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -92,7 +91,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT40A256M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.ddrphy),
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -111,7 +110,10 @@ def main():
     parser.add_target_argument("--with-pcie",    action="store_true",        help="Enable PCIe support.")
     parser.add_target_argument("--pcie-lanes",   default=4, type=int,        choices=[4, 8], help="PCIe lane count.")
     parser.add_target_argument("--driver",       action="store_true",        help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
          sys_clk_freq = args.sys_clk_freq,
@@ -127,6 +129,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
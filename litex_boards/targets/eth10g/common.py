@@ -0,0 +1,246 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from functools import reduce
+from operator import and_
+
+from migen import *
+
+from litex.gen import *
+
+from liteiclink.serdes.gty_ultrascale import GTYQuadPLL
+
+from liteeth.phy.xgmii import XGMII_IDLE, XGMII_START, XGMII_END
+from liteeth.phy.xgmii import LiteEthPHYXGMIITX, LiteEthPHYXGMIIRX
+from liteeth.phy.usp_gty_10g_baser import USP_GTY_10G_BASER
+
+# 10GBASE-R ----------------------------------------------------------------------------------------
+
+# LiteEth provides the raw 64b/66b GTY transceiver (USP_GTY_10G_BASER) and the 64-bit XGMII PHY
+# logic, but nothing in between: the 10GBASE-R PCS (IEEE 802.3 Clause 49: 64b/66b encoding,
+# x^58 + x^39 + 1 scrambling and block lock) is implemented here to connect them, giving a 64-bit
+# LiteEth PHY (156.25MHz eth_tx/eth_rx clock domains) for the SFP+/QSFP cages of the targets.
+
+ETH_10GBASER_LINERATE = 10.3125e9
+
+XGMII_ERROR = Constant(0xFE, bits_sign=8)
+
+# Sync headers/Block types, in IEEE bit order (bit 0 transmitted first).
+SYNC_DATA = 0b10
+SYNC_CTRL = 0b01
+
+BLOCK_TYPE_C    = 0x1e # C0-C7.
+BLOCK_TYPE_S0   = 0x78 # S0 D1-D7.
+BLOCK_TYPE_O_S4 = 0x66 # O0 S4 D5-D7.
+BLOCK_TYPE_C_S4 = 0x33 # C0-C3 S4 D5-D7.
+BLOCK_TYPE_T    = [0x87, 0x99, 0xaa, 0xb4, 0xcc, 0xd2, 0xe1, 0xff] # D0-D(k-1) Tk C(k+1)-C7.
+
+CTRL_IDLE  = 0x00
+CTRL_ERROR = 0x1e
+
+def _scramble(data, state, descramble=False):
+    """Self-synchronizing x^58 + x^39 + 1 (de)scrambling of `data` (bit 0 first) with the 58 previous
+    scrambled bits in `state` (oldest first), returns the output and next state expressions."""
+    stream = [state[i] for i in range(58)]
+    output = []
+    for i in range(len(data)):
+        bit = data[i] ^ stream[-39] ^ stream[-58]
+        output.append(bit)
+        stream.append(data[i] if descramble else bit)
+    return Cat(*output), Cat(*stream[-58:])
+
+# 10GBASE-R PCS TX ---------------------------------------------------------------------------------
+
+class _PCS10GBASERTX(LiteXModule):
+    def __init__(self, xgmii_data, xgmii_ctl):
+        self.data   = Signal(64) # Scrambled block payload (IEEE bit order).
+        self.header = Signal(2)  # Block sync header (IEEE bit order).
+
+        # # #
+
+        lanes = [xgmii_data[8*i:8*(i+1)] for i in range(8)]
+
+        # 64b/66b Encoder (XGMII from LiteEthPHYXGMIITX: Idles, Starts on lane 0/4, Terminates
+        # followed by Idles, anything else is encoded as Errors).
+        payload = Signal(64)
+        header  = Signal(2)
+        self.comb += [
+            header.eq(SYNC_CTRL),
+            payload.eq(Cat(Constant(BLOCK_TYPE_C, 8), Replicate(Constant(CTRL_ERROR, 7), 8))),
+            If(xgmii_ctl == 0x00,
+                header.eq(SYNC_DATA),
+                payload.eq(xgmii_data),
+            ).Elif((xgmii_ctl == 0xff) & reduce(and_, [lane == XGMII_IDLE for lane in lanes]),
+                payload.eq(BLOCK_TYPE_C),
+            ).Elif((xgmii_ctl == 0x01) & (lanes[0] == XGMII_START),
+                payload.eq(Cat(Constant(BLOCK_TYPE_S0, 8), *lanes[1:])),
+            ).Elif((xgmii_ctl == 0x1f) & (lanes[4] == XGMII_START),
+                payload.eq(Cat(Constant(BLOCK_TYPE_C_S4, 8), Constant(0, 32), *lanes[5:])),
+            )
+        ]
+        for k, block_type in enumerate(BLOCK_TYPE_T):
+            self.comb += If((xgmii_ctl == ((0xff << k) & 0xff)) & (lanes[k] == XGMII_END),
+                payload.eq(Cat(Constant(block_type, 8), *lanes[:k])),
+            )
+
+        # Scrambler.
+        state = Signal(58)
+        scrambled, next_state = _scramble(payload, state)
+        self.sync += [
+            state.eq(next_state),
+            self.data.eq(scrambled),
+            self.header.eq(header),
+        ]
+
+# 10GBASE-R PCS RX ---------------------------------------------------------------------------------
+
+class _PCS10GBASERRX(LiteXModule):
+    def __init__(self, xgmii_data, xgmii_ctl):
+        self.data       = Signal(64) # Scrambled block payload (IEEE bit order).
+        self.header     = Signal(2)  # Block sync header (IEEE bit order).
+        self.slip       = Signal()
+        self.block_lock = Signal()
+
+        # # #
+
+        # Block Lock (64 consecutive valid sync headers to lock, 16 invalid ones out of 64 to unlock;
+        # the gearbox is slipped by one bit on each failed attempt).
+        header_valid  = Signal()
+        header_count  = Signal(6)
+        invalid_count = Signal(4)
+        slip_wait     = Signal(6)
+        slip          = [
+            self.block_lock.eq(0),
+            self.slip.eq(1),
+            header_count.eq(0),
+            invalid_count.eq(0),
+            slip_wait.eq(2**len(slip_wait) - 1),
+        ]
+        self.comb += header_valid.eq(self.header[0] ^ self.header[1])
+        self.sync += [
+            self.slip.eq(0),
+            If(slip_wait != 0,
+                slip_wait.eq(slip_wait - 1)
+            ).Elif(~self.block_lock,
+                If(header_valid,
+                    header_count.eq(header_count + 1),
+                    If(header_count == (2**len(header_count) - 1),
+                        self.block_lock.eq(1)
+                    )
+                ).Else(*slip)
+            ).Else(
+                header_count.eq(header_count + 1),
+                If(header_count == (2**len(header_count) - 1),
+                    invalid_count.eq(0)
+                ),
+                If(~header_valid,
+                    invalid_count.eq(invalid_count + 1),
+                    If(invalid_count == (2**len(invalid_count) - 1), *slip)
+                )
+            )
+        ]
+
+        # Descrambler.
+        state = Signal(58)
+        payload, next_state = _scramble(self.data, state, descramble=True)
+        self.sync += state.eq(next_state)
+
+        # 64b/66b Decoder (Ordered Sets are decoded as Idles, invalid blocks as Errors).
+        lanes      = [payload[8*i:8*(i+1)] for i in range(8)]
+        codes      = [payload[8+7*i:8+7*(i+1)] for i in range(8)]
+        block_type = payload[:8]
+        data       = Signal(64)
+        ctl        = Signal(8)
+        error      = [data.eq(Replicate(XGMII_ERROR, 8)), ctl.eq(0xff)]
+        idle       = [data.eq(Replicate(XGMII_IDLE,  8)), ctl.eq(0xff)]
+        start4     = [data.eq(Cat(Replicate(XGMII_IDLE, 4), XGMII_START, *lanes[5:])), ctl.eq(0x1f)]
+        cases = {
+            BLOCK_TYPE_C    : [
+                data.eq(Cat(*[Mux(code == CTRL_IDLE, XGMII_IDLE, XGMII_ERROR) for code in codes])),
+                ctl.eq(0xff),
+            ],
+            BLOCK_TYPE_S0   : [data.eq(Cat(XGMII_START, *lanes[1:])), ctl.eq(0x01)],
+            BLOCK_TYPE_O_S4 : start4,
+            BLOCK_TYPE_C_S4 : start4,
+            0x2d            : idle, # C0-C3 O4.
+            0x4b            : idle, # O0 C4-C7.
+            0x55            : idle, # O0 O4.
+            "default"       : error,
+        }
+        for k, block_type_t in enumerate(BLOCK_TYPE_T):
+            cases[block_type_t] = [
+                data.eq(Cat(*lanes[1:k+1], XGMII_END, *([XGMII_IDLE]*(7 - k)))),
+                ctl.eq((0xff << k) & 0xff),
+            ]
+        self.comb += [
+            If(self.header == SYNC_DATA,
+                data.eq(payload),
+                ctl.eq(0x00),
+            ).Elif(self.header == SYNC_CTRL,
+                Case(block_type, cases)
+            ).Else(*error)
+        ]
+        self.sync += [
+            xgmii_data.eq(data),
+            xgmii_ctl.eq(ctl),
+            If(~self.block_lock,
+                xgmii_data.eq(Replicate(XGMII_IDLE, 8)),
+                xgmii_ctl.eq(0xff),
+            )
+        ]
+
+# USP GTY 10GBASE-R PHY ----------------------------------------------------------------------------
+
+class USP_GTY_10GBASER_QPLL(GTYQuadPLL):
+    """10GBASE-R GTY Quad PLL from `refclk_or_clk_pads`, shared by the channels of its Quad."""
+    def __init__(self, refclk_or_clk_pads, refclk_freq):
+        if isinstance(refclk_or_clk_pads, Signal):
+            refclk = refclk_or_clk_pads
+        else:
+            refclk = Signal()
+            self.specials += Instance("IBUFDS_GTE4",
+                i_CEB = 0,
+                i_I   = refclk_or_clk_pads.p,
+                i_IB  = refclk_or_clk_pads.n,
+                o_O   = refclk,
+            )
+        GTYQuadPLL.__init__(self, refclk, refclk_freq, ETH_10GBASER_LINERATE)
+
+class USP_GTY_10GBASER(USP_GTY_10G_BASER):
+    """64-bit 10GBASE-R LiteEth PHY on a GTY channel clocked from a USP_GTY_10GBASER_QPLL."""
+    dw          = 64
+    tx_clk_freq = ETH_10GBASER_LINERATE/66
+    rx_clk_freq = ETH_10GBASER_LINERATE/66
+    def __init__(self, pll, data_pads, sys_clk_freq, tx_polarity=0, rx_polarity=0):
+        USP_GTY_10G_BASER.__init__(self, pll, data_pads, sys_clk_freq,
+            tx_polarity = tx_polarity,
+            rx_polarity = rx_polarity)
+        self.integrated_ifg_inserter = True
+
+        # # #
+
+        # PCS.
+        self.xgmii = xgmii = Record([
+            ("tx_data", 64), ("tx_ctl", 8),
+            ("rx_data", 64), ("rx_ctl", 8),
+        ])
+        self.pcs_tx = ClockDomainsRenamer("eth_tx")(_PCS10GBASERTX(xgmii.tx_data, xgmii.tx_ctl))
+        self.pcs_rx = ClockDomainsRenamer("eth_rx")(_PCS10GBASERRX(xgmii.rx_data, xgmii.rx_ctl))
+
+        # The GTY gearbox transmits/receives the header and data MSB first.
+        self.comb += [
+            self.tx_data.eq(self.pcs_tx.data[::-1]),
+            self.tx_header.eq(self.pcs_tx.header[::-1]),
+            self.rx_slip.eq(self.pcs_rx.slip),
+        ]
+        self.sync.eth_rx += [
+            self.pcs_rx.data.eq(self.rx_data[::-1]),
+            self.pcs_rx.header.eq(self.rx_header[::-1]),
+        ]
+
+        # XGMII.
+        self.tx = ClockDomainsRenamer("eth_tx")(LiteEthPHYXGMIITX(xgmii, self.dw))
+        self.rx = ClockDomainsRenamer("eth_rx")(LiteEthPHYXGMIIRX(xgmii, self.dw))
+        self.sink, self.source = self.tx.sink, self.rx.source
@@ -0,0 +1,49 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Ethernet Data Width ------------------------------------------------------------------------------
+
+# --eth-data-width selects the datapath width of the LiteEth MAC/UDP cores added by add_ethernet()/
+# add_etherbone(): 8 keeps the LiteX default (8-bit datapath, in the PHY clock domains when possible),
+# 32 runs the datapath on 32-bit in the sys clock domain (1Gbps line rate from a 31.25MHz sys clock)
+# and 64 runs it on 64-bit (required by 10Gbps PHYs).
+
+ETH_DATA_WIDTHS = [8, 32, 64]
+
+def check_eth_data_width(phy, data_width=None):
+    """Check `data_width` (--eth-data-width) against the data width of `phy` and return it.
+
+    None selects the PHY data width. Raises ValueError for unsupported widths and for widths smaller
+    than the PHY data width.
+    """
+    phy_dw = getattr(phy, "dw", 8)
+    if data_width is None:
+        data_width = phy_dw
+    if data_width not in ETH_DATA_WIDTHS:
+        raise ValueError(f"Ethernet data width must be one of {ETH_DATA_WIDTHS}, got {data_width}")
+    if data_width < phy_dw:
+        raise ValueError(f"Ethernet data width ({data_width}) is smaller than the PHY data width ({phy_dw})")
+    return data_width
+
+# Etherbone Buffer Depth ---------------------------------------------------------------------------
+
+# --etherbone-buffer-depth sets the depth of the Etherbone record buffers, which bounds the number of
+# words of a single Etherbone read/write record: the LiteX default (16) makes litex_server memory
+# dumps and firmware uploads round-trip bound, 255 (the Etherbone record count limit) allows bursts
+# of up to 1KB per packet.
+
+ETHERBONE_BUFFER_DEPTH     = 16  # LiteX add_etherbone() default.
+ETHERBONE_BUFFER_DEPTH_MAX = 255
+
+def etherbone_args(soc, buffer_depth=ETHERBONE_BUFFER_DEPTH):
+    """add_etherbone() arguments for --etherbone-buffer-depth.
+
+    The depth is recorded in the SoC constants (ETHERBONE_BUFFER_DEPTH) so that host tools can size
+    their bursts from the csr.csv. Raises ValueError for depths outside 1..255.
+    """
+    if not (1 <= buffer_depth <= ETHERBONE_BUFFER_DEPTH_MAX):
+        raise ValueError(f"Etherbone buffer depth must be between 1 and {ETHERBONE_BUFFER_DEPTH_MAX}, got {buffer_depth}")
+    soc.add_constant("ETHERBONE_BUFFER_DEPTH", buffer_depth, check_duplicate=False)
+    return {"buffer_depth": buffer_depth}
@@ -31,6 +31,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import fairwaves_xtrx
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -39,9 +40,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.clock import *
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -79,6 +77,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
                 data_width = 64,
                 bar0_size  = 0x20000)
@@ -111,7 +110,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -126,6 +127,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -14,6 +14,7 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import gadgetfactory_papilio_pro
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -21,9 +22,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoVGAPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC4M16
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -62,14 +60,14 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=80e6,
+    def __init__(self, sys_clk_freq=80e6, sdram_rate="1:1",
         with_led_chaser     = True,
         with_video_terminal = False,
         **kwargs):
         platform = gadgetfactory_papilio_pro.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         if kwargs.get("cpu_type", "vexriscv") == "vexriscv":
@@ -78,11 +76,13 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            sdrphy_cls = GENSDRPHY
+            from litedram.modules import MT48LC4M16
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = MT48LC4M16(sys_clk_freq, "1:2"),
+                module        = MT48LC4M16(sys_clk_freq, sdram_rate),
                 l2_cache_size = 0
             )
 
@@ -104,11 +104,15 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=gadgetfactory_papilio_pro.Platform, description="LiteX SoC on Papilio Pro.")
     parser.add_target_argument("--sys-clk-freq",        default=80e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",          default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (VGA).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
+        sdram_rate          = args.sdram_rate,
         with_video_terminal = args.with_video_terminal,
         **parser.soc_argdict
     )
@@ -15,6 +15,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import gmm7550
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock.colognechip import GateMatePLL
 
@@ -247,7 +248,9 @@ def main():
 
     parser.set_defaults(cpu_type="vexriscv")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
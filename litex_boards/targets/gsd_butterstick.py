@@ -18,6 +18,9 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import gsd_butterstick
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -25,11 +28,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOTristate
 
-from litedram.modules import MT41K64M16,MT41K128M16,MT41K256M16,MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -81,15 +79,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, revision="1.0", device="85F", sys_clk_freq=60e6, toolchain="trellis",
-        sdram_device     = "MT41K64M16",
-        with_ethernet    = False,
-        with_etherbone   = False,
-        eth_ip           = "192.168.1.50",
-        remote_ip        = None,
-        eth_dynamic_ip   = False,
-        with_spi_flash   = False,
-        with_led_chaser  = True,
-        with_syzygy_gpio = True,
+        sdram_device           = "MT41K64M16",
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_spi_flash         = False,
+        with_led_chaser        = True,
+        with_syzygy_gpio       = True,
         **kwargs)       :
         platform = gsd_butterstick.Platform(revision=revision, device=device ,toolchain=toolchain)
 
@@ -103,6 +103,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -119,20 +121,22 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = sdram_module(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9, # KSZ9031RNX phy adds a 1.2ns RX delay
                 )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -166,6 +170,8 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-spi-flash", action="store_true",     help="Enable memory-mapped SPI flash.")
@@ -173,23 +179,28 @@ def main():
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-syzygy-gpio",    action="store_true",        help="Enable GPIOs through SYZYGY Breakout on Port-A.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        toolchain        = args.toolchain,
-        revision         = args.revision,
-        device           = args.device,
-        sdram_device     = args.sdram_device,
-        sys_clk_freq     = args.sys_clk_freq,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        remote_ip        = args.remote_ip,
-        eth_dynamic_ip   = args.eth_dynamic_ip,
-        with_spi_flash   = args.with_spi_flash,
-        with_syzygy_gpio = args.with_syzygy_gpio,
+        toolchain              = args.toolchain,
+        revision               = args.revision,
+        device                 = args.device,
+        sdram_device           = args.sdram_device,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_spi_flash         = args.with_spi_flash,
+        with_syzygy_gpio       = args.with_syzygy_gpio,
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -14,15 +14,14 @@ from litex.gen import *
 from litex.gen.genlib.misc import WaitTimer
 
 from litex_boards.platforms import gsd_orangecrab
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -166,6 +165,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -190,7 +191,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = sdram_module(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -210,7 +211,10 @@ def main():
     parser.add_target_argument("--sdram-device",    default="MT41K64M16",     help="SDRAM device (MT41K64M16, MT41K128M16, MT41K256M16 or MT41K512M16).")
     parser.add_target_argument("--with-spi-sdcard", action="store_true",      help="Enable SPI-mode SDCard support.")
     parser.add_target_argument("--without-dfu-rst", action="store_true",      help="Disable DFU Reset when pressing Button for 1s.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
@@ -21,6 +21,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import hyvision_pcie_opt01_revf
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -28,15 +31,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.common  import PHYPadsReducer
-from litedram.modules import K4T1G164QGBCE7
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.k7_1000basex import K7_1000BASEX
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -70,14 +64,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_sfp         = 0,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
+        with_led_chaser        = True,
+        with_pcie              = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_sfp                = 0,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
         **kwargs):
         platform = hyvision_pcie_opt01_revf.Platform()
 
@@ -89,6 +85,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width      = 128,
                 bar0_size       = 0x20000,
@@ -98,6 +95,9 @@ class BaseSoC(SoCCore):
 
         # DDR2 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import K4T1G164QGBCE7
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram"), [0, 1]),
                 memtype      = "DDR2",
@@ -106,11 +106,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = K4T1G164QGBCE7(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.k7_1000basex import K7_1000BASEX
             self.ethphy = K7_1000BASEX(
                 refclk_or_clk_pads = self.crg.cd_eth.clk,
                 data_pads          = self.platform.request("sfp", eth_sfp),
@@ -120,10 +121,11 @@ class BaseSoC(SoCCore):
             self.comb += self.platform.request("sfp_tx_disable", eth_sfp).eq(0)
             self.comb += self.platform.request("sfp_rs0",        eth_sfp).eq(1)
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -147,23 +149,30 @@ def main():
     parser.add_target_argument("--with-etherbone", action="store_true",                 help="Enable Etherbone support.")
     parser.add_target_argument("--eth-sfp",        default=0, type=int, choices=[0, 1], help="Ethernet SFP.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",              help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",             help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",                 help="Enable dynamic Ethernet IP assignment.")
 
     parser.set_defaults(uart_name="jtag_uart")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_pcie      = args.with_pcie,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_sfp        = args.eth_sfp,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_pcie              = args.with_pcie,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_sfp                = args.eth_sfp,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -174,6 +183,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
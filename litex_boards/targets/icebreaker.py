@@ -23,6 +23,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import icebreaker
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.ram import Up5kSPRAM
 from litex.soc.cores.clock import iCE40PLL
@@ -137,7 +138,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",        default=24e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--bios-flash-offset",   default="0x40000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (with DVI PMOD).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
@@ -13,6 +13,8 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import icepi_zero
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -20,9 +22,6 @@ from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
-from litedram import modules as litedram_modules
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -106,13 +105,15 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram import modules as litedram_modules
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = getattr(litedram_modules, sdram_module_cls)(sys_clk_freq, sdram_rate),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -154,7 +155,10 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         device                 = args.device,
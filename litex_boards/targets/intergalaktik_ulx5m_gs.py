@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import intergalaktik_ulx5m_gs
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock.colognechip import GateMatePLL
 from litex.soc.integration.soc import *
@@ -20,18 +21,18 @@ from litex.build.io import DDROutput
 
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import IS42S16160
-
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        rst_n          = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+        self.rst    = Signal()
+        rst_n       = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
 
         # Clk / Rst
         clk25    = platform.request("clk25")
@@ -45,21 +46,27 @@ class _CRG(LiteXModule):
 
         pll.register_clkin(clk25, 25e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
         platform.add_period_constraint(self.cd_sys.clk, 1e9/sys_clk_freq)
-        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), ClockSignal("sys_ps"))
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=20e6, toolchain="colognechip",
+        sdram_rate      = "1:1",
         with_led_chaser = True,
         with_spi_flash  = False,
         **kwargs):
         platform = intergalaktik_ulx5m_gs.Platform(toolchain)
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ULX5M-GS", **kwargs)
@@ -72,11 +79,14 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import IS42S16160
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
 
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = IS42S16160(sys_clk_freq, "1:1"),
+                module        = IS42S16160(sys_clk_freq, sdram_rate),
                 l2_cache_size = kwargs.get("l2_size", 0)
             )
 
@@ -92,15 +102,19 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=intergalaktik_ulx5m_gs.Platform, description="LiteX SoC on ULX5M-GS")
     parser.add_target_argument("--sys-clk-freq",   default=20e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",     default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable memory-mapped SPI flash.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
+        sdram_rate     = args.sdram_rate,
         toolchain      = args.toolchain,
         with_spi_flash = args.with_spi_flash,
         **parser.soc_argdict)
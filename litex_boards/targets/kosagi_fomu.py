@@ -15,6 +15,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import kosagi_fomu_pvt
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.ram import Up5kSPRAM
 from litex.soc.cores.clock import iCE40PLL
@@ -163,7 +164,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",      default=12e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--bios-flash-offset", default="0x20000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--flash",             action="store_true",      help="Flash bitstream.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     dfu_flash_offset = 0x40000
 
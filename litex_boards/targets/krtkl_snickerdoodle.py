@@ -14,6 +14,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import krtkl_snickerdoodle
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 
 from litex.soc.cores.clock import *
@@ -102,7 +103,9 @@ def main():
 
     parser.add_target_argument("--xci-file",                                help="XCI file for PS7 configuration.")
     parser.add_target_argument("--target",                                  help="Vivado programmer target.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant      = args.variant,
@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lattice_certuspro_nx_versa
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -21,7 +22,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 from litepcie.software          import *
-from litepcie.phy.lfcpnxpciephy import LFCPNXPCIEPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -69,6 +69,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.lfcpnxpciephy import LFCPNXPCIEPHY
             self.pcie_phy = LFCPNXPCIEPHY(platform, platform.request("pcie_x4"), cd="sys")
             self.add_pcie(phy=self.pcie_phy, ndmas=1, data_width=128, with_msi=True) # FIXME: MSI not connected in PHY!
 
@@ -95,7 +96,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",      help="Enable PCIe support.")
     parser.add_target_argument("--driver",       action="store_true",      help="Generate PCIe driver from LitePCIe (override local version).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -15,6 +15,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lattice_crosslink_nx_vip
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.ram import NXLRAM
 from litex.build.generic_platform import *
@@ -101,7 +102,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",  default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-hyperram", default="none",           help="Enable use of HyperRAM chip (none, 0 or 1).")
     parser.add_target_argument("--prog-target",   default="direct",         help="Programming Target (direct or flash).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -13,6 +13,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import lattice_ecp5_vip
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -102,7 +104,7 @@ class BaseSoC(SoCCore):
         self.add_sdram("sdram",
             phy           = self.ddrphy,
             module        = MT41K64M16(sys_clk_freq, "1:2"), # Not entirely MT41J64M16 but similar and works(c)
-            l2_cache_size = kwargs.get("l2_size", 8192),
+            **l2_cache_args(self, kwargs, phy=self.ddrphy),
         )
 
         # Video ------------------------------------------------------------------------------------
@@ -186,7 +188,10 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=lattice_ecp5_vip.Platform, description="LiteX SoC on ECP5 Evaluation Board.")
     parser.add_target_argument("--sys-clk-freq",        default=60e6, type=float, help="System clock frequency.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
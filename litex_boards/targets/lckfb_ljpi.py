@@ -19,9 +19,8 @@ from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.video import *
 
 from litex_boards.platforms import lckfb_ljpi
-
-from litedram.modules import MT41J128M16
-from litedram.phy import GW2DDRPHY
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -121,6 +120,8 @@ class BaseSoC(SoCCore):
         # DDR3 SDRAM -------------------------------------------------------------------------------
         # if not self.integrated_main_ram_size:
         if with_dram:
+            from litedram.modules import MT41J128M16
+            from litedram.phy import GW2DDRPHY
             self.ddrphy = GW2DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -131,7 +132,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41J128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -176,7 +177,10 @@ def main():
     viopts.add_argument("--with-video-colorbars", action="store_true", help="Enable Video Colorbars (HDMI).")
     parser.add_target_argument("--prog-kit",            default="gpwin",            help="Programmer select from Gowin/openFPGALoader.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain            = args.toolchain,
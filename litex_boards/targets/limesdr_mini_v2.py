@@ -21,6 +21,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import limesdr_mini_v2
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.interconnect.csr import *
@@ -32,8 +33,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.usb_fifo import FT245PHYSynchronous
 
-from litescope import LiteScopeAnalyzer
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -98,6 +97,7 @@ class BaseSoC(SoCCore):
 
         # USB-FIFO ---------------------------------------------------------------------------------
         if with_usb_fifo:
+            from litescope import LiteScopeAnalyzer
             usb_pads = platform.request("usb_fifo")
             self.usb_phy = usb_phy = FT245PHYSynchronous(
                 pads       = usb_pads,
@@ -143,7 +143,9 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=limesdr_mini_v2.Platform, description="LiteX SoC on LimeSDR-Mini-V2.")
     parser.add_target_argument("--sys-clk-freq",        default=80e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
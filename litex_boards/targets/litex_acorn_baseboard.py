@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import litex_acorn_baseboard
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -18,8 +20,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.cores.bitbang import I2CMaster
 
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -60,15 +60,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6, toolchain="trellis",
-        with_spi_flash      = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = None,
-        eth_dynamic_ip      = False,
-        with_video_terminal = False,
-        with_lcd            = False,
-        with_ws2812         = False,
+        with_spi_flash         = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_video_terminal    = False,
+        with_lcd               = False,
+        with_ws2812            = False,
         **kwargs):
         platform = litex_acorn_baseboard.Platform(toolchain=toolchain)
 
@@ -86,14 +88,16 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
@@ -130,6 +134,8 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
@@ -141,20 +147,24 @@ def main():
     parser.add_target_argument("--with-lcd",       action="store_true", help="Enable OLED LCD support.")
     parser.add_target_argument("--with-ws2812",    action="store_true", help="Enable WS2812 on PMOD1:0.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        toolchain           = args.toolchain,
-        with_spi_flash      = args.with_spi_flash,
-        with_ethernet       = args.with_ethernet,
-        eth_ip              = args.eth_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
-        remote_ip           = args.remote_ip,
-        with_etherbone      = args.with_etherbone,
-        with_video_terminal = args.with_video_terminal,
-        with_lcd            = args.with_lcd,
-        with_ws2812         = args.with_ws2812,
+        sys_clk_freq           = args.sys_clk_freq,
+        toolchain              = args.toolchain,
+        with_spi_flash         = args.with_spi_flash,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        with_video_terminal    = args.with_video_terminal,
+        with_lcd               = args.with_lcd,
+        with_ws2812            = args.with_ws2812,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -16,6 +16,9 @@ from litex.gen import *
 from litex.build.io import DifferentialInput
 
 from litex_boards.platforms import sqrl_acorn
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -25,18 +28,6 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
-from litedram.modules import MT41K512M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-from liteeth.core.ptp import LiteEthPTP, PTP_EVENT_PORT, PTP_GENERAL_PORT
-
-from litesata.phy import LiteSATAPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -87,17 +78,20 @@ class CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="cle-215+", sys_clk_freq=125e6,
-        with_pcie       = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_ptp        = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        ptp_p2p         = False,
-        ptp_debug       = False,
-        with_led_chaser = True,
-        with_sata       = False, sata_gen="gen2",
+        with_pcie              = False,
+        with_pcie_dma_bench    = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        with_ptp               = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        ptp_p2p                = False,
+        ptp_debug              = False,
+        with_led_chaser        = True,
+        with_sata              = False, sata_gen="gen2",
         **kwargs):
         platform = sqrl_acorn.Platform(variant=variant)
         platform.add_extension(sqrl_acorn._litex_acorn_baseboard_mini_io, prepend=True)
@@ -116,6 +110,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -123,23 +119,29 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K512M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             assert not with_sata
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 64,
                 bar0_size  = 0x20000)
             self.pcie_phy.update_config({"PCIe_Blk_Locn": "X0Y0"})
             self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=1)
             self.pcie_phy.add_gt_loc_constraints([
                 "GTPE2_CHANNEL_X0Y7",
             ], by_pipe_lane=False)
 
         # PCIe / Ethernet / SATA / Shared-QPLL -----------------------------------------------------
         if not with_pcie:
+            from liteeth.phy.a7_gtp import QPLLSettings, QPLL
             # Ethernet QPLL Settings.
             qpll_eth_settings = QPLLSettings(
                 refclksel  = 0b111,
@@ -167,6 +169,7 @@ class BaseSoC(SoCCore):
             )
 
         if with_pcie:
+            from liteeth.phy.a7_gtp import QPLLSettings, QPLL
             # PCIe QPLL Settings.
             qpll_pcie_settings = QPLLSettings(
                 refclksel  = 0b001,
@@ -195,6 +198,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.a7_1000basex import A7_1000BASEX
             self.ethphy = A7_1000BASEX(
                 qpll_channel = qpll.channels[1 if with_pcie else 0],
                 data_pads    = self.platform.request("sfp"),
@@ -202,6 +206,7 @@ class BaseSoC(SoCCore):
                 rx_polarity  = 1,  # Inverted on Acorn.
                 tx_polarity  = 0   # Inverted on Acorn and on baseboard.
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
 
             if with_etherbone:
                 ptp_igmp_groups = None
@@ -211,14 +216,17 @@ class BaseSoC(SoCCore):
                         ptp_igmp_groups.append(0xE000006B)     # 224.0.0.107.
                 self.add_etherbone(
                     phy           = self.ethphy,
+                    data_width    = eth_data_width,
                     ip_address    = eth_ip,
                     with_ethmac   = with_ethernet,
                     with_igmp     = with_ptp,
                     igmp_groups   = ptp_igmp_groups,
                     igmp_interval = 2,
+                    **etherbone_args(self, etherbone_buffer_depth),
                 )
 
                 if with_ptp:
+                    from liteeth.core.ptp import LiteEthPTP, PTP_EVENT_PORT, PTP_GENERAL_PORT
                     udp = self.ethcore_etherbone.udp
 
                     # PTP event / general ports (CDC from sys_eth to ethcore clock domain).
@@ -238,10 +246,11 @@ class BaseSoC(SoCCore):
                         self.ptp.p2p_mode.eq(1 if ptp_p2p else 0),
                     ]
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
+            from litesata.phy import LiteSATAPHY
             # PHY
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = self.crg.cd_sata_ref.clk,
@@ -276,11 +285,14 @@ def main():
     ], help="Programmer select from OpenOCD/openFPGALoader.")
     parser.add_target_argument("--sys-clk-freq",   default=125.00e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",      action="store_true",          help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect the PCIe DMA channel to line-rate generator/checker bench cores (see litepcie_dma_bench).")
     parser.add_target_argument("--driver",         action="store_true",          help="Generate PCIe driver.")
     parser.add_target_argument("--with-ethernet",  action="store_true",          help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",          help="Enable Etherbone support.")
     parser.add_target_argument("--with-ptp",       action="store_true",          help="Enable PTP support over Etherbone.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",       help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",      help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",          help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--ptp-p2p",        action="store_true",          help="Enable PTP P2P mode.")
@@ -288,24 +300,30 @@ def main():
     parser.add_target_argument("--with-sata",      action="store_true",          help="Enable SATA support (over FMCRAID).")
     parser.add_target_argument("--sata-gen",       default="2",                  choices=["1", "2"],
         help="SATA Gen.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        variant        = args.variant,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_pcie      = args.with_pcie,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_ptp       = args.with_ptp,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        ptp_p2p        = args.ptp_p2p,
-        ptp_debug      = args.ptp_debug,
-        with_sata      = args.with_sata,
-        sata_gen       = "gen" + args.sata_gen,
+        variant                = args.variant,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_pcie              = args.with_pcie,
+        with_pcie_dma_bench    = args.pcie_with_dma_bench,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        with_ptp               = args.with_ptp,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        ptp_p2p                = args.ptp_p2p,
+        ptp_debug              = args.ptp_debug,
+        with_sata              = args.with_sata,
+        sata_gen               = "gen" + args.sata_gen,
         **parser.soc_argdict
     )
 
@@ -317,7 +335,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer(args.programmer)
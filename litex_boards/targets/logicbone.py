@@ -13,16 +13,15 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import logicbone
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K512M16
-from litedram.phy import ECP5DDRPHY
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # _CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -92,6 +91,7 @@ class BaseSoC(SoCCore):
         sys_clk_freq    = 75e6,
         with_ethernet   = False,
         eth_ip          = "192.168.1.50",
+        eth_data_width  = 8,
         remote_ip       = None,
         eth_dynamic_ip  = False,
         with_led_chaser = True,
@@ -113,6 +113,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K512M16":  MT41K512M16,
                 #"AS4C1GM8":    AS4C1GM8, ## Too many rows, seems to break things.
@@ -127,15 +129,17 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = sdram_module(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -153,10 +157,14 @@ def main():
     parser.add_target_argument("--sdram-device",   default="MT41K512M16",    help="SDRAM device (MT41K512M16).")
     parser.add_target_argument("--with-ethernet",  action="store_true",      help="Enable Ethernet support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",   help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-sdcard",    action="store_true",      help="Enable SDCard support.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain      = args.toolchain,
@@ -165,6 +173,7 @@ def main():
         sdram_device   = args.sdram_device,
         with_ethernet  = args.with_ethernet,
         eth_ip         = args.eth_ip,
+        eth_data_width = args.eth_data_width,
         eth_dynamic_ip = args.eth_dynamic_ip,
         remote_ip      = args.remote_ip,
         **parser.soc_argdict
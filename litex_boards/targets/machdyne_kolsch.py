@@ -12,6 +12,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_kolsch
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.soc.cores.clock.colognechip import GateMatePLL
 from litex.soc.integration.soc import *
@@ -22,18 +24,18 @@ from litex.build.generic_platform import Pins
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import VideoVGAPHY
 
-from litedram.modules import W989D6DBGX6
-
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_video_terminal):
-        self.rst        = Signal()
-        rst_n           = Signal()
-        self.cd_sys     = ClockDomain()
-        self.cd_sys_ps  = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, with_video_terminal, sdram_rate="1:1"):
+        self.rst    = Signal()
+        rst_n       = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
         if with_video_terminal:
             self.cd_vga = ClockDomain()
 
@@ -47,9 +49,14 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(~rst_n)
         pll.register_clkin(clk48, 48e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
         platform.add_period_constraint(self.cd_sys.clk, 1e9/sys_clk_freq)
-        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), ClockSignal("sys_ps"))
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
         if with_video_terminal:
             self.pll_video = pll_video = GateMatePLL(perf_mode="economy")
@@ -62,18 +69,20 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=24e6, toolchain="colognechip",
-        with_video_terminal = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = None,
-        eth_dynamic_ip      = False,
-        with_led_chaser     = True,
+        sdram_rate             = "1:1",
+        with_video_terminal    = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
         **kwargs):
         platform = machdyne_kolsch.Platform(toolchain)
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, with_video_terminal)
+        self.crg = _CRG(platform, sys_clk_freq, with_video_terminal, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Kolsch", **kwargs)
@@ -92,11 +101,14 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import W989D6DBGX6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
 
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = W989D6DBGX6(sys_clk_freq, "1:1"),
+                module        = W989D6DBGX6(sys_clk_freq, sdram_rate),
                 l2_cache_size = kwargs.get("l2_size", 0)
             )
 
@@ -126,7 +138,7 @@ class BaseSoC(SoCCore):
             )
 
         if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
         if with_ethernet:
             self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
 
@@ -136,6 +148,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_kolsch.Platform, description="LiteX SoC on Kolsch")
     parser.add_target_argument("--sys-clk-freq",        default=24e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",          default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (VGA).")
     parser.add_target_argument("--flash",               action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--with-spi-sdcard",     action="store_true",      help="Enable SPI-mode SDCard support.")
@@ -143,20 +156,25 @@ def main():
     pmodopts.add_argument("--with-ethernet",            action="store_true",      help="Enable Ethernet support.")
     pmodopts.add_argument("--with-etherbone",           action="store_true",      help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        toolchain           = args.toolchain,
-        with_video_terminal = args.with_video_terminal,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        eth_ip              = args.eth_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
-        remote_ip           = args.remote_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        sdram_rate             = args.sdram_rate,
+        toolchain              = args.toolchain,
+        with_video_terminal    = args.with_video_terminal,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
         **parser.soc_argdict)
 
     if args.with_spi_sdcard:
@@ -15,6 +15,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_kopflos
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 
 from migen.genlib.resetsync import AsyncResetSynchronizer
@@ -27,9 +29,6 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.interconnect.csr_eventmanager import *
 
-from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
 
 from litex.soc.integration.soc import SoCRegion
 
@@ -119,6 +118,8 @@ class BaseSoC(SoCCore):
 
         # DDR3L ----------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -138,7 +139,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = sdram_module(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # USB Host ---------------------------------------------------------------------------------
@@ -181,7 +182,10 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip",  action="store_true",      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--sdram-device",    default="MT41K128M16",    help="SDRAM device.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain      = args.toolchain,
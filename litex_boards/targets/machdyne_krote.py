@@ -24,6 +24,7 @@ from litex.gen import *
 
 
 from litex_boards.platforms import machdyne_krote
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.soc import SoCRegion
@@ -107,7 +108,9 @@ def main():
     parser.add_target_argument("--bios-flash-offset", default="0x021000",       help="BIOS offset in SPI Flash (default: 0x21000)")
     parser.add_target_argument("--sys-clk-freq",      default=50e6, type=float, help="System clock frequency (default: 50MHz)")
     parser.add_target_argument("--with-led-chaser",   action="store_true",      help="Enable LED Chaser.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
          bios_flash_offset = int(args.bios_flash_offset, 0),
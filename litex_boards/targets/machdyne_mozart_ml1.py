@@ -14,6 +14,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_mozart_ml1
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.build.io import DDROutput
 
@@ -26,9 +28,6 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.interconnect.csr_eventmanager import *
 
-from litedram.modules import W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 from litex.soc.integration.soc import SoCRegion
 
 # CRG ---------------------------------------------------------------------------------------------
@@ -131,6 +130,8 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             if sdram_rate == "1:2":
                 sdrphy_cls = HalfRateGENSDRPHY
             elif sdram_rate == "1:4":
@@ -142,7 +143,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = W9825G6KH6(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # DDMI Framebuffer -------------------------------------------------------------------------------------
@@ -176,6 +177,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_mozart_ml1.Platform, description="LiteX SoC on Mozart ML1")
     parser.add_target_argument("--sys-clk-freq",    default=48e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",      default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--revision",        default="v2",             help="Board Revision (v0, v1, v2).")
     parser.add_target_argument("--device",          default="45F",            help="ECP5 device (12F, 25F, 45F or 85F).")
     parser.add_target_argument("--cable",           default="usb-blaster",    help="Specify an openFPGALoader cable.")
@@ -188,7 +190,10 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip",  action="store_true",      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--boot-from-flash", action="store_true",      help="Boot from flash MMOD.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain      = args.toolchain,
@@ -200,6 +205,7 @@ def main():
         eth_ip         = args.eth_ip,
         eth_dynamic_ip = args.eth_dynamic_ip,
         remote_ip      = args.remote_ip,
+        sdram_rate     = args.sdram_rate,
         **parser.soc_argdict)
 
     if args.with_sdcard:
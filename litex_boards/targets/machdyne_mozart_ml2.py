@@ -15,6 +15,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_mozart_ml2
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 
 from migen.genlib.resetsync import AsyncResetSynchronizer
@@ -27,9 +29,6 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.interconnect.csr_eventmanager import *
 
-from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
 from litex.soc.integration.soc import SoCRegion
 
 # CRG ---------------------------------------------------------------------------------------------
@@ -131,6 +130,8 @@ class BaseSoC(SoCCore):
 
         # DDR3L -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K64M16, MT41K128M16, MT41K256M16, MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -150,7 +151,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = sdram_module(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # DDMI Framebuffer -------------------------------------------------------------------------------------
@@ -195,7 +196,10 @@ def main():
     parser.add_target_argument("--boot-from-flash", action="store_true",      help="Boot from flash MMOD.")
     parser.add_target_argument("--sdram-device",    default="MT41K256M16",    help="SDRAM device.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain      = args.toolchain,
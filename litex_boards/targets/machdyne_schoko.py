@@ -14,6 +14,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_schoko
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.build.io import DDROutput
 
@@ -25,8 +27,6 @@ from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 #from litedram.phy import QuarterRateGENSDRPHY
 
 from litex.soc.integration.soc import SoCRegion
@@ -116,6 +116,8 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             if sdram_rate == "1:2":
                 sdrphy_cls = HalfRateGENSDRPHY
             elif sdram_rate == "1:4":
@@ -127,7 +129,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = W9825G6KH6(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # USB Host ---------------------------------------------------------------------------------
@@ -174,19 +176,24 @@ def main():
     parser = LiteXArgumentParser(platform=machdyne_schoko.Platform, description="LiteX SoC on Schoko.")
     parser.add_target_argument("--flash",           action="store_true",      help="Flash bitstream to MMOD.")
     parser.add_target_argument("--sys-clk-freq",    default=40e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",      default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--revision",        default="v1",             help="Board Revision (v1, v2).")
     parser.add_target_argument("--device",          default="45F",            help="ECP5 device (25F, 45F or 85F).")
     parser.add_target_argument("--cable",           default="usb-blaster",    help="Specify an openFPGALoader cable.")
     parser.add_target_argument("--with-sdcard",     action="store_true",      help="Enable SDCard support.")
     parser.add_target_argument("--with-spi-sdcard", action="store_true",      help="Enable SPI-mode SDCard support.")
     parser.add_target_argument("--with-usb-host",   action="store_true",      help="Enable USB host support.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = args.sys_clk_freq,
+        sdram_rate   = args.sdram_rate,
         **parser.soc_argdict)
 
     if args.with_sdcard:
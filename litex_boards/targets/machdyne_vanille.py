@@ -14,6 +14,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import machdyne_vanille
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.build.io import DDROutput
 
@@ -24,11 +25,6 @@ from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import W9825G6KH6
-from litedram.modules import IS42S16320
-
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 from litex.soc.integration.soc import SoCRegion
 
 # CRG ---------------------------------------------------------------------------------------------
@@ -114,6 +110,7 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             if sdram_rate == "1:2":
                 sdrphy_cls = HalfRateGENSDRPHY
             elif sdram_rate == "1:4":
@@ -125,6 +122,7 @@ class BaseSoC(SoCCore):
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
 
             if sdram_device == "W9825G6KH6":
+                from litedram.modules import W9825G6KH6
                 self.add_sdram("sdram",
                     phy           = self.sdrphy,
                     module        = W9825G6KH6(sys_clk_freq, sdram_rate),
@@ -132,6 +130,7 @@ class BaseSoC(SoCCore):
                 )
 
             if sdram_device == "IS42S16320":
+                from litedram.modules import IS42S16320
                 self.add_sdram("sdram",
                     phy           = self.sdrphy,
                     module        = IS42S16320(self.clk_freq, sdram_rate),
@@ -157,6 +156,7 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=machdyne_vanille.Platform, description="LiteX SoC on Vanille")
     parser.add_target_argument("--sys-clk-freq",    default=48e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",      default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--revision",        default="v0",             help="Board Revision (v0).")
     parser.add_target_argument("--device",          default="12F",            help="ECP5 device (25F, 45F or 85F).")
     parser.add_target_argument("--cable",           default="usb-blaster",    help="Specify an openFPGALoader cable.")
@@ -166,7 +166,9 @@ def main():
     parser.add_target_argument("--boot-from-flash", action="store_true",      help="Boot from flash MMOD.")
     parser.add_target_argument("--sdram-device",    default="W9825G6KH6",     help="SDRAM device (W9825G6KH6 or IS42S16320).")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain     = args.toolchain,
@@ -175,6 +177,7 @@ def main():
         sys_clk_freq  = int(float(args.sys_clk_freq)),
         sdram_device  = args.sdram_device,
         with_usb_host = args.with_usb_host,
+        sdram_rate    = args.sdram_rate,
         **parser.soc_argdict)
 
     if args.with_sdcard:
@@ -0,0 +1,49 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Memory Bench -------------------------------------------------------------------------------------
+
+# Attaches a LiteDRAM BIST generator/checker pair to a DRAM/HBM channel; each exposes CSR-readable
+# cycle counters (ticks) and the checker an error counter. Driven from the host with:
+#
+# python3 -m litex_boards.tools.mem_bench --csr-csv=csr.csv
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import CSRStatus
+
+
+class _MemBenchStatus(LiteXModule):
+    def __init__(self, init_done):
+        self.init_done = CSRStatus(description="Memory initialized, generator/checker held in reset until set.")
+        self.comb += self.init_done.status.eq(init_done)
+
+
+def add_mem_bench(soc, name, size, write_port, read_port=None, init_done=None):
+    """Add `{name}_generator`/`{name}_checker` on native or LiteDRAMAXIPort ports covering `size` bytes.
+
+    The checker reuses the generator's port when `read_port` is None (AXI ports have independent
+    write and read channels); native ports need one crossbar port each. When the memory is not
+    initialized with the SoC (e.g. an SDRAM channel initialized by the BIOS), `init_done` gates the
+    generator/checker and is exposed as `{name}_status_init_done` for the host.
+    """
+    from litedram.frontend.bist import LiteDRAMBISTGenerator, LiteDRAMBISTChecker
+    generator = LiteDRAMBISTGenerator(write_port)
+    checker   = LiteDRAMBISTChecker(write_port if read_port is None else read_port)
+    if init_done is not None:
+        # BIST cores have a `reset` CSR: use the per clock domain control (reset_sys).
+        generator = ResetInserter(["sys"])(generator)
+        checker   = ResetInserter(["sys"])(checker)
+        soc.comb += [
+            generator.reset_sys.eq(~init_done),
+            checker.reset_sys.eq(~init_done),
+        ]
+        soc.add_module(name=f"{name}_status", module=_MemBenchStatus(init_done))
+    soc.add_module(name=f"{name}_generator", module=generator)
+    soc.add_module(name=f"{name}_checker",   module=checker)
+    soc.add_constant(f"{name.upper()}_SIZE",       size)
+    soc.add_constant(f"{name.upper()}_DATA_WIDTH", write_port.data_width)
@@ -12,6 +12,7 @@ from litex.gen import *
 
 
 from litex_boards.platforms import micronova_mercury2
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -134,7 +135,9 @@ def main():
     parser.add_target_argument("--variant",      default="a7-35",          help="Board variant (a7-35 or a7-100).")
     parser.add_target_argument("--sys-clk-freq", default=50e6, type=float, help="System clock frequency.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant      = args.variant,
@@ -16,6 +16,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import microphase_a7_lite
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -25,11 +28,6 @@ from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna import S7DNA
 
-from litedram.modules import MT41K256M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -64,6 +62,7 @@ class BaseSoC(SoCCore):
         with_xadc       = False,
         with_dna        = False,
         with_ethernet   = False,
+        eth_data_width  = 8,
         with_led_chaser = True,
         with_spi_flash  = False,
         with_i2c        = False,
@@ -91,6 +90,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K256M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -98,18 +99,20 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K256M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 tx_delay   = 2e-9,
                 rx_delay   = 2e-9,
                 iodelay_clk_freq = 200e6)
-            self.add_ethernet(phy=self.ethphy)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -155,11 +158,15 @@ def main():
     parser.add_target_argument("--with-dna",       action="store_true",       help="Enable 7-Series DNA.")
     parser.add_target_argument("--with-buttons",   action="store_true",       help="Enable User Buttons.")
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet datapath width.")
     parser.add_target_argument("--with-i2c",       action="store_true",       help="Enable I2C.")
     parser.add_target_argument("--with-spi-sdcard",action="store_true",       help="Enable SPI-mode SDCard support.")
     parser.add_target_argument("--with-sdcard",    action="store_true",       help="Enable SDCard support.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         variant        = args.variant,
@@ -170,6 +177,7 @@ def main():
         with_dna       = args.with_dna,
         with_buttons   = args.with_buttons,
         with_ethernet  = args.with_ethernet,
+        eth_data_width = args.eth_data_width,
         with_i2c       = args.with_i2c,
         with_sdcard    = args.with_sdcard,
         with_spi_flash = args.with_spi_flash,
@@ -8,6 +8,7 @@
 
 from migen import *
 from litex_boards.platforms import microsoft_catapult_v3
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.gen import *
 
@@ -80,7 +81,9 @@ def main():
     parser.add_target_argument("--variant",         default="pcie",                    help="Board variant (pcie or ocp).")
     parser.add_target_argument("--sys-clk-freq",    default=100e6, type=float,         help="System clock frequency.")
     parser.add_target_argument("--with-led-chaser", action="store_true", default=True, help="Enable LED Chaser.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq    = args.sys_clk_freq,
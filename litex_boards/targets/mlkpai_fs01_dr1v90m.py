@@ -12,6 +12,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import mlkpai_fs01_dr1v90m
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.build.generic_platform import *
 
@@ -59,7 +60,9 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=mlkpai_fs01_dr1v90m.Platform, description="LiteX SoC on MLKPAI FS01 DR1V90M.")
     parser.add_target_argument("--sys-clk-freq",        default=25e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
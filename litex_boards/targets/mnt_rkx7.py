@@ -12,6 +12,9 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import mnt_rkx7
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.soc import SoCRegion
@@ -26,11 +29,6 @@ from litex.soc.cores.gpio import GPIOOut
 from litex.soc.cores.video import VideoDVIPHY
 from litex.soc.cores.usb_ohci import USBOHCI
 
-from litedram.modules import IS43TR16512B
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -79,14 +77,16 @@ class BaseSoC(SoCCore):
     }}
 
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet  = True,
-        with_etherbone = False,
-        eth_ip         = "192.168.1.50",
-        remote_ip      = None,
-        eth_dynamic_ip = True,
-        with_spi_flash = True,
-        with_usb_host  = True,
-        with_analyzer  = False,
+        with_ethernet          = True,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = True,
+        with_spi_flash         = True,
+        with_usb_host          = True,
+        with_analyzer          = False,
         **kwargs):
         platform = mnt_rkx7.Platform()
 
@@ -99,6 +99,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS43TR16512B
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -107,7 +109,7 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = IS43TR16512B(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192), # TBD: is L2 really necessary?
+                **l2_cache_args(self, kwargs, phy=self.ddrphy), # TBD: is L2 really necessary?
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -118,16 +120,19 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{main_ethphy_eth_rx_clk_ibuf}}]")
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{soclinux_ethphy_eth_rx_clk_ibuf}}]")
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
                 self.add_ethernet(
                     phy=self.ethphy,
+                    data_width = eth_data_width,
                     dynamic_ip=eth_dynamic_ip,
                     local_ip=eth_ip if not eth_dynamic_ip else None,
                     remote_ip=remote_ip,
@@ -223,19 +228,26 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", default=True, help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",               help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_etherbone = args.with_etherbone,
-        with_spi_flash = args.with_spi_flash,
-        with_usb_host  = args.with_usb_host,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        with_spi_flash         = args.with_spi_flash,
+        with_usb_host          = args.with_usb_host,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
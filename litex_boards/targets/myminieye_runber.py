@@ -16,6 +16,7 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 from litex_boards.platforms import myminieye_runber
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -61,7 +62,9 @@ def main():
     parser = LiteXArgumentParser(platform=myminieye_runber.Platform, description="LiteX SoC on Runber.")
     parser.add_target_argument("--flash",        action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=12e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
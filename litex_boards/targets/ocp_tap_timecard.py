@@ -31,6 +31,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import ocp_tap_timecard
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.interconnect.csr import *
 from litex.soc.interconnect import stream
@@ -43,9 +44,6 @@ from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna  import S7DNA
 
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -105,6 +103,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 64,
                 bar0_size  = 0x20000)
@@ -199,7 +198,9 @@ def main():
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--with-smas",    action="store_true",       help="Enable SMAs support.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -216,6 +217,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
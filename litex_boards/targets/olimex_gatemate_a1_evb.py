@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import olimex_gatemate_a1_evb
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import etherbone_args
 
 
 from litex.soc.cores.clock.colognechip import GateMatePLL
@@ -58,13 +60,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=24e6, toolchain="colognechip",
-        with_video_terminal = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = None,
-        eth_dynamic_ip      = False,
-        with_led_chaser     = True,
+        with_video_terminal    = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
         **kwargs):
         platform = olimex_gatemate_a1_evb.Platform(toolchain)
 
@@ -113,7 +116,7 @@ class BaseSoC(SoCCore):
             )
 
         if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+            self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
         if with_ethernet:
             self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
 
@@ -131,20 +134,24 @@ def main():
     pmodopts.add_argument("--with-ethernet",            action="store_true",      help="Enable Ethernet support.")
     pmodopts.add_argument("--with-etherbone",           action="store_true",      help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
 
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        toolchain           = args.toolchain,
-        with_video_terminal = args.with_video_terminal,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        eth_ip              = args.eth_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
-        remote_ip           = args.remote_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        toolchain              = args.toolchain,
+        with_video_terminal    = args.with_video_terminal,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
         **parser.soc_argdict)
 
     soc.platform.add_extension(olimex_gatemate_a1_evb._pmods_io)
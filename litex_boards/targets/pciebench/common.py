@@ -0,0 +1,154 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import shutil
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# PCIe DMA Bench -----------------------------------------------------------------------------------
+
+# Sources/sinks each LitePCIe DMA channel at line rate on the FPGA side so that DMA/PCIe limits can
+# be told apart from driver/host limits. The data pattern is litepcie_util's (32-bit word counter
+# restarting on each DMA buffer) so buffers can also be checked with the stock tools. Driven from
+# the host with litepcie_dma_bench (copied into the generated driver with --driver).
+
+PCIE_DMA_BENCH_BUFFER_SIZE = 8192 # Matches DMA_BUFFER_SIZE of the LitePCIe driver.
+
+class PCIeDMABench(LiteXModule):
+    def __init__(self, data_width, buffer_size=PCIE_DMA_BENCH_BUFFER_SIZE):
+        from litepcie.common import dma_layout
+        self.sink   = sink   = stream.Endpoint(dma_layout(data_width)) # From DMA Reader (Host -> FPGA).
+        self.source = source = stream.Endpoint(dma_layout(data_width)) # To   DMA Writer (FPGA -> Host).
+
+        self.control = CSRStorage(fields=[
+            CSRField("generator", size=1, offset=0, description="Continuously feed the DMA Writer."),
+            CSRField("checker",   size=1, offset=1, description="Consume and check the DMA Reader stream."),
+            CSRField("reset",     size=1, offset=8, pulse=True, description="Reset counters/patterns."),
+        ])
+        self.oneshot          = CSR()  # Write to send one buffer to the DMA Writer.
+        self.buffer_beats     = CSRStorage(32, reset=buffer_size//(data_width//8))
+        self.generator_beats  = CSRStatus(64)
+        self.generator_cycles = CSRStatus(64)
+        self.checker_beats    = CSRStatus(64)
+        self.checker_cycles   = CSRStatus(64)
+        self.checker_errors   = CSRStatus(32)
+
+        # # #
+
+        words  = data_width//32
+        shift  = log2_int(words)
+        reset  = self.control.fields.reset
+
+        def pattern(beat):
+            return Cat(*[((beat << shift) + i)[:32] for i in range(words)])
+
+        # Generator.
+        gen_beat    = Signal(32)
+        gen_pending = Signal(32)
+        gen_started = Signal()
+        gen_time    = Signal(64)
+        self.comb += [
+            source.valid.eq(self.control.fields.generator | (gen_pending != 0)),
+            source.last.eq(gen_beat == (self.buffer_beats.storage - 1)),
+            source.data.eq(pattern(gen_beat)),
+        ]
+        self.sync += [
+            If(gen_started, gen_time.eq(gen_time + 1)),
+            If(self.oneshot.re,
+                gen_pending.eq(self.buffer_beats.storage)
+            ),
+            If(source.valid & source.ready,
+                gen_started.eq(1),
+                gen_beat.eq(gen_beat + 1),
+                If(source.last, gen_beat.eq(0)),
+                If(gen_pending != 0, gen_pending.eq(gen_pending - 1)),
+                self.generator_beats.status.eq(self.generator_beats.status + 1),
+                self.generator_cycles.status.eq(gen_time + gen_started),
+            ),
+            If(reset,
+                gen_beat.eq(0),
+                gen_pending.eq(0),
+                gen_started.eq(0),
+                gen_time.eq(0),
+                self.generator_beats.status.eq(0),
+                self.generator_cycles.status.eq(0),
+            )
+        ]
+
+        # Checker (locks on the first buffer start: the DMA Reader free-runs on its buffer ring and
+        # returns unfilled buffers until the host has written them once).
+        chk_beat    = Signal(32)
+        chk_started = Signal()
+        chk_time    = Signal(64)
+        self.comb += sink.ready.eq(self.control.fields.checker)
+        self.sync += [
+            If(chk_started, chk_time.eq(chk_time + 1)),
+            If(sink.valid & sink.ready & (chk_started | (sink.data == pattern(C(0, 32)))),
+                chk_started.eq(1),
+                chk_beat.eq(chk_beat + 1),
+                If(chk_beat == (self.buffer_beats.storage - 1), chk_beat.eq(0)),
+                If(sink.data != pattern(chk_beat),
+                    self.checker_errors.status.eq(self.checker_errors.status + 1)
+                ),
+                self.checker_beats.status.eq(self.checker_beats.status + 1),
+                self.checker_cycles.status.eq(chk_time + chk_started),
+            ),
+            If(reset,
+                chk_beat.eq(0),
+                chk_started.eq(0),
+                chk_time.eq(0),
+                self.checker_beats.status.eq(0),
+                self.checker_cycles.status.eq(0),
+                self.checker_errors.status.eq(0),
+            )
+        ]
+
+
+def add_pcie_dma_bench(soc, ndmas, name="pcie"):
+    """Connect `{name}_dma{i}` user streams to a `{name}_dma{i}_bench` PCIeDMABench for each channel.
+
+    The DMA loopback (enabled from the host) still sits in front of the bench and takes precedence.
+    """
+    for i in range(ndmas):
+        dma   = getattr(soc, f"{name}_dma{i}")
+        bench = PCIeDMABench(data_width=dma.data_width)
+        soc.add_module(name=f"{name}_dma{i}_bench", module=bench)
+        soc.comb += [
+            dma.source.connect(bench.sink),
+            bench.source.connect(dma.sink),
+        ]
+    if ndmas:
+        soc.add_constant("PCIE_DMA_BENCH_DATA_WIDTH", bench.sink.data.nbits)
+
+def add_litepcie_user_program(driver_dir, program):
+    """Add litex_boards/tools/`program`.c to the user tools of a generate_litepcie_software() output."""
+    user_dir = os.path.join(driver_dir, "user")
+    src      = os.path.join(os.path.dirname(__file__), "..", "..", "tools", f"{program}.c")
+    shutil.copy(src, os.path.join(user_dir, f"{program}.c"))
+    makefile = os.path.join(user_dir, "Makefile")
+    with open(makefile) as f:
+        content = f.read()
+    if f"{program}:" in content:
+        return
+    content = re.sub(r"^(PROGS\s*=.*)$", rf"\1 {program}", content, count=1, flags=re.MULTILINE)
+    content += "\n".join([
+        "",
+        f"{program}: liblitepcie/liblitepcie.a {program}.o",
+        "\t$(CC) $(LDFLAGS) -o $@ $^ -Lliblitepcie -lpthread -lm -llitepcie",
+        "",
+    ])
+    with open(makefile, "w") as f:
+        f.write(content)
+
+def generate_pcie_dma_bench_software(driver_dir):
+    """Add litepcie_dma_bench to the user tools of a generate_litepcie_software() output."""
+    add_litepcie_user_program(driver_dir, "litepcie_dma_bench")
@@ -0,0 +1,225 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# PCIe DMA <-> Memory Bridge -----------------------------------------------------------------------
+
+# Connects a LitePCIe DMA channel straight to a full-width DRAM/HBM port (LiteDRAM native or
+# LiteDRAMAXIPort), so that the host fills/drains device memory at link rate without going through
+# the SoC bus.
+#
+# The LitePCIe DMAs loop on their host buffer rings without waiting for the host, so transfers are
+# paced by credits (in DMA buffers) the host writes to the bridge:
+# - Fill  (Host -> Memory): each DMA buffer starts with a one-beat header (32-bit tag, 32-bit seq);
+#   the bridge only writes in-sequence buffers (dropping stale/replayed ones) and stalls the DMA
+#   Reader once it reaches `fill_credits`.
+# - Drain (Memory -> Host): the bridge only produces `drain_credits` DMA buffers and zero-pads the
+#   last one.
+# Driven from the host with litepcie_dma_mem (copied into the generated driver with --driver).
+
+PCIE_DMA_MEM_BUFFER_SIZE = 8192 # Matches DMA_BUFFER_SIZE of the LitePCIe driver.
+
+class _MemoryAddresser(LiteXModule):
+    """Word addresses from base to base + length (bytes); byte addresses on AXI ports."""
+    def __init__(self, port):
+        from litedram.frontend.axi import LiteDRAMAXIPort
+        self.base   = Signal(32)
+        self.length = Signal(32)
+        self.enable = Signal()
+        self.done   = Signal()
+        self.source = source = stream.Endpoint([("address", port.address_width)])
+
+        # # #
+
+        ashift = log2_int(port.data_width//8)
+        offset = Signal(32 - ashift)
+        word   = Signal(32 - ashift)
+        self.comb += [
+            self.done.eq(offset == self.length[ashift:]),
+            word.eq(self.base[ashift:] + offset),
+            source.valid.eq(self.enable & ~self.done),
+            source.address.eq(word << ashift if isinstance(port, LiteDRAMAXIPort) else word),
+        ]
+        self.sync += [
+            If(~self.enable,
+                offset.eq(0)
+            ).Elif(source.valid & source.ready,
+                offset.eq(offset + 1)
+            )
+        ]
+
+
+class PCIeDMAMemoryBridge(LiteXModule):
+    def __init__(self, data_width, write_port, read_port, read_fifo_depth=256,
+        buffer_size = PCIE_DMA_MEM_BUFFER_SIZE):
+        from litepcie.common import dma_layout
+        from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+        self.sink   = sink   = stream.Endpoint(dma_layout(data_width)) # From DMA Reader (Host -> Memory).
+        self.source = source = stream.Endpoint(dma_layout(data_width)) # To   DMA Writer (Memory -> Host).
+
+        self.fill_base     = CSRStorage(32, description="Fill base address (bytes).")
+        self.fill_length   = CSRStorage(32, description="Fill length (bytes).")
+        self.fill_tag      = CSRStorage(32, description="Fill tag (in DMA buffer headers).")
+        self.fill_credits  = CSRStorage(32, description="DMA buffers the bridge is allowed to consume.")
+        self.fill_enable   = CSRStorage(description="Fill enable (0 resets the fill).")
+        self.fill_done     = CSRStatus(description="Fill done.")
+        self.fill_buffers  = CSRStatus(32, description="DMA buffers written to memory.")
+        self.drain_base    = CSRStorage(32, description="Drain base address (bytes).")
+        self.drain_length  = CSRStorage(32, description="Drain length (bytes).")
+        self.drain_credits = CSRStorage(32, description="DMA buffers the bridge is allowed to produce.")
+        self.drain_enable  = CSRStorage(description="Drain enable (0 resets the drain).")
+        self.drain_done    = CSRStatus(description="Drain done.")
+        self.drain_buffers = CSRStatus(32, description="DMA buffers sent to the host.")
+
+        # # #
+
+        buffer_beats = buffer_size//(data_width//8)
+
+        # Fill (Host -> Memory) --------------------------------------------------------------------
+        fill_enable = self.fill_enable.storage
+        self.fill_addresser = fill_addresser = _MemoryAddresser(write_port)
+        self.fill_converter = fill_converter = ResetInserter()(stream.Converter(data_width, write_port.data_width))
+        self.fill_writer    = fill_writer    = LiteDRAMDMAWriter(write_port)
+        self.comb += [
+            fill_addresser.base.eq(self.fill_base.storage),
+            fill_addresser.length.eq(self.fill_length.storage),
+            fill_addresser.enable.eq(fill_enable),
+            fill_converter.reset.eq(~fill_enable),
+            fill_writer.sink.valid.eq(fill_addresser.source.valid & fill_converter.source.valid),
+            fill_writer.sink.address.eq(fill_addresser.source.address),
+            fill_writer.sink.data.eq(fill_converter.source.data),
+            fill_addresser.source.ready.eq(fill_writer.sink.ready & fill_converter.source.valid),
+            fill_converter.source.ready.eq(fill_writer.sink.ready & fill_addresser.source.valid),
+            self.fill_done.status.eq(fill_addresser.done & ~fill_writer.fifo.source.valid),
+        ]
+
+        # Buffer framing: hunt for the first header, then check the header of each DMA buffer.
+        fill_locked = Signal()
+        fill_accept = Signal()
+        fill_beat   = Signal(max=max(buffer_beats, 2))
+        fill_seq    = self.fill_buffers.status
+        fill_run    = Signal()
+        fill_gate   = Signal()
+        fill_header = Signal()
+        fill_match  = Signal()
+        self.comb += [
+            fill_run.eq(fill_enable & ~fill_addresser.done),
+            fill_gate.eq(~fill_header | (fill_seq < self.fill_credits.storage)),
+            fill_header.eq(~fill_locked | (fill_beat == 0)),
+            fill_match.eq((sink.data[0:32] == self.fill_tag.storage) & (sink.data[32:64] == fill_seq)),
+            fill_converter.sink.valid.eq(sink.valid & fill_run & fill_gate & ~fill_header & fill_accept),
+            fill_converter.sink.data.eq(sink.data),
+            If(fill_run,
+                sink.ready.eq(fill_gate & (fill_header | ~fill_accept | fill_converter.sink.ready))
+            ).Else(
+                sink.ready.eq(1) # Discard.
+            )
+        ]
+        self.sync += [
+            If(~fill_enable,
+                fill_locked.eq(0),
+                fill_accept.eq(0),
+                fill_beat.eq(0),
+                fill_seq.eq(0),
+            ).Elif(sink.valid & sink.ready & fill_run,
+                If(fill_header,
+                    If(fill_match,
+                        fill_locked.eq(1),
+                        fill_seq.eq(fill_seq + 1),
+                    ),
+                    fill_accept.eq(fill_match),
+                ),
+                If(fill_locked | fill_match,
+                    fill_beat.eq(fill_beat + 1),
+                    If(fill_beat == (buffer_beats - 1),
+                        fill_beat.eq(0)
+                    )
+                )
+            )
+        ]
+
+        # Drain (Memory -> Host) -------------------------------------------------------------------
+        drain_enable = self.drain_enable.storage
+        self.drain_addresser = drain_addresser = _MemoryAddresser(read_port)
+        self.drain_reader    = drain_reader    = LiteDRAMDMAReader(read_port, fifo_depth=read_fifo_depth, fifo_buffered=True)
+        self.drain_converter = drain_converter = ResetInserter()(stream.Converter(read_port.data_width, data_width))
+        self.comb += [
+            drain_addresser.base.eq(self.drain_base.storage),
+            drain_addresser.length.eq(self.drain_length.storage),
+            drain_addresser.enable.eq(drain_enable),
+            drain_reader.enable.eq(drain_enable),
+            drain_converter.reset.eq(~drain_enable),
+            drain_addresser.source.connect(drain_reader.sink),
+            drain_reader.source.connect(drain_converter.sink, omit={"last"}),
+        ]
+
+        drain_pending = Signal(16)
+        drain_beat    = Signal(max=max(buffer_beats, 2))
+        drain_gate    = Signal()
+        drain_empty   = Signal()
+        self.comb += [
+            drain_gate.eq(self.drain_buffers.status < self.drain_credits.storage),
+            drain_empty.eq(drain_addresser.done & (drain_pending == 0) & ~drain_converter.source.valid),
+            If(drain_enable & drain_gate,
+                If(drain_converter.source.valid,
+                    source.valid.eq(1),
+                    source.data.eq(drain_converter.source.data),
+                    drain_converter.source.ready.eq(source.ready),
+                ).Elif(drain_empty & (drain_beat != 0),
+                    source.valid.eq(1), # Pad last DMA buffer.
+                )
+            ),
+            self.drain_done.status.eq(drain_empty & (drain_beat == 0)),
+        ]
+        self.sync += [
+            If(~drain_enable,
+                drain_pending.eq(0),
+                drain_beat.eq(0),
+                self.drain_buffers.status.eq(0),
+            ).Else(
+                drain_pending.eq(drain_pending
+                    + (drain_reader.sink.valid & drain_reader.sink.ready)
+                    - (drain_reader.source.valid & drain_reader.source.ready)),
+                If(source.valid & source.ready,
+                    drain_beat.eq(drain_beat + 1),
+                    If(drain_beat == (buffer_beats - 1),
+                        drain_beat.eq(0),
+                        self.drain_buffers.status.eq(self.drain_buffers.status + 1),
+                    )
+                )
+            )
+        ]
+
+
+def add_pcie_dma_mem(soc, channel, size, write_port, read_port=None, name="pcie"):
+    """Connect `{name}_dma{channel}` to `write_port`/`read_port` through a `{name}_dma{channel}_mem` bridge.
+
+    `read_port` defaults to `write_port` (AXI ports have independent write and read channels);
+    native ports need one crossbar port each.
+    """
+    dma    = getattr(soc, f"{name}_dma{channel}")
+    bridge = PCIeDMAMemoryBridge(dma.data_width,
+        write_port = write_port,
+        read_port  = write_port if read_port is None else read_port)
+    soc.add_module(name=f"{name}_dma{channel}_mem", module=bridge)
+    soc.comb += [
+        dma.source.connect(bridge.sink),
+        bridge.source.connect(dma.sink),
+    ]
+    soc.add_constant(f"{name}_dma{channel}_mem_size",       size)
+    soc.add_constant(f"{name}_dma{channel}_mem_data_width", write_port.data_width)
+    if "PCIE_DMA_MEM_DATA_WIDTH" not in soc.constants:
+        soc.add_constant("PCIE_DMA_MEM_DATA_WIDTH", dma.data_width)
+
+def generate_pcie_dma_mem_software(driver_dir):
+    """Add litepcie_dma_mem to the user tools of a generate_litepcie_software() output."""
+    from litex_boards.targets.pciebench.common import add_litepcie_user_program
+    add_litepcie_user_program(driver_dir, "litepcie_dma_mem")
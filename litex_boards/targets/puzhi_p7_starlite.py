@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import puzhi_p7_starlite
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.build.tools import write_to_file
 
@@ -21,8 +23,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -66,12 +66,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="xc7z020", toolchain="vivado", sys_clk_freq=100e6,
-            with_ethernet   = False,
-            with_etherbone  = False,
-            eth_ip          = "192.168.1.50",
-            remote_ip       = None,
-            eth_dynamic_ip  = False,
-            with_led_chaser = True,
+            with_ethernet          = False,
+            with_etherbone         = False,
+            eth_ip                 = "192.168.1.50",
+            eth_data_width         = 8,
+            etherbone_buffer_depth = 16,
+            remote_ip              = None,
+            eth_dynamic_ip         = False,
+            with_led_chaser        = True,
             **kwargs):
         platform = puzhi_p7_starlite.Platform(variant=variant, toolchain=toolchain)
 
@@ -121,13 +123,15 @@ class BaseSoC(SoCCore):
             self.cpu.add_sdio(0, "MIO 40 .. 45", None, None, None)
 
         if not with_ps7 and (with_ethernet or with_etherbone):
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0))
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=True)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=True)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -192,23 +196,29 @@ def main():
     parser.add_target_argument("--with-ethernet",  action="store_true",     help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",     help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
 
     parser.set_defaults(cpu_type="zynq7000")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
+        variant                = args.variant,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
         **parser.soc_argdict
     )
 
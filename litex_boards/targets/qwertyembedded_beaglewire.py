@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import qwertyembedded_beaglewire
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.build.io import DDROutput
 
@@ -22,9 +23,6 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.phy import GENSDRPHY
-from litedram.modules import MT48LC32M8
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -75,6 +73,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY
+            from litedram.modules import MT48LC32M8
             self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
@@ -107,7 +107,9 @@ def main():
     parser = LiteXArgumentParser(platform=qwertyembedded_beaglewire.Platform, description="LiteX SoC on Beaglewire.")
     parser.add_target_argument("--bios-flash-offset", default="0x60000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--sys-clk-freq",      default=50e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
          bios_flash_offset = int(args.bios_flash_offset, 0),
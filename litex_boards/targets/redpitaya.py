@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import redpitaya
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 
 from litex.soc.cores.clock import *
@@ -106,7 +107,9 @@ def main():
     parser.add_target_argument("--board",        default="redpitaya14",     help="Board type (redpitaya14 or redpitaya16).")
     parser.set_defaults(cpu_type="zynq7000")
     parser.set_defaults(no_uart=True)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     if args.cpu_type == "zynq7000":
         args.no_compile_software = True # otherwise fails
@@ -0,0 +1,202 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+
+# L2 Cache Sizing ----------------------------------------------------------------------------------
+
+# The LiteX L2 cache (between the SoC bus and the main RAM controller) is the main lever on DRAM
+# backed CPU workloads, so instead of a fixed size it is sized from the block RAM of the device
+# and its data width from the width of the memory, --l2-size always taking precedence.
+
+L2_SIZE_DEFAULT     = 8192        # LiteX --l2-size default.
+L2_SIZE_MAX         = 128*1024
+L2_BRAM_FRACTION    = 16          # Use up to 1/16th of the device block RAM.
+L2_WIDE_SIZE        = 32*1024     # Use lines of 2 memory words from this size.
+L2_DATA_WIDTH_MIN   = 128         # LiteX l2_cache_min_data_width default.
+L2_DATA_WIDTH_MAX   = 512
+
+# Block RAM (in Kbits, without UltraRAM/SPRAM) of the devices used by the targets, matched on the
+# start of the lowercase device name. Devices too small for more than L2_SIZE_DEFAULT are omitted.
+DEVICE_BLOCK_RAM_KBITS = [
+    # Xilinx Spartan-6.
+    (r"xc6slx45",           2088),
+    (r"xc6slx1(00|50)",     4824),
+    # Xilinx 7-Series.
+    (r"xc7s25",             1620),
+    (r"xc7s50",             2700),
+    (r"xc7a35t",            1800),
+    (r"xc7a50t",            2700),
+    (r"xc7a75t",            3780),
+    (r"xc7a100t",           4860),
+    (r"xc7a200t",          13140),
+    (r"xc7k70t",            4860),
+    (r"xc7k160t",          11700),
+    (r"xc7k325t",          16020),
+    (r"xc7k410t",          28620),
+    (r"xc7k420t",          30240),
+    (r"xc7k480t",          34560),
+    (r"xc7vx485t",         37080),
+    (r"xc7vx690t",         52920),
+    (r"xc7z010",            2160),
+    (r"xc7z020",            5040),
+    (r"xc7z045",           19620),
+    # Xilinx UltraScale/UltraScale+.
+    (r"xcau15p",            5184),
+    (r"xcau25p",           10800),
+    (r"xcku040",           21600),
+    (r"xcku3p",            12960),
+    (r"xcku5p",            17280),
+    (r"xcku115",           77760),
+    (r"xck26",              5184),
+    (r"xczu2",              5400),
+    (r"xczu7",             11232),
+    (r"xczu9",             32832),
+    (r"xczu11",            21600),
+    (r"xczu49dr",          38880),
+    (r"xc(vu9p|u200|u250)", 77760),
+    (r"xcvu13p",           96768),
+    (r"xcvu33p",           24192),
+    (r"xc(vu37p|u280)",    72576),
+    # Lattice.
+    (r"lfe5um?(5g)?-25f",   1008),
+    (r"lfe5um?(5g)?-45f",   1944),
+    (r"lfe5um?(5g)?-85f",   3744),
+    (r"(lifcl|lfd2nx)-40",  1512),
+    # Intel/Altera.
+    (r"10cl055",            2340),
+    (r"10cl080",            2745),
+    (r"10m50",              1638),
+    (r"ep4ce55",            2340),
+    (r"ep4ce115",           3888),
+    (r"ep4cgx150",          6480),
+    (r"5cefa2",             1760),
+    (r"5ceba4",             3080),
+    (r"5cefa5",             4460),
+    (r"5csema5",            3970),
+    (r"5cs(eba6|xfc6)",     5570),
+    # Gowin.
+    (r"gw5at-lv60",         2124),
+    (r"gw5ast-lv138",       6120),
+    # Efinix.
+    (r"ti60",               2560),
+    (r"t120",               5427),
+]
+
+def device_block_ram_size(device):
+    """Block RAM of `device` in bytes, None for unknown (or small) devices."""
+    for pattern, kbits in DEVICE_BLOCK_RAM_KBITS:
+        if re.match(pattern, device.lower()):
+            return kbits*1024//8
+    return None
+
+def l2_cache_args(soc, kwargs, phy, default=L2_SIZE_DEFAULT, data_width=None):
+    """add_sdram() L2 cache arguments for the device of `soc` and the memory of `phy`.
+
+    An l2_size argument takes precedence (targets default the LiteX --l2-size to None, so it is only
+    set when given on the command line). Otherwise the L2 uses up to 1/16th of
+    the device block RAM (`default` when unknown), between `default` and L2_SIZE_MAX, with lines of
+    two memory words once the cache is large enough for it. The selection is logged and recorded in
+    the SoC configuration (CONFIG_L2_SIZE, CONFIG_L2_MIN_DATA_WIDTH, CONFIG_L2_SIZE_AUTO).
+
+    `data_width` (--main-ram-data-width) forces the L2 data width, up to the native port width.
+    """
+    size = kwargs.get("l2_size", None)
+    auto = size is None
+    if auto:
+        size = default
+        bram = device_block_ram_size(soc.platform.device)
+        if bram is not None:
+            size = max(default, min(L2_SIZE_MAX, bram//L2_BRAM_FRACTION))
+            size = 2**(size.bit_length() - 1)
+
+    # Data width: from the memory (native port) width.
+    port_width = phy.settings.nphases*phy.settings.dfi_databits
+    if data_width is not None:
+        if data_width > port_width:
+            raise ValueError(f"Main RAM data width ({data_width}) exceeds the native DRAM port width ({port_width})")
+    elif size >= L2_WIDE_SIZE:
+        data_width = min(max(2*port_width, L2_DATA_WIDTH_MIN), L2_DATA_WIDTH_MAX)
+    else:
+        data_width = L2_DATA_WIDTH_MIN
+
+    soc.logger.info("L2 Cache: {} bytes ({}), {}-bit min data width.".format(
+        size, "from device" if auto else "from l2_size", data_width))
+    if size:
+        soc.add_config("L2_MIN_DATA_WIDTH", data_width, check_duplicate=False)
+        if auto:
+            soc.add_config("L2_SIZE_AUTO", check_duplicate=False)
+    return {
+        "l2_cache_size"           : size,
+        "l2_cache_min_data_width" : data_width,
+    }
+
+# Main RAM Data Width ------------------------------------------------------------------------------
+
+# --main-ram-data-width widens the SoC bus (and so the DMA masters on it, SATA, etc...) and the L2
+# cache to the native DRAM port width, removing width conversions on the main RAM path. Targets
+# default bus_data_width to None (parser.set_defaults) so that an explicit --bus-data-width can be
+# told apart from the LiteX default.
+
+MAIN_RAM_DATA_WIDTHS = [64, 128, 256, 512]
+
+def set_main_ram_data_width(kwargs, data_width):
+    """Set the SoC bus data width of the SoCCore `kwargs` to `data_width` (when not None).
+
+    An explicit, different bus_data_width in `kwargs` is an error, not silently overridden.
+    """
+    if data_width is None:
+        return
+    if data_width not in MAIN_RAM_DATA_WIDTHS:
+        raise ValueError(f"Main RAM data width must be one of {MAIN_RAM_DATA_WIDTHS}")
+    bus_data_width = kwargs.get("bus_data_width", None)
+    if bus_data_width not in [None, data_width]:
+        raise ValueError(f"Bus data width ({bus_data_width}) conflicts with the main RAM data width ({data_width})")
+    kwargs["bus_data_width"] = data_width
+
+# DRAM Channels ------------------------------------------------------------------------------------
+
+def parse_ddram_channels(channels, choices, counts=None, name="DDRAM channel"):
+    """Parse a channel, a list of channels or a comma/range string ("0,2", "0-3", "all").
+
+    Channels must be in `choices` and, when `counts` is given, their number in `counts`. Duplicates
+    are removed, the order is kept (the first channel is the main one). Also used for other indexed
+    resources (SFP ports, etc...), `name` is used in the error messages.
+    """
+    choices = list(choices)
+    if isinstance(channels, int):
+        channels = [channels]
+    elif isinstance(channels, str):
+        if channels == "all":
+            channels = choices
+        else:
+            values = []
+            for token in channels.replace(" ", "").split(","):
+                if "-" in token:
+                    first, last = token.split("-")
+                    values.extend(range(int(first, 0), int(last, 0) + 1))
+                elif token:
+                    values.append(int(token, 0))
+            channels = values
+    channels = tuple(dict.fromkeys(channels))
+    if not channels or any(channel not in choices for channel in channels):
+        names = [str(choice) for choice in choices]
+        raise ValueError(f"{name}s must be a non-empty list of " + ", ".join(names[:-1]) + " or " + names[-1])
+    if counts is not None and len(channels) not in counts:
+        names = [str(count) for count in counts]
+        raise ValueError(f"{name} count must be " + ", ".join(names[:-1]) + " or " + names[-1])
+    return channels
+
+# LiteDRAM BIOS Library ----------------------------------------------------------------------------
+
+# litex_boards/software/liblitedram: LiteX's liblitedram with sdram_init() wrapped to replay the
+# leveling cached in SPI Flash (sdramcalib) and to initialize the extra DRAM channels (sdramchannels).
+
+def add_liblitedram_software(builder):
+    """Build the BIOS against litex_boards/software/liblitedram instead of LiteX's liblitedram."""
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "software", "liblitedram"))
+    builder.software_packages = [(name, src_dir if name == "liblitedram" else package_dir)
+        for name, package_dir in builder.software_packages]
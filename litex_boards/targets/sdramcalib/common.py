@@ -0,0 +1,98 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from litex_boards.targets.sdram.common import add_liblitedram_software
+
+# SDRAM Calibration Cache --------------------------------------------------------------------------
+
+# Stores the BIOS read/write leveling results in a reserved SPI Flash block and replays them on the
+# next boots (followed by a short memtest) instead of running the full leveling and memtest. The
+# full calibration is only run (and the cache updated) when the cache is missing, comes from another
+# bitstream (SoC identifier) or when the short memtest fails; the sdram_init BIOS command always runs
+# it. The BIOS side is litex_boards/software/liblitedram (built instead of LiteX's liblitedram).
+#
+# The PHY delays/bitslips are only incremented/reset from the CSRs and can't be read back, so the
+# SDRAMCalibrationTracker mirrors them (per module, selected with sel) for the BIOS to save them.
+
+SDRAM_CALIB_CACHE_FLASH_SIZE   = 64*1024  # One liblitespi erase block.
+SDRAM_CALIB_CACHE_FLASH_MAX    = 16*1024*1024 # liblitespi programs with 3-byte addresses.
+SDRAM_CALIB_CACHE_MEMTEST_SIZE = 128*1024
+
+class SDRAMCalibrationTracker(LiteXModule):
+    def __init__(self, phy):
+        settings = phy.settings
+        nmodules = len(phy._dly_sel.storage)
+        self.sel = CSRStorage(8, description="Module selection (for the delays/bitslips status).")
+
+        # # #
+
+        phy_rst = getattr(phy, "_rst", None)
+
+        def wrap_inc(value, n):
+            return If(value == (n - 1), value.eq(0)).Else(value.eq(value + 1))
+
+        # Per-module delays/bitslips: (name, rst CSR, inc CSR, number of taps).
+        trackers = [
+            ("rdly_dq",         "_rdly_dq_rst",         "_rdly_dq_inc",     settings.delays),
+            ("rdly_dq_bitslip", "_rdly_dq_bitslip_rst", "_rdly_dq_bitslip", settings.bitslips),
+            ("wdly_dq",         "_wdly_dq_rst",         "_wdly_dq_inc",     settings.delays),
+            ("wdly_dqs",        "_wdly_dqs_rst",        "_wdly_dqs_inc",    settings.delays),
+            ("wdly_dq_bitslip", "_wdly_dq_bitslip_rst", "_wdly_dq_bitslip", settings.bitslips),
+        ]
+        for name, rst, inc, n in trackers:
+            if not hasattr(phy, inc) or n == 0:
+                continue
+            # UltraScale DQS delays are not reset by the PHY, only incremented around by the BIOS.
+            resettable = not (name == "wdly_dqs" and hasattr(phy, "_wdly_dqs_inc_count"))
+            values = Array(Signal(max=max(n, 2)) for _ in range(nmodules))
+            for i in range(nmodules):
+                sel = phy._dly_sel.storage[i]
+                self.sync += If(sel & getattr(phy, inc).re, wrap_inc(values[i], n))
+                if resettable:
+                    self.sync += If(sel & getattr(phy, rst).re, values[i].eq(0))
+                    if phy_rst is not None:
+                        self.sync += If(phy_rst.storage, values[i].eq(0))
+            status = CSRStatus(16, name=name, description=f"{name} of the selected module.")
+            setattr(self, name, status)
+            self.comb += status.status.eq(values[self.sel.storage])
+
+        # Cmd/Clk delay.
+        if hasattr(phy, "_cdly_inc") and settings.delays:
+            cdly = Signal(max=max(settings.delays, 2))
+            self.sync += If(phy._cdly_inc.re, wrap_inc(cdly, settings.delays))
+            self.sync += If(phy._cdly_rst.re, cdly.eq(0))
+            if phy_rst is not None:
+                self.sync += If(phy_rst.storage, cdly.eq(0))
+            self.cdly = CSRStatus(16, description="Cmd/Clk delay.")
+            self.comb += self.cdly.status.eq(cdly)
+
+
+def add_sdram_calib_cache(soc, phy, memtest_size=SDRAM_CALIB_CACHE_MEMTEST_SIZE):
+    """Cache the leveling of `phy` in the last block of the `spiflash` SPI Flash (with_master=True).
+
+    The BIOS also has to be built with add_sdram_calib_cache_software().
+    """
+    flash_region = soc.bus.regions.get("spiflash", None)
+    if flash_region is None or not hasattr(getattr(soc, "spiflash_core", None), "master"):
+        raise ValueError("SDRAM calibration cache requires a SPI Flash with master (add_spi_flash(..., with_master=True)).")
+    if not hasattr(phy, "_dly_sel"):
+        raise ValueError("SDRAM calibration cache requires a PHY with software leveling.")
+    offset = min(flash_region.size, SDRAM_CALIB_CACHE_FLASH_MAX) - SDRAM_CALIB_CACHE_FLASH_SIZE
+    soc.sdram_calib = SDRAMCalibrationTracker(phy)
+    soc.add_constant("SDRAM_CALIB_CACHE_FLASH_OFFSET", offset)
+    soc.add_constant("SDRAM_CALIB_CACHE_FLASH_SIZE",   SDRAM_CALIB_CACHE_FLASH_SIZE)
+    soc.add_constant("SDRAM_CALIB_CACHE_MEMTEST_SIZE", memtest_size)
+    soc.logger.info("SDRAM Calibration Cache: SPI Flash @0x{:08x} ({} bytes).".format(
+        offset, SDRAM_CALIB_CACHE_FLASH_SIZE))
+
+def add_sdram_calib_cache_software(builder):
+    """Build the BIOS against litex_boards/software/liblitedram instead of LiteX's liblitedram."""
+    add_liblitedram_software(builder)
@@ -0,0 +1,371 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+from litex.gen import *
+
+from litex.soc.interconnect import csr_bus, stream, wishbone
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect.axi import AXILiteInterface, AXILiteClockDomainCrossing, AXILite2CSR
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.clock import USPMMCM, USPIDELAYCTRL
+
+from litex_boards.targets.sdram.common import add_liblitedram_software
+
+# SDRAM Channels -----------------------------------------------------------------------------------
+
+# Extra DRAM channels next to the main SDRAM (sdram/ddrphy): one PHY and LiteDRAM controller per
+# channel, clocked from the channel's own reference clock (SDRAMChannelCRG) so the PHY clocks are
+# generated next to the channel's I/O banks (and don't cross SLRs). Nothing of a channel runs in sys:
+# - Its CSRs are on a CSR bus of its own, in the channel clock domain, with the ddrphy/sdram banks at
+#   the locations of the main ones. This CSR bus is mapped on the SoC bus (sdram<N>_csr region)
+#   through an AXI-Lite clock domain crossing.
+# - User ports (SDRAMChannel.get_port()) are crossed to sys with LiteDRAM native port CDCs.
+# The BIOS initializes and levels each channel, before the main SDRAM, with LiteX's sdram_init()
+# built against the channel CSR window (litex_boards/software/liblitedram/sdram_channels.c), so the
+# SoC software has to be built with add_sdram_channels_software().
+
+SDRAM_CHANNELS_MAX = 4 # Main SDRAM included, see sdram_channels.c.
+
+# SDRAM Channel CRG --------------------------------------------------------------------------------
+
+class SDRAMChannelCRG(LiteXModule):
+    """`name`, `name`_4x and `name`_ic domains (PHY sys/sys4x/ic) of a USPDDRPHY channel from its local
+    reference clock.
+
+    The domain is held in reset until the MMCM is locked and the IDELAYCTRL is ready.
+    """
+    def __init__(self, platform, name, clkin, clkin_freq, sys_clk_freq, sys_clk, rst=None,
+        iodelay_clk_freq = 500e6,
+        speedgrade       = -2):
+        self.cd_sys    = ClockDomain(name)
+        self.cd_sys4x  = ClockDomain(f"{name}_4x")
+        self.cd_pll4x  = ClockDomain(f"{name}_pll4x")
+        self.cd_idelay = ClockDomain(f"{name}_idelay")
+
+        # # #
+
+        self.pll = pll = USPMMCM(speedgrade=speedgrade)
+        if rst is not None:
+            self.comb += pll.reset.eq(rst)
+        pll.register_clkin(clkin, clkin_freq)
+        pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
+        pll.create_clkout(self.cd_idelay, iodelay_clk_freq)
+        platform.add_false_path_constraints(sys_clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
+
+        self.specials += [
+            Instance("BUFGCE_DIV",
+                p_BUFGCE_DIVIDE=4,
+                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys.clk),
+            Instance("BUFGCE",
+                i_CE=1, i_I=self.cd_pll4x.clk, o_O=self.cd_sys4x.clk),
+        ]
+
+        # IDELAYCTRL "ic" domain (used by the PHY) renamed to `name`_ic.
+        self.idelayctrl = ClockDomainsRenamer({"ic": f"{name}_ic"})(
+            USPIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys))
+
+        # The channel is only reached from sys through CDCs.
+        platform.add_false_path_constraints(sys_clk, self.cd_sys.clk)
+
+# SDRAM Channel ------------------------------------------------------------------------------------
+
+class _SDRAMChannelCore(Module):
+    """PHY, LiteDRAM core and CSR bus of a channel (not an AutoCSR: CSRs are kept off the SoC CSR bus)."""
+    def __init__(self, phy, module, clk_freq, csr_locs, csr, address_width, **kwargs):
+        from litedram.core import LiteDRAMCore
+        self.submodules.ddrphy = phy
+        self.submodules.sdram  = LiteDRAMCore(
+            phy             = phy,
+            geom_settings   = module.geom_settings,
+            timing_settings = module.timing_settings,
+            clk_freq        = clk_freq,
+            **kwargs)
+
+        # CSR Bus.
+        self.axi_lite = AXILiteInterface(data_width=csr.data_width, address_width=address_width)
+        self.submodules.csr_bridge = AXILite2CSR(
+            axi_lite = self.axi_lite,
+            bus_csr  = csr_bus.Interface(data_width=csr.data_width, address_width=csr.address_width, alignment=csr.alignment))
+        self.submodules.csr_bankarray = csr_bus.CSRBankArray(self,
+            address_map   = lambda name, memory: csr_locs.get(name, None) if memory is None else None,
+            data_width    = csr.data_width,
+            address_width = csr.address_width,
+            alignment     = csr.alignment,
+            paging        = csr.paging,
+            ordering      = csr.ordering)
+        self.submodules.csr_interconnect = csr_bus.InterconnectShared(
+            masters = [self.csr_bridge.csr],
+            slaves  = self.csr_bankarray.get_buses())
+
+
+class SDRAMChannel(LiteXModule):
+    def __init__(self, phy, module, clock_domain, clk_freq, csr_locs, csr, address_width=32, **kwargs):
+        self.clock_domain = clock_domain
+        self.ready     = CSRStatus(description="Channel out of reset (clocks locked, IDELAYCTRL ready).")
+        self.init_done = CSRStorage(description="Channel initialized and leveled (set by the BIOS).")
+
+        # # #
+
+        # PHY/Core in the channel clock domains (<clock_domain>, <clock_domain>_4x/_ic, see SDRAMChannelCRG).
+        self.core = ClockDomainsRenamer({
+            "sys"   : clock_domain,
+            "sys4x" : f"{clock_domain}_4x",
+            "ic"    : f"{clock_domain}_ic",
+        })(
+            _SDRAMChannelCore(phy, module, clk_freq, csr_locs, csr, address_width, **kwargs))
+
+        # CSR Bus (SoC side).
+        self.bus = AXILiteInterface(data_width=csr.data_width, address_width=address_width)
+        self.cdc = AXILiteClockDomainCrossing(self.bus, self.core.axi_lite, cd_from="sys", cd_to=clock_domain)
+
+        self.specials += MultiReg(~ResetSignal(clock_domain), self.ready.status)
+
+    def get_port(self, mode="both", data_width=None):
+        """Return a new native user port of the channel, in the sys clock domain."""
+        from litedram.common import LiteDRAMNativePort
+        from litedram.frontend.adapter import LiteDRAMNativePortCDC
+        port = self.core.sdram.crossbar.get_port(mode=mode, data_width=data_width)
+        port.clock_domain = self.clock_domain # Crossbar ports are in the (renamed) sys clock domain.
+        sys_port = LiteDRAMNativePort(
+            mode          = mode,
+            address_width = port.address_width,
+            data_width    = port.data_width,
+            clock_domain  = "sys",
+            id            = port.id)
+        self.submodules += LiteDRAMNativePortCDC(sys_port, port)
+        return sys_port
+
+    def finalize(self, *args, **kwargs):
+        # The crossbar needs a port: add an idle one when the channel is not used (before the core
+        # is finalized, so not from do_finalize).
+        if not self.core.sdram.crossbar.masters:
+            self.core.sdram.crossbar.get_port()
+        LiteXModule.finalize(self, *args, **kwargs)
+
+# Add SDRAM Channel --------------------------------------------------------------------------------
+
+def add_sdram_channel(soc, channel, phy, module, clock_domain, **kwargs):
+    """Add DRAM `channel` (sdram<channel>) with its `phy` (clocked from `clock_domain`/`clock_domain`_4x).
+
+    The main SDRAM (sdram/ddrphy, same module and PHY configuration) has to be added first. Use
+    add_sdram_channel_region() to map the channel on the SoC bus.
+    """
+    if not hasattr(soc, "sdram") or not hasattr(soc, "ddrphy"):
+        raise ValueError("SDRAM channels require the main SDRAM (sdram/ddrphy) to be added first")
+    if soc.cpu_type is None:
+        raise ValueError("SDRAM channels are initialized by the BIOS and require a CPU (--cpu-type)")
+    channels = getattr(soc, "sdram_channels", [])
+    if len(channels) + 2 > SDRAM_CHANNELS_MAX:
+        raise ValueError(f"Up to {SDRAM_CHANNELS_MAX - 1} SDRAM channels can be added next to the main SDRAM")
+    name = f"sdram{channel}"
+
+    # Channel CSR banks at the locations of the main ones (same CSR offsets for the BIOS), kept off
+    # location 0: liblitedram tests `#if CSR_DDRPHY_RST_ADDR`, 0 in the channel build at location 0.
+    csr_locs = {}
+    soc.csr.add("ctrl", use_loc_if_exists=True)
+    for bank in ["ddrphy", "sdram"]:
+        soc.csr.add(bank, use_loc_if_exists=True)
+        csr_locs[bank] = soc.csr.locs[bank]
+    if 0 in csr_locs.values():
+        raise ValueError("SDRAM channels require the main ddrphy/sdram CSRs off CSR location 0")
+
+    sdram_channel = SDRAMChannel(phy, module, clock_domain, soc.sys_clk_freq, csr_locs, soc.csr,
+        address_width = soc.bus.address_width,
+        **kwargs)
+    soc.add_module(name=name, module=sdram_channel)
+    soc.bus.add_slave(name=f"{name}_csr", slave=sdram_channel.bus, region=SoCRegion(
+        size   = soc.csr.n_locs*soc.csr.paging,
+        cached = False))
+
+    # BIOS channel table (see sdram_channels.c).
+    index = len(channels) + 1
+    soc.sdram_channels = channels + [channel]
+    soc.add_constant("SDRAM_CHANNELS", index + 1, check_duplicate=False)
+    soc.add_constant(f"SDRAM_CHANNEL{index}",          channel)
+    soc.add_constant(f"SDRAM_CHANNEL{index}_CSR_BASE", soc.bus.regions[f"{name}_csr"].origin)
+    soc.add_constant(f"SDRAM_CHANNEL{index}_BASE",     0)
+    soc.add_constant(f"SDRAM_CHANNEL{index}_SIZE",     0)
+    soc.logger.info("SDRAM Channel {}: CSRs @0x{:08x}.".format(channel, soc.bus.regions[f"{name}_csr"].origin))
+    return sdram_channel
+
+def add_sdram_channel_region(soc, channel, origin, size):
+    """Map DRAM `channel` on the SoC bus (ddram<channel> region); the BIOS memtests it when reachable."""
+    from litex.soc.interconnect import wishbone
+    from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+    wb = wishbone.Interface(
+        data_width    = soc.bus.data_width,
+        address_width = soc.bus.address_width,
+        addressing    = "word")
+    soc.submodules += LiteDRAMWishbone2Native(
+        wishbone     = wb,
+        port         = getattr(soc, f"sdram{channel}").get_port(),
+        base_address = origin)
+    soc.bus.add_slave(name=f"ddram{channel}", slave=wb, region=SoCRegion(
+        origin = origin,
+        size   = size,
+        cached = False))
+    index = soc.sdram_channels.index(channel) + 1
+    soc.add_constant(f"SDRAM_CHANNEL{index}_BASE", origin, check_duplicate=False)
+    soc.add_constant(f"SDRAM_CHANNEL{index}_SIZE", size,   check_duplicate=False)
+
+# SDRAM Interleaver -------------------------------------------------------------------------------
+
+class _SDRAMInterleaverPort(LiteXModule):
+    """Stripe native `port` over `channel_ports`, every `stripe_words` words, in order.
+
+    Writes: the command is held until its data (given by LiteDRAM masters after the command) is in
+    the channel write FIFO, then issued to the channel: the controller finds it there when executing
+    the write. Reads: LiteDRAM read data can't be stalled, so reads are only issued to a channel with
+    room in its read FIFO and are returned in issue order.
+    """
+    def __init__(self, port, channel_ports, stripe_words, depth):
+        n         = len(channel_ports)
+        sel_bits  = log2_int(n)
+        word_bits = log2_int(stripe_words)
+        dw        = port.data_width
+
+        # # #
+
+        # Command channel/address.
+        channel = Signal(sel_bits)
+        addr    = Signal(len(channel_ports[0].cmd.addr))
+        self.comb += [
+            channel.eq(port.cmd.addr[word_bits:word_bits + sel_bits]),
+            addr.eq(Cat(port.cmd.addr[:word_bits], port.cmd.addr[word_bits + sel_bits:])),
+        ]
+
+        # Write (pending command waiting for its data).
+        wr_pending = Signal()
+        wr_channel = Signal(sel_bits)
+        wr_addr    = Signal(len(addr))
+        wr_fire    = Signal()
+        wr_fifos   = [stream.SyncFIFO([("data", dw), ("we", dw//8)], depth) for _ in range(n)]
+        self.sync += [
+            If(wr_fire, wr_pending.eq(0)),
+            If(port.cmd.valid & port.cmd.ready & port.cmd.we,
+                wr_pending.eq(1),
+                wr_channel.eq(channel),
+                wr_addr.eq(addr),
+            )
+        ]
+
+        # Read (channel order of the reads, read data of each channel).
+        rd_fire   = Signal()
+        rd_order  = stream.SyncFIFO([("channel", sel_bits)], n*depth)
+        rd_fifos  = [stream.SyncFIFO([("data", dw)], depth) for _ in range(n)]
+        rd_counts = [Signal(max=depth + 1) for _ in range(n)]
+        self.submodules += wr_fifos + rd_fifos + [rd_order]
+
+        # Channels.
+        for i, (channel_port, wr_fifo, rd_fifo, rd_count) in enumerate(zip(channel_ports, wr_fifos, rd_fifos, rd_counts)):
+            wr_issue = Signal()
+            rd_issue = Signal()
+            self.comb += [
+                wr_issue.eq(wr_pending & (wr_channel == i) & port.wdata.valid & wr_fifo.sink.ready),
+                rd_issue.eq(port.cmd.valid & ~port.cmd.we & ~wr_pending & (channel == i) &
+                    rd_order.sink.ready & (rd_count != depth)),
+                channel_port.cmd.valid.eq(wr_issue | rd_issue),
+                channel_port.cmd.we.eq(wr_issue),
+                channel_port.cmd.last.eq(~wr_issue & port.cmd.last),
+                channel_port.cmd.addr.eq(Mux(wr_issue, wr_addr, addr)),
+                If(channel_port.cmd.ready,
+                    If(wr_issue, wr_fire.eq(1)),
+                    If(rd_issue, rd_fire.eq(1)),
+                ),
+                wr_fifo.sink.valid.eq(wr_issue & channel_port.cmd.ready),
+                wr_fifo.sink.data.eq(port.wdata.data),
+                wr_fifo.sink.we.eq(port.wdata.we),
+                wr_fifo.source.connect(channel_port.wdata),
+                rd_fifo.sink.valid.eq(channel_port.rdata.valid),
+                rd_fifo.sink.data.eq(channel_port.rdata.data),
+                channel_port.rdata.ready.eq(1),
+                rd_fifo.source.ready.eq(port.rdata.ready & rd_order.source.valid & (rd_order.source.channel == i)),
+            ]
+            self.sync += rd_count.eq(rd_count + (rd_issue & channel_port.cmd.ready) - (rd_fifo.source.valid & rd_fifo.source.ready))
+
+        # Port.
+        rd_valids = Array(rd_fifo.source.valid for rd_fifo in rd_fifos)
+        rd_datas  = Array(rd_fifo.source.data  for rd_fifo in rd_fifos)
+        self.comb += [
+            port.cmd.ready.eq(Mux(port.cmd.we, ~wr_pending | wr_fire, rd_fire)),
+            port.wdata.ready.eq(wr_fire),
+            rd_order.sink.valid.eq(rd_fire),
+            rd_order.sink.channel.eq(channel),
+            port.rdata.valid.eq(rd_order.source.valid & rd_valids[rd_order.source.channel]),
+            port.rdata.data.eq(rd_datas[rd_order.source.channel]),
+            rd_order.source.ready.eq(port.rdata.valid & port.rdata.ready),
+        ]
+
+
+class SDRAMInterleaver(LiteXModule):
+    """Native ports striped over DRAM channels every `stripe` bytes.
+
+    `get_ports` are the get_port() methods of the channels (LiteDRAM crossbars or SDRAMChannels, in
+    sys): like a crossbar, get_port() returns a new native port, here backed by a port on each
+    channel, so masters are arbitrated by the channel crossbars.
+    """
+    def __init__(self, get_ports, stripe, depth=32):
+        if len(get_ports) & (len(get_ports) - 1):
+            raise ValueError(f"SDRAM interleaving requires a power of 2 channels, not {len(get_ports)}")
+        self.get_ports = get_ports
+        self.stripe    = stripe
+        self.depth     = depth
+
+    def get_port(self, mode="both", data_width=None):
+        from litedram.common import LiteDRAMNativePort
+        channel_ports = [get_port(mode=mode, data_width=data_width) for get_port in self.get_ports]
+        data_width    = channel_ports[0].data_width
+        if (self.stripe*8) % data_width or (self.stripe*8//data_width) & (self.stripe*8//data_width - 1):
+            raise ValueError(f"SDRAM interleaving stripe ({self.stripe} bytes) must be a power of 2 multiple of the {data_width//8}-byte port word")
+        port = LiteDRAMNativePort(
+            mode          = mode,
+            address_width = channel_ports[0].address_width + log2_int(len(channel_ports)),
+            data_width    = data_width)
+        self.submodules += _SDRAMInterleaverPort(port, channel_ports,
+            stripe_words = self.stripe*8//data_width,
+            depth        = self.depth)
+        return port
+
+def add_sdram_interleaved_main_ram(soc, interleaver, size, l2_cache_size=8192, l2_cache_min_data_width=128):
+    """Main RAM (main_ram region, through the L2 cache) on `interleaver` ports, as add_sdram() does on
+    the ports of a single controller (CPUs with direct memory buses are not supported).
+    """
+    from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+    if len(soc.cpu.memory_buses):
+        raise ValueError("Interleaved main RAM does not support CPU direct memory buses")
+    soc.bus.add_region("main_ram", SoCRegion(
+        origin = soc.mem_map.get("main_ram", None),
+        size   = size,
+        mode   = "rwx"))
+    port     = interleaver.get_port()
+    wb_sdram = wishbone.Interface(data_width=soc.bus.data_width, address_width=32, addressing="word")
+    soc.bus.add_slave(name="main_ram", slave=wb_sdram)
+
+    # L2 Cache.
+    if l2_cache_size != 0:
+        l2_cache_size = max(l2_cache_size, 2*port.data_width//8)
+        l2_cache_size = 2**(l2_cache_size.bit_length() - 1)
+        soc.l2_cache  = FullMemoryWE()(wishbone.Cache(
+            cachesize = l2_cache_size//4,
+            master    = wb_sdram,
+            slave     = wishbone.Interface(data_width=max(port.data_width, l2_cache_min_data_width), address_width=32, addressing="word")))
+        litedram_wb = soc.l2_cache.slave
+        soc.add_config("L2_SIZE", l2_cache_size)
+    else:
+        litedram_wb = wishbone.Interface(data_width=port.data_width, address_width=32, addressing="word")
+        soc.submodules += wishbone.Converter(wb_sdram, litedram_wb)
+
+    # Wishbone Slave <--> Interleaver bridge.
+    soc.wishbone_bridge = LiteDRAMWishbone2Native(
+        wishbone     = litedram_wb,
+        port         = port,
+        base_address = soc.bus.regions["main_ram"].origin)
+
+def add_sdram_channels_software(builder):
+    """Build the BIOS with the SDRAM channels initialization (litex_boards/software/liblitedram)."""
+    add_liblitedram_software(builder)
@@ -39,18 +39,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import siglent_sds1104xe
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoVGAPHY
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41K64M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -84,14 +81,17 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         with_etherbone         = True,
+        with_udp_streamer      = False,
         eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         **kwargs):
         platform = siglent_sds1104xe.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, with_ethernet=with_etherbone)
+        self.crg = _CRG(platform, sys_clk_freq, with_ethernet=with_etherbone or with_udp_streamer)
 
         # SoCCore ----------------------------------------------------------------------------------
         if kwargs.get("uart_name", "serial") == "serial":
@@ -100,6 +100,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT41K64M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads           = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype        = "DDR3",
@@ -108,26 +111,34 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K64M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Etherbone + Ethernet ---------------------------------------------------------------------
-        if with_etherbone:
+        if with_etherbone or with_udp_streamer:
+            from liteeth.phy.mii import LiteEthPHYMII
             # Ethernet PHY
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
             )
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
 
             # Etherbone.
             self.add_etherbone(
                 phy         = self.ethphy,
                 ip_address  = "192.168.1.50",
                 mac_address = 0x10e2d5000000,
-                data_width  = 8,
+                data_width  = eth_data_width,
                 with_ethmac = True,
+                **etherbone_args(self, etherbone_buffer_depth),
             )
 
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            from litex_boards.targets.udpstreamer.common import add_udp_streamer
+            add_udp_streamer(self, ethcore=self.ethcore_etherbone)
+
         # Video ------------------------------------------------------------------------------------
         video_timings = ("800x480@60Hz", {
             "pix_clk"       : 33.3e6,
@@ -154,16 +165,25 @@ def main():
     parser = LiteXArgumentParser(platform=siglent_sds1104xe.Platform, description="LiteX SoC on SDS1104X-E.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--with-udp-streamer", action="store_true",    help="Enable DRAM to host UDP streamer (implies Etherbone).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_etherbone         = args.with_etherbone,
+        with_udp_streamer      = args.with_udp_streamer,
         eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **parser.soc_argdict
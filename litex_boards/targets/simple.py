@@ -15,6 +15,8 @@ from litex.gen import *
 
 from litex.build.io import CRG
 
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
@@ -53,7 +55,9 @@ def main():
     target_group.add_argument("--toolchain", default=None,        help="FPGA toolchain.")
     builder_args(parser)
     soc_core_args(parser)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     platform_module = importlib.import_module(args.platform)
     platform_kwargs = {}
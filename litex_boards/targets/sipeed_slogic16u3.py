@@ -14,6 +14,7 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder  import *
 
 from litex_boards.platforms.sipeed_slogic16u3 import Platform
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -63,7 +64,9 @@ def main():
     parser = LiteXArgumentParser(platform=Platform, description="LiteX SoC on Sipeed Slogic16U3.")
     parser.add_target_argument("--flash",        action="store_true",          help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=20.732e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -14,6 +14,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import *
 
 from litex_boards.platforms import sipeed_tang_console
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock.gowin_gw5a import GW5APLL
 from litex.soc.integration.soc import *
@@ -21,9 +23,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
-from litedram.modules import AS4C32M16, MT41J128M16, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -162,6 +161,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_ddr3 and not self.integrated_main_ram_size:
+            from litedram.modules import MT41J128M16
+            from litedram.phy import GW5DDRPHY
             self.ddrphy = GW5DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -177,6 +178,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.modules import AS4C32M16, W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -188,7 +191,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = module_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Video ------------------------------------------------------------------------------------
@@ -239,9 +242,13 @@ def main():
             "sipeed",
             "mister"
     ], help="SDRAM module model.")
+    parser.add_target_argument("--sdram-rate",      default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-ddr3",           action="store_true", help="Enable optional DDR3 module.")
     parser.add_target_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (HDMI).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
@@ -250,6 +257,7 @@ def main():
         with_ddr3           = args.with_ddr3,
         with_sdram          = args.with_sdram,
         sdram_model         = args.sdram_model,
+        sdram_rate          = args.sdram_rate,
         with_spi_flash      = args.with_spi_flash,
         with_sdcard         = args.with_sdcard,
         with_spi_sdcard     = args.with_spi_sdcard,
@@ -21,17 +21,14 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
-from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.gw5apciephy import GW5APCIEPHY
 from litepcie.software import *
 
-from litedram.modules import AS4C32M16, MT41J256M16, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import sipeed_tang_mega_138k
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -157,6 +154,8 @@ class BaseSoC(SoCCore):
         with_ethernet          = True,
         with_etherbone         = False,
         eth_ip                 = "192.168.1.50",
+        eth_data_width         = 32,
+        etherbone_buffer_depth = 16,
         remote_ip              = "",
         eth_dynamic_ip         = False,
         with_video_colorbars   = False,
@@ -177,14 +176,15 @@ class BaseSoC(SoCCore):
 
         if with_sdram:
             platform.add_extension({
-                "sipeed": sipeed_tang_mega_138k_pro.sipeedSDRAM(),
-                "mister": sipeed_tang_mega_138k_pro.misterSDRAM()}[sdram_model]
+                "sipeed": sipeed_tang_mega_138k.sipeedSDRAM(),
+                "mister": sipeed_tang_mega_138k.misterSDRAM()}[sdram_model]
             )
 
         # CRG --------------------------------------------------------------------------------------
         cpu_clk_freq = int(800e6) if kwargs["cpu_type"] == "gowin_ae350" else 0
         self.crg = _CRG(platform, sys_clk_freq, cpu_clk_freq,
             with_sdram     = with_sdram,
+            sdram_rate     = sdram_rate,
             with_ddr3      = with_ddr3,
             with_video_pll = with_video_terminal or with_video_framebuffer or with_video_colorbars,
             with_pcie      = with_pcie,
@@ -198,6 +198,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_ddr3 and not self.integrated_main_ram_size:
+            from litedram.modules import MT41J256M16
+            from litedram.phy import GW5DDRPHY
             self.ddrphy = GW5DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -232,25 +234,30 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy,
                     ip_address  = eth_ip,
                     with_ethmac = with_ethernet,
-                    data_with   = 32
+                    data_width  = eth_data_width,
+                    **etherbone_args(self, etherbone_buffer_depth)
                 )
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy,
                     dynamic_ip     = eth_dynamic_ip,
                     local_ip       = eth_ip,
                     remote_ip      = remote_ip,
-                    data_width     = 32,
+                    data_width     = eth_data_width,
                     software_debug = False)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.modules import AS4C32M16, W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -262,11 +269,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = module_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.gw5apciephy import GW5APCIEPHY
             self.pcie_phy = GW5APCIEPHY(platform, platform.request("pcie"), nlanes=4, cd="sys")
             self.add_pcie(phy=self.pcie_phy, ndmas=1, data_width=256)
 
@@ -286,6 +294,7 @@ def main():
             "sipeed",
             "mister"
     ], help="SDRAM module model.")
+    parser.add_target_argument("--sdram-rate",     default="1:2",       help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
 
     # Video.
     viopts = parser.target_group.add_mutually_exclusive_group()
@@ -299,11 +308,16 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-ip", "--local-ip", dest="eth_ip", default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=32, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
 
     # PCIe.
     parser.add_target_argument("--with-pcie",           action="store_true",        help="Enable PCIe support.")
 
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
@@ -315,10 +329,13 @@ def main():
         with_ddr3              = args.with_ddr3,
         with_sdram             = args.with_sdram,
         sdram_model            = args.sdram_model,
+        sdram_rate             = args.sdram_rate,
         with_pcie              = args.with_pcie,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
         eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
         remote_ip              = args.remote_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         **parser.soc_argdict
@@ -19,16 +19,12 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
-from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.gw5apciephy import GW5APCIEPHY
-
-from litedram.modules import AS4C32M16, H5TQ4G63EFR, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import sipeed_tang_mega_138k_pro
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -135,20 +131,22 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        with_ethernet       = True,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = "",
-        eth_dynamic_ip      = False,
-        with_video_terminal = False,
-        with_ddr3           = False,
-        with_sdram          = False,
-        sdram_model         = "sipeed",
-        sdram_rate          = "1:2",
-        with_pcie           = False,
-        with_led_chaser     = True,
-        with_rgb_led        = False,
-        with_buttons        = True,
+        with_ethernet          = True,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 32,
+        etherbone_buffer_depth = 16,
+        remote_ip              = "",
+        eth_dynamic_ip         = False,
+        with_video_terminal    = False,
+        with_ddr3              = False,
+        with_sdram             = False,
+        sdram_model            = "sipeed",
+        sdram_rate             = "1:2",
+        with_pcie              = False,
+        with_led_chaser        = True,
+        with_rgb_led           = False,
+        with_buttons           = True,
         **kwargs):
         platform = sipeed_tang_mega_138k_pro.Platform(toolchain="gowin")
 
@@ -164,6 +162,7 @@ class BaseSoC(SoCCore):
         cpu_clk_freq = int(800e6) if kwargs["cpu_type"] == "gowin_ae350" else 0
         self.crg = _CRG(platform, sys_clk_freq, cpu_clk_freq,
             with_sdram     = with_sdram,
+            sdram_rate     = sdram_rate,
             with_ddr3      = with_ddr3,
             with_video_pll = with_video_terminal,
             with_pcie      = with_pcie,
@@ -175,6 +174,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_ddr3 and not self.integrated_main_ram_size:
+            from litedram.modules import H5TQ4G63EFR
+            from litedram.phy import GW5DDRPHY
             self.ddrphy = GW5DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -205,6 +206,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -218,13 +220,16 @@ class BaseSoC(SoCCore):
                 i_CALIB    = 0,
                 o_CLKOUT   = clk50_half)
             self.specials += DDROutput(1, 0, platform.request("ephy_clk"), clk50_half)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, data_width=32)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, data_width=32, software_debug=True)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip, software_debug=True)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.modules import AS4C32M16, W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -236,11 +241,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = module_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.gw5apciephy import GW5APCIEPHY
             self.pcie_phy = GW5APCIEPHY(platform, platform.request("pcie"), nlanes=4, cd="sys")
             self.add_pcie(phy=self.pcie_phy, ndmas=1, data_width=256)
 
@@ -257,6 +263,7 @@ def main():
             "sipeed",
             "mister"
     ], help="SDRAM module model.")
+    parser.add_target_argument("--sdram-rate",          default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-ddr3",           action="store_true",      help="Enable optional DDR3 module.")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (HDMI).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
@@ -265,23 +272,31 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-ip", "--local-ip", dest="eth_ip", default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width", default=32, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--with-pcie",      action="store_true",     help="Enable PCIe support.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        with_video_terminal = args.with_video_terminal,
-        with_ddr3           = args.with_ddr3,
-        with_sdram          = args.with_sdram,
-        sdram_model         = args.sdram_model,
-        with_pcie           = args.with_pcie,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        eth_ip              = args.eth_ip,
-        remote_ip           = args.remote_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_video_terminal    = args.with_video_terminal,
+        with_ddr3              = args.with_ddr3,
+        with_sdram             = args.with_sdram,
+        sdram_model            = args.sdram_model,
+        sdram_rate             = args.sdram_rate,
+        with_pcie              = args.with_pcie,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
         **parser.soc_argdict
     )
 
@@ -35,6 +35,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sipeed_tang_nano
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock.gowin_gw1n import  GW1NPLL
 from litex.soc.integration.soc import *
@@ -89,7 +90,9 @@ def main():
     parser = LiteXArgumentParser(platform=sipeed_tang_nano.Platform, description="LiteX SoC on Tang Nano.")
     parser.add_target_argument("--flash",        action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=48e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
@@ -21,18 +21,18 @@ from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.video import VideoGowinHDMIPHY
 
-from litedram.modules import M12L64322A  # FIXME: use the real model number
-from litedram.phy import GENSDRPHY
-
 from litex_boards.platforms import sipeed_tang_nano_20k
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, with_hdmi=False):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1", with_hdmi=False):
         self.rst      = Signal()
         self.cd_sys   = ClockDomain()
         self.cd_por   = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x = ClockDomain()
         if with_hdmi:
             self.cd_hdmi   = ClockDomain()
             self.cd_hdmi5x = ClockDomain()
@@ -52,6 +52,8 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(~por_done)
         pll.register_clkin(clk27, 27e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x, 2*sys_clk_freq)
 
         # HDMI PLL
         if with_hdmi:
@@ -69,7 +71,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, toolchain="gowin", sys_clk_freq=48e6,
+    def __init__(self, toolchain="gowin", sys_clk_freq=48e6, sdram_rate="1:1",
         with_led_chaser      = True,
         with_rgb_led         = False,
         with_buttons         = True,
@@ -83,7 +85,7 @@ class BaseSoC(SoCCore):
         with_hdmi = with_video_terminal or with_video_colorbars
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, with_hdmi=with_hdmi)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate, with_hdmi=with_hdmi)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Tang Nano 20K", **kwargs)
@@ -96,6 +98,9 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import M12L64322A
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             class SDRAMPads:
                 def __init__(self):
                     self.clk   = platform.request("O_sdram_clk")
@@ -110,12 +115,12 @@ class BaseSoC(SoCCore):
                     self.dq    = platform.request("IO_sdram_dq")
             sdram_pads = SDRAMPads()
 
-            self.specials += DDROutput(0, 1, sdram_pads.clk, ClockSignal("sys"))
+            self.specials += DDROutput(0, 1, sdram_pads.clk, ClockSignal("sys2x" if sdram_rate == "1:2" else "sys"))
 
-            self.sdrphy = GENSDRPHY(sdram_pads, sys_clk_freq)
+            self.sdrphy = sdrphy_cls(sdram_pads, sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = M12L64322A(sys_clk_freq, "1:1"), # FIXME.
+                module        = M12L64322A(sys_clk_freq, sdram_rate), # FIXME.
                 l2_cache_size = 128,
             )
 
@@ -157,6 +162,7 @@ def main():
     parser = LiteXArgumentParser(platform=sipeed_tang_nano_20k.Platform, description="LiteX SoC on Tang Nano 20K.")
     parser.add_target_argument("--flash",          action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=48e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",     default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable memory-mapped SPI flash.")
     parser.add_target_argument("--with-rbg-led",   action="store_true",      help="Enable WS2812 RGB Led.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
@@ -165,11 +171,14 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",  action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-colorbars", action="store_true", help="Enable Video Colorbars (HDMI).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain            = args.toolchain,
         sys_clk_freq         = args.sys_clk_freq,
+        sdram_rate           = args.sdram_rate,
         with_rgb_led         = args.with_rbg_led,
         with_spi_flash       = args.with_spi_flash,
         with_video_terminal  = args.with_video_terminal,
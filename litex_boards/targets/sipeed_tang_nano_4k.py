@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sipeed_tang_nano_4k
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock.gowin_gw1n import GW1NPLL
 from litex.soc.integration.soc import *
@@ -149,7 +150,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",        default=27e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-hyperram",       action="store_true",      help="Enable HyperRAM.")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (HDMI).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain           = args.toolchain,
@@ -20,12 +20,10 @@ from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.video import *
 
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 from litex_boards.platforms import sipeed_tang_primer_20k
-
-from litedram.modules import IMD128M16R39CG8GNF
-from litedram.phy import GW2DDRPHY
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import etherbone_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -101,17 +99,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="gowin", sys_clk_freq=48e6,
-        with_spi_flash      = False,
-        with_led_chaser     = True,
-        with_rgb_led        = False,
-        with_buttons        = True,
-        with_video_terminal = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = None,
-        eth_dynamic_ip      = False,
-        dock                = "standard",
+        with_spi_flash         = False,
+        with_led_chaser        = True,
+        with_rgb_led           = False,
+        with_buttons           = True,
+        with_video_terminal    = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        dock                   = "standard",
         **kwargs):
 
         assert dock in ["standard", "lite"]
@@ -131,6 +130,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_dram:
+            from litedram.modules import IMD128M16R39CG8GNF
+            from litedram.phy import GW2DDRPHY
             self.ddrphy = GW2DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -141,7 +142,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = IMD128M16R39CG8GNF(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -166,7 +167,7 @@ class BaseSoC(SoCCore):
                     with_timing_constraints = False
                 )
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_timing_constraints=False, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_timing_constraints=False, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
@@ -216,21 +217,26 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",  help="Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP assignment.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        toolchain           = args.toolchain,
-        sys_clk_freq        = args.sys_clk_freq,
-        with_spi_flash      = args.with_spi_flash,
-        with_video_terminal = args.with_video_terminal,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        eth_ip              = args.eth_ip,
-        remote_ip           = args.remote_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
-        dock                = args.dock,
+        toolchain              = args.toolchain,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_spi_flash         = args.with_spi_flash,
+        with_video_terminal    = args.with_video_terminal,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        dock                   = args.dock,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
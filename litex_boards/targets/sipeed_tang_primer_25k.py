@@ -18,10 +18,9 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOIn
 
-from litedram.modules import AS4C32M16, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 from litex_boards.platforms import sipeed_tang_primer_25k
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -98,6 +97,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.modules import AS4C32M16, W9825G6KH6
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -109,7 +110,7 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = module_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -143,7 +144,11 @@ def main():
             "sipeed",
             "mister"
     ], help="SDRAM module model.")
+    parser.add_target_argument("--sdram-rate",       default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         toolchain      = args.toolchain,
@@ -151,6 +156,7 @@ def main():
         with_spi_flash = args.with_spi_flash,
         with_sdram     = args.with_sdram,
         sdram_model    = args.sdram_model,
+        sdram_rate     = args.sdram_rate,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
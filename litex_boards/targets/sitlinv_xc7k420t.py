@@ -20,6 +20,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sitlinv_xc7k420t
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -27,13 +29,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.phy import s7ddrphy
-from litedram.common import PHYPadsReducer
-from litedram.modules import K4B1G0446F
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -82,6 +77,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import s7ddrphy
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import K4B1G0446F
             # we need to use A7DDRPHY instead of K7DDRPHY, because the 420T has no ODELAYE2
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram", 0), [0, 1, 2, 3]),
@@ -94,11 +92,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = K4B1G0446F(sys_clk_freq, "1:4", "800"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                **l2_cache_args(self, kwargs, phy=self.ddrphy),
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -146,7 +145,10 @@ def main():
     parser.add_target_argument("--pcie-lanes",   default=4, type=int,       choices=[4, 8], help="PCIe lane count.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",    action="store_true",       help="Enable SATA support.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -164,6 +166,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
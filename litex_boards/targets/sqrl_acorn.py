@@ -31,6 +31,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sqrl_acorn
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc import *
@@ -41,12 +43,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.xadc import S7SystemMonitor
 from litex.soc.cores.dna  import S7DNA
 
-from litedram.modules import MT41K512M16
-from litedram.phy import s7ddrphy
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -82,6 +78,7 @@ class BaseSoC(SoCCore):
         pcie_address_width    = 64,
         with_pcie_dma_status  = False,
         with_pcie_dma_monitor = False,
+        with_pcie_dma_bench   = False,
         with_sata             = False,
         **kwargs):
         platform = sqrl_acorn.Platform(variant=variant)
@@ -101,6 +98,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -109,11 +108,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT41K512M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.comb += platform.request("pcie_clkreq_n").eq(0)
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
@@ -124,6 +124,10 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
             platform.add_period_constraint(self.crg.cd_sys.clk, 1e9/sys_clk_freq)
 
             # ICAP (For FPGA reload over PCIe).
@@ -192,11 +196,15 @@ def main():
     parser.add_target_argument("--pcie-address-width", default=64, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true", help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true", help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
     parser.add_target_argument("--driver",                action="store_true", help="Generate PCIe driver.")
 
     parser.add_target_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support (requires SDCard adapter on P2).")
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
 
@@ -208,6 +216,7 @@ def main():
         pcie_address_width    = args.pcie_address_width,
         with_pcie_dma_status  = args.pcie_with_dma_status,
         with_pcie_dma_monitor = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench   = args.pcie_with_dma_bench,
         with_sata             = args.with_sata,
         **parser.soc_argdict
     )
@@ -222,7 +231,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -18,6 +18,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import sqrl_fk33
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.usphbm2.common import (
+    USPHBM2_CHANNEL_SIZE,
+    USPHBM2_STRIPE_SIZE,
+    add_usphbm2_striped_window,
+    usphbm2_check_stripe,
+    usphbm2_share_port,
+    usphbm2_striped_window_origin,
+)
 from litex.soc.cores.clock import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import (
     USPHBM2,
@@ -32,9 +41,6 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litepcie.phy.usppciephy import USPHBMPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # HBM XCI ------------------------------------------------------------------------------------------
 
 def ensure_hbm_xci(url, hbm_xci=os.path.join("ip", "hbm", "hbm_0.xci")):
@@ -75,14 +81,27 @@ class BaseSoC(SoCCore):
         pcie_address_width    = 32,
         with_pcie_dma_status  = False,
         with_pcie_dma_monitor = False,
+        with_pcie_dma_bench   = False,
+        pcie_dma_hbm_channels = (),
         with_hbm              = False,
         hbm_channels          = (0, 1, 2, 3),
         hbm_main_channel      = 0,
         hbm_base              = USPHBM2_DEFAULT_BASE,
         hbm_high_base         = USPHBM2_HIGH_BASE,
         hbm_strip_origin      = False,
+        hbm_stripe_channels   = (),
+        hbm_stripe_size       = USPHBM2_STRIPE_SIZE,
+        with_mem_bench        = False,
         **kwargs):
         platform = sqrl_fk33.Platform()
+        if with_pcie_dma_bench and pcie_dma_hbm_channels:
+            raise ValueError("PCIe DMA bench and PCIe DMA to memory are exclusive")
+        if pcie_dma_hbm_channels:
+            pcie_dma_hbm_channels = parse_usphbm2_channels(pcie_dma_hbm_channels)
+            if not (with_pcie and with_hbm):
+                raise ValueError("PCIe DMA to HBM requires PCIe and HBM")
+            if len(pcie_dma_hbm_channels) > pcie_ndmas:
+                raise ValueError("More PCIe DMA HBM channels than PCIe DMA channels")
         if with_hbm:
             assert 225e6 <= sys_clk_freq <= 450e6
             hbm_channels = parse_usphbm2_channels(hbm_channels)
@@ -90,12 +109,20 @@ class BaseSoC(SoCCore):
                 raise ValueError("HBM main channel must be one of the mapped HBM channels")
             hbm_origins = usphbm2_channel_origins(hbm_channels, hbm_base, hbm_high_base)
             hbm_end = usphbm2_window_end(hbm_origins)
+            if hbm_end > 2**33:
+                hbm_strip_origin = True
+            if hbm_stripe_channels:
+                hbm_stripe_channels = parse_usphbm2_channels(hbm_stripe_channels)
+                if set(hbm_stripe_channels) & set(hbm_channels):
+                    raise ValueError("Striped HBM channels must not also be mapped individually")
+                usphbm2_check_stripe(hbm_stripe_channels, hbm_stripe_size)
+                # Striped window after the pseudochannel windows (in the 64-bit space when above 4GB).
+                hbm_stripe_origin = usphbm2_striped_window_origin(hbm_end, hbm_stripe_channels)
+                hbm_end = hbm_stripe_origin + len(hbm_stripe_channels)*USPHBM2_CHANNEL_SIZE
             if hbm_end > 2**kwargs.get("bus_address_width", 32):
                 kwargs["bus_address_width"] = 64
             if hbm_end > 2**pcie_address_width:
                 pcie_address_width = 64
-            if hbm_end > 2**33:
-                hbm_strip_origin = True
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq, with_hbm)
@@ -113,6 +140,16 @@ class BaseSoC(SoCCore):
             self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
 
             ensure_hbm_xci("https://github.com/litex-hub/litex-boards/files/8178874/hbm_0.xci.txt")
+            # Memory Bench (shares each channel with its bus mapping).
+            if with_mem_bench:
+                from litex_boards.targets.membench.common import add_mem_bench
+                for channel in (*hbm_channels, *hbm_stripe_channels):
+                    add_mem_bench(self, f"hbm{channel}_bench",
+                        size       = USPHBM2_CHANNEL_SIZE,
+                        write_port = usphbm2_share_port(self, hbm, channel, f"hbm{channel}_bench"))
+            # PCIe DMA ports (shared with the bus mapping of the channel, if any).
+            pcie_dma_hbm_ports = [usphbm2_share_port(self, hbm, channel, f"hbm{channel}_pcie")
+                for channel in pcie_dma_hbm_channels]
             add_usphbm2_pseudochannels(
                 soc              = self,
                 hbm              = hbm,
@@ -121,9 +158,17 @@ class BaseSoC(SoCCore):
                 origins          = hbm_origins,
                 hbm_high_base    = hbm_high_base,
                 hbm_strip_origin = hbm_strip_origin)
+            if hbm_stripe_channels:
+                add_usphbm2_striped_window(
+                    soc         = self,
+                    hbm         = hbm,
+                    channels    = hbm_stripe_channels,
+                    origin      = hbm_stripe_origin,
+                    stripe_size = hbm_stripe_size)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPHBMPCIEPHY
             assert self.csr_data_width == 32
             self.pcie_phy = USPHBMPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
@@ -134,6 +179,15 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
+            # DMA <-> HBM (bypassing the SoC bus).
+            if pcie_dma_hbm_channels:
+                from litex_boards.targets.pciemem.common import add_pcie_dma_mem
+                for i, port in enumerate(pcie_dma_hbm_ports):
+                    add_pcie_dma_mem(self, i, size=USPHBM2_CHANNEL_SIZE, write_port=port)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -153,6 +207,8 @@ def main():
     parser.add_target_argument("--pcie-address-width", default=32, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true", help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true", help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
+    parser.add_target_argument("--pcie-dma-hbm-channels", default="", help="HBM channels directly connected to PCIe DMA channels 0, 1... (comma/range list).")
     parser.add_target_argument("--with-hbm",              action="store_true", help="Use HBM2.")
     parser.add_target_argument("--hbm-channels", default="0,1,2,3",         help="HBM channels to map (comma/range list or all).")
     parser.add_target_argument("--hbm-main-channel", default=0, type=int,   help="Mapped HBM channel used as main RAM.")
@@ -161,12 +217,26 @@ def main():
     parser.add_target_argument("--hbm-high-base",  default=USPHBM2_HIGH_BASE,
         type=lambda x: int(x, 0), help="HBM bus base for channels above the low 32-bit cached window.")
     parser.add_target_argument("--hbm-strip-origin", action="store_true",   help="Expose each mapped HBM channel with local AXI addresses.")
+    parser.add_target_argument("--hbm-stripe-channels", default="",         help="HBM channels to interleave in one striped window (comma/range list).")
+    parser.add_target_argument("--hbm-stripe-size", default=USPHBM2_STRIPE_SIZE,
+        type=lambda x: int(x, 0), help="HBM striped window interleave granularity in bytes.")
+    parser.add_target_argument("--with-mem-bench", action="store_true",     help="Add per-channel HBM bandwidth/latency bench cores (see litex_boards.tools.mem_bench).")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
+    if args.pcie_with_dma_bench and args.pcie_dma_hbm_channels:
+        parser.error("--pcie-with-dma-bench cannot be used with PCIe DMA to memory.")
+    if args.pcie_dma_hbm_channels and not (args.with_pcie and args.with_hbm):
+        parser.error("--pcie-dma-hbm-channels requires --with-pcie and --with-hbm.")
     try:
         hbm_channels = parse_usphbm2_channels(args.hbm_channels)
+        hbm_stripe_channels = parse_usphbm2_channels(args.hbm_stripe_channels) if args.hbm_stripe_channels else ()
+        if hbm_stripe_channels:
+            usphbm2_check_stripe(hbm_stripe_channels, args.hbm_stripe_size)
+        pcie_dma_hbm_channels = parse_usphbm2_channels(args.pcie_dma_hbm_channels) if args.pcie_dma_hbm_channels else ()
     except ValueError as e:
         parser.error(str(e))
 
@@ -178,12 +248,17 @@ def main():
         pcie_address_width    = args.pcie_address_width,
         with_pcie_dma_status  = args.pcie_with_dma_status,
         with_pcie_dma_monitor = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench   = args.pcie_with_dma_bench,
+        pcie_dma_hbm_channels = pcie_dma_hbm_channels,
         with_hbm              = args.with_hbm,
         hbm_channels          = hbm_channels,
         hbm_main_channel      = args.hbm_main_channel,
         hbm_base              = args.hbm_base,
         hbm_high_base         = args.hbm_high_base,
         hbm_strip_origin      = args.hbm_strip_origin,
+        hbm_stripe_channels   = hbm_stripe_channels,
+        hbm_stripe_size       = args.hbm_stripe_size,
+        with_mem_bench        = args.with_mem_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -194,7 +269,14 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
+        if args.pcie_dma_hbm_channels:
+            from litex_boards.targets.pciemem.common import generate_pcie_dma_mem_software
+            generate_pcie_dma_mem_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -7,26 +7,22 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import functools
 
 from migen import *
 
 from litex.gen import *
 
 from litex_boards.platforms import sqrl_xcu1525
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args, set_main_ram_data_width, parse_ddram_channels
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M8
-from litedram.phy import usddrphy
-
-from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # QSFP ---------------------------------------------------------------------------------------------
 
 QSFP_PORTS = tuple(f"qsfp{qsfp}_sfp{sfp}" for qsfp in range(2) for sfp in range(4))
@@ -37,10 +33,16 @@ def parse_qsfp_port(port):
     qsfp, sfp = port.replace("qsfp", "").split("_sfp")
     return int(qsfp), int(sfp)
 
+# DDR4 Channels ------------------------------------------------------------------------------------
+
+DDRAM_CHANNELS      = range(4)
+DDRAM_CHANNEL_SIZE  = 0x40000000
+DDRAM_CHANNELS_BASE = 0x100000000 # Non-main channels, only mapped on the bus with --bus-address-width=64.
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, ddram_channel, with_qsfp=False):
+    def __init__(self, platform, sys_clk_freq, ddram_channels, with_qsfp=False):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_sys4x  = ClockDomain()
@@ -53,7 +55,7 @@ class _CRG(LiteXModule):
 
         self.pll = pll = USPMMCM(speedgrade=-2)
         self.comb += pll.reset.eq(self.rst)
-        pll.register_clkin(platform.request("clk300", ddram_channel), 300e6)
+        pll.register_clkin(platform.request("clk300", ddram_channels[0]), 300e6)
         pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
         pll.create_clkout(self.cd_idelay, 500e6)
         if with_qsfp:
@@ -70,58 +72,107 @@ class _CRG(LiteXModule):
 
         self.idelayctrl = USPIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
 
+        # Other DDR4 channels: clocked from their own clk300 (in their SLR), see sdramchannels.
+        for channel in ddram_channels[1:]:
+            from litex_boards.targets.sdramchannels.common import SDRAMChannelCRG
+            setattr(self, f"ddram{channel}_crg", SDRAMChannelCRG(platform, f"ddram{channel}",
+                clkin        = platform.request("clk300", channel),
+                clkin_freq   = 300e6,
+                sys_clk_freq = sys_clk_freq,
+                sys_clk      = self.cd_sys.clk,
+                rst          = self.rst))
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6, ddram_channel=0,
-        with_led_chaser       = True,
-        with_pcie             = False,
-        pcie_lanes            = 4,
-        pcie_ndmas            = 1,
-        pcie_address_width    = 32,
-        with_pcie_dma_status  = False,
-        with_pcie_dma_monitor = False,
-        with_sata             = False,
-        with_ethernet         = False,
-        with_etherbone        = False,
-        ethernet_port         = "qsfp0_sfp0",
-        etherbone_port        = "qsfp0_sfp1",
-        eth_ip                = "192.168.1.50",
-        eth_dynamic_ip        = False,
-        remote_ip             = None,
-        etherbone_ip          = "192.168.1.50",
+        ddram_channels         = None,
+        with_led_chaser        = True,
+        with_pcie              = False,
+        pcie_lanes             = 4,
+        pcie_ndmas             = 1,
+        pcie_address_width     = 32,
+        with_pcie_dma_status   = False,
+        with_pcie_dma_monitor  = False,
+        with_pcie_dma_bench    = False,
+        with_sata              = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        ethernet_port          = "qsfp0_sfp0",
+        etherbone_port         = "qsfp0_sfp1",
+        eth_rate               = "1g",
+        eth_data_width         = None,
+        eth_ip                 = "192.168.1.50",
+        eth_dynamic_ip         = False,
+        remote_ip              = None,
+        etherbone_ip           = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        with_mem_bench         = False,
+        main_ram_data_width    = None,
         **kwargs):
         platform = sqrl_xcu1525.Platform()
-        if ddram_channel not in range(4):
-            raise ValueError("DDRAM channel must be 0, 1, 2 or 3")
+        ddram_channels = parse_ddram_channels(ddram_channel if ddram_channels is None else ddram_channels, DDRAM_CHANNELS)
         if with_ethernet and with_etherbone and ethernet_port == etherbone_port:
             raise ValueError("Ethernet and Etherbone QSFP ports must be different")
 
         # CRG --------------------------------------------------------------------------------------
-        with_qsfp = with_ethernet or with_etherbone
-        self.crg = _CRG(platform, sys_clk_freq, ddram_channel, with_qsfp=with_qsfp)
+        with_qsfp = (with_ethernet or with_etherbone) and eth_rate == "1g"
+        self.crg = _CRG(platform, sys_clk_freq, ddram_channels, with_qsfp=with_qsfp)
 
         # SoCCore ----------------------------------------------------------------------------------
+        set_main_ram_data_width(kwargs, main_ram_data_width)
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on XCU1525", **kwargs)
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
+        self.ddram_channels = ()
         if not self.integrated_main_ram_size:
-            self.ddrphy = usddrphy.USPDDRPHY(
-                pads             = platform.request("ddram", ddram_channel),
-                memtype          = "DDR4",
-                sys_clk_freq     = sys_clk_freq,
-                iodelay_clk_freq = 500e6)
-            self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT40A512M8(sys_clk_freq, "1:4"),
-                size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
-            )
+            from litedram.modules import MT40A512M8
+            from litedram.phy import usddrphy
+            # The first channel is used as main RAM, the others are added as independent DRAM channels
+            # in their own clock domains (sdram<N>, initialized by the BIOS before main RAM).
+            self.ddram_channels = ddram_channels
+            for i, channel in enumerate(ddram_channels):
+                ddrphy = usddrphy.USPDDRPHY(
+                    pads             = platform.request("ddram", channel),
+                    memtype          = "DDR4",
+                    sys_clk_freq     = sys_clk_freq,
+                    iodelay_clk_freq = 500e6)
+                if i == 0:
+                    self.ddrphy = ddrphy
+                    self.add_sdram("sdram",
+                        phy    = self.ddrphy,
+                        module = MT40A512M8(sys_clk_freq, "1:4"),
+                        size   = DDRAM_CHANNEL_SIZE,
+                        **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=main_ram_data_width)
+                    )
+                else:
+                    from litex_boards.targets.sdramchannels.common import add_sdram_channel
+                    add_sdram_channel(self, channel,
+                        phy          = ddrphy,
+                        module       = MT40A512M8(sys_clk_freq, "1:4"),
+                        clock_domain = f"ddram{channel}")
+                    if self.bus.address_width > 32:
+                        self.add_ddram_region(channel, origin=DDRAM_CHANNELS_BASE + (i - 1)*DDRAM_CHANNEL_SIZE)
+                # Memory Bench.
+                if with_mem_bench:
+                    from litex_boards.targets.membench.common import add_mem_bench
+                    # Benches of the other channels only run once the BIOS has initialized them.
+                    if i == 0:
+                        get_port, init_done = self.sdram.crossbar.get_port, None
+                    else:
+                        get_port  = functools.partial(self.get_ddram_port, channel)
+                        init_done = getattr(self, f"sdram{channel}").init_done.storage
+                    add_mem_bench(self, f"ddram{channel}_bench",
+                        size       = DDRAM_CHANNEL_SIZE,
+                        write_port = get_port(),
+                        read_port  = get_port(),
+                        init_done  = init_done)
             # Workadound for Vivado 2018.2 DRC, can be ignored and probably fixed on newer Vivado versions.
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks PDCN-2736]")
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = {2: 64, 4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
@@ -131,18 +182,22 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         qsfp_in_use = [False, False]
 
         if with_ethernet:
             qsfp_id, sfp_lane = parse_qsfp_port(ethernet_port)
-            self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads          = platform.request(f"qsfp{qsfp_id}_sfp{sfp_lane}"),
-                sys_clk_freq       = self.clk_freq,
-                refclk_from_fabric = True)
+            self.ethphy = self.get_qsfp_eth_phy(qsfp_id, sfp_lane, eth_rate)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
             self.add_ethernet(
                 phy        = self.ethphy,
+                phy_cd     = "ethphy_eth" if with_etherbone else "eth",
+                data_width = eth_data_width,
                 local_ip   = eth_ip if not eth_dynamic_ip else None,
                 dynamic_ip = eth_dynamic_ip,
                 remote_ip  = remote_ip)
@@ -150,11 +205,14 @@ class BaseSoC(SoCCore):
 
         if with_etherbone:
             qsfp_id, sfp_lane = parse_qsfp_port(etherbone_port)
-            self.bonephy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads          = platform.request(f"qsfp{qsfp_id}_sfp{sfp_lane}"),
-                sys_clk_freq       = self.clk_freq,
-                refclk_from_fabric = True)
-            self.add_etherbone(phy=self.bonephy, ip_address=etherbone_ip)
+            self.bonephy = self.get_qsfp_eth_phy(qsfp_id, sfp_lane, eth_rate)
+            eth_data_width = check_eth_data_width(self.bonephy, eth_data_width)
+            self.add_etherbone(
+                phy        = self.bonephy,
+                phy_cd     = "bonephy_eth" if with_ethernet else "eth",
+                data_width = eth_data_width,
+                ip_address = etherbone_ip,
+                **etherbone_args(self, etherbone_buffer_depth))
             qsfp_in_use[qsfp_id] = True
 
         # SATA -------------------------------------------------------------------------------------
@@ -216,34 +274,100 @@ class BaseSoC(SoCCore):
                 pads         = platform.request_all("user_led"),
                 sys_clk_freq = sys_clk_freq)
 
+    # QSFP Ethernet PHYs ---------------------------------------------------------------------------
+
+    def get_qsfp_eth_phy(self, qsfp_id, sfp_lane, eth_rate="1g"):
+        """Return a 1000BASE-X or 10GBASE-R Ethernet PHY on a QSFP lane (10GBASE-R PHYs of a QSFP share its QPLL)."""
+        platform  = self.platform
+        data_pads = platform.request(f"qsfp{qsfp_id}_sfp{sfp_lane}")
+        if eth_rate == "1g":
+            from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
+            return USP_GTY_1000BASEX(self.crg.cd_eth.clk,
+                data_pads          = data_pads,
+                sys_clk_freq       = self.clk_freq,
+                refclk_from_fabric = True)
+        if eth_rate == "10g":
+            from litex_boards.targets.eth10g.common import USP_GTY_10GBASER_QPLL, USP_GTY_10GBASER
+            qpll_name = f"qsfp{qsfp_id}_qpll"
+            if not hasattr(self, qpll_name):
+                # 156.25MHz RefClk from the Si5335 (FS=0b01).
+                refclk_pads = platform.request(f"qsfp{qsfp_id}_refclk1")
+                platform.add_period_constraint(refclk_pads, 1e9/156.25e6)
+                self.comb += platform.request(f"qsfp{qsfp_id}_fs").eq(0b01)
+                setattr(self, qpll_name, USP_GTY_10GBASER_QPLL(refclk_pads, refclk_freq=156.25e6))
+            return USP_GTY_10GBASER(getattr(self, qpll_name),
+                data_pads    = data_pads,
+                sys_clk_freq = self.clk_freq)
+        raise ValueError(f"Unsupported Ethernet rate {eth_rate!r}, expected 1g or 10g")
+
+    # DDR4 Channel Ports ---------------------------------------------------------------------------
+
+    def get_ddram_port(self, channel, mode="native", data_width=None):
+        """Return a new native or AXI user port on a non-main DDR4 channel (in sys clock domain)."""
+        if channel not in self.ddram_channels[1:]:
+            raise ValueError(f"DDRAM channel {channel} is not an enabled non-main channel")
+        port = getattr(self, f"sdram{channel}").get_port(data_width=data_width)
+        if mode == "native":
+            return port
+        if mode == "axi":
+            from litex.soc.interconnect.axi import AXIInterface
+            from litedram.frontend.axi import LiteDRAMAXI2Native
+            axi = AXIInterface(
+                data_width    = port.data_width,
+                address_width = port.address_width + log2_int(port.data_width//8),
+                id_width      = 8)
+            self.submodules += LiteDRAMAXI2Native(axi=axi, port=port, base_address=0)
+            return axi
+        raise ValueError(f"Unsupported DDRAM port mode {mode!r}, expected native or axi")
+
+    def add_ddram_region(self, channel, origin):
+        """Map a non-main DDR4 channel on the SoC bus (ddram<channel> region)."""
+        from litex_boards.targets.sdramchannels.common import add_sdram_channel_region
+        if channel not in self.ddram_channels[1:]:
+            raise ValueError(f"DDRAM channel {channel} is not an enabled non-main channel")
+        add_sdram_channel_region(self, channel, origin=origin, size=DDRAM_CHANNEL_SIZE)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=sqrl_xcu1525.Platform, description="LiteX SoC on XCU1525.")
     parser.add_target_argument("--sys-clk-freq",  default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--ddram-channel", default=0, type=lambda x: int(x, 0), choices=range(4), help="DDRAM channel (0, 1, 2 or 3).")
+    parser.add_target_argument("--main-ram-data-width", default=None, type=int, choices=[64, 128, 256, 512], help="Main RAM data width: widen the SoC bus/DMAs and L2 cache up to the DDR4 native width.")
+    parser.add_target_argument("--ddram-channels", "--ddram-channel", dest="ddram_channels", default="0", help="DDRAM channels (comma/range list or all), the first one is main RAM, the others are initialized by the BIOS.")
     parser.add_target_argument("--with-pcie",     action="store_true",        help="Enable PCIe support.")
     parser.add_target_argument("--pcie-lanes",    default=4, type=int,        choices=[2, 4, 8, 16], help="PCIe lane count.")
     parser.add_target_argument("--pcie-ndmas",    default=1, type=int,        help="Number of PCIe DMA channels.")
     parser.add_target_argument("--pcie-address-width", default=32, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true",       help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true",       help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
     parser.add_target_argument("--with-ethernet",         action="store_true",       help="Enable Ethernet support over QSFP/SFP.")
     parser.add_target_argument("--with-etherbone",        action="store_true",       help="Enable Etherbone support over QSFP/SFP.")
     parser.add_target_argument("--ethernet-port",  default="qsfp0_sfp0", choices=QSFP_PORTS, help="Ethernet QSFP/SFP port.")
     parser.add_target_argument("--etherbone-port", default="qsfp0_sfp1", choices=QSFP_PORTS, help="Etherbone QSFP/SFP port.")
+    parser.add_target_argument("--eth-rate",       default="1g", choices=["1g", "10g"],      help="Ethernet/Etherbone rate (1000BASE-X or 10GBASE-R).")
+    parser.add_target_argument("--eth-data-width", default=None, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width (default: PHY width).")
     parser.add_target_argument("--ethernet-ip",    default="192.168.1.50",    help="Ethernet IP address.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--etherbone-ip",   default="192.168.1.50",    help="Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--driver",        action="store_true",        help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",     action="store_true",        help="Enable SATA support (over SFP2SATA on qsfp0_sfp0).")
+    parser.add_target_argument("--with-mem-bench", action="store_true",       help="Add per-channel DDR4 bandwidth/latency bench cores (see litex_boards.tools.mem_bench).")
+    parser.set_defaults(l2_size=None, bus_data_width=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
+    try:
+        ddram_channels = parse_ddram_channels(args.ddram_channels, DDRAM_CHANNELS)
+    except ValueError as e:
+        parser.error(str(e))
     if args.with_ethernet and args.with_etherbone and args.ethernet_port == args.etherbone_port:
         parser.error("Ethernet and Etherbone QSFP ports must be different.")
     if args.with_sata:
@@ -255,26 +379,35 @@ def main():
                 parser.error(f"{feature} on qsfp0_sfp0 conflicts with SATA.")
 
     soc = BaseSoC(
-        sys_clk_freq          = args.sys_clk_freq,
-        ddram_channel         = args.ddram_channel,
-        with_pcie             = args.with_pcie,
-        pcie_lanes            = args.pcie_lanes,
-        pcie_ndmas            = args.pcie_ndmas,
-        pcie_address_width    = args.pcie_address_width,
-        with_pcie_dma_status  = args.pcie_with_dma_status,
-        with_pcie_dma_monitor = args.pcie_with_dma_monitor,
-        with_sata             = args.with_sata,
-        with_ethernet         = args.with_ethernet,
-        with_etherbone        = args.with_etherbone,
-        ethernet_port         = args.ethernet_port,
-        etherbone_port        = args.etherbone_port,
-        eth_ip                = args.ethernet_ip,
-        eth_dynamic_ip        = args.eth_dynamic_ip,
-        remote_ip             = args.remote_ip,
-        etherbone_ip          = args.etherbone_ip,
+        sys_clk_freq           = args.sys_clk_freq,
+        main_ram_data_width    = args.main_ram_data_width,
+        ddram_channels         = ddram_channels,
+        with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_ndmas             = args.pcie_ndmas,
+        pcie_address_width     = args.pcie_address_width,
+        with_pcie_dma_status   = args.pcie_with_dma_status,
+        with_pcie_dma_monitor  = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench    = args.pcie_with_dma_bench,
+        with_sata              = args.with_sata,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        ethernet_port          = args.ethernet_port,
+        etherbone_port         = args.etherbone_port,
+        eth_rate               = args.eth_rate,
+        eth_data_width         = args.eth_data_width,
+        eth_ip                 = args.ethernet_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        etherbone_ip           = args.etherbone_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        with_mem_bench         = args.with_mem_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
+    if len(soc.ddram_channels) > 1:
+        from litex_boards.targets.sdramchannels.common import add_sdram_channels_software
+        add_sdram_channels_software(builder)
     if args.build or args.driver:
         if not args.build:
             builder.compile_software = False
@@ -282,7 +415,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -13,6 +13,8 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import terasic_de10lite
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import Max10PLL
 from litex.soc.integration.soc import *
@@ -20,57 +22,71 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoVGAPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import IS42S16320
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_clk_phase):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
-        self.cd_vga    = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, sdram_clk_phase=None, sdram_rate="1:1"):
+        self.rst    = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
+        self.cd_vga = ClockDomain()
 
         # # #
 
         # Clk / Rst
         clk50 = platform.request("clk50")
 
+        # SDRAM clock phase (of sys2x_ps at 1:2).
+        if sdram_clk_phase is None:
+            sdram_clk_phase = 180 if sdram_rate == "1:2" else 90 # 1:2: Idealy 90° but needs to be increased.
+
         # PLL
         self.pll = pll = Max10PLL(speedgrade="-7")
         self.comb += pll.reset.eq(self.rst)
         pll.register_clkin(clk50, 50e6)
-        pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=sdram_clk_phase)
-        pll.create_clkout(self.cd_vga,    40e6)
+        pll.create_clkout(self.cd_sys, sys_clk_freq)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=sdram_clk_phase)
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=sdram_clk_phase)
+        pll.create_clkout(self.cd_vga, 40e6)
 
         # SDRAM clock
-        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), ClockSignal("sys_ps"))
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        sdram_clk_phase     = 90,
+        sdram_clk_phase     = None,
+        sdram_rate          = "1:1",
         with_led_chaser     = True,
         with_video_terminal = False,
         **kwargs):
         platform = terasic_de10lite.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, sdram_clk_phase)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_clk_phase, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on DE10-Lite", **kwargs)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import IS42S16320
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = IS42S16320(sys_clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                module        = IS42S16320(sys_clk_freq, sdram_rate),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Video Terminal ---------------------------------------------------------------------------
@@ -90,13 +106,18 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=terasic_de10lite.Platform, description="LiteX SoC on DE10-Lite.")
     parser.add_target_argument("--sys-clk-freq",        default=50e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--sdram-clk-phase",     default=90,   type=float, help="SDRAM clock phase.")
+    parser.add_target_argument("--sdram-clk-phase",     default=None, type=float, help="SDRAM clock phase (default: 90 at 1:1, 180 at 1:2).")
+    parser.add_target_argument("--sdram-rate",          default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (VGA).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
         sdram_clk_phase     = args.sdram_clk_phase,
+        sdram_rate          = args.sdram_rate,
         with_video_terminal = args.with_video_terminal,
         **parser.soc_argdict
     )
@@ -13,24 +13,26 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import terasic_de2_115
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.soc.cores.clock import CycloneIVPLL
 from litex.soc.cores.led import LedChaser
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import IS42S16320
-from litedram.phy import GENSDRPHY
-
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+        self.rst    = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
 
         # # #
 
@@ -42,42 +44,52 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(self.rst)
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
 
         # SDRAM clock
-        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), ClockSignal("sys_ps"))
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = True,
-        with_sdcard     = False,
-        with_led_chaser = True,
-        ethernet_phy    = 0,
-        etherbone_ip    = "192.168.1.50",
-        etherbone_phy   = 1,
+        sdram_rate             = "1:1",
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        remote_ip              = None,
+        eth_dynamic_ip         = True,
+        with_sdcard            = False,
+        with_led_chaser        = True,
+        ethernet_phy           = 0,
+        etherbone_ip           = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        etherbone_phy          = 1,
         **kwargs,
     ):
         platform = terasic_de2_115.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on DE2-115", **kwargs)
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import IS42S16320
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = IS42S16320(self.clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                module        = IS42S16320(self.clk_freq, sdram_rate),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -93,6 +105,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.mii import LiteEthPHYMII
             # Ethernet PHY
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = platform.request("eth_clocks", ethernet_phy),
@@ -106,6 +119,7 @@ class BaseSoC(SoCCore):
                 remote_ip  = remote_ip,
             )
         if with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             # Ethernet PHY
             self.submodules.ethbphy = LiteEthPHYMII(
                 clock_pads = platform.request("eth_clocks", etherbone_phy),
@@ -115,6 +129,7 @@ class BaseSoC(SoCCore):
                 phy        = self.ethbphy,
                 phy_cd     = "ethbphy_eth" if with_ethernet else "eth",
                 ip_address = etherbone_ip,
+                **etherbone_args(self, etherbone_buffer_depth),
             )
 
 # Build --------------------------------------------------------------------------------------------
@@ -124,6 +139,7 @@ def main():
     parser = LiteXArgumentParser(platform=terasic_de2_115.Platform, description="LiteX SoC on DE2-115.")
 
     parser.add_target_argument("--sys-clk-freq",    default=50e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",      default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-led-chaser", action="store_true",      help="Enable LED chaser.")
     parser.add_target_argument("--with-sdcard",     action="store_true",      help="Enable SD card support.")
     parser.add_target_argument("--with-ethernet",   action="store_true",      help="Enable Ethernet support.")
@@ -132,24 +148,30 @@ def main():
     parser.add_target_argument("--remote-ip",       default="192.168.1.100",  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip",  action="store_true",      help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--etherbone-ip",    default="192.168.48.100", help="Etherbone IP address.")
-    parser.add_target_argument("--etherbone-phy",   default=1, type=int,      help="Etherbone PHY (0 or 1).")
-    parser.add_target_argument("--ethernet-phy",    default=0, type=int,      help="Ethernet  PHY (0 or 1).")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
+    parser.add_target_argument("--etherbone-phy",   default=1, type=int,         help="Etherbone PHY (0 or 1).")
+    parser.add_target_argument("--ethernet-phy",    default=0, type=int,         help="Ethernet  PHY (0 or 1).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.with_etherbone and args.eth_dynamic_ip:
         parser.error("--eth-dynamic-ip cannot be used with Etherbone.")
 
     soc = BaseSoC(
-        sys_clk_freq    = args.sys_clk_freq,
-        with_sdcard     = args.with_sdcard,
-        with_ethernet   = args.with_ethernet,
-        eth_ip          = args.eth_ip,
-        eth_dynamic_ip  = args.eth_dynamic_ip,
-        remote_ip       = args.remote_ip,
-        with_etherbone  = args.with_etherbone,
-        with_led_chaser = args.with_led_chaser,
-        etherbone_ip    = args.etherbone_ip,
-        etherbone_phy   = args.etherbone_phy,
-        ethernet_phy    = args.ethernet_phy,
+        sys_clk_freq           = args.sys_clk_freq,
+        sdram_rate             = args.sdram_rate,
+        with_sdcard            = args.with_sdcard,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_etherbone         = args.with_etherbone,
+        with_led_chaser        = args.with_led_chaser,
+        etherbone_ip           = args.etherbone_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        etherbone_phy          = args.etherbone_phy,
+        ethernet_phy           = args.ethernet_phy,
         **parser.soc_argdict,
     )
 
@@ -12,6 +12,8 @@
 
 from migen import *
 from litex_boards.platforms import terasic_deca
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.ethernet.common import etherbone_args
 
 from litex.gen import *
 
@@ -21,8 +23,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoDVIPHY
 from litex.soc.cores.led import LedChaser
 
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -57,14 +57,15 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
-        with_led_chaser     = True,
-        with_video_terminal = False,
-        with_spi_sdcard     = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        eth_ip              = "192.168.1.50",
-        remote_ip           = None,
-        eth_dynamic_ip      = False,
+        with_led_chaser        = True,
+        with_video_terminal    = False,
+        with_spi_sdcard        = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        eth_ip                 = "192.168.1.50",
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
         **kwargs):
         self.platform = platform = terasic_deca.Platform()
 
@@ -85,6 +86,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.platform.toolchain.additional_sdc_commands += [
                 'create_clock -name eth_rx_clk -period 40.0 [get_ports {eth_clocks_rx}]',
                 'create_clock -name eth_tx_clk -period 40.0 [get_ports {eth_clocks_tx}]',
@@ -96,7 +98,7 @@ class BaseSoC(SoCCore):
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
@@ -139,21 +141,25 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",              default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
     parser.add_target_argument("--remote-ip",           default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip",      action="store_true",     help="Enable dynamic Ethernet IP assignment.")
     parser.add_target_argument("--with-video-terminal", action="store_true",     help="Enable Video Terminal (VGA).")
     parser.add_target_argument("--with-spi-sdcard",     action="store_true",     help="Enable SPI SD card controller.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
-        sys_clk_freq        = args.sys_clk_freq,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        eth_ip              = args.eth_ip,
-        remote_ip           = args.remote_ip,
-        eth_dynamic_ip      = args.eth_dynamic_ip,
-        with_video_terminal = args.with_video_terminal,
-        with_spi_sdcard     = args.with_spi_sdcard,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        eth_ip                 = args.eth_ip,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        remote_ip              = args.remote_ip,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        with_video_terminal    = args.with_video_terminal,
+        with_spi_sdcard        = args.with_spi_sdcard,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -10,6 +10,8 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import terasic_sockit
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc  import *
@@ -19,9 +21,6 @@ from litex.soc.cores.video import VideoVGAPHY
 
 from litex.build.io import DDROutput
 
-from litedram.modules import W9825G6KH6, AS4C32M16
-from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -85,13 +84,15 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if mister_sdram is not None:
+            from litedram.modules import W9825G6KH6, AS4C32M16
+            from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             sdrphy_mod = {"xs_v22": W9825G6KH6, "xs_v24": AS4C32M16}[mister_sdram]
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = sdrphy_mod(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Video Terminal ---------------------------------------------------------------------------
@@ -113,18 +114,23 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=terasic_sockit.Platform, description="LiteX SoC on the Terasic SoCKit.")
-    parser.add_target_argument("--single-rate-sdram",   action="store_true",      help="Clock SDRAM with 1x the sytem clock (instead of 2x).")
+    parser.add_target_argument("--sdram-rate",          default="1:2",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    parser.add_target_argument("--single-rate-sdram",   dest="sdram_rate", action="store_const", const="1:1",
+        help="Same as --sdram-rate=1:1 (deprecated).")
     parser.add_target_argument("--mister-sdram-xs-v22", action="store_true",      help="Use optional MiSTer SDRAM module XS v2.2 on J2 on GPIO daughter card.")
     parser.add_target_argument("--mister-sdram-xs-v24", action="store_true",      help="Use optional MiSTer SDRAM module XS v2.4 on J2 on GPIO daughter card.")
     parser.add_target_argument("--revision",            default="revd",           help="Board revision (revb, revc or revd).")
     parser.add_target_argument("--sys-clk-freq",        default=50e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-video-terminal", action="store_true",      help="Enable Video Terminal (VGA).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
         revision            = args.revision,
-        sdram_rate          = "1:1" if args.single_rate_sdram else "1:2",
+        sdram_rate          = args.sdram_rate,
         mister_sdram        = "xs_v22" if args.mister_sdram_xs_v22 else "xs_v24" if args.mister_sdram_xs_v24 else None,
         with_video_terminal = args.with_video_terminal,
         **parser.soc_argdict
@@ -13,6 +13,7 @@ from litex.gen import *
 from litex.build.io import CRG
 
 from litex_boards.platforms import tinyfpga_bx
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.integration.soc import *
 from litex.soc.integration.soc import SoCRegion
@@ -59,7 +60,9 @@ def main():
     parser = LiteXArgumentParser(platform=tinyfpga_bx.Platform, description="LiteX SoC on TinyFPGA BX.")
     parser.add_target_argument("--bios-flash-offset", default="0x50000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--sys-clk-freq",      default=16e6, type=float, help="System clock frequency.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
          bios_flash_offset = int(args.bios_flash_offset, 0),
@@ -12,25 +12,25 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import trenz_cr00010
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC4M16
-from litedram.phy import GENSDRPHY
-
-from litespi.modules import W74M64FV
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
-        self.rst       = Signal()
-        self.cd_sys    = ClockDomain()
-        self.cd_sys_ps = ClockDomain()
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+        self.rst    = Signal()
+        self.cd_sys = ClockDomain()
+        if sdram_rate == "1:2":
+            self.cd_sys2x    = ClockDomain()
+            self.cd_sys2x_ps = ClockDomain()
+        else:
+            self.cd_sys_ps = ClockDomain()
 
         # # #
 
@@ -38,9 +38,14 @@ class _CRG(LiteXModule):
         self.comb += pll.reset.eq(self.rst)
         pll.register_clkin(platform.request("clk12"), 12e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if sdram_rate == "1:2":
+            pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
+            pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180)  # Idealy 90° but needs to be increased.
+        else:
+            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
 
-        self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
+        sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
+        self.comb += platform.request("sdram_clock").eq(sdram_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -50,6 +55,7 @@ class BaseSoC(SoCCore):
     }}
 
     def __init__(self, sys_clk_freq=50e6,
+        sdram_rate      = "1:1",
         device          = "10M08SAU169C8G",
         with_hyperram   = True,
         with_led_chaser = True,
@@ -59,7 +65,7 @@ class BaseSoC(SoCCore):
         platform = trenz_cr00010.Platform(device=device)
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, sdram_rate=sdram_rate)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on CR00010", **kwargs)
@@ -73,6 +79,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import W74M64FV
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(
                 name        = "spiflash",
                 mode        = "1x",
@@ -83,11 +91,14 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
-            self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
+            from litedram.modules import MT48LC4M16
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+            sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
+            self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
-                module        = MT48LC4M16(sys_clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                module        = MT48LC4M16(sys_clk_freq, sdram_rate),
+                **l2_cache_args(self, kwargs, phy=self.sdrphy)
             )
 
         # Power Control ----------------------------------------------------------------------------
@@ -111,11 +122,15 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=trenz_cr00010.Platform, description="LiteX SoC on CR00010.")
     parser.add_target_argument("--sys-clk-freq",    default=50e6, type=float,       help="System clock frequency.")
+    parser.add_target_argument("--sdram-rate",      default="1:1",                  help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--device",          default="10m08", choices=["10m08", "10m16"], help="FPGA device.")
     parser.add_target_argument("--no-hyperram",     action="store_true",            help="Disable HyperRAM support.")
     parser.add_target_argument("--no-sdram",        action="store_true",            help="Disable SDRAM support.")
     parser.add_target_argument("--with-spi-flash",  action="store_true",            help="Enable SPI flash support.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     device = {
         "10m08": "10M08SAU169C8G",
@@ -124,6 +139,7 @@ def main():
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
+        sdram_rate     = args.sdram_rate,
         device         = device,
         with_hyperram  = not args.no_hyperram,
         with_sdram     = not args.no_sdram,
@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import trenz_mf_max10_001
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 from litex_boards.targets.microfpga.common import MFIOBasic, OnChipOscillator
 
 from litex.soc.integration.soc import SoCRegion
@@ -78,7 +79,9 @@ def main():
     parser.add_target_argument("--platform-id",  default=0,     type=int,   help="Platform variant index.")
     parser.add_target_argument("--no-mfio",      action="store_true",      help="Disable MFIO Wishbone bridge.")
     parser.set_defaults(uart_name="jtag_uart")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import trenz_s7mini
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -67,7 +68,9 @@ def main():
     parser = LiteXArgumentParser(platform=trenz_s7mini.Platform, description="LiteX SoC on Trenz S7 Mini.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--no-hyperram",  action="store_true",      help="Disable HyperRAM support.")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq  = args.sys_clk_freq,
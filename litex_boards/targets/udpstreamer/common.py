@@ -0,0 +1,164 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+# UDP Streamer -------------------------------------------------------------------------------------
+
+# Streams a DRAM region to a host as back-to-back UDP datagrams: a LiteDRAM DMA reader feeds a UDP
+# user port of the Etherbone UDP/IP stack, each datagram carrying an 8-byte header (32-bit sequence
+# number and 32-bit byte offset of the payload in the region, little-endian) followed by up to
+# packet_size bytes of the region. Driven/received from the host with:
+#
+# litex_server --udp --udp-ip=192.168.1.50
+# python3 -m litex_boards.tools.udp_streamer --csr-csv=csr.csv --length=0x1000000 --output=dump.bin
+
+UDP_STREAMER_SRC_PORT    = 2000
+UDP_STREAMER_DATA_WIDTH  = 32
+UDP_STREAMER_HEADER_SIZE = 8
+UDP_STREAMER_PACKET_SIZE = 1024 # Payload bytes per datagram (up to 1472 with a 1500 bytes MTU).
+
+class UDPStreamer(LiteXModule):
+    def __init__(self, port, udp_port, src_port=UDP_STREAMER_SRC_PORT, fifo_depth=32):
+        from litedram.frontend.dma import LiteDRAMDMAReader
+        assert udp_port.dw == UDP_STREAMER_DATA_WIDTH
+        word_bytes = port.data_width//8
+        beat_bytes = UDP_STREAMER_DATA_WIDTH//8
+
+        self.start       = CSR()  # Write to stream the region.
+        self.ip_address  = CSRStorage(32, description="Host IP address.")
+        self.udp_port    = CSRStorage(16, reset=UDP_STREAMER_SRC_PORT, description="Host UDP port.")
+        self.base        = CSRStorage(32, description="Region offset in DRAM (bytes, DRAM word aligned).")
+        self.length      = CSRStorage(32, description="Region length (bytes, DRAM word aligned).")
+        self.packet_size = CSRStorage(16, reset=UDP_STREAMER_PACKET_SIZE, description="Payload bytes per datagram (multiple of 4).")
+        self.status      = CSRStatus(fields=[
+            CSRField("busy", size=1, offset=0, description="Region being streamed."),
+        ])
+        self.packets     = CSRStatus(32, description="Datagrams sent by the last transfer.")
+        self.cycles      = CSRStatus(64, description="sys_clk cycles of the last transfer.")
+
+        # # #
+
+        # DMA Reader.
+        self.dma = dma = LiteDRAMDMAReader(port, fifo_depth=fifo_depth, fifo_buffered=True)
+        self.converter = converter = stream.Converter(port.data_width, UDP_STREAMER_DATA_WIDTH)
+        self.comb += dma.source.connect(converter.sink)
+
+        busy       = Signal()
+        read_words = Signal(32)
+        read_count = Signal(32)
+        self.comb += [
+            dma.sink.valid.eq(busy & (read_count != read_words)),
+            dma.sink.address.eq((self.base.storage[log2_int(word_bytes):] + read_count)[:len(dma.sink.address)]),
+        ]
+        self.sync += [
+            If(dma.sink.valid & dma.sink.ready,
+                read_count.eq(read_count + 1)
+            ),
+            If(self.start.re & ~busy,
+                read_count.eq(0),
+                read_words.eq(self.length.storage[log2_int(word_bytes):]),
+            ),
+        ]
+
+        # Datagrams.
+        sink      = udp_port.sink
+        remaining = Signal(32)
+        offset    = Signal(32)
+        sequence  = Signal(32)
+        payload   = Signal(16)
+        count     = Signal(16)
+        self.comb += [
+            sink.src_port.eq(src_port),
+            sink.dst_port.eq(self.udp_port.storage),
+            sink.ip_address.eq(self.ip_address.storage),
+            sink.length.eq(payload + UDP_STREAMER_HEADER_SIZE),
+            udp_port.source.ready.eq(1), # Datagrams sent to the streamer are dropped.
+        ]
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(self.start.re & (self.length.storage != 0),
+                NextValue(busy, 1),
+                NextValue(remaining, self.length.storage),
+                NextValue(offset, 0),
+                NextValue(sequence, 0),
+                NextValue(self.packets.status, 0),
+                NextState("HEADER-SEQUENCE")
+            )
+        )
+        fsm.act("HEADER-SEQUENCE",
+            NextValue(payload, Mux(remaining < self.packet_size.storage, remaining, self.packet_size.storage)),
+            NextState("HEADER-SEQUENCE-SEND")
+        )
+        fsm.act("HEADER-SEQUENCE-SEND",
+            sink.valid.eq(1),
+            sink.data.eq(sequence),
+            If(sink.ready,
+                NextState("HEADER-OFFSET")
+            )
+        )
+        fsm.act("HEADER-OFFSET",
+            sink.valid.eq(1),
+            sink.data.eq(offset),
+            If(sink.ready,
+                NextValue(count, beat_bytes),
+                NextState("PAYLOAD")
+            )
+        )
+        fsm.act("PAYLOAD",
+            sink.valid.eq(converter.source.valid),
+            sink.data.eq(converter.source.data),
+            sink.last.eq(count >= payload),
+            sink.last_be.eq(Mux(sink.last, 1 << (beat_bytes - 1), 0)),
+            converter.source.ready.eq(sink.ready),
+            If(sink.valid & sink.ready,
+                NextValue(count, count + beat_bytes),
+                NextValue(offset, offset + beat_bytes),
+                NextValue(remaining, remaining - beat_bytes),
+                If(sink.last,
+                    NextValue(sequence, sequence + 1),
+                    NextValue(self.packets.status, self.packets.status + 1),
+                    If(remaining == beat_bytes,
+                        NextValue(busy, 0),
+                        NextState("IDLE")
+                    ).Else(
+                        NextState("HEADER-SEQUENCE")
+                    )
+                )
+            )
+        )
+        self.sync += [
+            If(self.start.re & ~busy,
+                self.cycles.status.eq(0)
+            ).Elif(busy,
+                self.cycles.status.eq(self.cycles.status + 1)
+            )
+        ]
+        self.comb += self.status.fields.busy.eq(busy)
+
+# Add UDP Streamer ---------------------------------------------------------------------------------
+
+def add_udp_streamer(soc, ethcore, name="udp_streamer", src_port=UDP_STREAMER_SRC_PORT):
+    """Add a UDPStreamer on a DRAM crossbar port and on a UDP port of `ethcore` (LiteEthUDPIPCore).
+
+    As with Etherbone, the UDP port is taken from a sys-clocked alias domain: "sys" inside the
+    UDP/IP core can be renamed to the PHY's eth_rx domain.
+    """
+    if not hasattr(soc, "sdram"):
+        raise ValueError("UDP streamer requires a DRAM main RAM (not available with --integrated-main-ram-size)")
+    setattr(soc, f"cd_{name}", ClockDomain(name))
+    soc.comb += getattr(soc, f"cd_{name}").clk.eq(ClockSignal("sys"))
+    soc.comb += getattr(soc, f"cd_{name}").rst.eq(ResetSignal("sys"))
+    udp_port = ethcore.udp.crossbar.get_port(src_port, dw=UDP_STREAMER_DATA_WIDTH, cd=name)
+    streamer = UDPStreamer(soc.sdram.crossbar.get_port(), udp_port, src_port=src_port)
+    soc.add_module(name=name, module=streamer)
+    soc.add_constant(f"{name.upper()}_DRAM_BASE", soc.bus.regions["main_ram"].origin)
+    soc.add_constant(f"{name.upper()}_DRAM_WORD", soc.sdram.crossbar.controller.data_width//8)
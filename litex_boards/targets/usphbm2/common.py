@@ -0,0 +1,265 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from functools import reduce
+from operator import and_
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.axi import AXIArbiter, AXIInterface, AXIRemapper, BURST_INCR, RESP_SLVERR
+from litex.soc.integration.soc import SoCRegion
+
+# Striped HBM2 Window ------------------------------------------------------------------------------
+
+USPHBM2_CHANNEL_SIZE     = 2**28 # 256MiB per pseudochannel.
+USPHBM2_MAX_BURST_BEATS  = 16    # HBM2 AXI ports only have a 4-bit AxLEN.
+USPHBM2_STRIPE_SIZE      = 4096
+
+def usphbm2_check_stripe(channels, stripe_size, data_width=256):
+    if len(channels) < 2 or len(channels) & (len(channels) - 1):
+        raise ValueError("Striped HBM window needs a power of 2 number of channels (>= 2)")
+    if stripe_size & (stripe_size - 1) or not (data_width//8 <= stripe_size <= USPHBM2_CHANNEL_SIZE):
+        raise ValueError(f"HBM stripe size must be a power of 2 between {data_width//8} and {USPHBM2_CHANNEL_SIZE} bytes")
+
+
+class USPHBM2Striper(LiteXModule):
+    """Present N HBM2 pseudochannels as one window striped every `stripe_size` bytes.
+
+    INCR bursts on `bus` are split at stripe boundaries (and at 16 beats) into sub-bursts issued in
+    order to the pseudochannel AXI ports; write responses are merged and read data is returned in
+    request order, so sub-bursts to different pseudochannels are in flight concurrently. Sub-bursts
+    are issued with a constant ID (ordering is kept here), the master ID is returned from the order
+    FIFOs. FIXED/WRAP and narrow bursts are not supported: they are not issued to the pseudochannels
+    and are answered with SLVERR responses (write data dropped, read data zeroed).
+    """
+    def __init__(self, channels, ports, stripe_size=USPHBM2_STRIPE_SIZE, address_width=32, origin=0, depth=16):
+        data_width = ports[0].data_width
+        id_width   = len(ports[0].aw.id)
+        usphbm2_check_stripe(channels, stripe_size, data_width)
+        self.bus = bus = AXIInterface(
+            data_width    = data_width,
+            address_width = address_width,
+            id_width      = id_width)
+
+        # # #
+
+        nchannels    = len(channels)
+        beat_bytes   = data_width//8
+        beat_shift   = log2_int(beat_bytes)
+        stripe_shift = log2_int(stripe_size)
+        chan_shift   = log2_int(nchannels)
+        order_layout = [("chan", chan_shift), ("beats", 5), ("final", 1), ("error", 1), ("id", id_width)]
+
+        # Request (AW/AR) Splitters.
+        def splitter(ax_name, orders):
+            master_ax = getattr(bus, ax_name)
+            addr      = Signal(address_width)
+            remaining = Signal(9)
+            axid      = Signal(id_width)
+            error     = Signal()
+            busy      = Signal()
+            chan      = Signal(chan_shift)
+            beats     = Signal(5)
+            offset    = Signal(address_width)
+            local     = Signal(address_width)
+            to_stripe = Signal(stripe_shift - beat_shift + 1)
+            stripe_beats = stripe_size >> beat_shift
+            if stripe_shift > beat_shift:
+                self.comb += to_stripe.eq(stripe_beats - offset[beat_shift:stripe_shift])
+            else:
+                self.comb += to_stripe.eq(1)
+            self.comb += [
+                offset.eq(addr - origin),
+                chan.eq(offset[stripe_shift:stripe_shift + chan_shift]),
+                local.eq(Cat(offset[:stripe_shift], offset[stripe_shift + chan_shift:])),
+                beats.eq(USPHBM2_MAX_BURST_BEATS),
+                If(remaining < USPHBM2_MAX_BURST_BEATS,
+                    beats.eq(remaining)
+                ),
+                If(to_stripe < remaining,
+                    If(to_stripe < USPHBM2_MAX_BURST_BEATS,
+                        beats.eq(to_stripe)
+                    )
+                ),
+                master_ax.ready.eq(~busy),
+            ]
+            issue       = Signal()
+            order_ready = Signal()
+            self.comb += order_ready.eq(reduce(and_, [order.sink.ready for order in orders]))
+            for n, port in enumerate(ports):
+                slave_ax = getattr(port, ax_name)
+                self.comb += [
+                    slave_ax.valid.eq(busy & ~error & (chan == n) & order_ready),
+                    slave_ax.addr.eq(Cat(local[:log2_int(USPHBM2_CHANNEL_SIZE)], Constant(channels[n], 5))),
+                    slave_ax.burst.eq(BURST_INCR),
+                    slave_ax.len.eq(beats - 1),
+                    slave_ax.size.eq(beat_shift),
+                    slave_ax.id.eq(0),
+                    If(slave_ax.valid & slave_ax.ready, issue.eq(1)),
+                ]
+            self.comb += If(busy & error & order_ready, issue.eq(1)) # Only answered.
+            for order in orders:
+                self.comb += [
+                    order.sink.valid.eq(issue),
+                    order.sink.chan.eq(chan),
+                    order.sink.beats.eq(beats),
+                    order.sink.final.eq(beats == remaining),
+                    order.sink.error.eq(error),
+                    order.sink.id.eq(axid),
+                ]
+            self.sync += [
+                If(~busy,
+                    If(master_ax.valid,
+                        busy.eq(1),
+                        addr.eq(master_ax.addr),
+                        remaining.eq(master_ax.len + 1),
+                        axid.eq(master_ax.id),
+                        error.eq((master_ax.burst != BURST_INCR) | (master_ax.size != beat_shift)),
+                    )
+                ).Elif(issue,
+                    addr.eq(addr + (beats << beat_shift)),
+                    remaining.eq(remaining - beats),
+                    If(beats == remaining,
+                        busy.eq(0)
+                    )
+                )
+            ]
+
+        self.w_order = w_order = stream.SyncFIFO(order_layout, depth)
+        self.b_order = b_order = stream.SyncFIFO(order_layout, depth)
+        self.r_order = r_order = stream.SyncFIFO(order_layout, depth)
+        splitter("aw", [w_order, b_order])
+        splitter("ar", [r_order])
+
+        # Write Data: route master beats to the pseudochannel of the oldest sub-burst (dropped on error).
+        w_count = Signal(5)
+        w_last  = Signal()
+        w_error = w_order.source.error
+        self.comb += w_last.eq(w_count == (w_order.source.beats - 1))
+        for n, port in enumerate(ports):
+            self.comb += [
+                port.w.valid.eq(bus.w.valid & w_order.source.valid & ~w_error & (w_order.source.chan == n)),
+                port.w.data.eq(bus.w.data),
+                port.w.strb.eq(bus.w.strb),
+                port.w.last.eq(w_last),
+            ]
+        self.comb += [
+            bus.w.ready.eq(w_order.source.valid & (w_error | Array(port.w.ready for port in ports)[w_order.source.chan])),
+            w_order.source.ready.eq(bus.w.valid & bus.w.ready & w_last),
+        ]
+        self.sync += If(bus.w.valid & bus.w.ready,
+            w_count.eq(w_count + 1),
+            If(w_last, w_count.eq(0))
+        )
+
+        # Write Responses: merge the responses of a burst's sub-bursts (keeping the worst one).
+        b_resp     = Signal(2)
+        b_chan     = b_order.source.chan
+        b_error    = b_order.source.error
+        b_valid    = Signal()
+        b_src_resp = Signal(2)
+        self.comb += [
+            b_valid.eq(b_error | Array(port.b.valid for port in ports)[b_chan]),
+            b_src_resp.eq(Mux(b_error, RESP_SLVERR, Array(port.b.resp for port in ports)[b_chan])),
+        ]
+        for n, port in enumerate(ports):
+            self.comb += port.b.ready.eq(b_order.source.valid & ~b_error & (b_chan == n) &
+                (~b_order.source.final | bus.b.ready))
+        self.comb += [
+            bus.b.valid.eq(b_order.source.valid & b_order.source.final & b_valid),
+            bus.b.id.eq(b_order.source.id),
+            bus.b.resp.eq(Mux(b_src_resp > b_resp, b_src_resp, b_resp)),
+            b_order.source.ready.eq(b_valid & (~b_order.source.final | bus.b.ready)),
+        ]
+        self.sync += If(b_order.source.valid & b_order.source.ready,
+            If(b_order.source.final,
+                b_resp.eq(0)
+            ).Elif(b_src_resp > b_resp,
+                b_resp.eq(b_src_resp)
+            )
+        )
+
+        # Read Data: return beats in request order (generated on error).
+        r_chan  = r_order.source.chan
+        r_error = r_order.source.error
+        r_port  = Array(port.r for port in ports)
+        r_count = Signal(5)
+        r_valid = Signal()
+        r_last  = Signal()
+        for n, port in enumerate(ports):
+            self.comb += port.r.ready.eq(r_order.source.valid & ~r_error & (r_chan == n) & bus.r.ready)
+        self.comb += [
+            If(r_error,
+                r_valid.eq(1),
+                r_last.eq(r_count == (r_order.source.beats - 1)),
+            ).Else(
+                r_valid.eq(r_port[r_chan].valid),
+                r_last.eq(r_port[r_chan].last),
+            ),
+            bus.r.valid.eq(r_order.source.valid & r_valid),
+            bus.r.data.eq(Mux(r_error, 0, r_port[r_chan].data)),
+            bus.r.resp.eq(Mux(r_error, RESP_SLVERR, r_port[r_chan].resp)),
+            bus.r.id.eq(r_order.source.id),
+            bus.r.last.eq(r_last & r_order.source.final),
+            r_order.source.ready.eq(bus.r.valid & bus.r.ready & r_last),
+        ]
+        self.sync += If(bus.r.valid & bus.r.ready,
+            r_count.eq(r_count + 1),
+            If(r_last, r_count.eq(0))
+        )
+
+
+def add_usphbm2_striped_window(soc, hbm, channels, origin, stripe_size=USPHBM2_STRIPE_SIZE, name="hbm_stripe"):
+    """Map `channels` as one striped window at `origin` on the SoC bus; return the striper."""
+    striper = USPHBM2Striper(
+        channels      = channels,
+        ports         = [hbm.axi[channel] for channel in channels],
+        stripe_size   = stripe_size,
+        address_width = soc.bus.address_width,
+        origin        = origin)
+    soc.add_module(name=name, module=striper)
+    soc.bus.add_slave(name=name, slave=striper.bus, region=SoCRegion(
+        origin = origin,
+        size   = len(channels)*USPHBM2_CHANNEL_SIZE,
+        cached = False))
+    soc.add_constant(f"{name.upper()}_CHANNELS", len(channels))
+    soc.add_constant(f"{name.upper()}_SIZE",     stripe_size)
+    return striper
+
+
+def usphbm2_striped_window_origin(end, channels):
+    """First origin after `end` aligned on the striped window size."""
+    size = len(channels)*USPHBM2_CHANNEL_SIZE
+    return (end + size - 1)//size*size
+
+# Shared Pseudochannel Ports -----------------------------------------------------------------------
+
+def usphbm2_share_port(soc, hbm, channel, name):
+    """Arbitrate pseudochannel `channel` between its SoC mapping and a new local AXI port (returned).
+
+    Must be called before the channel is mapped (add_usphbm2_pseudochannels/add_usphbm2_striped_window),
+    which then connect to the arbitrated port. The returned LiteDRAMAXIPort covers the pseudochannel
+    with local (0 based) byte addresses.
+    """
+    from litedram.frontend.axi import LiteDRAMAXIPort
+    port     = hbm.axi[channel]
+    id_width = len(port.aw.id)
+    shared   = AXIInterface(data_width=port.data_width, address_width=port.address_width, id_width=id_width)
+    remapped = AXIInterface(data_width=port.data_width, address_width=port.address_width, id_width=id_width)
+    local    = LiteDRAMAXIPort(
+        data_width    = port.data_width,
+        address_width = log2_int(USPHBM2_CHANNEL_SIZE),
+        id_width      = id_width)
+    soc.add_module(name=f"{name}_remapper", module=AXIRemapper(
+        master = local,
+        slave  = remapped,
+        origin = channel*USPHBM2_CHANNEL_SIZE,
+        size   = USPHBM2_CHANNEL_SIZE))
+    soc.add_module(name=f"{name}_arbiter", module=AXIArbiter(masters=[shared, remapped], target=port))
+    hbm.axi[channel] = shared
+    return local
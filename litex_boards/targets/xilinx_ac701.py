@@ -14,23 +14,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_ac701
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -58,14 +50,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet   = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        eth_phy         = "rgmii",
-        with_spi_flash  = False,
-        with_led_chaser = True,
-        with_pcie       = False,
+        with_ethernet          = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        eth_phy                = "rgmii",
+        with_spi_flash         = False,
+        with_sdram_calib_cache = False,
+        with_led_chaser        = True,
+        with_pcie              = False,
         **kwargs):
         platform = xilinx_ac701.Platform()
 
@@ -77,6 +71,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype      = "DDR3",
@@ -85,13 +82,14 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 # phy
                 self.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
@@ -99,6 +97,8 @@ class BaseSoC(SoCCore):
 
             # 1000BaseX Ethernet PHY ---------------------------------------------------------------
             if eth_phy == "1000basex":
+                from liteeth.phy.a7_gtp import QPLLSettings, QPLL
+                from liteeth.phy.a7_1000basex import A7_1000BASEX
                 # phy
                 self.comb += self.platform.request("sfp_mgt_clk_sel0", 0).eq(0)
                 self.comb += self.platform.request("sfp_mgt_clk_sel1", 0).eq(0)
@@ -123,7 +123,8 @@ class BaseSoC(SoCCore):
                     data_pads    = self.platform.request("sfp", 0),
                     sys_clk_freq = self.clk_freq)
 
-            self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -131,8 +132,14 @@ class BaseSoC(SoCCore):
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=N25Q256A(Codes.READ_1_1_4), rate="1:1", with_master=True)
 
+        # SDRAM Calibration Cache ------------------------------------------------------------------
+        if with_sdram_calib_cache and not self.integrated_main_ram_size:
+            from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache
+            add_sdram_calib_cache(self, phy=self.ddrphy)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -149,29 +156,42 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_ac701.Platform, description="LiteX SoC on AC701.")
-    parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
-    parser.add_target_argument("--eth-phy",        default="rgmii",           help="Select Ethernet PHY (rgmii or 1000basex).")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI flash.")
-    parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",           default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",       help="Enable dynamic Ethernet IP assignment.")
+    parser.add_target_argument("--eth-phy",                default="rgmii",           help="Select Ethernet PHY (rgmii or 1000basex).")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",       help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--with-sdram-calib-cache", action="store_true",       help="Cache the DRAM leveling in SPI Flash (requires --with-spi-flash).")
+    parser.add_target_argument("--with-pcie",              action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--driver",                 action="store_true",       help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+
+    if args.with_sdram_calib_cache and not args.with_spi_flash:
+        parser.error("--with-sdram-calib-cache requires --with-spi-flash.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        eth_phy        = args.eth_phy,
-        with_spi_flash = args.with_spi_flash,
-        with_pcie      = args.with_pcie,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        eth_phy                = args.eth_phy,
+        with_spi_flash         = args.with_spi_flash,
+        with_sdram_calib_cache = args.with_sdram_calib_cache,
+        with_pcie              = args.with_pcie,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
+    if args.with_sdram_calib_cache:
+        from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache_software
+        add_sdram_calib_cache_software(builder)
     if args.build or args.driver:
         if not args.build:
             builder.compile_software = False
@@ -179,6 +199,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -15,17 +15,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_alveo_u250
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args, set_main_ram_data_width
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -66,6 +63,8 @@ class BaseSoC(SoCCore):
         pcie_address_width    = 32,
         with_pcie_dma_status  = False,
         with_pcie_dma_monitor = False,
+        with_pcie_dma_bench   = False,
+        main_ram_data_width   = None,
         **kwargs):
         platform = xilinx_alveo_u250.Platform()
 
@@ -73,10 +72,13 @@ class BaseSoC(SoCCore):
         self.crg = _CRG(platform, sys_clk_freq)
 
         # SoCCore ----------------------------------------------------------------------------------
+        set_main_ram_data_width(kwargs, main_ram_data_width)
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Alveo U250", **kwargs)
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MTA18ASF2G72PZ
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -87,7 +89,7 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy, data_width=main_ram_data_width)
             )
 
         # Firmware RAM (To ease initial LiteDRAM calibration support) ------------------------------
@@ -95,6 +97,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = {4: 128, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
@@ -104,6 +107,10 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -117,25 +124,32 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_alveo_u250.Platform, description="LiteX SoC on Alveo U250.")
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float,  help="System clock frequency.")
+    parser.add_target_argument("--main-ram-data-width", default=None, type=int, choices=[64, 128, 256, 512], help="Main RAM data width: widen the SoC bus/DMAs and L2 cache up to the DDR4 native width.")
     parser.add_target_argument("--with-pcie",    action="store_true",        help="Enable PCIe support.")
     parser.add_target_argument("--pcie-lanes",   default=4, type=int,        choices=[4, 16], help="PCIe lane count.")
     parser.add_target_argument("--pcie-ndmas",   default=1, type=int,        help="Number of PCIe DMA channels.")
     parser.add_target_argument("--pcie-address-width", default=32, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true",        help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true",        help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
     parser.add_target_argument("--driver",                action="store_true",        help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None, bus_data_width=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
 
     soc = BaseSoC(
         sys_clk_freq          = args.sys_clk_freq,
+        main_ram_data_width   = args.main_ram_data_width,
         with_pcie             = args.with_pcie,
         pcie_lanes            = args.pcie_lanes,
         pcie_ndmas            = args.pcie_ndmas,
         pcie_address_width    = args.pcie_address_width,
         with_pcie_dma_status  = args.pcie_with_dma_status,
         with_pcie_dma_monitor = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench   = args.pcie_with_dma_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -146,7 +160,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
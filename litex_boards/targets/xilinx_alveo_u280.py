@@ -19,6 +19,16 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_alveo_u280
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.usphbm2.common import (
+    USPHBM2_CHANNEL_SIZE,
+    USPHBM2_STRIPE_SIZE,
+    add_usphbm2_striped_window,
+    usphbm2_check_stripe,
+    usphbm2_share_port,
+    usphbm2_striped_window_origin,
+)
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
@@ -34,15 +44,14 @@ from litex.soc.cores.ram.xilinx_usp_hbm2 import (
 )
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
 
 from litedram.common import *
 from litedram.frontend.axi import *
 
+# DDR4 ---------------------------------------------------------------------------------------------
+
+DDRAM_SIZE = 0x40000000
+
 # HBM XCI ------------------------------------------------------------------------------------------
 
 def ensure_hbm_xci(url, hbm_xci=os.path.join("ip", "hbm", "hbm_0.xci")):
@@ -105,6 +114,9 @@ class BaseSoC(SoCCore):
         pcie_address_width    = 32,
         with_pcie_dma_status  = False,
         with_pcie_dma_monitor = False,
+        with_pcie_dma_bench   = False,
+        pcie_dma_hbm_channels = (),
+        with_pcie_dma_ddram   = False,
         with_led_chaser       = False,
         with_hbm              = False,
         hbm_channels          = (0, 1, 2, 3),
@@ -112,10 +124,23 @@ class BaseSoC(SoCCore):
         hbm_base              = USPHBM2_DEFAULT_BASE,
         hbm_high_base         = USPHBM2_HIGH_BASE,
         hbm_strip_origin      = False,
+        hbm_stripe_channels   = (),
+        hbm_stripe_size       = USPHBM2_STRIPE_SIZE,
+        with_mem_bench        = False,
         **kwargs):
         platform = xilinx_alveo_u280.Platform()
         if ddram_channel not in range(2):
             raise ValueError("DDRAM channel must be 0 or 1")
+        if with_pcie_dma_bench and (pcie_dma_hbm_channels or with_pcie_dma_ddram):
+            raise ValueError("PCIe DMA bench and PCIe DMA to memory are exclusive")
+        if pcie_dma_hbm_channels:
+            pcie_dma_hbm_channels = parse_usphbm2_channels(pcie_dma_hbm_channels)
+            if not (with_pcie and with_hbm):
+                raise ValueError("PCIe DMA to HBM requires PCIe and HBM")
+            if len(pcie_dma_hbm_channels) > pcie_ndmas:
+                raise ValueError("More PCIe DMA HBM channels than PCIe DMA channels")
+        if with_pcie_dma_ddram and (with_hbm or not with_pcie):
+            raise ValueError("PCIe DMA to DDR4 requires PCIe and DDR4 (without HBM)")
         if with_hbm:
             assert 225e6 <= sys_clk_freq <= 450e6
             hbm_channels = parse_usphbm2_channels(hbm_channels)
@@ -123,12 +148,20 @@ class BaseSoC(SoCCore):
                 raise ValueError("HBM main channel must be one of the mapped HBM channels")
             hbm_origins = usphbm2_channel_origins(hbm_channels, hbm_base, hbm_high_base)
             hbm_end = usphbm2_window_end(hbm_origins)
+            if hbm_end > 2**33:
+                hbm_strip_origin = True
+            if hbm_stripe_channels:
+                hbm_stripe_channels = parse_usphbm2_channels(hbm_stripe_channels)
+                if set(hbm_stripe_channels) & set(hbm_channels):
+                    raise ValueError("Striped HBM channels must not also be mapped individually")
+                usphbm2_check_stripe(hbm_stripe_channels, hbm_stripe_size)
+                # Striped window after the pseudochannel windows (in the 64-bit space when above 4GB).
+                hbm_stripe_origin = usphbm2_striped_window_origin(hbm_end, hbm_stripe_channels)
+                hbm_end = hbm_stripe_origin + len(hbm_stripe_channels)*USPHBM2_CHANNEL_SIZE
             if hbm_end > 2**kwargs.get("bus_address_width", 32):
                 kwargs["bus_address_width"] = 64
             if hbm_end > 2**pcie_address_width:
                 pcie_address_width = 64
-            if hbm_end > 2**33:
-                hbm_strip_origin = True
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq, ddram_channel, with_hbm)
@@ -143,6 +176,16 @@ class BaseSoC(SoCCore):
             # Add HBM Core.
             self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
             ensure_hbm_xci("https://github.com/litex-hub/litex-boards/files/6893157/hbm_0.xci.txt")
+            # Memory Bench (shares each channel with its bus mapping).
+            if with_mem_bench:
+                from litex_boards.targets.membench.common import add_mem_bench
+                for channel in (*hbm_channels, *hbm_stripe_channels):
+                    add_mem_bench(self, f"hbm{channel}_bench",
+                        size       = USPHBM2_CHANNEL_SIZE,
+                        write_port = usphbm2_share_port(self, hbm, channel, f"hbm{channel}_bench"))
+            # PCIe DMA ports (shared with the bus mapping of the channel, if any).
+            pcie_dma_hbm_ports = [usphbm2_share_port(self, hbm, channel, f"hbm{channel}_pcie")
+                for channel in pcie_dma_hbm_channels]
             add_usphbm2_pseudochannels(
                 soc              = self,
                 hbm              = hbm,
@@ -151,10 +194,19 @@ class BaseSoC(SoCCore):
                 origins          = hbm_origins,
                 hbm_high_base    = hbm_high_base,
                 hbm_strip_origin = hbm_strip_origin)
+            if hbm_stripe_channels:
+                add_usphbm2_striped_window(
+                    soc         = self,
+                    hbm         = hbm,
+                    channels    = hbm_stripe_channels,
+                    origin      = hbm_stripe_origin,
+                    stripe_size = hbm_stripe_size)
 
         else:
             # DDR4 SDRAM -------------------------------------------------------------------------------
             if not self.integrated_main_ram_size:
+                from litedram.modules import MTA18ASF2G72PZ
+                from litedram.phy import usddrphy
                 self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", ddram_channel),
                     memtype          = "DDR4",
                     cmd_latency      = 1, # seems to work better with cmd_latency=1
@@ -164,8 +216,8 @@ class BaseSoC(SoCCore):
                 self.add_sdram("sdram",
                     phy           = self.ddrphy,
                     module        = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
-                    size          = 0x40000000,
-                    l2_cache_size = kwargs.get("l2_size", 8192)
+                    size          = DDRAM_SIZE,
+                    **l2_cache_args(self, kwargs, phy=self.ddrphy)
                 )
 
             # Firmware RAM (To ease initial LiteDRAM calibration support) --------------------------
@@ -173,6 +225,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = {4: 128, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
@@ -182,6 +235,22 @@ class BaseSoC(SoCCore):
                 address_width    = pcie_address_width,
                 with_dma_status  = with_pcie_dma_status,
                 with_dma_monitor = with_pcie_dma_monitor)
+            # DMA Bench.
+            if with_pcie_dma_bench:
+                from litex_boards.targets.pciebench.common import add_pcie_dma_bench
+                add_pcie_dma_bench(self, ndmas=pcie_ndmas)
+            # DMA <-> HBM (bypassing the SoC bus).
+            if pcie_dma_hbm_channels:
+                from litex_boards.targets.pciemem.common import add_pcie_dma_mem
+                for i, port in enumerate(pcie_dma_hbm_ports):
+                    add_pcie_dma_mem(self, i, size=USPHBM2_CHANNEL_SIZE, write_port=port)
+            # DMA <-> DDR4 (bypassing the SoC bus).
+            if with_pcie_dma_ddram:
+                from litex_boards.targets.pciemem.common import add_pcie_dma_mem
+                for i in range(pcie_ndmas):
+                    add_pcie_dma_mem(self, i, size=DDRAM_SIZE,
+                        write_port = self.sdram.crossbar.get_port(),
+                        read_port  = self.sdram.crossbar.get_port())
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -202,6 +271,9 @@ def main():
     parser.add_target_argument("--pcie-address-width", default=32, type=int, choices=[32, 64], help="PCIe address width.")
     parser.add_target_argument("--pcie-with-dma-status",  action="store_true",        help="Enable PCIe DMA status CSRs.")
     parser.add_target_argument("--pcie-with-dma-monitor", action="store_true",        help="Enable PCIe DMA monitor CSRs.")
+    parser.add_target_argument("--pcie-with-dma-bench", "--pcie-dma-bench", dest="pcie_with_dma_bench", action="store_true", help="Connect PCIe DMA channels to line-rate generator/checker bench cores (see litepcie_dma_bench).")
+    parser.add_target_argument("--pcie-dma-hbm-channels", default="", help="HBM channels directly connected to PCIe DMA channels 0, 1... (comma/range list).")
+    parser.add_target_argument("--pcie-with-dma-ddram",   action="store_true",        help="Connect each PCIe DMA channel directly to a DDR4 controller port.")
     parser.add_target_argument("--driver",                action="store_true",        help="Generate PCIe driver.")
     parser.add_target_argument("--with-hbm",              action="store_true",        help="Use HBM2.")
     parser.add_target_argument("--hbm-channels",    default="0,1,2,3",          help="HBM channels to map (comma/range list or all).")
@@ -211,13 +283,30 @@ def main():
     parser.add_target_argument("--hbm-high-base",   default=USPHBM2_HIGH_BASE,
         type=lambda x: int(x, 0), help="HBM bus base for channels above the low 32-bit cached window.")
     parser.add_target_argument("--hbm-strip-origin", action="store_true",       help="Expose each mapped HBM channel with local AXI addresses.")
+    parser.add_target_argument("--hbm-stripe-channels", default="",             help="HBM channels to interleave in one striped window (comma/range list).")
+    parser.add_target_argument("--hbm-stripe-size", default=USPHBM2_STRIPE_SIZE,
+        type=lambda x: int(x, 0), help="HBM striped window interleave granularity in bytes.")
+    parser.add_target_argument("--with-mem-bench", action="store_true",         help="Add per-channel HBM bandwidth/latency bench cores (see litex_boards.tools.mem_bench).")
     parser.add_target_argument("--with-analyzer",   action="store_true",        help="Enable Analyzer.")
     parser.add_target_argument("--with-led-chaser", action="store_true",        help="Enable LED Chaser.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     if args.pcie_ndmas < 0:
         parser.error("--pcie-ndmas must be >= 0")
+    if args.pcie_with_dma_bench and (args.pcie_dma_hbm_channels or args.pcie_with_dma_ddram):
+        parser.error("--pcie-with-dma-bench cannot be used with PCIe DMA to memory.")
+    if args.pcie_dma_hbm_channels and not (args.with_pcie and args.with_hbm):
+        parser.error("--pcie-dma-hbm-channels requires --with-pcie and --with-hbm.")
+    if args.pcie_with_dma_ddram and (args.with_hbm or not args.with_pcie):
+        parser.error("--pcie-with-dma-ddram requires --with-pcie (and DDR4, not --with-hbm).")
     try:
         hbm_channels = parse_usphbm2_channels(args.hbm_channels)
+        hbm_stripe_channels = parse_usphbm2_channels(args.hbm_stripe_channels) if args.hbm_stripe_channels else ()
+        if hbm_stripe_channels:
+            usphbm2_check_stripe(hbm_stripe_channels, args.hbm_stripe_size)
+        pcie_dma_hbm_channels = parse_usphbm2_channels(args.pcie_dma_hbm_channels) if args.pcie_dma_hbm_channels else ()
     except ValueError as e:
         parser.error(str(e))
 
@@ -233,6 +322,9 @@ def main():
         pcie_address_width    = args.pcie_address_width,
         with_pcie_dma_status  = args.pcie_with_dma_status,
         with_pcie_dma_monitor = args.pcie_with_dma_monitor,
+        with_pcie_dma_bench   = args.pcie_with_dma_bench,
+        pcie_dma_hbm_channels = pcie_dma_hbm_channels,
+        with_pcie_dma_ddram   = args.pcie_with_dma_ddram,
         with_led_chaser       = args.with_led_chaser,
         with_hbm              = args.with_hbm,
         hbm_channels          = hbm_channels,
@@ -240,6 +332,9 @@ def main():
         hbm_base              = args.hbm_base,
         hbm_high_base         = args.hbm_high_base,
         hbm_strip_origin      = args.hbm_strip_origin,
+        hbm_stripe_channels   = hbm_stripe_channels,
+        hbm_stripe_size       = args.hbm_stripe_size,
+        with_mem_bench        = args.with_mem_bench,
         with_analyzer         = args.with_analyzer,
         **parser.soc_argdict
     )
@@ -251,7 +346,14 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.pcie_with_dma_bench:
+            from litex_boards.targets.pciebench.common import generate_pcie_dma_bench_software
+            generate_pcie_dma_bench_software(os.path.join(builder.output_dir, "driver"))
+        if args.pcie_dma_hbm_channels or args.pcie_with_dma_ddram:
+            from litex_boards.targets.pciemem.common import generate_pcie_dma_mem_software
+            generate_pcie_dma_mem_software(os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -15,20 +15,15 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_kc705
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.ethernet.common import check_eth_data_width, etherbone_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthPHY
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -60,16 +55,20 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        remote_ip       = None,
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
-        with_pcie       = False,
-        pcie_lanes      = 4,
-        with_sata       = False,
+        with_ethernet          = False,
+        with_etherbone         = False,
+        with_udp_streamer      = False,
+        eth_ip                 = "192.168.1.50",
+        eth_data_width         = 8,
+        etherbone_buffer_depth = 16,
+        remote_ip              = None,
+        eth_dynamic_ip         = False,
+        with_led_chaser        = True,
+        with_spi_flash         = False,
+        with_sdram_calib_cache = False,
+        with_pcie              = False,
+        pcie_lanes             = 4,
+        with_sata              = False,
         **kwargs):
         platform = xilinx_kc705.Platform()
 
@@ -81,6 +80,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -88,16 +89,26 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
                 module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet:
+        if with_ethernet or with_etherbone or with_udp_streamer:
+            from liteeth.phy import LiteEthPHY
             self.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 clk_freq   = self.clk_freq)
-            self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+            eth_data_width = check_eth_data_width(self.ethphy, eth_data_width)
+            if with_etherbone or with_udp_streamer:
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width, ip_address=eth_ip, with_ethmac=with_ethernet, **etherbone_args(self, etherbone_buffer_depth))
+            elif with_ethernet:
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
+
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            from litex_boards.targets.udpstreamer.common import add_udp_streamer
+            add_udp_streamer(self, ethcore=self.ethcore_etherbone)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -105,8 +116,14 @@ class BaseSoC(SoCCore):
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=N25Q128A13(Codes.READ_1_1_4), rate="1:1", with_master=True)
 
+        # SDRAM Calibration Cache ------------------------------------------------------------------
+        if with_sdram_calib_cache and not self.integrated_main_ram_size:
+            from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache
+            add_sdram_calib_cache(self, phy=self.ddrphy)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -157,31 +174,53 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_kc705.Platform, description="LiteX SoC on KC705.")
-    parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP assignment.")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable memory-mapped SPI flash.")
-    parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--pcie-lanes",     default=4, type=int,       choices=[4, 8], help="PCIe lane count.")
-    parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sata",      action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sys-clk-freq",           default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--with-udp-streamer",      action="store_true",       help="Enable DRAM to host UDP streamer (implies Etherbone).")
+    parser.add_target_argument("--eth-ip",                 default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-data-width",         default=8, type=int, choices=[8, 32, 64], help="Ethernet/Etherbone datapath width.")
+    parser.add_target_argument("--etherbone-buffer-depth", default=16, type=int, help="Etherbone record buffer depth (max words per Etherbone burst, up to 255).")
+    parser.add_target_argument("--remote-ip",              default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",         action="store_true",       help="Enable dynamic Ethernet IP assignment.")
+    parser.add_target_argument("--with-spi-flash",         action="store_true",       help="Enable memory-mapped SPI flash.")
+    parser.add_target_argument("--with-sdram-calib-cache", action="store_true",       help="Cache the DRAM leveling in SPI Flash (requires --with-spi-flash).")
+    parser.add_target_argument("--with-pcie",              action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",             default=4, type=int,       choices=[4, 8], help="PCIe lane count.")
+    parser.add_target_argument("--driver",                 action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sata",              action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
+
+    if args.with_sdram_calib_cache and not args.with_spi_flash:
+        parser.error("--with-sdram-calib-cache requires --with-spi-flash.")
+
+    with_etherbone = args.with_etherbone or args.with_udp_streamer # UDP Streamer is controlled over Etherbone.
+    assert not (with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        remote_ip      = args.remote_ip,
-        with_spi_flash = args.with_spi_flash,
-        with_pcie      = args.with_pcie,
-        pcie_lanes     = args.pcie_lanes,
-        with_sata      = args.with_sata,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        with_udp_streamer      = args.with_udp_streamer,
+        eth_ip                 = args.eth_ip,
+        eth_data_width         = args.eth_data_width,
+        etherbone_buffer_depth = args.etherbone_buffer_depth,
+        eth_dynamic_ip         = args.eth_dynamic_ip,
+        remote_ip              = args.remote_ip,
+        with_spi_flash         = args.with_spi_flash,
+        with_sdram_calib_cache = args.with_sdram_calib_cache,
+        with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        with_sata              = args.with_sata,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
+    if args.with_sdram_calib_cache:
+        from litex_boards.targets.sdramcalib.common import add_sdram_calib_cache_software
+        add_sdram_calib_cache_software(builder)
     if args.build or args.driver:
         if not args.build:
             builder.compile_software = False
@@ -189,6 +228,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
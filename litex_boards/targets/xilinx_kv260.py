@@ -23,6 +23,7 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_kv260
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 from litex.build.tools import write_to_file
 
 
@@ -199,7 +200,9 @@ def main():
     parser.add_target_argument("--sys-clk-freq",        default=100e6, type=float, help="System clock frequency.")
     parser.set_defaults(cpu_type="zynqmp")
     parser.set_defaults(no_uart=True)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
@@ -12,6 +12,7 @@ from litex.gen import *
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import xilinx_sp605
+from litex_boards.profiling import add_profiling_args, profile_elaboration
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import *
@@ -234,7 +235,9 @@ def main():
     parser.add_target_argument("--with-video-terminal",    action="store_true",      help="Enable Video Terminal (DVI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",      help="Enable Video Framebuffer (DVI).")
     parser.add_target_argument("--with-video-colorbars",   action="store_true",      help="Enable Video Colorbars (DVI).")
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
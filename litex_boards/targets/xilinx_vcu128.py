@@ -15,6 +15,16 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import xilinx_vcu128
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
+from litex_boards.targets.usphbm2.common import (
+    USPHBM2_CHANNEL_SIZE,
+    USPHBM2_STRIPE_SIZE,
+    add_usphbm2_striped_window,
+    usphbm2_check_stripe,
+    usphbm2_share_port,
+    usphbm2_striped_window_origin,
+)
 from litex.soc.cores.clock import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import (
     USPHBM2,
@@ -29,9 +39,6 @@ from litex.soc.integration.soc import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
 # HBM XCI ------------------------------------------------------------------------------------------
 
 def ensure_hbm_xci(url, hbm_xci=os.path.join("ip", "hbm", "hbm_0.xci")):
@@ -82,13 +89,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_led_chaser  = True,
-        with_hbm         = False,
-        hbm_channels     = (0, 1, 2, 3),
-        hbm_main_channel = 0,
-        hbm_base         = USPHBM2_DEFAULT_BASE,
-        hbm_high_base    = USPHBM2_HIGH_BASE,
-        hbm_strip_origin = False,
+        with_led_chaser     = True,
+        with_hbm            = False,
+        hbm_channels        = (0, 1, 2, 3),
+        hbm_main_channel    = 0,
+        hbm_base            = USPHBM2_DEFAULT_BASE,
+        hbm_high_base       = USPHBM2_HIGH_BASE,
+        hbm_strip_origin    = False,
+        hbm_stripe_channels = (),
+        hbm_stripe_size     = USPHBM2_STRIPE_SIZE,
+        with_mem_bench      = False,
         **kwargs):
         platform = xilinx_vcu128.Platform()
         if with_hbm:
@@ -98,10 +108,18 @@ class BaseSoC(SoCCore):
                 raise ValueError("HBM main channel must be one of the mapped HBM channels")
             hbm_origins = usphbm2_channel_origins(hbm_channels, hbm_base, hbm_high_base)
             hbm_end = usphbm2_window_end(hbm_origins)
-            if hbm_end > 2**kwargs.get("bus_address_width", 32):
-                kwargs["bus_address_width"] = 64
             if hbm_end > 2**33:
                 hbm_strip_origin = True
+            if hbm_stripe_channels:
+                hbm_stripe_channels = parse_usphbm2_channels(hbm_stripe_channels)
+                if set(hbm_stripe_channels) & set(hbm_channels):
+                    raise ValueError("Striped HBM channels must not also be mapped individually")
+                usphbm2_check_stripe(hbm_stripe_channels, hbm_stripe_size)
+                # Striped window after the pseudochannel windows (in the 64-bit space when above 4GB).
+                hbm_stripe_origin = usphbm2_striped_window_origin(hbm_end, hbm_stripe_channels)
+                hbm_end = hbm_stripe_origin + len(hbm_stripe_channels)*USPHBM2_CHANNEL_SIZE
+            if hbm_end > 2**kwargs.get("bus_address_width", 32):
+                kwargs["bus_address_width"] = 64
 
         # CRG --------------------------------------------------------------------------------------
         self.crg = _CRG(platform, sys_clk_freq, with_hbm)
@@ -116,6 +134,13 @@ class BaseSoC(SoCCore):
             # Add HBM Core.
             self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
             ensure_hbm_xci("https://github.com/litex-hub/litex-boards/files/6893157/hbm_0.xci.txt")
+            # Memory Bench (shares each channel with its bus mapping).
+            if with_mem_bench:
+                from litex_boards.targets.membench.common import add_mem_bench
+                for channel in (*hbm_channels, *hbm_stripe_channels):
+                    add_mem_bench(self, f"hbm{channel}_bench",
+                        size       = USPHBM2_CHANNEL_SIZE,
+                        write_port = usphbm2_share_port(self, hbm, channel, f"hbm{channel}_bench"))
             add_usphbm2_pseudochannels(
                 soc              = self,
                 hbm              = hbm,
@@ -124,7 +149,16 @@ class BaseSoC(SoCCore):
                 origins          = hbm_origins,
                 hbm_high_base    = hbm_high_base,
                 hbm_strip_origin = hbm_strip_origin)
+            if hbm_stripe_channels:
+                add_usphbm2_striped_window(
+                    soc         = self,
+                    hbm         = hbm,
+                    channels    = hbm_stripe_channels,
+                    origin      = hbm_stripe_origin,
+                    stripe_size = hbm_stripe_size)
         elif not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             # DDR4 SDRAM -------------------------------------------------------------------------------
             self.ddrphy = usddrphy.USPDDRPHY(
                 pads             = platform.request("ddram"),
@@ -136,7 +170,7 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MT40A512M16(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -159,9 +193,19 @@ def main():
     parser.add_target_argument("--hbm-high-base",  default=USPHBM2_HIGH_BASE,
         type=lambda x: int(x, 0), help="HBM bus base for channels above the low 32-bit cached window.")
     parser.add_target_argument("--hbm-strip-origin", action="store_true",         help="Expose each mapped HBM channel with local AXI addresses.")
+    parser.add_target_argument("--hbm-stripe-channels", default="",               help="HBM channels to interleave in one striped window (comma/range list).")
+    parser.add_target_argument("--hbm-stripe-size", default=USPHBM2_STRIPE_SIZE,
+        type=lambda x: int(x, 0), help="HBM striped window interleave granularity in bytes.")
+    parser.add_target_argument("--with-mem-bench", action="store_true",           help="Add per-channel HBM bandwidth/latency bench cores (see litex_boards.tools.mem_bench).")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
     try:
         hbm_channels = parse_usphbm2_channels(args.hbm_channels)
+        hbm_stripe_channels = parse_usphbm2_channels(args.hbm_stripe_channels) if args.hbm_stripe_channels else ()
+        if hbm_stripe_channels:
+            usphbm2_check_stripe(hbm_stripe_channels, args.hbm_stripe_size)
     except ValueError as e:
         parser.error(str(e))
 
@@ -169,13 +213,16 @@ def main():
         args.sys_clk_freq = 250e6
 
     soc = BaseSoC(
-        sys_clk_freq     = args.sys_clk_freq,
-        with_hbm         = args.with_hbm,
-        hbm_channels     = hbm_channels,
-        hbm_main_channel = args.hbm_main_channel,
-        hbm_base         = args.hbm_base,
-        hbm_high_base    = args.hbm_high_base,
-        hbm_strip_origin = args.hbm_strip_origin,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_hbm            = args.with_hbm,
+        hbm_channels        = hbm_channels,
+        hbm_main_channel    = args.hbm_main_channel,
+        hbm_base            = args.hbm_base,
+        hbm_high_base       = args.hbm_high_base,
+        hbm_strip_origin    = args.hbm_strip_origin,
+        hbm_stripe_channels = hbm_stripe_channels,
+        hbm_stripe_size     = args.hbm_stripe_size,
+        with_mem_bench      = args.with_mem_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -15,19 +15,14 @@ from migen import *
 from litex.gen import *
 
 from litex_boards.platforms import ypcb_00338_1p1
+from litex_boards.profiling import add_profiling_args, profile_elaboration
+from litex_boards.targets.sdram.common import l2_cache_args
 
 from litex.soc.cores.clock          import *
 from litex.soc.integration.soc import *
 from litex.soc.integration.builder  import *
 from litex.soc.cores.led            import LedChaser
 
-from litedram.modules import MT41J256M16
-from litedram.phy     import s7ddrphy
-from litedram.common import PHYPadsReducer
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG -------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -77,6 +72,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41J256M16
+            from litedram.phy import s7ddrphy
+            from litedram.common import PHYPadsReducer
             assert dram_channel in (0, 1), "dram_channel must be 0 or 1"
             self.ddrphy = s7ddrphy.A7DDRPHY( # FIXME: DDR3 on HR Bank so no ODELAY, use A7DDRPHY as workaround for now.
                 pads         = PHYPadsReducer(platform.request("ddram", dram_channel), [0, 1, 2, 3]), # FIXME: Get all modules working.
@@ -87,11 +85,12 @@ class BaseSoC(SoCCore):
                 phy           = self.ddrphy,
                 module        = MT41J256M16(sys_clk_freq, "1:4"),
                 size          = 0x20000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                **l2_cache_args(self, kwargs, phy=self.ddrphy)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x8"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -121,7 +120,10 @@ def main():
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.set_defaults(l2_size=None)
+    add_profiling_args(parser)
     args = parser.parse_args()
+    profile_elaboration(args, __name__)
 
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
@@ -136,6 +138,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
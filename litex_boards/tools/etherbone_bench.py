@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Etherbone read/write throughput: writes then reads back a memory region in bursts of 1 word up to
+# the Etherbone buffer depth of the SoC (--etherbone-buffer-depth) and prints words/s per burst.
+#
+# Running board:
+# litex_server --udp --udp-ip=192.168.1.50
+# python3 -m litex_boards.tools.etherbone_bench --csr-csv=build/<board>/csr.csv
+#
+# Simulated board (or directly over UDP, without litex_server, with --udp-ip=192.168.1.51):
+# litex_sim --with-etherbone --csr-csv=csr.csv
+# litex_server --udp --udp-ip=192.168.1.51
+# python3 -m litex_boards.tools.etherbone_bench --csr-csv=csr.csv
+
+import time
+import random
+import argparse
+
+# Etherbone Bench ----------------------------------------------------------------------------------
+
+ETHERBONE_BUFFER_DEPTH = 16 # LiteX add_etherbone() default, when not recorded in the SoC constants.
+
+def bursts(depth):
+    """Burst lengths (in words) to bench: powers of two up to `depth`, then `depth`."""
+    lengths = [2**n for n in range(depth.bit_length()) if 2**n <= depth]
+    if lengths[-1] != depth:
+        lengths.append(depth)
+    return lengths
+
+
+def bench(bus, base, length, burst, seed=0):
+    """Write then read back `length` bytes at `base` in bursts of `burst` words.
+
+    Return (write words/s, read words/s, errors). Etherbone writes are posted, so the write pass
+    ends with a read to wait for them to complete.
+    """
+    words = length//4
+    rng   = random.Random(seed)
+    datas = [rng.getrandbits(32) for _ in range(words)]
+    chunks = [(offset, min(burst, words - offset)) for offset in range(0, words, burst)]
+
+    start = time.perf_counter()
+    for offset, n in chunks:
+        bus.write(base + 4*offset, datas[offset:offset + n])
+    bus.read(base)
+    write_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    readback = []
+    for offset, n in chunks:
+        readback += bus.read(base + 4*offset, n)
+    read_duration = time.perf_counter() - start
+
+    errors = sum(a != b for a, b in zip(datas, readback))
+    return words/write_duration, words/read_duration, errors
+
+# Run ----------------------------------------------------------------------------------------------
+
+def run(bus, base, length, depth):
+    print(f"Etherbone bench: {length} bytes at 0x{base:08x}, buffer depth {depth}.")
+    print(f"{'burst':>5} {'write':>12} {'read':>12} {'write':>9} {'read':>9} {'errors':>7}")
+    for burst in bursts(depth):
+        wr, rd, errors = bench(bus, base, length, burst)
+        print(f"{burst:>5} {wr:>8.0f} w/s {rd:>8.0f} w/s {wr*4/1e6:>5.2f}MB/s {rd*4/1e6:>5.2f}MB/s {errors:>7}")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards Etherbone read/write throughput bench.")
+    parser.add_argument("--csr-csv", default="csr.csv",      help="SoC CSV file.")
+    parser.add_argument("--host",    default="localhost",    help="litex_server host.")
+    parser.add_argument("--port",    default=1234, type=int, help="litex_server (or Etherbone with --udp-ip) port.")
+    parser.add_argument("--udp-ip",  default=None,           help="Talk to the Etherbone core at this IP address directly (without litex_server).")
+    parser.add_argument("--mem",     default=None,           help="Memory region to bench (default: main_ram, else sram).")
+    parser.add_argument("--base",    default=None, type=lambda x: int(x, 0), help="Bench address (default: end of the memory region).")
+    parser.add_argument("--length",  default=16*1024, type=lambda x: int(x, 0), help="Bytes per pass.")
+    parser.add_argument("--burst",   default=None, type=int, help="Max burst in words (default: SoC Etherbone buffer depth).")
+    args = parser.parse_args()
+
+    if args.udp_ip is not None:
+        from litex.tools.remote.comm_udp import CommUDP
+        bus = CommUDP(server=args.udp_ip, port=args.port, csr_csv=args.csr_csv)
+    else:
+        from litex import RemoteClient
+        bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    try:
+        depth = args.burst or getattr(bus.constants, "etherbone_buffer_depth", ETHERBONE_BUFFER_DEPTH)
+        base  = args.base
+        if base is None:
+            # Bench the end of the region, away from the firmware/stack of a running CPU.
+            name = args.mem or ("main_ram" if "main_ram" in bus.mems.d else "sram")
+            if name not in bus.mems.d:
+                parser.error(f"No {name} memory region in CSR map (available: " + ", ".join(bus.mems.d) + ").")
+            mem  = bus.mems.d[name]
+            base = mem.base + min(mem.size, 2**32 - mem.base) - args.length
+        run(bus, base, args.length - args.length%4, depth)
+    finally:
+        bus.close()
+
+if __name__ == "__main__":
+    main()
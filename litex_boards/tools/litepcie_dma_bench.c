@@ -0,0 +1,414 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Host side of the --pcie-with-dma-bench cores, built against the LitePCIe user library:
+ *
+ * ./<board>.py --with-pcie --pcie-with-dma-bench --build --driver
+ * cd build/<board>/driver/user && make && ./litepcie_dma_bench
+ *
+ * Throughput: every DMA channel is run concurrently (one thread per /dev/litepcieX) and reports
+ * host GB/s (buffers seen by the application) next to FPGA GB/s (beats/cycles measured by the bench
+ * core): a gap between both points at the driver/host, low FPGA figures at the DMA/PCIe link.
+ *
+ * Latency: the bench core sends a single buffer to the DMA Writer and the tool polls the Writer
+ * loop status until the descriptor completes: MMIO write + buffer DMA + MMIO read round-trip.
+ */
+
+#include <getopt.h>
+#include <pthread.h>
+#include <signal.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <unistd.h>
+
+#include "liblitepcie.h"
+#include "csr.h"
+#include "soc.h"
+
+/* Bench CSRs */
+
+struct bench_csrs {
+    uint32_t control;
+    uint32_t oneshot;
+    uint32_t generator_beats;
+    uint32_t generator_cycles;
+    uint32_t checker_beats;
+    uint32_t checker_cycles;
+    uint32_t checker_errors;
+    uint32_t writer_loop_status;
+};
+
+#define BENCH_CHANNEL(n) {                                                 \
+    CSR_PCIE_DMA##n##_BENCH_CONTROL_ADDR,                                  \
+    CSR_PCIE_DMA##n##_BENCH_ONESHOT_ADDR,                                  \
+    CSR_PCIE_DMA##n##_BENCH_GENERATOR_BEATS_ADDR,                          \
+    CSR_PCIE_DMA##n##_BENCH_GENERATOR_CYCLES_ADDR,                         \
+    CSR_PCIE_DMA##n##_BENCH_CHECKER_BEATS_ADDR,                            \
+    CSR_PCIE_DMA##n##_BENCH_CHECKER_CYCLES_ADDR,                           \
+    CSR_PCIE_DMA##n##_BENCH_CHECKER_ERRORS_ADDR,                           \
+    CSR_PCIE_DMA##n##_WRITER_TABLE_LOOP_STATUS_ADDR,                       \
+}
+
+static const struct bench_csrs bench_csrs[] = {
+#ifdef CSR_PCIE_DMA0_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(0),
+#endif
+#ifdef CSR_PCIE_DMA1_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(1),
+#endif
+#ifdef CSR_PCIE_DMA2_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(2),
+#endif
+#ifdef CSR_PCIE_DMA3_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(3),
+#endif
+#ifdef CSR_PCIE_DMA4_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(4),
+#endif
+#ifdef CSR_PCIE_DMA5_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(5),
+#endif
+#ifdef CSR_PCIE_DMA6_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(6),
+#endif
+#ifdef CSR_PCIE_DMA7_BENCH_CONTROL_ADDR
+    BENCH_CHANNEL(7),
+#endif
+};
+
+#define BENCH_CHANNELS (int)(sizeof(bench_csrs)/sizeof(bench_csrs[0]))
+
+#define BENCH_CONTROL_GENERATOR (1 << 0)
+#define BENCH_CONTROL_CHECKER   (1 << 1)
+#define BENCH_CONTROL_RESET     (1 << 8)
+
+#define MODE_WRITE (1 << 0) /* FPGA -> Host (DMA Writer). */
+#define MODE_READ  (1 << 1) /* Host -> FPGA (DMA Reader). */
+
+#define LATENCY_TIMEOUT_NS 1000000000ULL
+
+/* Helpers */
+
+static sig_atomic_t keep_running = 1;
+
+static void intHandler(int dummy) {
+    keep_running = 0;
+}
+
+static uint64_t get_time_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec*1000000000ULL + ts.tv_nsec;
+}
+
+/* 64-bit CSRs are split in two 32-bit words, MSB first. */
+static uint64_t bench_read64(int fd, uint32_t addr)
+{
+    uint64_t hi = litepcie_readl(fd, addr + 0);
+    uint64_t lo = litepcie_readl(fd, addr + 4);
+    return (hi << 32) | lo;
+}
+
+static double gbps(uint64_t bytes, double seconds)
+{
+    return seconds > 0 ? (double)bytes/(seconds*1e9) : 0;
+}
+
+/* Throughput */
+
+struct bench_result {
+    int      channel;
+    uint64_t host_wr_bytes;
+    uint64_t host_rd_bytes;
+    double   host_seconds;
+    uint64_t fpga_wr_bytes;
+    uint64_t fpga_wr_cycles;
+    uint64_t fpga_rd_bytes;
+    uint64_t fpga_rd_cycles;
+    uint32_t fpga_rd_errors;
+    int      failed;
+};
+
+struct bench_args {
+    int                  channel;
+    int                  mode;
+    double               duration;
+    uint8_t              zero_copy;
+    struct bench_result *result;
+};
+
+static void *bench_throughput(void *arg)
+{
+    struct bench_args *args = arg;
+    struct bench_result *result = args->result;
+    const struct bench_csrs *csrs = &bench_csrs[args->channel];
+    struct litepcie_dma_ctrl dma = {
+        .use_reader = !!(args->mode & MODE_READ),
+        .use_writer = !!(args->mode & MODE_WRITE),
+        .loopback   = 0,
+    };
+    char device[64];
+    uint32_t pattern[DMA_BUFFER_SIZE/sizeof(uint32_t)];
+    uint32_t control;
+    uint64_t start, end;
+    char *buf;
+    int i, fd;
+
+    result->channel = args->channel;
+
+    /* Same pattern as the bench core/litepcie_util: 32-bit counter restarting on each buffer. */
+    for (i = 0; i < DMA_BUFFER_SIZE/sizeof(uint32_t); i++)
+        pattern[i] = i;
+
+    snprintf(device, sizeof(device), "/dev/litepcie%d", args->channel);
+    if (litepcie_dma_init(&dma, device, args->zero_copy)) {
+        result->failed = 1;
+        return NULL;
+    }
+    fd = dma.fds.fd;
+
+    /* Reset the bench and enable the generator/checker before the DMAs so that the first beat
+       is aligned on the first DMA buffer. */
+    litepcie_writel(fd, csrs->control, BENCH_CONTROL_RESET);
+    control  = 0;
+    control |= (args->mode & MODE_WRITE) ? BENCH_CONTROL_GENERATOR : 0;
+    control |= (args->mode & MODE_READ)  ? BENCH_CONTROL_CHECKER   : 0;
+    litepcie_writel(fd, csrs->control, control);
+
+    dma.reader_enable = dma.use_reader;
+    dma.writer_enable = dma.use_writer;
+
+    start = get_time_ns();
+    end   = start + (uint64_t)(args->duration*1e9);
+    while (keep_running && get_time_ns() < end) {
+        litepcie_dma_process(&dma);
+        /* Host -> FPGA. */
+        while ((buf = litepcie_dma_next_write_buffer(&dma))) {
+            memcpy(buf, pattern, DMA_BUFFER_SIZE);
+            result->host_rd_bytes += DMA_BUFFER_SIZE;
+        }
+        /* FPGA -> Host. */
+        while ((buf = litepcie_dma_next_read_buffer(&dma)))
+            result->host_wr_bytes += DMA_BUFFER_SIZE;
+    }
+    result->host_seconds = (get_time_ns() - start)/1e9;
+
+    /* Stop the generator/checker (freezing the bench counters) and let the Writer drain before
+       reading the counters: litepcie_dma_cleanup() releases the device. */
+    litepcie_writel(fd, csrs->control, 0);
+    usleep(1000);
+    result->fpga_wr_bytes  = bench_read64(fd, csrs->generator_beats)*(PCIE_DMA_BENCH_DATA_WIDTH/8);
+    result->fpga_wr_cycles = bench_read64(fd, csrs->generator_cycles);
+    result->fpga_rd_bytes  = bench_read64(fd, csrs->checker_beats)*(PCIE_DMA_BENCH_DATA_WIDTH/8);
+    result->fpga_rd_cycles = bench_read64(fd, csrs->checker_cycles);
+    result->fpga_rd_errors = litepcie_readl(fd, csrs->checker_errors);
+    litepcie_dma_cleanup(&dma);
+
+    return NULL;
+}
+
+/* Latency */
+
+static int cmp_u64(const void *a, const void *b)
+{
+    uint64_t x = *(const uint64_t *)a;
+    uint64_t y = *(const uint64_t *)b;
+    return (x > y) - (x < y);
+}
+
+static double percentile_us(uint64_t *samples, int n, double p)
+{
+    int i = (int)(p*(n - 1) + 0.5);
+    return samples[i]/1e3;
+}
+
+static int bench_latency(int channel, int n, uint8_t zero_copy)
+{
+    const struct bench_csrs *csrs = &bench_csrs[channel];
+    struct litepcie_dma_ctrl dma = {.use_writer = 1};
+    uint64_t *samples, t0, t1;
+    uint32_t status;
+    char device[64];
+    int i, fd, count = 0, timeouts = 0;
+
+    snprintf(device, sizeof(device), "/dev/litepcie%d", channel);
+    if (litepcie_dma_init(&dma, device, zero_copy))
+        return -1;
+    fd = dma.fds.fd;
+    litepcie_writel(fd, csrs->control, BENCH_CONTROL_RESET);
+    litepcie_writel(fd, csrs->control, 0);
+    dma.writer_enable = 1;
+    litepcie_dma_process(&dma);
+
+    samples = calloc(n, sizeof(uint64_t));
+    for (i = 0; i < n && keep_running; i++) {
+        /* One buffer in flight at a time; the Writer loop status (loop count/descriptor index)
+           changes once the descriptor has been completed. */
+        status = litepcie_readl(fd, csrs->writer_loop_status);
+        t0 = get_time_ns();
+        litepcie_writel(fd, csrs->oneshot, 1);
+        do {
+            t1 = get_time_ns();
+            if (t1 - t0 > LATENCY_TIMEOUT_NS) {
+                timeouts++;
+                break;
+            }
+        } while (litepcie_readl(fd, csrs->writer_loop_status) == status);
+        if (t1 - t0 <= LATENCY_TIMEOUT_NS)
+            samples[count++] = t1 - t0;
+        /* Keep the application side of the ring consumed. */
+        if ((i % DMA_BUFFER_PER_IRQ) == (DMA_BUFFER_PER_IRQ - 1)) {
+            litepcie_dma_process(&dma);
+            while (litepcie_dma_next_read_buffer(&dma));
+        }
+    }
+    litepcie_dma_cleanup(&dma);
+
+    if (count) {
+        qsort(samples, count, sizeof(uint64_t), cmp_u64);
+        printf("%7d %10d %10.2f %10.2f %10.2f %10.2f %10.2f %8d\n",
+            channel, count,
+            percentile_us(samples, count, 0.00),
+            percentile_us(samples, count, 0.50),
+            percentile_us(samples, count, 0.90),
+            percentile_us(samples, count, 0.99),
+            percentile_us(samples, count, 1.00),
+            timeouts);
+    } else {
+        printf("%7d %10d %10s %10s %10s %10s %10s %8d\n",
+            channel, 0, "-", "-", "-", "-", "-", timeouts);
+    }
+    free(samples);
+
+    return 0;
+}
+
+/* Main */
+
+static void help(void)
+{
+    printf("LitePCIe DMA bench (%d channel(s), %d-bit, %d-byte buffers)\n"
+           "usage: litepcie_dma_bench [options]\n"
+           "\n"
+           "options:\n"
+           "-h                    Help.\n"
+           "-m write|read|both    Throughput direction (write: FPGA->Host, read: Host->FPGA, default: both).\n"
+           "-t seconds            Throughput test duration (default: 5).\n"
+           "-n samples            Descriptor round-trip latency samples per channel (default: 1000, 0: skip).\n"
+           "-c channel            Only run on this channel (default: all channels).\n"
+           "-z                    Enable zero-copy DMA mode.\n",
+           BENCH_CHANNELS, PCIE_DMA_BENCH_DATA_WIDTH, DMA_BUFFER_SIZE);
+    exit(1);
+}
+
+int main(int argc, char **argv)
+{
+    struct bench_args args[BENCH_CHANNELS];
+    struct bench_result results[BENCH_CHANNELS];
+    struct bench_result total = {0};
+    pthread_t threads[BENCH_CHANNELS];
+    double duration = 5;
+    double fpga_wr, fpga_rd;
+    int mode = MODE_WRITE | MODE_READ;
+    int samples = 1000;
+    int channel = -1;
+    int first, last;
+    uint8_t zero_copy = 0;
+    int c, i;
+
+    signal(SIGINT, intHandler);
+
+    for (;;) {
+        c = getopt(argc, argv, "hm:t:n:c:z");
+        if (c == -1)
+            break;
+        switch (c) {
+        case 'm':
+            if (!strcmp(optarg, "write"))
+                mode = MODE_WRITE;
+            else if (!strcmp(optarg, "read"))
+                mode = MODE_READ;
+            else if (!strcmp(optarg, "both"))
+                mode = MODE_WRITE | MODE_READ;
+            else
+                help();
+            break;
+        case 't':
+            duration = atof(optarg);
+            break;
+        case 'n':
+            samples = atoi(optarg);
+            break;
+        case 'c':
+            channel = atoi(optarg);
+            if (channel < 0 || channel >= BENCH_CHANNELS)
+                help();
+            break;
+        case 'z':
+            zero_copy = 1;
+            break;
+        default:
+            help();
+        }
+    }
+    first = channel < 0 ? 0 : channel;
+    last  = channel < 0 ? BENCH_CHANNELS - 1 : channel;
+
+    /* Throughput: all channels concurrently. */
+    memset(results, 0, sizeof(results));
+    for (i = first; i <= last; i++) {
+        args[i] = (struct bench_args){i, mode, duration, zero_copy, &results[i]};
+        pthread_create(&threads[i], NULL, bench_throughput, &args[i]);
+    }
+    for (i = first; i <= last; i++)
+        pthread_join(threads[i], NULL);
+
+    printf("\e[1m%7s %12s %12s %12s %12s %8s\e[0m\n",
+        "channel", "host wr", "fpga wr", "host rd", "fpga rd", "errors");
+    printf("\e[1m%7s %12s %12s %12s %12s %8s\e[0m\n",
+        "", "(GB/s)", "(GB/s)", "(GB/s)", "(GB/s)", "");
+    for (i = first; i <= last; i++) {
+        struct bench_result *r = &results[i];
+        if (r->failed) {
+            printf("%7d %12s\n", i, "failed");
+            continue;
+        }
+        fpga_wr = gbps(r->fpga_wr_bytes, (r->fpga_wr_cycles + 1)/(double)CONFIG_CLOCK_FREQUENCY);
+        fpga_rd = gbps(r->fpga_rd_bytes, (r->fpga_rd_cycles + 1)/(double)CONFIG_CLOCK_FREQUENCY);
+        printf("%7d %12.3f %12.3f %12.3f %12.3f %8u\n", i,
+            gbps(r->host_wr_bytes, r->host_seconds), r->fpga_wr_bytes ? fpga_wr : 0,
+            gbps(r->host_rd_bytes, r->host_seconds), r->fpga_rd_bytes ? fpga_rd : 0,
+            r->fpga_rd_errors);
+        total.host_wr_bytes  += r->host_wr_bytes;
+        total.host_rd_bytes  += r->host_rd_bytes;
+        total.fpga_rd_errors += r->fpga_rd_errors;
+        /* Channels run concurrently: aggregate FPGA figures are the sum of per-channel rates. */
+        total.fpga_wr_bytes  += r->fpga_wr_bytes ? (uint64_t)(fpga_wr*1e9) : 0;
+        total.fpga_rd_bytes  += r->fpga_rd_bytes ? (uint64_t)(fpga_rd*1e9) : 0;
+        if (r->host_seconds > total.host_seconds)
+            total.host_seconds = r->host_seconds;
+    }
+    printf("%7s %12.3f %12.3f %12.3f %12.3f %8u\n", "total",
+        gbps(total.host_wr_bytes, total.host_seconds), total.fpga_wr_bytes/1e9,
+        gbps(total.host_rd_bytes, total.host_seconds), total.fpga_rd_bytes/1e9,
+        total.fpga_rd_errors);
+
+    /* Latency: one channel at a time. */
+    if (samples > 0 && keep_running) {
+        printf("\n\e[1m%7s %10s %10s %10s %10s %10s %10s %8s\e[0m\n",
+            "channel", "samples", "min", "p50", "p90", "p99", "max", "timeouts");
+        printf("\e[1m%7s %10s %10s %10s %10s %10s %10s %8s\e[0m\n",
+            "", "", "(us)", "(us)", "(us)", "(us)", "(us)", "");
+        for (i = first; i <= last && keep_running; i++)
+            if (bench_latency(i, samples, zero_copy) < 0)
+                printf("%7d %10s\n", i, "failed");
+    }
+
+    return 0;
+}
@@ -0,0 +1,368 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Host side of the PCIe DMA <-> HBM/DDR4 bridges (--pcie-dma-hbm-channels/--pcie-with-dma-ddram),
+ * built against the LitePCIe user library:
+ *
+ * ./<board>.py --with-pcie --pcie-dma-hbm-channels=4 --build --driver
+ * cd build/<board>/driver/user && make
+ * ./litepcie_dma_mem write data.bin 0x0          (Host -> device memory)
+ * ./litepcie_dma_mem read  dump.bin 0x0 0x100000 (device memory -> Host)
+ *
+ * The DMAs loop on their buffer rings without waiting for the host, so the bridge is paced with
+ * credits (in DMA buffers): on writes, each buffer carries a header (tag, sequence number) and the
+ * bridge only consumes credited buffers, CREDIT_MARGIN buffers behind the ones already filled so
+ * that the DMA Reader prefetch never reaches buffers still being written; on reads, the bridge only
+ * produces buffers the host has room for.
+ */
+
+#include <getopt.h>
+#include <inttypes.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <unistd.h>
+
+#include "liblitepcie.h"
+#include "csr.h"
+#include "soc.h"
+
+/* Bridge CSRs */
+
+struct mem_csrs {
+    uint32_t fill_base;
+    uint32_t fill_length;
+    uint32_t fill_tag;
+    uint32_t fill_credits;
+    uint32_t fill_enable;
+    uint32_t fill_done;
+    uint32_t drain_base;
+    uint32_t drain_length;
+    uint32_t drain_credits;
+    uint32_t drain_enable;
+    uint32_t drain_done;
+    uint64_t size;
+    uint32_t data_width;
+};
+
+#define MEM_CHANNEL(n) {                                                   \
+    CSR_PCIE_DMA##n##_MEM_FILL_BASE_ADDR,                                  \
+    CSR_PCIE_DMA##n##_MEM_FILL_LENGTH_ADDR,                                \
+    CSR_PCIE_DMA##n##_MEM_FILL_TAG_ADDR,                                   \
+    CSR_PCIE_DMA##n##_MEM_FILL_CREDITS_ADDR,                               \
+    CSR_PCIE_DMA##n##_MEM_FILL_ENABLE_ADDR,                                \
+    CSR_PCIE_DMA##n##_MEM_FILL_DONE_ADDR,                                  \
+    CSR_PCIE_DMA##n##_MEM_DRAIN_BASE_ADDR,                                 \
+    CSR_PCIE_DMA##n##_MEM_DRAIN_LENGTH_ADDR,                               \
+    CSR_PCIE_DMA##n##_MEM_DRAIN_CREDITS_ADDR,                              \
+    CSR_PCIE_DMA##n##_MEM_DRAIN_ENABLE_ADDR,                               \
+    CSR_PCIE_DMA##n##_MEM_DRAIN_DONE_ADDR,                                 \
+    PCIE_DMA##n##_MEM_SIZE,                                                \
+    PCIE_DMA##n##_MEM_DATA_WIDTH,                                          \
+}
+
+/* Channels without a bridge (or beyond 8) are left empty (size 0). */
+static const struct mem_csrs mem_csrs[8] = {
+#ifdef CSR_PCIE_DMA0_MEM_FILL_BASE_ADDR
+    [0] = MEM_CHANNEL(0),
+#endif
+#ifdef CSR_PCIE_DMA1_MEM_FILL_BASE_ADDR
+    [1] = MEM_CHANNEL(1),
+#endif
+#ifdef CSR_PCIE_DMA2_MEM_FILL_BASE_ADDR
+    [2] = MEM_CHANNEL(2),
+#endif
+#ifdef CSR_PCIE_DMA3_MEM_FILL_BASE_ADDR
+    [3] = MEM_CHANNEL(3),
+#endif
+#ifdef CSR_PCIE_DMA4_MEM_FILL_BASE_ADDR
+    [4] = MEM_CHANNEL(4),
+#endif
+#ifdef CSR_PCIE_DMA5_MEM_FILL_BASE_ADDR
+    [5] = MEM_CHANNEL(5),
+#endif
+#ifdef CSR_PCIE_DMA6_MEM_FILL_BASE_ADDR
+    [6] = MEM_CHANNEL(6),
+#endif
+#ifdef CSR_PCIE_DMA7_MEM_FILL_BASE_ADDR
+    [7] = MEM_CHANNEL(7),
+#endif
+};
+
+#define HEADER_SIZE   (PCIE_DMA_MEM_DATA_WIDTH/8)
+#define PAYLOAD_SIZE  (DMA_BUFFER_SIZE - HEADER_SIZE)
+#define CREDIT_MARGIN 32
+
+/* Helpers */
+
+static uint64_t get_time_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec*1000000000ULL + ts.tv_nsec;
+}
+
+static uint32_t mem_alignment(const struct mem_csrs *csrs)
+{
+    uint32_t mem_bytes = csrs->data_width/8;
+    return mem_bytes > HEADER_SIZE ? mem_bytes : HEADER_SIZE;
+}
+
+static int mem_check(const struct mem_csrs *csrs, uint64_t offset, uint64_t length)
+{
+    if (offset % (csrs->data_width/8)) {
+        fprintf(stderr, "Offset must be aligned on %d bytes.\n", csrs->data_width/8);
+        return -1;
+    }
+    if (offset + length > csrs->size) {
+        fprintf(stderr, "Transfer exceeds the %" PRIu64 " bytes of memory.\n", csrs->size);
+        return -1;
+    }
+    return 0;
+}
+
+static void print_rate(const char *what, uint64_t length, uint64_t offset, uint64_t ns)
+{
+    printf("%s %" PRIu64 " bytes at 0x%08" PRIx64 " in %.3f ms (%.3f GB/s).\n",
+        what, length, offset, ns/1e6, ns ? (double)length/ns : 0);
+}
+
+/* Host -> Memory */
+
+static int mem_write(int channel, const char *filename, uint64_t offset, double timeout)
+{
+    const struct mem_csrs *csrs = &mem_csrs[channel];
+    struct litepcie_dma_ctrl dma = {.use_reader = 1};
+    uint32_t align, tag, *header;
+    uint64_t size, length, nbuffers, seq, credits, start, elapsed;
+    char device[64];
+    uint8_t *data;
+    char *buf;
+    FILE *f;
+    int fd, ret = 0;
+
+    /* Load file (zero-padded to the bridge alignment). */
+    f = fopen(filename, "rb");
+    if (!f) {
+        perror(filename);
+        return -1;
+    }
+    fseek(f, 0, SEEK_END);
+    size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    align  = mem_alignment(csrs);
+    length = (size + align - 1)/align*align;
+    if (mem_check(csrs, offset, length) < 0) {
+        fclose(f);
+        return -1;
+    }
+    data = calloc(length ? length : 1, 1);
+    if (fread(data, 1, size, f) != size) {
+        perror(filename);
+        fclose(f);
+        free(data);
+        return -1;
+    }
+    fclose(f);
+    nbuffers = (length + PAYLOAD_SIZE - 1)/PAYLOAD_SIZE;
+
+    /* Zero-copy: headers are written in place, after the payload. */
+    snprintf(device, sizeof(device), "/dev/litepcie%d", channel);
+    if (litepcie_dma_init(&dma, device, 1)) {
+        free(data);
+        return -1;
+    }
+    fd  = dma.fds.fd;
+    tag = (uint32_t)get_time_ns() | 1;
+
+    litepcie_writel(fd, csrs->fill_enable,  0);
+    litepcie_writel(fd, csrs->fill_base,    offset);
+    litepcie_writel(fd, csrs->fill_length,  length);
+    litepcie_writel(fd, csrs->fill_tag,     tag);
+    litepcie_writel(fd, csrs->fill_credits, 0);
+    litepcie_writel(fd, csrs->fill_enable,  1);
+
+    dma.reader_enable = 1;
+
+    seq   = 0;
+    start = get_time_ns();
+    for (;;) {
+        litepcie_dma_process(&dma);
+        /* Fill buffers; the last CREDIT_MARGIN ones are padding that is never credited. */
+        while (seq < nbuffers + CREDIT_MARGIN && (buf = litepcie_dma_next_write_buffer(&dma))) {
+            uint64_t pos = seq*PAYLOAD_SIZE;
+            uint64_t n   = pos < length ? length - pos : 0;
+            if (n > PAYLOAD_SIZE)
+                n = PAYLOAD_SIZE;
+            if (n)
+                memcpy(buf + HEADER_SIZE, data + pos, n);
+            memset(buf + HEADER_SIZE + n, 0, PAYLOAD_SIZE - n);
+            memset(buf + 8, 0, HEADER_SIZE - 8);
+            header = (uint32_t *)buf;
+            header[0] = tag;
+            __sync_synchronize();
+            header[1] = seq;
+            seq++;
+        }
+        credits = seq > CREDIT_MARGIN ? seq - CREDIT_MARGIN : 0;
+        litepcie_writel(fd, csrs->fill_credits, credits);
+        if (litepcie_readl(fd, csrs->fill_done))
+            break;
+        if ((get_time_ns() - start) > timeout*1e9) {
+            fprintf(stderr, "Timeout (%" PRIu64 "/%" PRIu64 " buffers sent).\n", credits, nbuffers);
+            ret = -1;
+            break;
+        }
+    }
+    elapsed = get_time_ns() - start;
+
+    litepcie_writel(fd, csrs->fill_enable, 0);
+    litepcie_dma_cleanup(&dma);
+    free(data);
+
+    if (ret == 0)
+        print_rate("Wrote", size, offset, elapsed);
+    return ret;
+}
+
+/* Memory -> Host */
+
+static int mem_read(int channel, const char *filename, uint64_t offset, uint64_t size, double timeout)
+{
+    const struct mem_csrs *csrs = &mem_csrs[channel];
+    struct litepcie_dma_ctrl dma = {.use_writer = 1};
+    uint64_t length, nbuffers, received, start, elapsed;
+    uint32_t align;
+    char device[64];
+    uint8_t *data;
+    char *buf;
+    FILE *f;
+    int fd, ret = 0;
+
+    align  = mem_alignment(csrs);
+    length = (size + align - 1)/align*align;
+    if (mem_check(csrs, offset, length) < 0)
+        return -1;
+    nbuffers = (length + DMA_BUFFER_SIZE - 1)/DMA_BUFFER_SIZE;
+    data     = malloc(nbuffers ? nbuffers*DMA_BUFFER_SIZE : 1);
+
+    snprintf(device, sizeof(device), "/dev/litepcie%d", channel);
+    if (litepcie_dma_init(&dma, device, 0)) {
+        free(data);
+        return -1;
+    }
+    fd = dma.fds.fd;
+
+    litepcie_writel(fd, csrs->drain_enable,  0);
+    litepcie_writel(fd, csrs->drain_base,    offset);
+    litepcie_writel(fd, csrs->drain_length,  length);
+    litepcie_writel(fd, csrs->drain_credits, DMA_BUFFER_COUNT/2);
+
+    /* Start the DMA Writer before the bridge so that data lands at the start of the ring. */
+    dma.writer_enable = 1;
+    litepcie_dma_process(&dma);
+    litepcie_writel(fd, csrs->drain_enable, 1);
+
+    received = 0;
+    start    = get_time_ns();
+    while (received < nbuffers) {
+        litepcie_dma_process(&dma);
+        while (received < nbuffers && (buf = litepcie_dma_next_read_buffer(&dma))) {
+            memcpy(data + received*DMA_BUFFER_SIZE, buf, DMA_BUFFER_SIZE);
+            received++;
+        }
+        litepcie_writel(fd, csrs->drain_credits, received + DMA_BUFFER_COUNT/2);
+        if ((get_time_ns() - start) > timeout*1e9) {
+            fprintf(stderr, "Timeout (%" PRIu64 "/%" PRIu64 " buffers received).\n", received, nbuffers);
+            ret = -1;
+            break;
+        }
+    }
+    elapsed = get_time_ns() - start;
+
+    litepcie_writel(fd, csrs->drain_enable, 0);
+    litepcie_dma_cleanup(&dma);
+
+    if (ret == 0) {
+        f = fopen(filename, "wb");
+        if (!f || fwrite(data, 1, size, f) != size) {
+            perror(filename);
+            ret = -1;
+        }
+        if (f)
+            fclose(f);
+    }
+    free(data);
+
+    if (ret == 0)
+        print_rate("Read", size, offset, elapsed);
+    return ret;
+}
+
+/* Main */
+
+static void help(void)
+{
+    printf("LitePCIe DMA <-> memory transfers\n"
+           "usage: litepcie_dma_mem [options] cmd [args...]\n"
+           "\n"
+           "options:\n"
+           "-h                    Help.\n"
+           "-c channel            DMA channel (default: 0).\n"
+           "-t seconds            Timeout (default: 10).\n"
+           "\n"
+           "available commands:\n"
+           "write file [offset]   Write file to device memory.\n"
+           "read file offset size Read device memory to file.\n");
+    exit(1);
+}
+
+int main(int argc, char **argv)
+{
+    double timeout = 10;
+    int channel = 0;
+    const char *cmd;
+    int c;
+
+    for (;;) {
+        c = getopt(argc, argv, "hc:t:");
+        if (c == -1)
+            break;
+        switch (c) {
+        case 'c':
+            channel = atoi(optarg);
+            break;
+        case 't':
+            timeout = atof(optarg);
+            break;
+        default:
+            help();
+        }
+    }
+    if (optind >= argc)
+        help();
+    if (channel < 0 || channel >= 8 || mem_csrs[channel].size == 0) {
+        fprintf(stderr, "No memory bridge on DMA channel %d.\n", channel);
+        exit(1);
+    }
+
+    cmd = argv[optind++];
+    if (!strcmp(cmd, "write")) {
+        if (optind + 1 > argc)
+            help();
+        return mem_write(channel, argv[optind],
+            optind + 1 < argc ? strtoull(argv[optind + 1], NULL, 0) : 0, timeout) < 0;
+    } else if (!strcmp(cmd, "read")) {
+        if (optind + 3 > argc)
+            help();
+        return mem_read(channel, argv[optind],
+            strtoull(argv[optind + 1], NULL, 0), strtoull(argv[optind + 2], NULL, 0), timeout) < 0;
+    }
+    help();
+
+    return 0;
+}
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Host side of the --with-mem-bench cores: runs sequential/random write and read sweeps on every
+# benched channel through litex_server and prints GB/s and read latency per channel.
+#
+# litex_server --udp --udp-ip=192.168.1.50 (or --jtag, --pcie --pcie-bar=...)
+# python3 -m litex_boards.tools.mem_bench --csr-csv=build/<board>/csr.csv
+
+import re
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Mem Bench ----------------------------------------------------------------------------------------
+
+def find_benches(bus):
+    """Return the names of the benched channels described in the CSR/constant map."""
+    names = []
+    for reg in bus.regs.d:
+        m = re.fullmatch(r"(\w+)_generator_start", reg)
+        if m and f"{m.group(1)}_checker_start" in bus.regs.d and f"{m.group(1)}_size" in bus.constants.d:
+            names.append(m.group(1))
+    return sorted(names)
+
+
+def initialized(bus, name):
+    """Return False when the memory of bench `name` reports it is not initialized (init_done gate)."""
+    reg = f"{name}_status_init_done"
+    return reg not in bus.regs.d or bool(getattr(bus.regs, reg).read())
+
+
+class MemBench:
+    def __init__(self, bus, name):
+        self.bus        = bus
+        self.name       = name
+        self.size       = bus.constants.d[f"{name}_size"]
+        self.word_bytes = bus.constants.d[f"{name}_data_width"]//8
+
+    def _reg(self, core, reg):
+        return getattr(self.bus.regs, f"{self.name}_{core}_{reg}")
+
+    def run(self, core, length, random=False, timeout=10.0):
+        """Run the generator or checker over `length` bytes; return (ticks, errors)."""
+        self._reg(core, "reset").write(1)
+        self._reg(core, "base").write(0)
+        self._reg(core, "end").write(self.size)
+        self._reg(core, "length").write(length)
+        self._reg(core, "random").write(0b11 if random else 0b01) # Random data, optionally random address.
+        self._reg(core, "start").write(1)
+        deadline = time.monotonic() + timeout
+        while not self._reg(core, "done").read():
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.name} {core} did not complete in {timeout}s")
+            time.sleep(1e-3)
+        ticks  = self._reg(core, "ticks").read()
+        errors = self._reg("checker", "errors").read() if core == "checker" else 0
+        return ticks, errors
+
+
+def gbps(length, ticks, clk_freq):
+    return length/(ticks/clk_freq)/1e9 if ticks else 0.0
+
+# Run ----------------------------------------------------------------------------------------------
+
+def run(bus, names, length, timeout):
+    clk_freq = bus.constants.config_clock_frequency
+    print(f"{'channel':<16} {'seq wr':>8} {'seq rd':>8} {'rnd wr':>8} {'rnd rd':>8} {'latency':>9} {'errors':>7}")
+    for name in names:
+        if not initialized(bus, name):
+            print(f"{name:<16} not initialized (run the BIOS first), skipped.")
+            continue
+        bench   = MemBench(bus, name)
+        sweep   = min(length, bench.size//2) # BIST length CSR is as wide as the channel address.
+        results = {}
+        for mode, random in [("seq", False), ("rnd", True)]:
+            wr_ticks, _      = bench.run("generator", sweep, random, timeout)
+            rd_ticks, errors = bench.run("checker",   sweep, random, timeout)
+            results[mode] = (gbps(sweep, wr_ticks, clk_freq), gbps(sweep, rd_ticks, clk_freq))
+            if not random:
+                # Random addresses are not unique (later writes overwrite earlier ones), so only the
+                # sequential sweep is checked.
+                seq_errors = errors
+        lat_ticks, _ = bench.run("checker", bench.word_bytes, False, timeout)
+        print(f"{name:<16} "
+            f"{results['seq'][0]:>8.2f} {results['seq'][1]:>8.2f} "
+            f"{results['rnd'][0]:>8.2f} {results['rnd'][1]:>8.2f} "
+            f"{lat_ticks*1e9/clk_freq:>7.0f}ns {seq_errors:>7}")
+    print("(GB/s, read latency of a single word including the checker FSM overhead)")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards HBM/DDR memory bench (--with-mem-bench).")
+    parser.add_argument("--csr-csv", default="csr.csv",   help="SoC CSV file.")
+    parser.add_argument("--host",    default="localhost", help="litex_server host.")
+    parser.add_argument("--port",    default=1234, type=int, help="litex_server port.")
+    parser.add_argument("--length",  default=16*1024*1024, type=lambda x: int(x, 0), help="Bytes per sweep.")
+    parser.add_argument("--timeout", default=10.0, type=float, help="Timeout per sweep in seconds.")
+    parser.add_argument("--channel", action="append",     help="Bench only this channel (repeatable, e.g. hbm3_bench).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    try:
+        names = find_benches(bus)
+        if args.channel:
+            unknown = set(args.channel) - set(names)
+            if unknown:
+                parser.error("Unknown channel(s): " + ", ".join(sorted(unknown)) + " (available: " + ", ".join(names) + ")")
+            names = [name for name in names if name in args.channel]
+        if not names:
+            parser.error("No memory bench found in CSR map, build the target with --with-mem-bench.")
+        run(bus, names, args.length, args.timeout)
+    finally:
+        bus.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Host side of the --with-udp-streamer core: configures and starts the streamer through litex_server,
+# receives the datagrams, reassembles the DRAM region and prints the throughput and lost datagrams.
+#
+# litex_server --udp --udp-ip=192.168.1.50
+# python3 -m litex_boards.tools.udp_streamer --csr-csv=build/<board>/csr.csv --length=0x100000 --output=dump.bin
+
+import time
+import socket
+import struct
+import argparse
+
+# UDP Streamer -------------------------------------------------------------------------------------
+
+HEADER = struct.Struct("<II") # Sequence number, byte offset of the payload in the region.
+
+
+class Reassembler:
+    """Place the streamer datagrams of a `length` bytes region into a buffer."""
+    def __init__(self, length, packet_size):
+        self.data        = bytearray(length)
+        self.packet_size = packet_size
+        self.received    = 0
+        self.duplicates  = 0
+        self.reordered   = 0
+        self.seen        = set()
+        self.last_seq    = -1
+
+    @property
+    def packets(self):
+        return (len(self.data) + self.packet_size - 1)//self.packet_size
+
+    @property
+    def complete(self):
+        return self.received == len(self.data)
+
+    def missing(self):
+        """Return the sequence numbers not received (yet)."""
+        return sorted(set(range(self.packets)) - self.seen)
+
+    def feed(self, datagram):
+        if len(datagram) < HEADER.size:
+            raise ValueError(f"Datagram too short ({len(datagram)} bytes)")
+        seq, offset = HEADER.unpack_from(datagram)
+        payload     = memoryview(datagram)[HEADER.size:]
+        if offset != seq*self.packet_size or offset + len(payload) > len(self.data):
+            raise ValueError(f"Unexpected datagram (seq {seq}, offset 0x{offset:x}, {len(payload)} bytes)")
+        if seq in self.seen:
+            self.duplicates += 1
+            return
+        if seq < self.last_seq:
+            self.reordered += 1
+        self.seen.add(seq)
+        self.last_seq = max(self.last_seq, seq)
+        self.data[offset:offset + len(payload)] = payload
+        self.received += len(payload)
+
+
+def local_ip_for(board_ip):
+    """Return the local IP address routing to `board_ip`."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect((board_ip, 1234))
+        return s.getsockname()[0]
+    finally:
+        s.close()
+
+# Run ----------------------------------------------------------------------------------------------
+
+def run(bus, name, sock, udp_ip, udp_port, base, length, packet_size, timeout):
+    def reg(r):
+        return getattr(bus.regs, f"{name}_{r}")
+
+    if reg("status").read() & 0b1:
+        raise RuntimeError(f"{name} is busy")
+    reg("ip_address").write(struct.unpack(">I", socket.inet_aton(udp_ip))[0])
+    reg("udp_port").write(udp_port)
+    reg("base").write(base)
+    reg("length").write(length)
+    reg("packet_size").write(packet_size)
+
+    reassembler = Reassembler(length, packet_size)
+    sock.settimeout(timeout)
+    start = end = time.monotonic()
+    reg("start").write(1)
+    try:
+        while not reassembler.complete:
+            datagram, _ = sock.recvfrom(65536)
+            reassembler.feed(datagram)
+            end = time.monotonic()
+    except socket.timeout:
+        pass
+    duration = end - start
+
+    clk_freq = bus.constants.config_clock_frequency
+    cycles   = reg("cycles").read()
+    packets  = reg("packets").read()
+    print(f"{length} bytes in {packets} datagrams of {packet_size} bytes.")
+    if reassembler.received:
+        print(f"Host    : {reassembler.received/duration/1e6:8.2f} MB/s")
+    if cycles:
+        print(f"Gateware: {length/(cycles/clk_freq)/1e6:8.2f} MB/s")
+    missing = reassembler.missing()
+    print(f"Lost    : {len(missing)} datagram(s), {reassembler.reordered} reordered, {reassembler.duplicates} duplicate(s).")
+    if missing:
+        print("Missing sequence numbers: " + ", ".join(str(seq) for seq in missing[:16]) + (" ..." if len(missing) > 16 else ""))
+    return reassembler
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    from litex import RemoteClient
+
+    parser = argparse.ArgumentParser(description="LiteX-Boards DRAM to host UDP streamer (--with-udp-streamer).")
+    parser.add_argument("--csr-csv",     default="csr.csv",      help="SoC CSV file.")
+    parser.add_argument("--host",        default="localhost",    help="litex_server host.")
+    parser.add_argument("--port",        default=1234, type=int, help="litex_server port.")
+    parser.add_argument("--name",        default="udp_streamer", help="Streamer name in the CSR map.")
+    parser.add_argument("--board-ip",    default="192.168.1.50", help="Board IP address (to find the local IP address).")
+    parser.add_argument("--udp-ip",      default=None,           help="IP address to stream to (default: local IP address routing to the board).")
+    parser.add_argument("--udp-port",    default=2000, type=int, help="UDP port to stream to.")
+    parser.add_argument("--base",        default=None, type=lambda x: int(x, 0), help="Region base address (default: start of main RAM).")
+    parser.add_argument("--length",      default=1024*1024, type=lambda x: int(x, 0), help="Region length in bytes.")
+    parser.add_argument("--packet-size", default=1024, type=int, help="Payload bytes per datagram (multiple of 4, up to 1472).")
+    parser.add_argument("--timeout",     default=1.0, type=float, help="Timeout without datagram in seconds.")
+    parser.add_argument("--output",      default=None,           help="Write the received region to this file.")
+    args = parser.parse_args()
+
+    if args.packet_size % 4 or not (4 <= args.packet_size <= 1472):
+        parser.error("--packet-size must be a multiple of 4 between 4 and 1472.")
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        if not hasattr(bus.regs, f"{args.name}_start"):
+            parser.error(f"No {args.name} found in CSR map, build the target with --with-udp-streamer.")
+        dram_base = getattr(bus.constants, f"{args.name}_dram_base")
+        dram_word = getattr(bus.constants, f"{args.name}_dram_word")
+        base      = 0 if args.base is None else args.base - dram_base
+        length    = (args.length + dram_word - 1)//dram_word*dram_word
+        if base < 0 or base % dram_word:
+            parser.error(f"--base must be in main RAM and aligned on {dram_word} bytes.")
+
+        # Bind before starting the streamer and leave room for the whole burst in the socket buffer.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 64*1024*1024)
+        sock.bind(("", args.udp_port))
+        udp_ip = args.udp_ip or local_ip_for(args.board_ip)
+
+        reassembler = run(bus, args.name, sock, udp_ip, args.udp_port, base, length, args.packet_size, args.timeout)
+        if args.output is not None:
+            with open(args.output, "wb") as f:
+                f.write(reassembler.data)
+    finally:
+        sock.close()
+        bus.close()
+
+if __name__ == "__main__":
+    main()
@@ -34,5 +34,5 @@ setup(
         "Programming Language :: Python",
     ],
     packages                      = find_packages(exclude=['test*']),
-    package_data                  = {"litex_boards": ["prog/*.cfg"]},
+    package_data                  = {"litex_boards": ["prog/*.cfg", "boards.json", "tools/*.c", "software/*/*"]},
 )
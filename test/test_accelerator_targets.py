@@ -7,7 +7,9 @@ from litex.soc.cores.ram.xilinx_usp_hbm2 import (
 )
 from litex_boards.targets.alibaba_vu13p import QSFP_PORTS as ALIBABA_QSFP_PORTS
 from litex_boards.targets.alibaba_vu13p import parse_qsfp_port as parse_alibaba_qsfp_port
+from litex_boards.targets.alibaba_vu13p import check_ddram_stripe as check_alibaba_ddram_stripe
 from litex_boards.targets.sqrl_xcu1525 import QSFP_PORTS, parse_qsfp_port
+from litex_boards.targets.digilent_netfpga_sume import SFP_PORT_MODES, check_eth_port_mode, parse_eth_ports
 
 
 def test_fk33_hbm_channel_parser_accepts_lists_ranges_and_all():
@@ -48,3 +50,33 @@ def test_alibaba_qsfp_port_parser_uses_sfp_lane_names():
 def test_alibaba_qsfp_port_parser_rejects_old_short_names():
     with pytest.raises(ValueError):
         parse_alibaba_qsfp_port("qsfp0_0")
+
+
+@pytest.mark.parametrize("stripe", [64, 256, 4096, 2**20])
+def test_alibaba_ddram_stripe_accepts_power_of_2_controller_words(stripe):
+    check_alibaba_ddram_stripe(stripe)
+
+
+@pytest.mark.parametrize("stripe", [0, 32, 96, 1000, 2**31])
+def test_alibaba_ddram_stripe_rejects_invalid_sizes(stripe):
+    with pytest.raises(ValueError):
+        check_alibaba_ddram_stripe(stripe)
+
+
+def test_netfpga_sume_eth_port_parser_accepts_lists_ranges_and_all():
+    assert parse_eth_ports(2) == (2,)
+    assert parse_eth_ports("3,0-1") == (3, 0, 1)
+    assert parse_eth_ports("all") == (0, 1, 2, 3)
+
+
+@pytest.mark.parametrize("ports", ["", "4", "0-4"])
+def test_netfpga_sume_eth_port_parser_rejects_invalid_ports(ports):
+    with pytest.raises(ValueError, match="Ethernet ports must be"):
+        parse_eth_ports(ports)
+
+
+def test_netfpga_sume_eth_port_mode():
+    for mode in SFP_PORT_MODES:
+        check_eth_port_mode(mode)
+    with pytest.raises(ValueError):
+        check_eth_port_mode("raw")
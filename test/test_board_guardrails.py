@@ -1,6 +1,9 @@
 import importlib.util
+import json
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 
@@ -58,6 +61,35 @@ def test_stale_exclusion_checker_detects_passing_probe():
     assert result.stale
 
 
+def test_stale_exclusion_checker_runs_probes_concurrently_within_deadline(tmp_path):
+    checker = load_script("check_stale_board_exclusions.py")
+    def probe(name, code):
+        return checker.Probe(kind="target", name=name, category="untested", reason="Demo.", cmd=(sys.executable, "-c", code))
+    probes = [
+        probe("fast",  ""),
+        probe("slow",  "import time; time.sleep(0.5)"),
+        probe("slow2", "import time; time.sleep(0.5)"),
+        probe("hang",  "import time; time.sleep(30)"),
+    ]
+
+    start = time.monotonic()
+    results = list(checker.run_probes(probes, workers=4, timeout=10, deadline=time.monotonic() + 2))
+    assert time.monotonic() - start < 5
+    assert results[0].probe.name == "fast"
+    assert {result.probe.name: result.status for result in results} == {
+        "fast": "stale", "slow": "stale", "slow2": "stale", "hang": "timeout",
+    }
+
+    # Probes that could not start before the deadline are reported, not run.
+    expired = list(checker.run_probes(probes[:1], workers=1, timeout=10, deadline=time.monotonic() - 1))
+    assert expired[0].status == "not_run" and not expired[0].stale
+
+    report = tmp_path / "report.json"
+    checker.write_report(report, results + expired)
+    entries = json.loads(report.read_text(encoding="utf-8"))["probes"]
+    assert [entry["status"] for entry in entries] == ["stale", "not_run", "timeout", "stale", "stale"]
+
+
 def test_board_audit_understands_platform_module_imports(tmp_path):
     audit = load_script("audit_board_consistency.py")
     target = tmp_path / "demo.py"
@@ -177,3 +209,265 @@ def test_target_exclusions_use_structured_metadata():
             assert set(record) >= {"category", "reason"}
             assert record["category"] in metadata["EXCLUSION_CATEGORIES"]
             assert record["reason"].endswith(".")
+
+
+def test_build_runner_isolates_target_output_dirs(tmp_path):
+    runner = load_script("run_target_builds.py")
+    first  = runner.target_job("demo_a", tmp_path)
+    second = runner.target_job("demo_b", tmp_path)
+    assert first.output_dir != second.output_dir
+    assert first.cmd[-2:] == ("--output-dir", str(tmp_path / "targets" / "demo_a"))
+
+
+def test_build_runner_streams_results_and_ranks_slowest(tmp_path):
+    runner = load_script("run_target_builds.py")
+    jobs = [
+        runner.BuildJob(
+            kind       = "target",
+            name       = name,
+            cmd        = (sys.executable, "-c", f"import time; time.sleep({delay})"),
+            output_dir = tmp_path / name,
+        )
+        for name, delay in [("slow", 0.5), ("fast", 0.0)]
+    ]
+
+    results = list(runner.run_jobs(jobs, workers=2))
+    assert [result.job.name for result in results] == ["fast", "slow"]
+    assert all(result.ok for result in results)
+    assert [result.job.name for result in runner.slowest(results, 1)] == ["slow"]
+
+
+def test_build_runner_cache_skips_unchanged_targets(tmp_path, monkeypatch):
+    runner = load_script("run_target_builds.py")
+    targets = tmp_path / "litex_boards" / "targets"
+    targets.mkdir(parents=True)
+    source = targets / "demo.py"
+    source.write_text("\n", encoding="utf-8")
+    monkeypatch.setattr(runner, "ROOT", tmp_path)
+    monkeypatch.setattr(runner, "TARGETS_DIR", targets)
+
+    job = runner.BuildJob(
+        kind       = "target",
+        name       = "demo",
+        cmd        = (sys.executable, "-c", ""),
+        output_dir = tmp_path / "build" / "demo",
+    )
+    cache_path = tmp_path / "cache.json"
+
+    def run(force_rebuild=False):
+        cache = runner.BuildCache(cache_path, force_rebuild=force_rebuild)
+        return list(runner.run_jobs([job], cache=cache))[0]
+
+    assert not run().cached
+    assert run().cached
+    assert not run(force_rebuild=True).cached
+
+    source.write_text("# Changed.\n", encoding="utf-8")
+    assert not run().cached
+
+
+def test_build_runner_selects_targets_affected_by_changes(tmp_path, monkeypatch):
+    runner = load_script("run_target_builds.py")
+    package   = tmp_path / "litex_boards"
+    targets   = package / "targets"
+    platforms = package / "platforms"
+    (targets / "common").mkdir(parents=True)
+    platforms.mkdir()
+    (targets / "common" / "helpers.py").write_text("\n", encoding="utf-8")
+    (platforms / "shared.py").write_text("\n", encoding="utf-8")
+    (targets / "first.py").write_text(
+        "from litex_boards.platforms import shared\n"
+        "from litex_boards.targets.common.helpers import Helper\n",
+        encoding="utf-8",
+    )
+    (targets / "second.py").write_text("from litex_boards.platforms.shared import Platform\n", encoding="utf-8")
+    (targets / "third.py").write_text("\n", encoding="utf-8")
+    monkeypatch.setattr(runner, "ROOT", tmp_path)
+    monkeypatch.setattr(runner, "TARGETS_DIR", targets)
+    monkeypatch.setattr(runner, "PLATFORMS_DIR", platforms)
+
+    jobs = [runner.target_job(name, tmp_path / "build") for name in ["first", "second", "third"]]
+
+    def selected(*paths):
+        return [job.name for job in runner.select_affected(jobs, [tmp_path / path for path in paths])]
+
+    assert selected("litex_boards/platforms/shared.py") == ["first", "second"]
+    assert selected("litex_boards/targets/common/helpers.py") == ["first"]
+    assert selected("litex_boards/targets/third.py") == ["third"]
+    assert selected("README.md") == []
+    assert selected("test/test_targets.py") == ["first", "second", "third"]
+
+
+def test_board_index_reuses_cached_records_until_content_changes(tmp_path, monkeypatch):
+    index_module = load_script("board_index.py")
+    target = tmp_path / "demo.py"
+    target.write_text(
+        """
+from litex_boards.platforms import demo
+
+def main():
+    parser.add_target_argument("--sys-clk-freq", default=50e6, type=float, help="System clock frequency.")
+""",
+        encoding="utf-8",
+    )
+    index_path = tmp_path / "index.json"
+
+    index = index_module.BoardIndex(index_path)
+    record = index.target(target)
+    assert record.platform_imports == ("demo",)
+    assert record.option("--sys-clk-freq").default == "50000000.0"
+    index.save()
+
+    # A touched but unchanged file is matched by hash and not re-parsed.
+    def parse_target(path, text):
+        raise AssertionError("unexpected re-parse")
+    parse, dump, load = index_module.KINDS["target"]
+    monkeypatch.setitem(index_module.KINDS, "target", (parse_target, dump, load))
+    os.utime(target, ns=(0, 0))
+    assert index_module.BoardIndex(index_path).target(target) == record
+
+    monkeypatch.setitem(index_module.KINDS, "target", (parse, dump, load))
+    target.write_text("def main():\n    pass\n", encoding="utf-8")
+    assert index_module.BoardIndex(index_path).target(target).platform_imports == ()
+
+
+def test_elaboration_benchmark_collects_build_metrics(tmp_path):
+    benchmark = load_script("benchmark_target_elaboration.py")
+    output_dir = tmp_path / "targets" / "demo"
+    script = (
+        "import json, pathlib\n"
+        f"out = pathlib.Path({str(output_dir)!r})\n"
+        "(out / 'gateware').mkdir(parents=True)\n"
+        "(out / 'gateware' / 'demo.v').write_text('module demo;\\nendmodule\\n')\n"
+        "(out / 'csr.json').write_text(json.dumps({'csr_registers': {'a': 0, 'b': 1}, 'memories': {'rom': 0}}))\n"
+    )
+    job = benchmark.BuildJob(kind="target", name="demo", cmd=(sys.executable, "-c", script), output_dir=output_dir)
+
+    result = benchmark.measure(job)
+    assert result.ok
+    assert result.verilog_lines == 2
+    assert result.csr_count == 2
+    assert result.memory_regions == 1
+    assert result.peak_rss_mb > 0
+
+
+def test_target_fingerprints_ignore_build_date_and_paths(tmp_path):
+    fingerprints = load_script("fingerprint_targets.py")
+
+    def build(output_dir, date, verilog):
+        (output_dir / "gateware").mkdir(parents=True)
+        header = f"// Auto-generated by LiteX (1234abcd) on {date}\n"
+        (output_dir / "gateware" / "demo.v").write_text(header + verilog + f"// {output_dir}/gateware/mem.init\n")
+        (output_dir / "gateware" / "demo.xdc").write_text(header + "set_property PACKAGE_PIN E3 [get_ports clk100]\n")
+        (output_dir / "csr.csv").write_text("#" + header + "csr_base,ctrl,0xf0000000,,\n")
+        (output_dir / "csr.json").write_text(json.dumps({"memories": {"rom": {"base": 0, "size": 131072}}}))
+        return fingerprints.collect_fingerprints(output_dir, "usage: demo\n")
+
+    before = build(tmp_path / "before", "2026-01-01 10:00:00", "module demo();\nendmodule\n")
+    after  = build(tmp_path / "after",  "2026-02-01 11:00:00", "module demo();\nendmodule\n")
+    assert before == after and None not in before.values()
+
+    changed = build(tmp_path / "changed", "2026-02-01 11:00:00", "module demo(input clk);\nendmodule\n")
+    assert fingerprints.compare({"demo": changed, "other": before}, {"demo": before}) == {
+        "demo"  : ["verilog"],
+        "other" : ["new"],
+    }
+
+
+def test_elaboration_benchmark_flags_regressions_beyond_threshold():
+    benchmark = load_script("benchmark_target_elaboration.py")
+    reference = {"ok": True, "wall_time": 10.0, "peak_rss_mb": 400.0, "verilog_lines": 10000, "csr_count": 20, "memory_regions": 4}
+    baseline = {"demo": reference}
+
+    regressions, changes = benchmark.compare({"demo": {**reference, "wall_time": 12.0}}, baseline, threshold=0.25)
+    assert regressions == [] and changes == []
+
+    regressions, changes = benchmark.compare({"demo": {**reference, "wall_time": 20.0, "csr_count": 21}}, baseline, threshold=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("demo: wall_time")
+    assert changes == ["demo: csr_count 20 -> 21"]
+
+    regressions, _ = benchmark.compare({"demo": {**reference, "wall_time": 20.0}}, baseline, threshold=0.25, metrics=("verilog_lines",))
+    assert regressions == []
+
+
+def test_elaboration_baseline_skips_failed_builds():
+    benchmark = load_script("benchmark_target_elaboration.py")
+    reference = {"ok": True, "wall_time": 10.0, "peak_rss_mb": 400.0, "verilog_lines": 10000, "csr_count": 20, "memory_regions": 4}
+    failed    = {"ok": False, "wall_time": 0.2, "peak_rss_mb": 30.0, "verilog_lines": 0, "csr_count": 0, "memory_regions": 0}
+    merged = benchmark.merge_baseline({"demo": reference}, {"demo": failed, "other": failed, "new": reference})
+    assert merged == {"demo": reference, "new": reference}
+
+
+def test_targets_import_feature_cores_lazily():
+    result = subprocess.run(
+        [sys.executable, ".github/scripts/check_target_lazy_imports.py"],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    assert result.returncode == 0, result.stdout
+
+
+def test_lazy_import_fixer_moves_imports_into_feature_blocks(tmp_path):
+    index_module = load_script("board_index.py")
+    lazy = load_script("check_target_lazy_imports.py")
+    target = tmp_path / "demo.py"
+    target.write_text(
+        """from migen import *
+
+from liteeth.phy.mii import LiteEthPHYMII
+from litedram.modules import MT41K128M16
+from litedram.phy import s7ddrphy
+
+class BaseSoC:
+    def __init__(self, with_ethernet=False):
+        if not self.integrated_main_ram_size:
+            self.ddrphy = s7ddrphy.A7DDRPHY()
+            self.add_sdram("sdram", phy=self.ddrphy, module=MT41K128M16(sys_clk_freq, "1:4"))
+
+        if with_ethernet:
+            self.ethphy = LiteEthPHYMII()
+""",
+        encoding="utf-8",
+    )
+    record = index_module.BoardIndex(tmp_path / "index.json").target(target)
+    assert [entry.line for entry in record.deferrable_imports] == [3, 4, 5]
+
+    fixed = lazy.defer_imports(target.read_text(encoding="utf-8"), record.deferrable_imports)
+    assert fixed == """from migen import *
+
+class BaseSoC:
+    def __init__(self, with_ethernet=False):
+        if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
+            self.ddrphy = s7ddrphy.A7DDRPHY()
+            self.add_sdram("sdram", phy=self.ddrphy, module=MT41K128M16(sys_clk_freq, "1:4"))
+
+        if with_ethernet:
+            from liteeth.phy.mii import LiteEthPHYMII
+            self.ethphy = LiteEthPHYMII()
+"""
+
+
+def test_board_registry_is_current():
+    result = subprocess.run(
+        [sys.executable, ".github/scripts/generate_board_registry.py", "--check"],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    assert result.returncode == 0, result.stdout
+
+
+def test_board_registry_lists_boards_without_importing_them():
+    code = """
+import sys
+from litex_boards import registry
+arty = registry.target("digilent_arty")
+assert arty.platforms == ("digilent_arty",) and arty.toolchains == ("vivado",)
+assert arty.device.startswith("xc7a") and arty.sys_clk_freq == 100e6 and "ethernet" in arty.features
+assert registry.target("simple").exclusion == "generic_target"
+assert registry.platform("digilent_arty").default_clk_name == "clk100"
+assert arty in registry.find_targets(device="xc7a", toolchain="vivado", feature="ethernet")
+assert len(registry.targets()) > 200 and len(registry.platforms()) > 200
+assert not [name for name in sys.modules if name.startswith(("litex_boards.targets.", "litex_boards.platforms.", "litex."))]
+"""
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,126 @@
+import pytest
+
+pytest.importorskip("migen")
+pytest.importorskip("liteeth")
+pytest.importorskip("liteiclink")
+
+from migen import *
+
+from litex_boards.targets.eth10g.common import _PCS10GBASERTX, _PCS10GBASERRX
+
+IDLE  = 0x07
+START = 0xfb
+END   = 0xfd
+
+
+class PCSLoopback(Module):
+    """TX PCS looped back into RX PCS through the GTY bit reversal of USP_GTY_10GBASER.
+
+    The RX PCS is held in reset until the serializer runs (RX clock domain reset of the PHY).
+    """
+    def __init__(self):
+        self.rx_reset      = Signal(reset=1)
+        self.xgmii_tx_data = Signal(64)
+        self.xgmii_tx_ctl  = Signal(8)
+        self.xgmii_rx_data = Signal(64)
+        self.xgmii_rx_ctl  = Signal(8)
+        self.tx_data       = Signal(64) # Gearbox side, MSB first.
+        self.tx_header     = Signal(2)
+        self.rx_data       = Signal(64)
+        self.rx_header     = Signal(2)
+
+        # # #
+
+        self.submodules.pcs_tx = pcs_tx = _PCS10GBASERTX(self.xgmii_tx_data, self.xgmii_tx_ctl)
+        self.submodules.pcs_rx = pcs_rx = ResetInserter()(_PCS10GBASERRX(self.xgmii_rx_data, self.xgmii_rx_ctl))
+        self.comb += [
+            pcs_rx.reset.eq(self.rx_reset),
+            self.tx_data.eq(pcs_tx.data[::-1]),
+            self.tx_header.eq(pcs_tx.header[::-1]),
+        ]
+        self.sync += [
+            pcs_rx.data.eq(self.rx_data[::-1]),
+            pcs_rx.header.eq(self.rx_header[::-1]),
+        ]
+
+
+def block(lanes, ctl):
+    return sum(lane << 8*i for i, lane in enumerate(lanes)), ctl
+
+def idle():
+    return block([IDLE]*8, 0xff)
+
+def data(seed):
+    return block([(seed + i) & 0xff for i in range(8)], 0x00)
+
+def start(lane):
+    if lane == 0:
+        return block([START] + [0x55]*6 + [0xd5], 0x01)
+    return block([IDLE]*4 + [START, 0x55, 0x55, 0x55], 0x1f)
+
+def terminate(k, seed):
+    return block([(seed + i) & 0xff for i in range(k)] + [END] + [IDLE]*(7 - k), (0xff << k) & 0xff)
+
+def frames():
+    """Idles then frames starting on lane 0 (S0) and 4 (S4), ending with each Terminate (T0-T7)."""
+    blocks = [idle()]*4
+    for k in range(8):
+        blocks += [start(4*(k % 2)), data(16*k), data(16*k + 8), terminate(k, 16*k + 128), idle()]
+    return blocks
+
+
+def run_loopback(offset, lock_cycles, blocks):
+    dut = PCSLoopback()
+    rx  = {"slips": 0, "lock": None, "blocks": []}
+
+    def generator():
+        stream = [0]*offset # Bits received before the first block: gearbox out of alignment.
+        for cycle, (xgmii_data, xgmii_ctl) in enumerate([idle()]*lock_cycles + blocks + [idle()]*8):
+            yield dut.xgmii_tx_data.eq(xgmii_data)
+            yield dut.xgmii_tx_ctl.eq(xgmii_ctl)
+
+            # Serializer (header then data, MSB first) / Deserializer (slipping one bit on request).
+            tx_header = (yield dut.tx_header)
+            tx_data   = (yield dut.tx_data)
+            stream   += [(tx_header >> (1 - i)) & 0b1 for i in range(2)]
+            stream   += [(tx_data >> (63 - i)) & 0b1 for i in range(64)]
+            if (yield dut.pcs_rx.slip):
+                rx["slips"] += 1
+                stream.pop(0)
+            bits, stream = stream[:66], stream[66:]
+            yield dut.rx_header.eq(int("".join(str(b) for b in bits[:2]), 2))
+            yield dut.rx_data.eq(int("".join(str(b) for b in bits[2:]), 2))
+            yield dut.rx_reset.eq(cycle < 4)
+
+            if (yield dut.pcs_rx.block_lock):
+                if rx["lock"] is None:
+                    rx["lock"] = cycle
+                rx["blocks"].append(((yield dut.xgmii_rx_data), (yield dut.xgmii_rx_ctl)))
+            yield
+
+    run_simulation(dut, generator())
+    return rx
+
+
+def find(blocks, pattern):
+    for i in range(len(blocks) - len(pattern) + 1):
+        if blocks[i:i + len(pattern)] == pattern:
+            return i
+    return None
+
+
+def test_pcs_loopback_frames():
+    rx = run_loopback(offset=0, lock_cycles=96, blocks=frames())
+    assert rx["slips"] == 0
+    assert rx["lock"] is not None
+    assert find(rx["blocks"], frames()) is not None
+
+
+def test_pcs_block_lock_from_bit_offset():
+    # Each slip advances the deserializer by one bit: the block lock is acquired after `offset` slips.
+    rx = run_loopback(offset=3, lock_cycles=512, blocks=frames())
+    assert rx["slips"] == 3
+    assert rx["lock"] is not None
+    # Idles until the frames (descrambler synchronized), then the frames unchanged.
+    assert set(rx["blocks"][:8]) == {idle()}
+    assert find(rx["blocks"], frames()) is not None
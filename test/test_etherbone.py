@@ -0,0 +1,42 @@
+import pytest
+
+from litex_boards.targets.ethernet.common import etherbone_args
+from litex_boards.tools.etherbone_bench import bench, bursts
+
+
+class ConstantsSoC:
+    def __init__(self):
+        self.constants = {}
+
+    def add_constant(self, name, value=None, check_duplicate=True):
+        self.constants[name] = value
+
+
+class MemoryBus:
+    def __init__(self):
+        self.mem = {}
+
+    def write(self, addr, datas):
+        for i, data in enumerate(datas):
+            self.mem[addr + 4*i] = data
+
+    def read(self, addr, length=None):
+        datas = [self.mem.get(addr + 4*i, 0) for i in range(1 if length is None else length)]
+        return datas[0] if length is None else datas
+
+
+def test_etherbone_args():
+    soc = ConstantsSoC()
+    assert etherbone_args(soc, 255) == {"buffer_depth": 255}
+    assert soc.constants == {"ETHERBONE_BUFFER_DEPTH": 255}
+    for buffer_depth in [0, 256]:
+        with pytest.raises(ValueError, match="between 1 and 255"):
+            etherbone_args(soc, buffer_depth)
+
+
+def test_etherbone_bench():
+    assert bursts(16) == [1, 2, 4, 8, 16]
+    assert bursts(255) == [1, 2, 4, 8, 16, 32, 64, 128, 255]
+    for burst in bursts(255):
+        wr, rd, errors = bench(MemoryBus(), 0x40000000, 4096, burst)
+        assert wr > 0 and rd > 0 and errors == 0
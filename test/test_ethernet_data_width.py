@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+import pytest
+
+from litex_boards.targets.ethernet.common import check_eth_data_width
+
+
+def test_eth_data_width_defaults_to_phy_width():
+    assert check_eth_data_width(SimpleNamespace(dw=8)) == 8
+    assert check_eth_data_width(SimpleNamespace(dw=64)) == 64
+    assert check_eth_data_width(SimpleNamespace()) == 8
+
+
+def test_eth_data_width_against_phy():
+    for data_width in [8, 32, 64]:
+        assert check_eth_data_width(SimpleNamespace(dw=8), data_width) == data_width
+    assert check_eth_data_width(SimpleNamespace(dw=64), 64) == 64
+    with pytest.raises(ValueError, match="smaller than the PHY data width"):
+        check_eth_data_width(SimpleNamespace(dw=64), 32)
+    with pytest.raises(ValueError, match="must be one of"):
+        check_eth_data_width(SimpleNamespace(dw=8), 16)
@@ -0,0 +1,64 @@
+import sys
+import json
+import argparse
+import importlib
+from pathlib import Path
+
+from litex_boards.profiling import ElaborationProfiler, add_profiling_args, profile_elaboration, target_module_name
+
+
+class TargetParser(argparse.ArgumentParser):
+    def add_target_argument(self, *args, **kwargs):
+        self.add_argument(*args, **kwargs)
+
+
+def test_targets_import_has_no_side_effects(monkeypatch):
+    argv = ["litex_boards.targets.sqrl_xcu1525", "--profile-output", "out.json", "--build"]
+    monkeypatch.setattr(sys, "argv", list(argv))
+    monkeypatch.delitem(sys.modules, "litex_boards.targets", raising=False)
+    importlib.import_module("litex_boards.targets")
+    assert sys.argv == argv
+
+
+def test_targets_have_profile_elaboration_hook():
+    targets_dir = Path(__file__).resolve().parent.parent / "litex_boards" / "targets"
+    offenders = []
+    for path in sorted(targets_dir.glob("*.py")):
+        text = path.read_text(encoding="utf-8")
+        if path.name != "__init__.py" and not ("add_profiling_args(parser)" in text and "profile_elaboration(args, __name__)" in text):
+            offenders.append(path.name)
+    assert not offenders, "Targets without --profile-elaboration: " + ", ".join(offenders)
+
+
+def test_profile_elaboration_is_opt_in():
+    parser = TargetParser()
+    add_profiling_args(parser)
+    args = parser.parse_args([])
+    assert (args.profile_elaboration, args.profile_output) == (False, None)
+    assert profile_elaboration(args, __name__) is None
+    args = parser.parse_args(["--profile-elaboration", "--profile-output", "out.json"])
+    assert (args.profile_elaboration, args.profile_output) == (True, "out.json")
+
+
+def test_profile_target_module_name():
+    assert target_module_name("sqrl_xcu1525") == "litex_boards.targets.sqrl_xcu1525"
+    assert target_module_name("litex_boards/targets/sqrl_xcu1525.py") == "litex_boards.targets.sqrl_xcu1525"
+    assert target_module_name("litex_boards.targets.sqrl_xcu1525") == "litex_boards.targets.sqrl_xcu1525"
+
+
+def test_profiler_records_nested_phases(tmp_path):
+    profiler = ElaborationProfiler()
+    inner = profiler.wrap("add_sdram", lambda: [0]*1000)
+    outer = profiler.wrap("SoCCore.__init__", lambda: inner())
+    outer()
+    outer()
+
+    assert profiler.stats["SoCCore.__init__"][0] == 2
+    assert profiler.stats["add_sdram"][0] == 2
+    assert "add_sdram" in profiler.render()
+
+    output = tmp_path / "profile.json"
+    profiler.write_speedscope(output)
+    profile = json.loads(output.read_text())
+    assert [frame["name"] for frame in profile["shared"]["frames"]] == ["SoCCore.__init__", "add_sdram"]
+    assert [event["type"] for event in profile["profiles"][0]["events"]][:4] == ["O", "O", "C", "C"]
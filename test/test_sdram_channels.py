@@ -0,0 +1,17 @@
+import pytest
+
+from litex_boards.targets.sdram.common import parse_ddram_channels
+
+
+def test_parse_ddram_channels():
+    assert parse_ddram_channels(2, range(4)) == (2,)
+    assert parse_ddram_channels("0,2", range(4)) == (0, 2)
+    assert parse_ddram_channels("2, 0-3", range(4)) == (2, 0, 1, 3)
+    assert parse_ddram_channels("all", range(4)) == (0, 1, 2, 3)
+    assert parse_ddram_channels([1, 1, 0], range(4), counts=[1, 2, 4]) == (1, 0)
+    with pytest.raises(ValueError, match="0, 1, 2 or 3"):
+        parse_ddram_channels("0,4", range(4))
+    with pytest.raises(ValueError, match="0, 1, 2 or 3"):
+        parse_ddram_channels("", range(4))
+    with pytest.raises(ValueError, match="count must be 1, 2 or 4"):
+        parse_ddram_channels("0-2", range(4), counts=[1, 2, 4])
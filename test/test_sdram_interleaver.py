@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+pytest.importorskip("migen")
+pytest.importorskip("litedram")
+
+from migen import *
+
+from litedram.common import LiteDRAMNativePort
+
+from litex_boards.targets.sdramchannels.common import SDRAMInterleaver
+
+ADDRESS_WIDTH = 10
+DATA_WIDTH    = 32
+
+
+class InterleaverDUT(Module):
+    def __init__(self, channels, stripe):
+        self.channel_ports = []
+
+        def get_port(mode="both", data_width=None):
+            port = LiteDRAMNativePort(mode, ADDRESS_WIDTH, DATA_WIDTH)
+            self.channel_ports.append(port)
+            return port
+
+        self.submodules.interleaver = SDRAMInterleaver([get_port]*channels, stripe=stripe, depth=4)
+        self.port = self.interleaver.get_port()
+
+
+def channel_model(port, mem, rng, cycles):
+    """In-order LiteDRAM crossbar port: random command ready, write data taken (that has to be valid,
+    the controller does not wait for it) and read data returned (without back-pressure) later."""
+    ops   = []
+    write = None
+    for cycle in range(cycles):
+        if write is not None:
+            assert (yield port.wdata.valid) and (yield port.wdata.ready)
+            mem[write] = (yield port.wdata.data)
+            write = None
+        yield port.cmd.ready.eq(rng.random() < 0.7)
+        yield port.wdata.ready.eq(0)
+        yield port.rdata.valid.eq(0)
+        if ops and ops[0][0] <= cycle:
+            _, we, addr = ops.pop(0)
+            if we:
+                yield port.wdata.ready.eq(1)
+                write = addr
+            else:
+                yield port.rdata.valid.eq(1)
+                yield port.rdata.data.eq(mem.get(addr, 0))
+        yield
+        if (yield port.cmd.valid) and (yield port.cmd.ready):
+            start = max([cycle + rng.randrange(2, 12)] + [op[0] + 1 for op in ops])
+            ops.append((start, (yield port.cmd.we), (yield port.cmd.addr)))
+
+
+def run_interleaver(channels, stripe, ops, seed=0):
+    dut  = InterleaverDUT(channels, stripe)
+    rng  = random.Random(seed)
+    mems = [{} for _ in range(channels)]
+    reads, wdatas = [], []
+
+    def cmd_generator():
+        for we, addr, data in ops:
+            yield dut.port.cmd.valid.eq(1)
+            yield dut.port.cmd.we.eq(we)
+            yield dut.port.cmd.addr.eq(addr)
+            yield dut.port.cmd.last.eq(~we)
+            yield
+            while not (yield dut.port.cmd.ready):
+                yield
+            if we:
+                wdatas.append(data) # Data given after the command, as LiteDRAMWishbone2Native.
+        yield dut.port.cmd.valid.eq(0)
+
+    def wdata_generator():
+        for _ in range(4000):
+            yield dut.port.wdata.valid.eq(len(wdatas) > 0)
+            yield dut.port.wdata.data.eq(wdatas[0] if wdatas else 0)
+            yield dut.port.wdata.we.eq(0xf)
+            yield
+            if (yield dut.port.wdata.valid) and (yield dut.port.wdata.ready):
+                wdatas.pop(0)
+
+    def rdata_generator():
+        for _ in range(4000):
+            yield dut.port.rdata.ready.eq(rng.random() < 0.5)
+            yield
+            if (yield dut.port.rdata.valid) and (yield dut.port.rdata.ready):
+                reads.append((yield dut.port.rdata.data))
+
+    generators = [cmd_generator(), wdata_generator(), rdata_generator()]
+    generators += [channel_model(port, mem, random.Random(seed + i), 4000) for i, (port, mem) in enumerate(zip(dut.channel_ports, mems))]
+    run_simulation(dut, generators)
+    return mems, reads
+
+
+@pytest.mark.parametrize("channels, stripe", [(2, 4), (4, 4), (4, 16)])
+def test_sdram_interleaver(channels, stripe):
+    rng        = random.Random(channels*stripe)
+    words      = stripe//(DATA_WIDTH//8)
+    addrs      = rng.sample(range(2**(ADDRESS_WIDTH + 1)), 64)
+    datas      = {addr: rng.getrandbits(DATA_WIDTH) for addr in addrs}
+    write_ops  = [(1, addr, datas[addr]) for addr in addrs]
+    read_addrs = addrs[::-1]
+    read_ops   = [(0, addr, None) for addr in read_addrs]
+    mems, reads = run_interleaver(channels, stripe, write_ops + read_ops)
+
+    # Read back in order.
+    assert reads == [datas[addr] for addr in read_addrs]
+
+    # Striped over the channels every `stripe` bytes.
+    sel_bits  = (channels - 1).bit_length()
+    word_bits = (words - 1).bit_length()
+    for addr, data in datas.items():
+        channel = (addr >> word_bits) & (channels - 1)
+        offset  = (addr & (words - 1)) | ((addr >> (word_bits + sel_bits)) << word_bits)
+        assert mems[channel][offset] == data
+
+
+def test_sdram_interleaver_stripe():
+    with pytest.raises(ValueError):
+        SDRAMInterleaver([None]*3, stripe=256)
+    with pytest.raises(ValueError):
+        InterleaverDUT(2, stripe=6)
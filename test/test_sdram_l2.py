@@ -0,0 +1,74 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from litex_boards.targets.sdram.common import device_block_ram_size, l2_cache_args, set_main_ram_data_width
+
+
+class FakeSoC:
+    def __init__(self, device):
+        self.platform  = SimpleNamespace(device=device)
+        self.logger    = logging.getLogger("test")
+        self.constants = {}
+
+    def add_config(self, name, value=None, check_duplicate=True):
+        self.constants["CONFIG_" + name] = value
+
+
+def phy(nphases, dfi_databits):
+    return SimpleNamespace(settings=SimpleNamespace(nphases=nphases, dfi_databits=dfi_databits))
+
+
+def test_device_block_ram_size():
+    assert device_block_ram_size("xc7a35ticsg324-1L") == 1800*1024//8
+    assert device_block_ram_size("LFE5UM5G-85F-8BG381") == 3744*1024//8
+    assert device_block_ram_size("xcu280-fsvh2892-2L-e-es1") == device_block_ram_size("xcvu37p-fsvh2892-2L-e")
+    assert device_block_ram_size("ice40-up5k-sg48") is None
+
+
+def test_l2_cache_scales_with_device():
+    # Small/unknown devices keep the target default.
+    assert l2_cache_args(FakeSoC("xc7a35ticsg324-1L"), {}, phy(4, 32)) == {
+        "l2_cache_size": 8192, "l2_cache_min_data_width": 128}
+    assert l2_cache_args(FakeSoC("ice40-up5k-sg48"), {}, phy(1, 16), default=1024)["l2_cache_size"] == 1024
+    # Large devices get a larger L2 with lines of 2 memory words.
+    soc  = FakeSoC("xcvu13p-fhgb2104-2l-e")
+    args = l2_cache_args(soc, {}, phy(4, 32))
+    assert args == {"l2_cache_size": 128*1024, "l2_cache_min_data_width": 256}
+    assert soc.constants == {"CONFIG_L2_MIN_DATA_WIDTH": 256, "CONFIG_L2_SIZE_AUTO": None}
+    assert l2_cache_args(FakeSoC("xcvu13p"), {}, phy(4, 128))["l2_cache_min_data_width"] == 512
+
+
+def test_l2_size_takes_precedence():
+    # Any l2_size (--l2-size), including the LiteX default value, disables the device sizing.
+    soc = FakeSoC("xcvu13p-fhgb2104-2l-e")
+    assert l2_cache_args(soc, {"l2_size": 8192}, phy(4, 32))["l2_cache_size"] == 8192
+    assert "CONFIG_L2_SIZE_AUTO" not in soc.constants
+    assert l2_cache_args(FakeSoC("xcvu13p"), {"l2_size": 0}, phy(4, 32))["l2_cache_size"] == 0
+    assert l2_cache_args(FakeSoC("xcvu13p"), {"l2_size": 2048}, phy(4, 32))["l2_cache_size"] == 2048
+
+
+def test_main_ram_data_width():
+    kwargs = {"bus_data_width": 32}
+    set_main_ram_data_width(kwargs, None)
+    assert kwargs == {"bus_data_width": 32}
+    kwargs = {}
+    set_main_ram_data_width(kwargs, 512)
+    assert kwargs == {"bus_data_width": 512}
+    set_main_ram_data_width(kwargs, 512)
+    assert kwargs == {"bus_data_width": 512}
+    with pytest.raises(ValueError):
+        set_main_ram_data_width({}, 48)
+
+    # An explicit --bus-data-width must match --main-ram-data-width.
+    with pytest.raises(ValueError):
+        set_main_ram_data_width({"bus_data_width": 32}, 512)
+    kwargs = {"bus_data_width": None}
+    set_main_ram_data_width(kwargs, 256)
+    assert kwargs == {"bus_data_width": 256}
+
+    args = l2_cache_args(FakeSoC("xcvu9p-flga2104-2-e"), {}, phy(4, 128), data_width=512)
+    assert args["l2_cache_min_data_width"] == 512
+    with pytest.raises(ValueError):
+        l2_cache_args(FakeSoC("xcvu9p-flga2104-2-e"), {}, phy(4, 32), data_width=512)
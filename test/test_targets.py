@@ -8,14 +8,30 @@
 import subprocess
 import unittest
 import importlib
+import importlib.util
 import os
 import shutil
 import sys
+from pathlib import Path
 
 from migen import *
 
 from litex.soc.integration.builder import *
 
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(name):
+    path = ROOT / ".github" / "scripts" / name
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+build_runner = load_script("run_target_builds.py")
+
 EXCLUSION_CATEGORIES = {
     "external_toolchain",
     "generic_target",
@@ -188,6 +204,23 @@ def subprocess_run_quiet(cmd):
     return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
 
 
+# Import time budget for a target --help, generous enough for loaded CI runners.
+HELP_IMPORT_BUDGET_MS = int(os.getenv("LITEX_BOARDS_HELP_IMPORT_BUDGET_MS", "3000"))
+
+
+def help_import_time_ms(output):
+    # Sum the cumulative time of top-level imports reported by python -X importtime.
+    total = 0
+    for line in output.splitlines():
+        fields = line.split("|")
+        if not line.startswith("import time:") or len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        if fields[2].startswith("  "):
+            continue
+        total += int(fields[1])
+    return total/1000
+
+
 def efinity_available():
     if os.getenv("LITEX_ENV_EFINITY"):
         return True
@@ -238,19 +271,26 @@ class TestTargets(unittest.TestCase):
                 ]
                 subprocess.check_call(cmd)
 
-    # Exercise target imports and parser setup for board targets, including no-compile exclusions.
+    # Exercise target imports and parser setup for board targets, including no-compile exclusions,
+    # and keep --help startup (python -X importtime) within LITEX_BOARDS_HELP_IMPORT_BUDGET_MS.
     def test_target_parsers_smoke(self):
         targets = [name for name in python_module_names("./litex_boards/targets/") if name != "simple"]
-        for name in targets:
-            with self.subTest(target=name):
-                cmd = [
-                    sys.executable,
-                    "-m", f"litex_boards.targets.{name}",
-                    "--help",
-                ]
-                result = subprocess_run_quiet(cmd)
-                if result.returncode != 0:
-                    self.fail(result.stdout)
+        jobs = [
+            build_runner.BuildJob(
+                kind       = "target",
+                name       = name,
+                cmd        = (sys.executable, "-X", "importtime", "-m", f"litex_boards.targets.{name}", "--help"),
+                output_dir = ROOT / "build" / "test_target_parsers" / name,
+            )
+            for name in targets
+        ]
+        for result in build_runner.run_jobs(jobs):
+            with self.subTest(target=result.job.name):
+                if not result.ok:
+                    self.fail(result.output)
+                import_time = help_import_time_ms(result.output)
+                if import_time > HELP_IMPORT_BUDGET_MS:
+                    self.fail(f"--help imports took {import_time:.0f}ms (budget: {HELP_IMPORT_BUDGET_MS}ms).")
 
     # Build a framebuffer target with native SDRAM and integrated main RAM.
     def test_video_framebuffer_memory_backends(self):
@@ -276,6 +316,23 @@ class TestTargets(unittest.TestCase):
                 ]
                 subprocess.check_call(cmd)
 
+    # Run no-compile build jobs concurrently (LITEX_BOARDS_TEST_JOBS) and report the slowest ones.
+    # Builds matching a previous successful run are reported as cached, unless
+    # LITEX_BOARDS_TEST_FORCE_REBUILD or LITEX_BOARDS_TEST_NO_CACHE is set.
+    # With LITEX_BOARDS_TEST_CHANGED_SINCE=<rev>, only builds affected by the git diff are run.
+    def run_build_jobs(self, jobs):
+        changed_since = os.getenv("LITEX_BOARDS_TEST_CHANGED_SINCE")
+        if changed_since:
+            jobs = build_runner.select_affected(jobs, build_runner.changed_files(changed_since))
+        results = []
+        for result in build_runner.run_jobs(jobs, cache=build_runner.default_cache()):
+            results.append(result)
+            with self.subTest(**{result.job.kind: result.job.name}):
+                if not result.ok:
+                    self.fail(result.output)
+        print("")
+        print(build_runner.render_summary(results))
+
     # Build simple design for all platforms.
     def test_platforms(self):
         # Collect platforms.
@@ -285,18 +342,7 @@ class TestTargets(unittest.TestCase):
                 platforms.append(name)
 
         # Test platforms with simple design.
-        for name in platforms:
-            with self.subTest(platform=name):
-                shutil.rmtree("build", ignore_errors=True)
-                cmd = [
-                    sys.executable,
-                    "-m", "litex_boards.targets.simple",
-                    f"litex_boards.platforms.{name}",
-                    "--build",
-                    "--no-compile",
-                    "--uart-name=stub",
-                ]
-                subprocess.check_call(cmd)
+        self.run_build_jobs(build_runner.platform_job(name) for name in platforms)
 
     # Build default configuration for all targets.
     def test_targets(self):
@@ -307,16 +353,4 @@ class TestTargets(unittest.TestCase):
                 targets.append(name)
 
         # Test targets.
-        for name in targets:
-            with self.subTest(target=name):
-                shutil.rmtree("build", ignore_errors=True)
-                cmd = [
-                    sys.executable,
-                    "-m", f"litex_boards.targets.{name}",
-                    "--cpu-type=vexriscv",
-                    "--cpu-variant=minimal",
-                    "--uart-name=stub",
-                    "--build",
-                    "--no-compile",
-                ]
-                subprocess.check_call(cmd)
+        self.run_build_jobs(build_runner.target_job(name) for name in targets)
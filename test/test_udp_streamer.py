@@ -0,0 +1,32 @@
+import pytest
+
+from litex_boards.tools.udp_streamer import HEADER, Reassembler
+
+
+def datagrams(data, packet_size):
+    for seq, offset in enumerate(range(0, len(data), packet_size)):
+        yield HEADER.pack(seq, offset) + data[offset:offset + packet_size]
+
+
+def test_udp_streamer_reassembly():
+    data        = bytes(range(256))*17
+    packets     = list(datagrams(data, 1024))
+    reassembler = Reassembler(len(data), 1024)
+    for datagram in [packets[1], packets[0], packets[0]] + packets[2:]:
+        reassembler.feed(datagram)
+    assert reassembler.complete
+    assert bytes(reassembler.data) == data
+    assert (reassembler.reordered, reassembler.duplicates) == (1, 1)
+    assert reassembler.missing() == []
+
+
+def test_udp_streamer_lost_datagrams():
+    data        = bytes(4096)
+    reassembler = Reassembler(len(data), 1024)
+    for seq, datagram in enumerate(datagrams(data, 1024)):
+        if seq != 2:
+            reassembler.feed(datagram)
+    assert not reassembler.complete
+    assert reassembler.missing() == [2]
+    with pytest.raises(ValueError):
+        reassembler.feed(HEADER.pack(0, 512) + bytes(1024))
@@ -0,0 +1,239 @@
+import random
+
+import pytest
+
+pytest.importorskip("migen")
+pytest.importorskip("litex")
+
+from migen import *
+
+from litex.soc.interconnect.axi import AXIInterface, BURST_FIXED, BURST_INCR, BURST_WRAP, RESP_OKAY, RESP_SLVERR
+
+from litex_boards.targets.usphbm2.common import USPHBM2_CHANNEL_SIZE, USPHBM2Striper, usphbm2_check_stripe
+
+DATA_WIDTH = 32
+BEAT_BYTES = DATA_WIDTH//8
+BEAT_SIZE  = 2 # log2(BEAT_BYTES).
+ID_WIDTH   = 4
+ORIGIN     = 0x40000000
+
+
+class StriperDUT(Module):
+    def __init__(self, channels, stripe_size):
+        self.ports = [AXIInterface(data_width=DATA_WIDTH, address_width=33, id_width=ID_WIDTH) for _ in channels]
+        self.submodules.striper = USPHBM2Striper(channels, self.ports, stripe_size=stripe_size, origin=ORIGIN, depth=4)
+        self.bus = self.striper.bus
+
+
+@passive
+def pseudochannel_model(port, channel, mem, log, rng, bresp=RESP_OKAY):
+    """HBM2 pseudochannel AXI port: random AW/AR/W ready, in-order B responses and read data
+    returned later with random valid. Sub-bursts are logged as (port address, len)."""
+    writes, bresps, reads = [], [], []
+    cycle = 0
+    while True:
+        yield port.aw.ready.eq(rng.random() < 0.5)
+        yield port.ar.ready.eq(rng.random() < 0.5)
+        yield port.w.ready.eq(len(writes) > 0 and rng.random() < 0.7)
+        b_valid = len(bresps) > 0 and bresps[0][0] <= cycle
+        yield port.b.valid.eq(b_valid)
+        yield port.b.id.eq(bresps[0][1] if b_valid else 0)
+        yield port.b.resp.eq(bresp)
+        r_valid = len(reads) > 0 and reads[0][0] <= cycle and rng.random() < 0.7
+        yield port.r.valid.eq(r_valid)
+        if r_valid:
+            _, axid, addr, beats = reads[0]
+            yield port.r.id.eq(axid)
+            yield port.r.data.eq(mem.get(addr, 0))
+            yield port.r.resp.eq(RESP_OKAY)
+            yield port.r.last.eq(beats == 1)
+        yield
+        for ax, requests in [(port.aw, log["aw"]), (port.ar, log["ar"])]:
+            if (yield ax.valid) and (yield ax.ready):
+                assert (yield ax.burst) == BURST_INCR
+                assert (yield ax.size)  == BEAT_SIZE
+                assert (yield ax.addr)//USPHBM2_CHANNEL_SIZE == channel
+                requests.append(((yield ax.addr), (yield ax.len)))
+                request = [(yield ax.id), (yield ax.addr) % USPHBM2_CHANNEL_SIZE, (yield ax.len) + 1]
+                if ax is port.aw:
+                    writes.append(request)
+                else:
+                    start = max([cycle + rng.randrange(2, 12)] + [read[0] for read in reads])
+                    reads.append([start] + request)
+        if (yield port.w.valid) and (yield port.w.ready):
+            axid, addr, beats = writes[0]
+            assert (yield port.w.last) == (beats == 1)
+            mem[addr] = (yield port.w.data)
+            writes[0] = [axid, addr + BEAT_BYTES, beats - 1]
+            if beats == 1:
+                start = max([cycle + rng.randrange(1, 8)] + [b[0] for b in bresps])
+                bresps.append((start, axid))
+                writes.pop(0)
+        if b_valid and (yield port.b.ready):
+            bresps.pop(0)
+        if r_valid and (yield port.r.ready):
+            _, axid, addr, beats = reads[0]
+            reads[0][2:] = [addr + BEAT_BYTES, beats - 1]
+            if beats == 1:
+                reads.pop(0)
+        cycle += 1
+
+
+def run_striper(channels, stripe_size, writes, reads, bresps=None, seed=0):
+    """Issue `writes` (addr, len, id, burst, size, datas) then, once all are answered, `reads`
+    (addr, len, id, burst, size) on the striper; return the B responses, R beats, sub-burst logs
+    and pseudochannel memories."""
+    dut    = StriperDUT(channels, stripe_size)
+    rng    = random.Random(seed)
+    mems   = [{} for _ in channels]
+    log    = {"aw": [], "ar": []}
+    bresps = bresps or [RESP_OKAY]*len(channels)
+    b, r   = [], []
+
+    def ax_generator(ax, bursts, wait=lambda: False):
+        while wait():
+            yield
+        for addr, length, axid, burst, size, *_ in bursts:
+            yield ax.valid.eq(1)
+            yield ax.addr.eq(addr)
+            yield ax.len.eq(length)
+            yield ax.id.eq(axid)
+            yield ax.burst.eq(burst)
+            yield ax.size.eq(size)
+            yield
+            while not (yield ax.ready):
+                yield
+        yield ax.valid.eq(0)
+
+    def w_generator():
+        beats = [(data, n == len(datas) - 1) for *_, datas in writes for n, data in enumerate(datas)]
+        while beats:
+            data, last = beats[0]
+            yield dut.bus.w.valid.eq(rng.random() < 0.7)
+            yield dut.bus.w.data.eq(data)
+            yield dut.bus.w.strb.eq(2**BEAT_BYTES - 1)
+            yield dut.bus.w.last.eq(last)
+            yield
+            if (yield dut.bus.w.valid) and (yield dut.bus.w.ready):
+                beats.pop(0)
+        yield dut.bus.w.valid.eq(0)
+
+    def response_generator():
+        while len(b) < len(writes) or len(r) < sum(length + 1 for _, length, *_ in reads):
+            yield dut.bus.b.ready.eq(rng.random() < 0.5)
+            yield dut.bus.r.ready.eq(rng.random() < 0.5)
+            yield
+            if (yield dut.bus.b.valid) and (yield dut.bus.b.ready):
+                b.append(((yield dut.bus.b.id), (yield dut.bus.b.resp)))
+            if (yield dut.bus.r.valid) and (yield dut.bus.r.ready):
+                r.append(((yield dut.bus.r.id), (yield dut.bus.r.data), (yield dut.bus.r.resp), (yield dut.bus.r.last)))
+
+    generators = [
+        ax_generator(dut.bus.aw, writes),
+        ax_generator(dut.bus.ar, reads, wait=lambda: len(b) < len(writes)),
+        w_generator(),
+        response_generator(),
+    ]
+    generators += [pseudochannel_model(port, channel, mem, log, random.Random(seed + n), bresp)
+        for n, (port, channel, mem, bresp) in enumerate(zip(dut.ports, channels, mems, bresps))]
+    run_simulation(dut, generators)
+    return b, r, log, mems
+
+
+def split(channels, stripe_size, addr, length):
+    """Expected sub-bursts (channel index, port address, len) of an INCR burst."""
+    offset    = addr - ORIGIN
+    remaining = length + 1
+    while remaining:
+        beats = min(16, remaining, (stripe_size - offset % stripe_size)//BEAT_BYTES)
+        chan  = (offset//stripe_size) % len(channels)
+        local = offset % stripe_size + offset//(stripe_size*len(channels))*stripe_size
+        yield chan, channels[chan]*USPHBM2_CHANNEL_SIZE + local, beats - 1
+        offset    += beats*BEAT_BYTES
+        remaining -= beats
+
+
+def random_bursts(rng, count, datas=False):
+    bursts = []
+    for _ in range(count):
+        addr   = ORIGIN + BEAT_BYTES*rng.randrange(256)
+        length = rng.randrange(40)
+        burst  = (addr, length, rng.randrange(2**ID_WIDTH), BURST_INCR, BEAT_SIZE)
+        if datas:
+            burst += ([rng.getrandbits(DATA_WIDTH) for _ in range(length + 1)],)
+        bursts.append(burst)
+    return bursts
+
+
+@pytest.mark.parametrize("channels, stripe_size", [([4, 5], 16), ([8, 9, 10, 11], 16), ([0, 1], 128), ([0, 1, 2, 3], 128)])
+def test_usphbm2_striper(channels, stripe_size):
+    rng    = random.Random(len(channels)*stripe_size)
+    writes = random_bursts(rng, 12, datas=True)
+    reads  = random_bursts(rng, 12)
+    b, r, log, mems = run_striper(channels, stripe_size, writes, reads)
+
+    # Split at stripe and 16-beat boundaries, issued in request order.
+    for name, bursts in [("aw", writes), ("ar", reads)]:
+        subs = [sub for addr, length, *_ in bursts for sub in split(channels, stripe_size, addr, length)]
+        assert log[name] == [(port_addr, length) for _, port_addr, length in subs]
+
+    # Written striped over the pseudochannels, merged write responses with the master IDs.
+    ref = {}
+    for addr, length, axid, burst, size, datas in writes:
+        for n, data in enumerate(datas):
+            ref[addr + n*BEAT_BYTES] = data
+    for addr, data in ref.items():
+        (chan, port_addr, _), = split(channels, stripe_size, addr, 0)
+        assert mems[chan][port_addr % USPHBM2_CHANNEL_SIZE] == data
+    assert b == [(axid, RESP_OKAY) for _, _, axid, *_ in writes]
+
+    # Read data returned in request order with the master IDs, last on the final beat only.
+    assert r == [(axid, ref.get(addr + n*BEAT_BYTES, 0), RESP_OKAY, n == length)
+        for addr, length, axid, *_ in reads for n in range(length + 1)]
+
+
+def test_usphbm2_striper_write_response():
+    # Pseudochannel 1 answers SLVERR: the worst response of the sub-bursts is returned.
+    writes = [
+        (ORIGIN +  0, 3, 1, BURST_INCR, BEAT_SIZE, [1, 2, 3, 4]), # Channel 0.
+        (ORIGIN +  8, 3, 2, BURST_INCR, BEAT_SIZE, [5, 6, 7, 8]), # Channels 0 then 1.
+        (ORIGIN + 24, 3, 3, BURST_INCR, BEAT_SIZE, [5, 6, 7, 8]), # Channels 1 then 0.
+        (ORIGIN + 32, 3, 4, BURST_INCR, BEAT_SIZE, [1, 2, 3, 4]), # Channel 0.
+    ]
+    b, r, log, mems = run_striper([0, 1], 16, writes, [], bresps=[RESP_OKAY, RESP_SLVERR])
+    assert b == [(1, RESP_OKAY), (2, RESP_SLVERR), (3, RESP_SLVERR), (4, RESP_OKAY)]
+
+
+def test_usphbm2_striper_unsupported():
+    # FIXED/WRAP and narrow bursts are answered with SLVERR and not issued to the pseudochannels.
+    writes = [
+        (ORIGIN +  0, 3, 1, BURST_FIXED, BEAT_SIZE,     [1, 2, 3, 4]),
+        (ORIGIN + 16, 1, 2, BURST_INCR,  BEAT_SIZE,     [5, 6]),
+        (ORIGIN +  0, 3, 3, BURST_WRAP,  BEAT_SIZE,     [7, 8, 9, 10]),
+        (ORIGIN +  0, 1, 4, BURST_INCR,  BEAT_SIZE - 1, [11, 12]),
+    ]
+    reads = [
+        (ORIGIN +  0, 3, 5, BURST_WRAP,  BEAT_SIZE),
+        (ORIGIN + 16, 1, 6, BURST_INCR,  BEAT_SIZE),
+        (ORIGIN +  0, 2, 7, BURST_FIXED, BEAT_SIZE),
+        (ORIGIN + 20, 0, 8, BURST_INCR,  BEAT_SIZE - 1),
+    ]
+    b, r, log, mems = run_striper([0, 1], 16, writes, reads)
+    assert log == {"aw": [(USPHBM2_CHANNEL_SIZE, 1)], "ar": [(USPHBM2_CHANNEL_SIZE, 1)]}
+    assert mems == [{}, {0: 5, 4: 6}]
+    assert b == [(1, RESP_SLVERR), (2, RESP_OKAY), (3, RESP_SLVERR), (4, RESP_SLVERR)]
+    assert r == [
+        *[(5, 0, RESP_SLVERR, n == 3) for n in range(4)],
+        (6, 5, RESP_OKAY, 0), (6, 6, RESP_OKAY, 1),
+        *[(7, 0, RESP_SLVERR, n == 2) for n in range(3)],
+        (8, 0, RESP_SLVERR, 1),
+    ]
+
+
+def test_usphbm2_striper_stripe():
+    with pytest.raises(ValueError):
+        usphbm2_check_stripe([0, 1, 2], 4096)
+    with pytest.raises(ValueError):
+        StriperDUT([0, 1], stripe_size=24)
+    with pytest.raises(ValueError):
+        StriperDUT([0, 1], stripe_size=2)